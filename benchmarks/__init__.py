@@ -0,0 +1,15 @@
+"""Command-latency benchmarks for workstack.
+
+Builds synthetic repositories of configurable size and measures the commands
+run most often: cold `--help`, `switch` through `__shell`, `list --stacks`,
+`status`, `tree` and `graphite branches`. Two suites are available:
+
+- ``fake``: commands run in-process against the fakes in ``tests/fakes``,
+  isolating workstack's own cost from git's
+- ``real``: commands run as fresh processes against a real git repository
+  with real worktrees, Graphite metadata and PR fixtures
+
+Each command reports wall time, the number of subprocesses it spawned and its
+peak memory. Results can be saved as a baseline and later runs are compared
+against it; see ``python -m benchmarks --help``.
+"""
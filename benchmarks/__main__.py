@@ -0,0 +1,210 @@
+"""Run the workstack benchmarks: ``python -m benchmarks``."""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+from click.testing import CliRunner
+
+from benchmarks.baseline import (
+    DEFAULT_TOLERANCE,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from benchmarks.measure import Measurement, measure_in_process, measure_subprocess
+from benchmarks.scenarios import (
+    Scenario,
+    ScenarioSize,
+    build_fake_scenario,
+    build_real_scenario,
+)
+from workstack.cli.cli import cli
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Inline script handoff, as used by the shell wrappers
+SHELL_ENV = {"WORKSTACK_SHELL": "bash", "WORKSTACK_SCRIPT_HANDOFF": "stdout"}
+
+
+@dataclass(frozen=True)
+class BenchCommand:
+    """A command to benchmark.
+
+    Attributes:
+        name: Short name used in reports and baselines
+        args: Arguments passed to workstack
+        in_worktree: Run from the first linked worktree instead of the repo root
+        real_only: Only meaningful as a fresh process (e.g. cold start)
+    """
+
+    name: str
+    args: list[str]
+    in_worktree: bool = False
+    real_only: bool = False
+
+
+def bench_commands(size: ScenarioSize) -> list[BenchCommand]:
+    """Commands measured by both suites."""
+    target = size.worktree_name(0)
+    return [
+        BenchCommand("help", ["--help"], real_only=True),
+        BenchCommand("shell-switch", ["__shell", "switch", target], real_only=True),
+        BenchCommand("switch-script", ["switch", target, "--script"]),
+        BenchCommand("list-stacks", ["list", "--stacks"]),
+        BenchCommand("status", ["status"], in_worktree=True),
+        BenchCommand("tree", ["tree"]),
+        BenchCommand("graphite-branches", ["graphite", "branches", "--format", "json"]),
+    ]
+
+
+def run_fake_suite(root: Path, size: ScenarioSize, *, repeat: int) -> list[Measurement]:
+    """Run every command in-process against the fakes."""
+    scenario = build_fake_scenario(root, size)
+    runner = CliRunner()
+    measurements = []
+    original_cwd = os.getcwd()
+    try:
+        for command in bench_commands(size):
+            if command.real_only:
+                continue
+            os.chdir(_command_cwd(scenario, command))
+
+            def run(args: list[str] = command.args) -> int:
+                result = runner.invoke(cli, args, obj=scenario.ctx, env=SHELL_ENV)
+                return result.exit_code
+
+            measurements.append(measure_in_process(f"fake/{command.name}", run, repeat=repeat))
+    finally:
+        os.chdir(original_cwd)
+    return measurements
+
+
+def run_real_suite(root: Path, size: ScenarioSize, *, repeat: int) -> list[Measurement]:
+    """Run every command as a fresh process against a real git repository."""
+    scenario = build_real_scenario(root, size)
+    assert scenario.env is not None
+    env = {**scenario.env, **SHELL_ENV}
+    return [
+        measure_subprocess(
+            f"real/{command.name}",
+            command.args,
+            cwd=_command_cwd(scenario, command),
+            env=env,
+            repeat=repeat,
+        )
+        for command in bench_commands(size)
+    ]
+
+
+def _command_cwd(scenario: Scenario, command: BenchCommand) -> Path:
+    if command.in_worktree and scenario.worktree_paths:
+        return scenario.worktree_paths[0]
+    return scenario.repo_root
+
+
+def _format_row(measurement: Measurement, baseline: Measurement | None) -> str:
+    row = (
+        f"{measurement.name:<28} {measurement.wall_ms:>9.1f} "
+        f"{measurement.subprocesses:>6} {measurement.peak_kb:>10}"
+    )
+    if baseline is not None:
+        row += f"   (baseline {baseline.wall_ms:.1f} ms, {baseline.subprocesses} procs)"
+    if measurement.exit_code != 0:
+        row += f"   exit {measurement.exit_code}"
+    return row
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option(
+    "--suite",
+    type=click.Choice(["fake", "real", "all"]),
+    default="all",
+    show_default=True,
+    help="Fakes in-process, real git in fresh processes, or both.",
+)
+@click.option("--worktrees", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option("--stack-height", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option("--prs/--no-prs", default=True, show_default=True, help="Add PR fixtures.")
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_BASELINE,
+    show_default=True,
+)
+@click.option("--save-baseline", "save", is_flag=True, help="Store this run as the new baseline.")
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Allowed relative increase in wall time and memory.",
+)
+def main(
+    suite: str,
+    worktrees: int,
+    stack_height: int,
+    prs: bool,
+    repeat: int,
+    baseline_path: Path,
+    save: bool,
+    tolerance: float,
+) -> None:
+    """Benchmark workstack commands against synthetic repositories.
+
+    Exits with status 1 if a command fails, regresses against the baseline, or
+    there is no baseline to compare with (unless --save-baseline creates it).
+    Baselines are machine-specific and only comparable for the same size
+    options.
+    """
+    size = ScenarioSize(worktrees=worktrees, stack_height=stack_height, prs=prs)
+    measurements: list[Measurement] = []
+    with tempfile.TemporaryDirectory(prefix="workstack-bench-") as tmp:
+        root = Path(tmp).resolve()
+        if suite in ("fake", "all"):
+            measurements.extend(run_fake_suite(root / "fake", size, repeat=repeat))
+        if suite in ("real", "all"):
+            measurements.extend(run_real_suite(root / "real", size, repeat=repeat))
+
+    baseline = load_baseline(baseline_path)
+    click.echo(f"{'benchmark':<28} {'wall ms':>9} {'procs':>6} {'peak KiB':>10}")
+    for measurement in measurements:
+        click.echo(_format_row(measurement, baseline.get(measurement.name)))
+
+    failed = [m for m in measurements if m.exit_code != 0]
+    regressions = find_regressions(baseline, measurements, tolerance=tolerance)
+    for regression in regressions:
+        click.echo(
+            f"REGRESSION {regression.name} {regression.metric}: "
+            f"{regression.baseline:g} -> {regression.current:g}",
+            err=True,
+        )
+    for measurement in failed:
+        click.echo(f"FAILED {measurement.name}: exit {measurement.exit_code}", err=True)
+
+    missing_baseline = not baseline and not save
+    if missing_baseline:
+        click.echo(
+            f"Error: No usable baseline at {baseline_path}, nothing was compared. "
+            "Create one with `make bench-baseline`.",
+            err=True,
+        )
+    elif not save:
+        for measurement in measurements:
+            if measurement.name not in baseline:
+                click.echo(f"WARNING {measurement.name}: not in baseline, not compared", err=True)
+
+    if save:
+        save_baseline(baseline_path, measurements)
+        click.echo(f"Saved baseline to {baseline_path}")
+
+    if failed or regressions or missing_baseline:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
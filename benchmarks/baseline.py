@@ -0,0 +1,97 @@
+"""Storing benchmark baselines and flagging regressions against them.
+
+Subprocess counts are deterministic, so any increase is a regression. Wall
+time and memory vary between runs and machines; they regress only when they
+exceed the baseline by more than a relative tolerance and a small absolute
+floor, so that noise on very fast commands is not reported.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.measure import Measurement
+
+BASELINE_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+WALL_MS_FLOOR = 5.0
+PEAK_KB_FLOOR = 1024
+
+
+@dataclass(frozen=True)
+class Regression:
+    """One metric of one benchmark that got worse than its baseline.
+
+    Attributes:
+        name: Benchmark name
+        metric: ``wall_ms``, ``subprocesses`` or ``peak_kb``
+        baseline: Baseline value
+        current: Value measured now
+    """
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def load_baseline(path: Path) -> dict[str, Measurement]:
+    """Load a baseline file, returning an empty baseline if it does not exist."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        return {}
+    return {entry["name"]: Measurement(**entry) for entry in data.get("benchmarks", [])}
+
+
+def save_baseline(path: Path, measurements: list[Measurement]) -> None:
+    """Write measurements as the new baseline."""
+    data = {
+        "version": BASELINE_VERSION,
+        "benchmarks": [asdict(m) for m in sorted(measurements, key=lambda m: m.name)],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    baseline: dict[str, Measurement],
+    measurements: list[Measurement],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Regression]:
+    """Compare measurements with a baseline.
+
+    Benchmarks missing from the baseline are not compared.
+
+    Args:
+        baseline: Baseline measurements by name
+        measurements: Current measurements
+        tolerance: Allowed relative increase of wall time and memory
+    """
+    regressions: list[Regression] = []
+    for current in measurements:
+        previous = baseline.get(current.name)
+        if previous is None:
+            continue
+
+        if current.subprocesses > previous.subprocesses:
+            regressions.append(
+                Regression(
+                    current.name, "subprocesses", previous.subprocesses, current.subprocesses
+                )
+            )
+        if _exceeds(previous.wall_ms, current.wall_ms, tolerance, WALL_MS_FLOOR):
+            regressions.append(
+                Regression(current.name, "wall_ms", previous.wall_ms, current.wall_ms)
+            )
+        if _exceeds(previous.peak_kb, current.peak_kb, tolerance, PEAK_KB_FLOOR):
+            regressions.append(
+                Regression(current.name, "peak_kb", previous.peak_kb, current.peak_kb)
+            )
+    return regressions
+
+
+def _exceeds(baseline: float, current: float, tolerance: float, floor: float) -> bool:
+    return current > baseline * (1 + tolerance) and current - baseline > floor
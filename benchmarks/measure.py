@@ -0,0 +1,168 @@
+"""Measuring wall time, subprocess count and peak memory of one command run."""
+
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Installed in the measured child process before workstack is imported. The
+# audit hook sees every subprocess.Popen the command starts. At exit the child
+# writes "<subprocess count> <peak RSS in KiB>". Peak RSS comes from VmHWM,
+# because ru_maxrss also counts the parent's memory copied by fork().
+_CHILD_BOOTSTRAP = """
+import atexit, sys
+_count = [0]
+def _hook(event, args):
+    if event == "subprocess.Popen":
+        _count[0] += 1
+sys.addaudithook(_hook)
+def _report(path=sys.argv[1]):
+    peak = 0
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    peak = int(line.split()[1])
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024
+    with open(path, "w") as f:
+        f.write(f"{_count[0]} {peak}")
+atexit.register(_report)
+sys.argv = ["workstack", *sys.argv[2:]]
+from workstack import main
+main()
+"""
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Result of running one benchmark.
+
+    Attributes:
+        name: Benchmark name, ``<suite>/<command>``
+        wall_ms: Fastest wall time over the repeats, in milliseconds
+        subprocesses: Subprocesses spawned by the command (per run)
+        peak_kb: Peak memory in KiB: the child's peak RSS for subprocess runs,
+            the peak traced Python allocation for in-process runs
+        exit_code: Exit code of the last run
+    """
+
+    name: str
+    wall_ms: float
+    subprocesses: int
+    peak_kb: int
+    exit_code: int
+
+
+def measure_subprocess(
+    name: str, args: list[str], *, cwd: Path, env: dict[str, str], repeat: int
+) -> Measurement:
+    """Run ``workstack <args>`` in fresh interpreters and measure each run.
+
+    Args:
+        name: Benchmark name
+        args: Arguments passed to workstack
+        cwd: Working directory for the command
+        env: Environment for the command
+        repeat: Number of runs; the fastest wall time is reported
+    """
+    best_ms = float("inf")
+    subprocesses = 0
+    peak_kb = 0
+    exit_code = 0
+    with tempfile.TemporaryDirectory(prefix="workstack-bench-") as tmp:
+        report_file = Path(tmp) / "report"
+        for _ in range(repeat):
+            report_file.unlink(missing_ok=True)
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [sys.executable, "-c", _CHILD_BOOTSTRAP, str(report_file), *args],
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            exit_code = proc.wait()
+            best_ms = min(best_ms, (time.perf_counter() - start) * 1000)
+
+            if report_file.exists():
+                count, peak = report_file.read_text(encoding="utf-8").split()
+                subprocesses = int(count)
+                peak_kb = max(peak_kb, int(peak))
+
+    return Measurement(
+        name=name,
+        wall_ms=best_ms,
+        subprocesses=subprocesses,
+        peak_kb=peak_kb,
+        exit_code=exit_code,
+    )
+
+
+class _SubprocessCounter:
+    """Counts subprocess.Popen calls made in this process while enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.count = 0
+        sys.addaudithook(self._hook)
+
+    def _hook(self, event: str, args: tuple[object, ...]) -> None:
+        if self.enabled and event == "subprocess.Popen":
+            self.count += 1
+
+
+_counter: _SubprocessCounter | None = None
+
+
+def measure_in_process(name: str, run: Callable[[], int], *, repeat: int) -> Measurement:
+    """Call ``run`` in this process and measure each call.
+
+    Args:
+        name: Benchmark name
+        run: Runs the command once and returns its exit code
+        repeat: Number of calls; the fastest wall time is reported
+    """
+    global _counter
+    if _counter is None:
+        # Audit hooks cannot be removed, so one counter serves every benchmark
+        _counter = _SubprocessCounter()
+
+    best_ms = float("inf")
+    subprocesses = 0
+    exit_code = 0
+    for _ in range(repeat):
+        _counter.count = 0
+        _counter.enabled = True
+        start = time.perf_counter()
+        try:
+            exit_code = run()
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _counter.enabled = False
+        best_ms = min(best_ms, elapsed_ms)
+        subprocesses = _counter.count
+
+    # Tracing slows allocation down, so memory gets a separate run
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    peak_kb = peak // 1024
+
+    return Measurement(
+        name=name,
+        wall_ms=best_ms,
+        subprocesses=subprocesses,
+        peak_kb=peak_kb,
+        exit_code=exit_code,
+    )
@@ -0,0 +1,246 @@
+"""Synthetic repositories for the benchmarks.
+
+Both suites use the same shape: one Graphite stack of ``stack_height``
+branches per worktree, stacked on ``main``, with the worktree checked out on
+the top branch of its stack and (optionally) an open PR for every branch.
+"""
+
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.shell_ops import FakeShellOps
+
+from workstack.core.context import WorkstackContext
+from workstack.core.gitops import WorktreeInfo
+from workstack.core.graphite_ops import RealGraphiteOps
+
+TRUNK = "main"
+PR_OWNER = "acme"
+PR_REPO = "widgets"
+
+GIT_IDENTITY_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+@dataclass(frozen=True)
+class ScenarioSize:
+    """Size of a synthetic repository.
+
+    Attributes:
+        worktrees: Number of worktrees (and Graphite stacks)
+        stack_height: Branches per stack
+        prs: Whether every branch has an open PR in Graphite's PR cache
+    """
+
+    worktrees: int
+    stack_height: int
+    prs: bool
+
+    def stack(self, index: int) -> list[str]:
+        """Branch names of one stack, bottom first."""
+        return [f"stack-{index:03d}/b{level}" for level in range(self.stack_height)]
+
+    def worktree_name(self, index: int) -> str:
+        return f"wt-{index:03d}"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A synthetic repository ready to run commands against.
+
+    Attributes:
+        repo_root: Root worktree of the repository
+        worktree_paths: Linked worktrees, in stack order
+        ctx: Context for in-process runs (fake suite only)
+        env: Environment for subprocess runs (real suite only)
+    """
+
+    repo_root: Path
+    worktree_paths: list[Path]
+    ctx: WorkstackContext | None
+    env: dict[str, str] | None
+
+
+def graphite_cache(size: ScenarioSize) -> dict[str, object]:
+    """Build the contents of ``.graphite_cache_persist``."""
+    stacks = [size.stack(i) for i in range(size.worktrees)]
+    branches: list[list[object]] = [
+        [TRUNK, {"validationResult": "TRUNK", "children": [stack[0] for stack in stacks]}]
+    ]
+    for stack in stacks:
+        for level, name in enumerate(stack):
+            parent = TRUNK if level == 0 else stack[level - 1]
+            children = stack[level + 1 : level + 2]
+            branches.append([name, {"parentBranchName": parent, "children": children}])
+    return {"branches": branches}
+
+
+def graphite_pr_info(size: ScenarioSize) -> dict[str, object]:
+    """Build the contents of ``.graphite_pr_info`` (empty when PRs are disabled)."""
+    if not size.prs:
+        return {"prInfos": []}
+    infos = []
+    number = 1
+    for i in range(size.worktrees):
+        for name in size.stack(i):
+            infos.append(
+                {
+                    "headRefName": name,
+                    "prNumber": number,
+                    "state": "OPEN",
+                    "isDraft": False,
+                    "url": f"https://app.graphite.dev/github/pr/{PR_OWNER}/{PR_REPO}/{number}",
+                }
+            )
+            number += 1
+    return {"prInfos": infos}
+
+
+def _write_graphite_files(git_dir: Path, size: ScenarioSize) -> None:
+    (git_dir / ".graphite_cache_persist").write_text(
+        json.dumps(graphite_cache(size)), encoding="utf-8"
+    )
+    (git_dir / ".graphite_pr_info").write_text(json.dumps(graphite_pr_info(size)), encoding="utf-8")
+
+
+def build_fake_scenario(root: Path, size: ScenarioSize) -> Scenario:
+    """Create a scenario backed by the fakes in ``tests/fakes``.
+
+    Git, GitHub, config and shell are fakes; Graphite is the real
+    implementation, which only reads the cache files written here.
+    """
+    repo_root = root / "repo"
+    git_dir = repo_root / ".git"
+    git_dir.mkdir(parents=True)
+    _write_graphite_files(git_dir, size)
+
+    workstacks_root = root / "workstacks"
+    worktrees = [WorktreeInfo(path=repo_root, branch=TRUNK)]
+    git_common_dirs = {repo_root: git_dir}
+    current_branches: dict[Path, str | None] = {repo_root: TRUNK}
+    branch_heads = {TRUNK: f"{0:040x}"}
+    commit_messages = {branch_heads[TRUNK]: "Initial commit"}
+    commit_parents: dict[str, list[str]] = {}
+
+    for i in range(size.worktrees):
+        stack = size.stack(i)
+        wt_path = workstacks_root / repo_root.name / size.worktree_name(i)
+        wt_path.mkdir(parents=True)
+        worktrees.append(WorktreeInfo(path=wt_path, branch=stack[-1]))
+        git_common_dirs[wt_path] = git_dir
+        current_branches[wt_path] = stack[-1]
+
+        parent_sha = branch_heads[TRUNK]
+        for name in stack:
+            sha = f"{len(branch_heads):040x}"
+            branch_heads[name] = sha
+            commit_messages[sha] = f"Work on {name}"
+            commit_parents[sha] = [parent_sha]
+            parent_sha = sha
+
+    git_ops = FakeGitOps(
+        worktrees={repo_root: worktrees},
+        current_branches=current_branches,
+        default_branches={repo_root: TRUNK},
+        git_common_dirs=git_common_dirs,
+        branch_heads=branch_heads,
+        commit_messages=commit_messages,
+        commit_parents=commit_parents,
+    )
+    ctx = WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=workstacks_root, use_graphite=True, show_pr_info=size.prs
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=RealGraphiteOps(),
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+    return Scenario(
+        repo_root=repo_root,
+        worktree_paths=[wt.path for wt in worktrees[1:]],
+        ctx=ctx,
+        env=None,
+    )
+
+
+def build_real_scenario(root: Path, size: ScenarioSize) -> Scenario:
+    """Create a scenario backed by a real git repository and workstack config.
+
+    Commits are written with a single ``git fast-import``; each worktree costs
+    one ``git worktree add``.
+    """
+    home = root / "home"
+    workstacks_root = root / "workstacks"
+    repo_root = root / "repo"
+    repo_root.mkdir(parents=True)
+
+    config_dir = home / ".workstack"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.toml").write_text(
+        f'workstacks_root = "{workstacks_root}"\n'
+        "use_graphite = true\n"
+        "shell_setup_complete = true\n"
+        f"show_pr_info = {'true' if size.prs else 'false'}\n",
+        encoding="utf-8",
+    )
+
+    env = {**os.environ, **GIT_IDENTITY_ENV, "HOME": str(home)}
+    # Benchmarks measure the in-process path unless asked otherwise
+    env.pop("WORKSTACK_DAEMON", None)
+
+    def git(*args: str, stdin: str | None = None) -> None:
+        subprocess.run(["git", *args], cwd=repo_root, env=env, input=stdin, text=True, check=True)
+
+    git("init", "-q", "-b", TRUNK)
+    git("fast-import", "--quiet", stdin=_fast_import_stream(size))
+    git("checkout", "-q", TRUNK)
+    _write_graphite_files(repo_root / ".git", size)
+
+    worktree_paths = []
+    for i in range(size.worktrees):
+        wt_path = workstacks_root / repo_root.name / size.worktree_name(i)
+        git("worktree", "add", "-q", str(wt_path), size.stack(i)[-1])
+        worktree_paths.append(wt_path)
+
+    return Scenario(repo_root=repo_root, worktree_paths=worktree_paths, ctx=None, env=env)
+
+
+def _fast_import_stream(size: ScenarioSize) -> str:
+    """Render a fast-import stream with one commit per branch."""
+    lines: list[str] = []
+    mark = 0
+
+    def commit(ref: str, message: str, path: str, parent: int | None) -> int:
+        nonlocal mark
+        mark += 1
+        lines.append(f"commit refs/heads/{ref}")
+        lines.append(f"mark :{mark}")
+        lines.append(f"committer Bench <bench@example.com> {1_700_000_000 + mark} +0000")
+        lines.append(f"data {len(message.encode('utf-8'))}")
+        lines.append(message)
+        if parent is not None:
+            lines.append(f"from :{parent}")
+        content = f"{message}\n"
+        lines.append(f"M 644 inline {path}")
+        lines.append(f"data {len(content.encode('utf-8'))}")
+        lines.append(content)
+        return mark
+
+    trunk_mark = commit(TRUNK, "Initial commit", "README.md", None)
+    for i in range(size.worktrees):
+        parent = trunk_mark
+        for name in size.stack(i):
+            parent = commit(name, f"Work on {name}", f"{name}.txt", parent)
+    return "\n".join(lines) + "\n"
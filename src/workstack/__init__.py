@@ -4,9 +4,43 @@ This package provides a Click-based CLI for managing git worktrees in a
 global worktrees directory. See `workstack --help` for details.
 """
 
-from workstack.cli.cli import cli
+import os
+import sys
+
+COMPLETE_VAR = "_WORKSTACK_COMPLETE"
 
 
 def main() -> None:
-    """CLI entry point used by the `workstack` console script."""
-    cli()
+    """CLI entry point used by the `workstack` console script.
+
+    `workstack prompt` is answered before click is imported: it runs on every
+    shell prompt, and importing the CLI alone would exceed its time budget.
+    `workstack __shell` is likewise forwarded to the shell-integration daemon
+    when it is enabled, and shell completion requests are answered from the
+    completion index when possible.
+    """
+    complete_mode = os.environ.get(COMPLETE_VAR)
+    if complete_mode is not None:
+        from workstack.cli.completion import run_fast_path as run_completion_fast_path
+
+        if run_completion_fast_path(complete_mode):
+            return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "prompt":
+        from workstack.cli.prompt import run_fast_path
+
+        if run_fast_path(sys.argv[2:]):
+            return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "__shell":
+        from workstack.cli.shell_integration.client import run_fast_path as run_shell_fast_path
+
+        exit_code = run_shell_fast_path(sys.argv[2:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from workstack.cli.cli import cli
+
+    # Pinned so that `python -m workstack` answers the same variable as the
+    # console script, whatever click would derive from the program name
+    cli(complete_var=COMPLETE_VAR)
@@ -1,30 +1,70 @@
+import importlib
+from typing import Any
+
 import click
 
-from workstack.cli.commands.completion import completion_group
-from workstack.cli.commands.config import config_group
-from workstack.cli.commands.create import create
-from workstack.cli.commands.down import down_cmd
-from workstack.cli.commands.gc import gc_cmd
-from workstack.cli.commands.gt import graphite_group
-from workstack.cli.commands.init import init_cmd
-from workstack.cli.commands.jump import jump_cmd
-from workstack.cli.commands.list import list_cmd, ls_cmd
-from workstack.cli.commands.move import move_cmd
-from workstack.cli.commands.prepare_cwd_recovery import prepare_cwd_recovery_cmd
-from workstack.cli.commands.remove import remove_cmd, rm_cmd
-from workstack.cli.commands.rename import rename_cmd
-from workstack.cli.commands.shell_integration import hidden_shell_cmd
-from workstack.cli.commands.status import status_cmd
-from workstack.cli.commands.switch import switch_cmd
-from workstack.cli.commands.sync import sync_cmd
-from workstack.cli.commands.tree import tree_cmd
-from workstack.cli.commands.up import up_cmd
 from workstack.core.context import create_context
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])  # terse help flags
 
+# Command name -> "module:attribute". Command modules are imported only when
+# their command is dispatched (or listed in help), so `workstack switch` does
+# not pay for importing the status subsystem, click.testing, and the rest.
+LAZY_COMMANDS: dict[str, str] = {
+    "completion": "workstack.cli.commands.completion:completion_group",
+    "create": "workstack.cli.commands.create:create",
+    "down": "workstack.cli.commands.down:down_cmd",
+    "jump": "workstack.cli.commands.jump:jump_cmd",
+    "switch": "workstack.cli.commands.switch:switch_cmd",
+    "up": "workstack.cli.commands.up:up_cmd",
+    "list": "workstack.cli.commands.list:list_cmd",
+    "ls": "workstack.cli.commands.list:ls_cmd",
+    "status": "workstack.cli.commands.status:status_cmd",
+    "prompt": "workstack.cli.commands.prompt:prompt_cmd",
+    "init": "workstack.cli.commands.init:init_cmd",
+    "move": "workstack.cli.commands.move:move_cmd",
+    "remove": "workstack.cli.commands.remove:remove_cmd",
+    "rm": "workstack.cli.commands.remove:rm_cmd",
+    "rename": "workstack.cli.commands.rename:rename_cmd",
+    "config": "workstack.cli.commands.config:config_group",
+    "gc": "workstack.cli.commands.gc:gc_cmd",
+    "stack": "workstack.cli.commands.stack:stack_group",
+    "sync": "workstack.cli.commands.sync:sync_cmd",
+    "tree": "workstack.cli.commands.tree:tree_cmd",
+    "graphite": "workstack.cli.commands.gt:graphite_group",
+    "__shell": "workstack.cli.commands.shell_integration:hidden_shell_cmd",
+    "__daemon": "workstack.cli.commands.shell_integration:hidden_daemon_group",
+    "__prepare_cwd_recovery": (
+        "workstack.cli.commands.prepare_cwd_recovery:prepare_cwd_recovery_cmd"
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+
+        module_name, attr = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_commands[cmd_name]} is not a click command")
+        # Cache so later lookups skip the import machinery
+        self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, context_settings=CONTEXT_SETTINGS)
 @click.version_option(package_name="workstack")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -34,30 +74,6 @@ def cli(ctx: click.Context) -> None:
         ctx.obj = create_context(dry_run=False)
 
 
-# Register all commands
-cli.add_command(completion_group)
-cli.add_command(create)
-cli.add_command(down_cmd)
-cli.add_command(jump_cmd)
-cli.add_command(switch_cmd)
-cli.add_command(up_cmd)
-cli.add_command(list_cmd)
-cli.add_command(ls_cmd)
-cli.add_command(status_cmd)
-cli.add_command(init_cmd)
-cli.add_command(move_cmd)
-cli.add_command(remove_cmd)
-cli.add_command(rm_cmd)
-cli.add_command(rename_cmd)
-cli.add_command(config_group)
-cli.add_command(gc_cmd)
-cli.add_command(sync_cmd)
-cli.add_command(tree_cmd)
-cli.add_command(graphite_group)
-cli.add_command(hidden_shell_cmd)
-cli.add_command(prepare_cwd_recovery_cmd)
-
-
 def main() -> None:
     """CLI entry point used by the `workstack` console script."""
     cli()
@@ -1,9 +1,21 @@
-import os
-import shutil
-import subprocess
-import sys
-
 import click
+from click.shell_completion import get_completion_class
+
+from workstack import COMPLETE_VAR
+
+
+def _echo_completion_source(shell: str) -> None:
+    """Print click's completion script for ``shell``.
+
+    The script is rendered in-process from the root command rather than by
+    re-running the workstack executable with ``{COMPLETE_VAR}={shell}_source``.
+    """
+    root_command = click.get_current_context().find_root().command
+    completion_class = get_completion_class(shell)
+    if completion_class is None:
+        raise click.ClickException(f"Unsupported shell: {shell}")
+    completion = completion_class(root_command, {}, "workstack", COMPLETE_VAR)
+    click.echo(completion.source(), nl=False)
 
 
 @click.group("completion")
@@ -34,16 +46,7 @@ def completion_bash() -> None:
     \b
     You will need to start a new shell for this setup to take effect.
     """
-    # Find the workstack executable
-    workstack_exe = shutil.which("workstack")
-    if not workstack_exe:
-        # Fallback to current Python + module
-        workstack_exe = sys.argv[0]
-
-    env = os.environ.copy()
-    env["_WORKSTACK_COMPLETE"] = "bash_source"
-    result = subprocess.run([workstack_exe], env=env, capture_output=True, text=True)
-    click.echo(result.stdout, nl=False)
+    _echo_completion_source("bash")
 
 
 @completion_group.command("zsh")
@@ -68,16 +71,7 @@ def completion_zsh() -> None:
     \b
     You will need to start a new shell for this setup to take effect.
     """
-    # Find the workstack executable
-    workstack_exe = shutil.which("workstack")
-    if not workstack_exe:
-        # Fallback to current Python + module
-        workstack_exe = sys.argv[0]
-
-    env = os.environ.copy()
-    env["_WORKSTACK_COMPLETE"] = "zsh_source"
-    result = subprocess.run([workstack_exe], env=env, capture_output=True, text=True)
-    click.echo(result.stdout, nl=False)
+    _echo_completion_source("zsh")
 
 
 @completion_group.command("fish")
@@ -100,13 +94,4 @@ def completion_fish() -> None:
     \b
     You will need to start a new shell for this setup to take effect.
     """
-    # Find the workstack executable
-    workstack_exe = shutil.which("workstack")
-    if not workstack_exe:
-        # Fallback to current Python + module
-        workstack_exe = sys.argv[0]
-
-    env = os.environ.copy()
-    env["_WORKSTACK_COMPLETE"] = "fish_source"
-    result = subprocess.run([workstack_exe], env=env, capture_output=True, text=True)
-    click.echo(result.stdout, nl=False)
+    _echo_completion_source("fish")
@@ -7,9 +7,17 @@ from pathlib import Path
 import click
 
 from workstack.cli.config import LoadedConfig, load_config
-from workstack.cli.core import discover_repo_context, ensure_workstacks_dir, worktree_path_for
+from workstack.cli.core import (
+    GRAPHITE_SCOPE,
+    WORKTREES_SCOPE,
+    discover_repo_context,
+    ensure_workstacks_dir,
+    refresh_completion_index,
+    repo_lock,
+    worktree_path_for,
+)
 from workstack.cli.graphite import get_parent_branch
-from workstack.cli.shell_utils import render_cd_script, write_script_to_temp
+from workstack.cli.shell_utils import render_cd_script, script_handoff
 from workstack.cli.subprocess_utils import run_with_error_reporting
 from workstack.core.context import WorkstackContext
 
@@ -183,8 +191,33 @@ def add_worktree(
     - Without graphite: `git worktree add -b <branch> <path> <ref or HEAD>`
 
     Otherwise, uses `git worktree add <path> <ref or HEAD>`.
+
+    Runs under the worktrees lock, and `gt create` under the Graphite lock as
+    well, so concurrent workstack invocations queue instead of colliding.
     """
+    with repo_lock(ctx, repo_root, WORKTREES_SCOPE):
+        _add_worktree_locked(
+            ctx,
+            repo_root,
+            path,
+            branch=branch,
+            ref=ref,
+            use_existing_branch=use_existing_branch,
+            use_graphite=use_graphite,
+        )
+
 
+def _add_worktree_locked(
+    ctx: WorkstackContext,
+    repo_root: Path,
+    path: Path,
+    *,
+    branch: str | None,
+    ref: str | None,
+    use_existing_branch: bool,
+    use_graphite: bool,
+) -> None:
+    """Body of add_worktree(), run while holding the worktrees lock."""
     if branch and use_existing_branch:
         # Validate branch is not already checked out
         existing_path = ctx.git_ops.is_branch_checked_out(repo_root, branch)
@@ -221,18 +254,19 @@ def add_worktree(
                     err=True,
                 )
                 raise SystemExit(1)
-            run_with_error_reporting(
-                ["gt", "create", "--no-interactive", branch],
-                cwd=cwd,
-                error_prefix=f"Failed to create Graphite branch '{branch}'",
-                troubleshooting=[
-                    "Check if branch name is valid",
-                    "Ensure Graphite is properly configured (gt repo init)",
-                    f"Try creating the branch manually: gt create {branch}",
-                    "Disable Graphite: workstack config set use_graphite false",
-                ],
-            )
-            ctx.git_ops.checkout_branch(cwd, original_branch)
+            with repo_lock(ctx, repo_root, GRAPHITE_SCOPE):
+                run_with_error_reporting(
+                    ["gt", "create", "--no-interactive", branch],
+                    cwd=cwd,
+                    error_prefix=f"Failed to create Graphite branch '{branch}'",
+                    troubleshooting=[
+                        "Check if branch name is valid",
+                        "Ensure Graphite is properly configured (gt repo init)",
+                        f"Try creating the branch manually: gt create {branch}",
+                        "Disable Graphite: workstack config set use_graphite false",
+                    ],
+                )
+                ctx.git_ops.checkout_branch(cwd, original_branch)
             ctx.git_ops.add_worktree(repo_root, path, branch=branch, ref=None, create_branch=False)
         else:
             ctx.git_ops.add_worktree(repo_root, path, branch=branch, ref=ref, create_branch=True)
@@ -471,14 +505,15 @@ def create(
             )
             raise SystemExit(1)
 
-        # Check if target branch is available (not checked out in another worktree)
-        checkout_path = ctx.git_ops.is_branch_checked_out(repo.root, to_branch)
-        if checkout_path is not None:
-            # Target branch is in use, fall back to detached HEAD
-            ctx.git_ops.checkout_detached(Path.cwd(), current_branch)
-        else:
-            # Target branch is available, checkout normally
-            ctx.git_ops.checkout_branch(Path.cwd(), to_branch)
+        with repo_lock(ctx, repo.root, WORKTREES_SCOPE):
+            # Check if target branch is available (not checked out in another worktree)
+            checkout_path = ctx.git_ops.is_branch_checked_out(repo.root, to_branch)
+            if checkout_path is not None:
+                # Target branch is in use, fall back to detached HEAD
+                ctx.git_ops.checkout_detached(Path.cwd(), current_branch)
+            else:
+                # Target branch is available, checkout normally
+                ctx.git_ops.checkout_branch(Path.cwd(), to_branch)
 
         # Create worktree with existing branch
         add_worktree(
@@ -521,6 +556,7 @@ def create(
     # Write .env based on config
     env_content = make_env_content(cfg, worktree_path=wt_path, repo_root=repo.root, name=name)
     (wt_path / ".env").write_text(env_content, encoding="utf-8")
+    refresh_completion_index(ctx, repo)
 
     # Move or copy plan file if provided
     if plan_file:
@@ -549,12 +585,12 @@ def create(
             comment="cd to new worktree",
             success_message="✓ Switched to new worktree.",
         )
-        script_path = write_script_to_temp(
+        handoff = script_handoff(
             script_content,
             command_name="create",
             comment=f"cd to {name}",
         )
-        click.echo(str(script_path), nl=False)
+        click.echo(handoff, nl=False)
     else:
         click.echo(f"Created workstack at {wt_path} checked out at branch '{branch}'")
         click.echo(f"\nworkstack switch {name}")
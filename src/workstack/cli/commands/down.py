@@ -3,26 +3,32 @@ from pathlib import Path
 import click
 
 from workstack.cli.commands.switch import (
-    _activate_root_repo,
-    _activate_worktree,
+    _activate_stack_branch,
     _ensure_graphite_enabled,
-    _resolve_down_navigation,
+    _load_stack_position,
+    _resolve_stack_offset,
 )
 from workstack.cli.core import discover_repo_context
-from workstack.cli.graphite import find_worktree_for_branch
 from workstack.core.context import WorkstackContext
 
 
 @click.command("down")
+@click.argument("count", type=click.IntRange(min=1), default=1, required=False)
+@click.option(
+    "--checkout",
+    is_flag=True,
+    help="Check the target branch out in the current worktree if it has no worktree.",
+)
 @click.option(
     "--script", is_flag=True, help="Print only the activation script without usage instructions."
 )
 @click.pass_obj
-def down_cmd(ctx: WorkstackContext, script: bool) -> None:
-    """Move to parent branch in Graphite stack.
+def down_cmd(ctx: WorkstackContext, count: int, checkout: bool, script: bool) -> None:
+    """Move COUNT branches down the Graphite stack (default 1).
 
     With shell integration (recommended):
       workstack down
+      workstack down 3
 
     The shell wrapper function automatically activates the worktree.
     Run 'workstack init --shell' to set up shell integration.
@@ -30,8 +36,9 @@ def down_cmd(ctx: WorkstackContext, script: bool) -> None:
     Without shell integration:
       source <(workstack down --script)
 
-    This will cd to the parent branch's worktree (or root repo if parent is trunk),
-    create/activate .venv, and load .env variables.
+    This will cd to the target branch's worktree (or root repo if the target is trunk),
+    create/activate .venv, and load .env variables. If the target branch has no
+    worktree, --checkout checks it out in the current one instead.
     Requires Graphite to be enabled: 'workstack config set use_graphite true'
     """
     _ensure_graphite_enabled(ctx)
@@ -43,25 +50,18 @@ def down_cmd(ctx: WorkstackContext, script: bool) -> None:
         click.echo("Error: Not currently on a branch (detached HEAD)", err=True)
         raise SystemExit(1)
 
-    # Get all worktrees for checking if target has a worktree
+    # One cache read and one worktree listing, however far the move
+    position = _load_stack_position(ctx, repo, current_branch)
+    target_branch = _resolve_stack_offset(position, -count)
     worktrees = ctx.git_ops.list_worktrees(repo.root)
 
-    # Resolve navigation to get target branch or 'root'
-    target_name = _resolve_down_navigation(ctx, repo, current_branch, worktrees)
-
-    # Check if target_name refers to 'root' which means root repo
-    if target_name == "root":
-        _activate_root_repo(repo, script, "down")
-
-    # Resolve target branch to actual worktree path
-    target_wt_path = find_worktree_for_branch(worktrees, target_name)
-    if target_wt_path is None:
-        # This should not happen because _resolve_down_navigation already checks
-        # But include defensive error handling
-        click.echo(
-            f"Error: Branch '{target_name}' has no worktree. This should not happen.",
-            err=True,
-        )
-        raise SystemExit(1)
-
-    _activate_worktree(repo, target_wt_path, script, "down")
+    _activate_stack_branch(
+        ctx,
+        repo,
+        worktrees,
+        position,
+        target_branch,
+        checkout=checkout,
+        script=script,
+        command_name="down",
+    )
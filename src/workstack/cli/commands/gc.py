@@ -1,9 +1,109 @@
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
 from workstack.cli.core import discover_repo_context, ensure_workstacks_dir
 from workstack.core.context import WorkstackContext
+from workstack.core.merge_detection import collect_merged_branches
+
+
+@dataclass(frozen=True)
+class DeletableWorktree:
+    """A managed worktree whose branch is merged or whose PR is closed.
+
+    Attributes:
+        name: Worktree name
+        branch: Branch checked out in the worktree
+        state: "MERGED" or "CLOSED"
+        pr_number: Number of the branch's PR, or None if the merge was
+            detected locally
+        merged_by: How the branch was found merged locally (one of the
+            merge_detection.MERGED_BY_* constants), or None if a PR said so
+    """
+
+    name: str
+    branch: str
+    state: str
+    pr_number: int | None
+    merged_by: str | None
+
+
+def find_deletable_worktrees(
+    ctx: WorkstackContext,
+    repo_root: Path,
+    candidates: list[tuple[str, str]],
+    *,
+    debug: bool = False,
+    log: Callable[[str], None] = lambda _msg: None,
+    use_graphite_cache: bool = True,
+) -> list[DeletableWorktree]:
+    """Find which worktrees are safe to delete, asking GitHub as little as possible.
+
+    Sources are consulted cheapest first, each only for the branches the
+    previous ones left undecided:
+
+    1. Graphite's local PR cache (when Graphite is enabled)
+    2. Local merge detection against trunk, for all branches at once
+    3. GitHub, one request per remaining branch
+
+    Args:
+        ctx: Workstack context
+        repo_root: Repository root
+        candidates: (worktree name, branch) pairs to check
+        debug: Show the GitHub commands being executed
+        log: Receives progress messages
+        use_graphite_cache: Consult Graphite's PR cache; off while gt sync may
+            be rewriting it
+
+    Returns:
+        Deletable worktrees, in the order of ``candidates``
+    """
+    found: dict[str, DeletableWorktree] = {}
+
+    if use_graphite_cache and ctx.global_config_ops.get_use_graphite():
+        graphite_prs = ctx.graphite_ops.get_prs_from_graphite(ctx.git_ops, repo_root)
+        for name, branch in candidates:
+            pr = graphite_prs.get(branch)
+            if pr is not None and pr.state in ("MERGED", "CLOSED"):
+                log(f"Graphite cache: {name} [{branch}] → state={pr.state}, pr_number={pr.number}")
+                found[name] = DeletableWorktree(name, branch, pr.state, pr.number, None)
+
+    pending = [(name, branch) for name, branch in candidates if name not in found]
+    if pending:
+        merged = collect_merged_branches(
+            ctx.git_ops, repo_root, [branch for _name, branch in pending]
+        )
+        for name, branch in pending:
+            if branch in merged:
+                log(f"Merged locally: {name} [{branch}] → {merged[branch]}")
+                found[name] = DeletableWorktree(name, branch, "MERGED", None, merged[branch])
+
+    for name, branch in candidates:
+        if name in found:
+            continue
+        log(f"Checking PR status for {name} [{branch}]...")
+        state, pr_number, title = ctx.github_ops.get_pr_status(repo_root, branch, debug=debug)
+        log(f"  → state={state}, pr_number={pr_number}, title={title}\n")
+        if state in ("MERGED", "CLOSED") and pr_number is not None:
+            found[name] = DeletableWorktree(name, branch, state, pr_number, None)
+
+    return [found[name] for name, _branch in candidates if name in found]
+
+
+def format_deletable(worktree: DeletableWorktree) -> str:
+    """Format a deletable worktree as one line: name, branch, state and its source."""
+    name_part = click.style(worktree.name, fg="cyan", bold=True)
+    branch_part = click.style(f"[{worktree.branch}]", fg="yellow")
+    state = worktree.state
+    state_part = click.style(state.lower(), fg="green" if state == "MERGED" else "red")
+    if worktree.pr_number is not None:
+        source = f"PR #{worktree.pr_number}"
+    else:
+        source = f"detected locally: {worktree.merged_by}"
+    source_part = click.style(source, fg="bright_black")
+    return f"{name_part} {branch_part} - {state_part} ({source_part})"
 
 
 @click.command("gc")
@@ -18,8 +118,10 @@ from workstack.core.context import WorkstackContext
 def gc_cmd(ctx: WorkstackContext, debug: bool) -> None:
     """List workstacks that are safe to delete (merged/closed PRs).
 
-    Checks each worktree's branch for PRs that have been merged or closed on GitHub.
-    Does not actually delete anything - just prints what could be deleted.
+    Branches already merged into trunk are recognized locally (also after
+    squash and rebase merges); only the remaining branches are checked for
+    merged or closed PRs on GitHub. Does not actually delete anything - just
+    prints what could be deleted.
     """
 
     click.echo("Debug mode is enabled by default while this feature is in development.\n")
@@ -38,8 +140,8 @@ def gc_cmd(ctx: WorkstackContext, debug: bool) -> None:
 
     debug_print(f"Found {len(branches)} worktrees\n")
 
-    # Track workstacks eligible for deletion
-    deletable: list[tuple[str, str, str, int]] = []
+    # Managed worktrees with a branch, as (name, branch)
+    candidates: list[tuple[str, str]] = []
 
     # Check each worktree (skip root repo)
     for wt_path, branch in branches.items():
@@ -61,16 +163,9 @@ def gc_cmd(ctx: WorkstackContext, debug: bool) -> None:
             )
             continue
 
-        # Get PR status
-        debug_print(f"Checking PR status for {wt_path.name} [{branch}]...")
-        state, pr_number, title = ctx.github_ops.get_pr_status(repo.root, branch, debug=debug)
+        candidates.append((wt_path.name, branch))
 
-        debug_print(f"  → state={state}, pr_number={pr_number}, title={title}\n")
-
-        # Check if PR is merged or closed
-        if state in ("MERGED", "CLOSED") and pr_number is not None:
-            name = wt_path.name
-            deletable.append((name, branch, state, pr_number))
+    deletable = find_deletable_worktrees(ctx, repo.root, candidates, debug=debug, log=debug_print)
 
     # Display results
     if not deletable:
@@ -79,12 +174,12 @@ def gc_cmd(ctx: WorkstackContext, debug: bool) -> None:
 
     click.echo("Workstacks safe to delete:\n")
 
-    for name, branch, state, pr_number in deletable:
-        name_part = click.style(name, fg="cyan", bold=True)
-        branch_part = click.style(f"[{branch}]", fg="yellow")
-        state_part = click.style(state.lower(), fg="green" if state == "MERGED" else "red")
-        pr_part = click.style(f"PR #{pr_number}", fg="bright_black")
-        cmd_part = click.style(f"workstack rm {name}", fg="bright_black")
+    for worktree in deletable:
+        cmd_part = click.style(f"workstack rm {worktree.name}", fg="bright_black")
 
-        click.echo(f"  {name_part} {branch_part} - {state_part} ({pr_part})")
+        click.echo(f"  {format_deletable(worktree)}")
         click.echo(f"    → {cmd_part}\n")
+
+    if len(deletable) > 1:
+        names = " ".join(worktree.name for worktree in deletable)
+        click.echo(click.style(f"Remove all at once: workstack rm {names}", fg="bright_black"))
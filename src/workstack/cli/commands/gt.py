@@ -13,6 +13,7 @@ from workstack.cli.core import discover_repo_context
 from workstack.core.branch_metadata import BranchMetadata
 from workstack.core.context import WorkstackContext
 from workstack.core.gitops import GitOps
+from workstack.core.stack_health import BranchHealth, collect_stack_health
 
 
 @click.group("graphite")
@@ -60,20 +61,27 @@ def graphite_branches_cmd(ctx: WorkstackContext, format: str, stack: str | None)
               "parent": null,
               "children": ["feature-1"],
               "is_trunk": true,
-              "commit_sha": "abc123..."
+              "commit_sha": "abc123...",
+              "commits_ahead": null,
+              "needs_restack": false
             }
           ]
         }
 
         $ workstack graphite branches --format tree
         main (abc123f) "Initial commit"
-        ├─ feature-a (def456g) "Add user authentication"
-        │  └─ feature-a-tests (789hij0) "Add tests for auth"
-        └─ feature-b (klm123n) "Refactor database layer"
+        ├─ feature-a (def456g) "Add user authentication" [2 ahead]
+        │  └─ feature-a-tests (789hij0) "Add tests for auth" [1 ahead, needs restack]
+        └─ feature-b (klm123n) "Refactor database layer" [3 ahead]
 
         $ workstack graphite branches --format tree --stack feature-a
-        feature-a (def456g) "Add user authentication"
-        └─ feature-a-tests (789hij0) "Add tests for auth"
+        feature-a (def456g) "Add user authentication" [2 ahead]
+        └─ feature-a-tests (789hij0) "Add tests for auth" [1 ahead, needs restack]
+
+    In json and tree formats every branch reports how many commits it has on
+    top of its parent and whether it needs restacking (its parent's head is
+    no longer an ancestor). This is computed for all branches at once from a
+    single walk of the commit graph.
 
     Requires:
         - Graphite enabled (use_graphite config)
@@ -102,13 +110,27 @@ def graphite_branches_cmd(ctx: WorkstackContext, format: str, stack: str | None)
     branches_dict = ctx.graphite_ops.get_all_branches(ctx.git_ops, repo.root)
 
     if format == "json":
-        # Convert to list of dicts for JSON output
-        branches_list = [asdict(metadata) for metadata in branches_dict.values()]
+        # Convert to list of dicts for JSON output, with stack health per branch
+        health = collect_stack_health(ctx.git_ops, repo.root, branches_dict)
+        branches_list = []
+        for metadata in branches_dict.values():
+            entry = asdict(metadata)
+            branch_health = health.get(metadata.name)
+            entry["commits_ahead"] = (
+                branch_health.commits_ahead if branch_health is not None else None
+            )
+            entry["needs_restack"] = (
+                branch_health.needs_restack if branch_health is not None else False
+            )
+            branches_list.append(entry)
         output = {"branches": branches_list}
         click.echo(json.dumps(output, indent=2))
     elif format == "tree":
-        # Tree format: hierarchical display with commit info
-        output = _format_branches_as_tree(branches_dict, ctx.git_ops, repo.root, root_branch=stack)
+        # Tree format: hierarchical display with commit info and stack health
+        health = collect_stack_health(ctx.git_ops, repo.root, branches_dict)
+        output = _format_branches_as_tree(
+            branches_dict, ctx.git_ops, repo.root, root_branch=stack, health=health
+        )
         click.echo(output)
     else:
         # Text format: simple list of branch names
@@ -122,6 +144,7 @@ def _format_branches_as_tree(
     repo_root: Path,
     *,
     root_branch: str | None,
+    health: dict[str, BranchHealth] | None = None,
 ) -> str:
     """Format branches as a hierarchical tree.
 
@@ -130,6 +153,8 @@ def _format_branches_as_tree(
         git_ops: GitOps instance for retrieving commit messages
         repo_root: Repository root path
         root_branch: Optional branch to use as root (shows only this branch and descendants)
+        health: Precomputed stack health per branch; supplies commit subjects and
+            adds commits-ahead / needs-restack annotations when given
 
     Returns:
         Multi-line string with tree visualization
@@ -160,6 +185,7 @@ def _format_branches_as_tree(
             prefix="",
             is_last=is_last_root,
             is_root=True,
+            health=health,
         )
 
     return "\n".join(lines)
@@ -174,6 +200,7 @@ def _format_branch_recursive(
     prefix: str,
     is_last: bool,
     is_root: bool,
+    health: dict[str, BranchHealth] | None = None,
 ) -> None:
     """Recursively format a branch and its children.
 
@@ -186,6 +213,7 @@ def _format_branch_recursive(
         prefix: Prefix string for indentation
         is_last: True if this is the last child of its parent
         is_root: True if this is a root node
+        health: Precomputed stack health per branch (optional)
     """
     if branch_name not in branches:
         return
@@ -194,13 +222,22 @@ def _format_branch_recursive(
 
     # Get commit info
     short_sha = metadata.commit_sha[:7] if metadata.commit_sha else "unknown"
-    commit_message = (
-        git_ops.get_commit_message(repo_root, metadata.commit_sha) or "No commit message"
-    )
+    branch_health = health.get(branch_name) if health is not None else None
+    if branch_health is not None and branch_health.subject:
+        commit_message = branch_health.subject
+    else:
+        commit_message = (
+            git_ops.get_commit_message(repo_root, metadata.commit_sha) or "No commit message"
+        )
 
     # Format current line
     connector = "└─" if is_last else "├─"
     branch_info = f'{branch_name} ({short_sha}) "{commit_message}"'
+    if branch_health is not None and branch_health.commits_ahead is not None:
+        annotation = f"{branch_health.commits_ahead} ahead"
+        if branch_health.needs_restack:
+            annotation += ", needs restack"
+        branch_info += f" [{annotation}]"
 
     if is_root:
         # Root node: no connector
@@ -233,4 +270,5 @@ def _format_branch_recursive(
                 prefix=child_prefix,
                 is_last=is_last_child,
                 is_root=False,
+                health=health,
             )
@@ -6,10 +6,16 @@ from pathlib import Path
 import click
 
 from workstack.cli.activation import render_activation_script
-from workstack.cli.core import discover_repo_context
+from workstack.cli.core import (
+    WORKTREES_SCOPE,
+    discover_repo_context,
+    list_completion_branches,
+    refresh_completion_index,
+    repo_lock,
+)
 from workstack.cli.graphite import find_worktrees_containing_branch, get_branch_stack
-from workstack.cli.shell_utils import write_script_to_temp
-from workstack.core.context import WorkstackContext
+from workstack.cli.shell_utils import script_handoff
+from workstack.core.context import WorkstackContext, create_context
 from workstack.core.gitops import WorktreeInfo
 
 
@@ -72,7 +78,8 @@ def _perform_jump(
     # If we need to checkout, do it before generating the activation script
     if need_checkout:
         # Checkout the branch in the target worktree
-        ctx.git_ops.checkout_branch(target_path, branch)
+        with repo_lock(ctx, repo_root, WORKTREES_SCOPE):
+            ctx.git_ops.checkout_branch(target_path, branch)
 
         # Show stack context
         if not script:
@@ -94,12 +101,12 @@ def _perform_jump(
             worktree_path=target_path, final_message=jump_message
         )
 
-        script_path = write_script_to_temp(
+        handoff = script_handoff(
             script_content,
             command_name="jump",
             comment=f"jump to {branch}",
         )
-        click.echo(str(script_path), nl=False)
+        click.echo(handoff, nl=False)
     else:
         # No shell integration available, show manual instructions
         click.echo(
@@ -109,8 +116,38 @@ def _perform_jump(
         click.echo(f"\nOr use: source <(workstack jump {branch} --script)")
 
 
+def complete_branch_names(
+    ctx: click.Context, param: click.Parameter | None, incomplete: str
+) -> list[str]:
+    """Shell completion for branch names, local and Graphite-tracked.
+
+    This is a shell completion function, which is an acceptable error boundary:
+    if completion fails, an empty list is returned rather than breaking the
+    user's shell.
+
+    Args:
+        ctx: Click context
+        param: Click parameter (unused, but required by Click's completion protocol)
+        incomplete: Partial input string to complete
+    """
+    try:
+        workstack_ctx = ctx.find_root().obj
+        if workstack_ctx is None:
+            workstack_ctx = create_context(dry_run=False)
+
+        repo = discover_repo_context(workstack_ctx, Path.cwd())
+        branches = list_completion_branches(workstack_ctx, repo)
+
+        # The fast path in workstack.main() declined; rebuild its index
+        refresh_completion_index(workstack_ctx, repo)
+        return [branch for branch in branches if branch.startswith(incomplete)]
+    except Exception:
+        # Shell completion error boundary: return empty list for graceful degradation
+        return []
+
+
 @click.command("jump")
-@click.argument("branch", metavar="BRANCH")
+@click.argument("branch", metavar="BRANCH", shell_complete=complete_branch_names)
 @click.option(
     "--script", is_flag=True, help="Print only the activation script without usage instructions."
 )
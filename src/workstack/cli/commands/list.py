@@ -1,11 +1,20 @@
 from pathlib import Path
+from typing import Any
 
 import click
 
-from workstack.cli.core import discover_repo_context, ensure_workstacks_dir
-from workstack.cli.graphite import _load_graphite_cache, get_branch_stack
+from workstack.cli.core import discover_repo_context, ensure_workstacks_dir, list_worktree_dirs
+from workstack.cli.graphite import (
+    BranchInfo,
+    _load_graphite_cache,
+    parse_branch_info,
+    stack_from_branch_info,
+)
+from workstack.cli.records import OUTPUT_FORMATS, RecordWriter, load_pr_map, pr_record
 from workstack.core.context import WorkstackContext
 from workstack.core.github_ops import PullRequestInfo
+from workstack.core.plan_index import PLAN_FILENAME, PlanIndex
+from workstack.core.worktree_status import WorktreeStatusSummary, collect_worktree_summaries
 
 
 def _format_worktree_line(
@@ -47,11 +56,57 @@ def _format_worktree_line(
     return line
 
 
+def _format_status_summary(summary: WorktreeStatusSummary | None) -> str:
+    """Format the --status columns: dirty marker and ahead/behind counts.
+
+    Counts of zero are omitted, so an up-to-date clean worktree adds nothing.
+
+    Args:
+        summary: Status summary for the worktree, or None if unavailable
+
+    Returns:
+        Suffix starting with a space, or empty string
+    """
+    if summary is None:
+        return ""
+
+    parts: list[str] = []
+    if summary.dirty:
+        parts.append(click.style("*", fg="red", bold=True))
+
+    if summary.upstream is not None:
+        counts = _format_ahead_behind(summary.upstream, up="⇡", down="⇣")
+        if counts:
+            parts.append(click.style(counts, fg="bright_blue"))
+
+    if summary.parent is not None and summary.parent_ahead_behind is not None:
+        counts = _format_ahead_behind(summary.parent_ahead_behind, up="↑", down="↓")
+        if counts:
+            label = click.style(f"vs {summary.parent}", fg="white", dim=True)
+            parts.append(f"{click.style(counts, fg='magenta')} {label}")
+
+    if not parts:
+        return ""
+    return " " + " ".join(parts)
+
+
+def _format_ahead_behind(counts: tuple[int, int], *, up: str, down: str) -> str:
+    """Format (ahead, behind) as e.g. "↑2 ↓1", omitting zero counts."""
+    ahead, behind = counts
+    parts = []
+    if ahead:
+        parts.append(f"{up}{ahead}")
+    if behind:
+        parts.append(f"{down}{behind}")
+    return " ".join(parts)
+
+
 def _filter_stack_for_worktree(
     stack: list[str],
     current_worktree_path: Path,
     all_worktree_branches: dict[Path, str | None],
     is_root_worktree: bool,
+    checked_out_branches: set[str] | None = None,
 ) -> list[str]:
     """Filter a graphite stack to only show branches relevant to the current worktree.
 
@@ -78,6 +133,8 @@ def _filter_stack_for_worktree(
         current_worktree_path: Path to the worktree we're displaying the stack for
         all_worktree_branches: Mapping of all worktree paths to their checked-out branches
         is_root_worktree: True if this is the root repository worktree
+        checked_out_branches: Branches checked out in any worktree, precomputed
+            by callers filtering many stacks (computed here if None)
 
     Returns:
         Filtered stack with only relevant branches
@@ -99,9 +156,11 @@ def _filter_stack_for_worktree(
     else:
         # Non-root worktree: show ancestors + current + descendants with worktrees
         # Build a set of branches that are checked out in ANY worktree
-        all_checked_out_branches = {
-            branch for branch in all_worktree_branches.values() if branch is not None
-        }
+        all_checked_out_branches = checked_out_branches
+        if all_checked_out_branches is None:
+            all_checked_out_branches = {
+                branch for branch in all_worktree_branches.values() if branch is not None
+            }
 
         result = []
         for i, branch in enumerate(stack):
@@ -222,22 +281,20 @@ def _format_pr_info(
     return f"{emoji} {clickable_link}"
 
 
-def _format_plan_summary(worktree_path: Path) -> str | None:
+def _format_plan_summary(worktree_path: Path, plan_index: PlanIndex) -> str | None:
     """Format plan summary line if .PLAN.md exists.
 
     Args:
         worktree_path: Path to the worktree directory
+        plan_index: Shared plan metadata index
 
     Returns:
         Formatted line with plan title, or None if no plan file
     """
-    from workstack.core.file_utils import extract_plan_title
-
-    plan_path = worktree_path / ".PLAN.md"
-    title = extract_plan_title(plan_path)
-
-    if title is None:
+    metadata = plan_index.get(worktree_path / PLAN_FILENAME)
+    if metadata is None or metadata.title is None:
         return None
+    title = metadata.title
 
     # Format: "  📋 <title in bright magenta>"
     title_colored = click.style(title, fg="bright_magenta")
@@ -251,7 +308,8 @@ def _display_branch_stack(
     branch: str,
     all_branches: dict[Path, str | None],
     is_root_worktree: bool,
-    cache_data: dict | None = None,  # If None, cache will be loaded from disk
+    branch_graph: dict[str, BranchInfo],
+    checked_out_branches: set[str],
     prs: dict[str, PullRequestInfo] | None = None,  # If None, no PR info displayed
 ) -> None:
     """Display the graphite stack for a worktree with colorization and PR info.
@@ -264,28 +322,26 @@ def _display_branch_stack(
         ctx: Workstack context with git operations
         repo_root: Path to the repository root
         worktree_path: Path to the current worktree
-        branch: Branch name to display stack for
+        branch: Branch checked out in the worktree
         all_branches: Mapping of all worktree paths to their checked-out branches
-        cache_data: Pre-loaded graphite cache data (if None, loaded from disk)
+        is_root_worktree: True if this is the root repository worktree
+        branch_graph: Graphite branch graph, parsed once for all worktrees
+        checked_out_branches: Branches checked out in any worktree
         prs: Mapping of branch names to PR information (if None, no PR info displayed)
     """
-    stack = get_branch_stack(ctx, repo_root, branch)
+    stack = stack_from_branch_info(branch_graph, branch)
     if not stack:
         return
 
     filtered_stack = _filter_stack_for_worktree(
-        stack, worktree_path, all_branches, is_root_worktree
+        stack, worktree_path, all_branches, is_root_worktree, checked_out_branches
     )
     if not filtered_stack:
         return
 
-    # Determine which branch to highlight
-    actual_branch = ctx.git_ops.get_current_branch(worktree_path)
-    highlight_branch = actual_branch if actual_branch else branch
-
     # Display stack with colored markers and PR info
     for branch_name in reversed(filtered_stack):
-        is_current = branch_name == highlight_branch
+        is_current = branch_name == branch
 
         if is_current:
             # Current branch: bright green marker + bright green bold text
@@ -309,128 +365,307 @@ def _display_branch_stack(
         click.echo(line)
 
 
-def _list_worktrees(ctx: WorkstackContext, show_stacks: bool, show_checks: bool) -> None:
-    """Internal function to list worktrees."""
+def _list_worktrees(
+    ctx: WorkstackContext,
+    show_stacks: bool,
+    show_checks: bool,
+    show_status: bool = False,
+    output_format: str = "text",
+) -> None:
+    """Internal function to list worktrees.
+
+    Everything that is shared between entries is computed once up front: the
+    worktree list (indexed by resolved path), the Graphite branch graph and the
+    PR map. Each entry is then rendered with dictionary lookups only, so the
+    cost grows linearly with the number of worktrees.
+
+    With a structured output format, each entry is written as a record as
+    soon as it is computed and no text styling is done.
+    """
     repo = discover_repo_context(ctx, Path.cwd())
     current_dir = Path.cwd().resolve()
+    structured = output_format != "text"
 
     # Get branch info for all worktrees
     worktrees = ctx.git_ops.list_worktrees(repo.root)
     branches = {wt.path: wt.branch for wt in worktrees}
+    checked_out_branches = {branch for branch in branches.values() if branch is not None}
+
+    # Index worktrees by resolved path, resolving each path exactly once
+    worktrees_by_resolved: dict[Path, tuple[Path, str | None]] = {}
+    for wt_path, wt_branch in branches.items():
+        if wt_path.exists():
+            worktrees_by_resolved[wt_path.resolve()] = (wt_path, wt_branch)
 
     # Determine which worktree the user is currently in
     current_worktree_path = None
-    for wt_path in branches.keys():
-        if wt_path.exists():
-            wt_path_resolved = wt_path.resolve()
-            if current_dir == wt_path_resolved or current_dir.is_relative_to(wt_path_resolved):
-                current_worktree_path = wt_path_resolved
-                break
-
-    # Load graphite cache once if showing stacks
-    cache_data = None
-    if show_stacks:
-        if not ctx.global_config_ops.get_use_graphite():
-            click.echo(
-                "Error: --stacks requires graphite to be enabled. "
-                "Run 'workstack config set use_graphite true'",
-                err=True,
-            )
-            raise SystemExit(1)
-
-        # Load cache once for all worktrees
-        git_dir = ctx.git_ops.get_git_common_dir(repo.root)
-        if git_dir is not None:
-            cache_file = git_dir / ".graphite_cache_persist"
-            if cache_file.exists():
-                cache_data = _load_graphite_cache(cache_file)
-
-    # Fetch PR information based on config and flags
-    prs: dict[str, PullRequestInfo] | None = None
-    if ctx.global_config_ops.get_show_pr_info():
-        # Determine if we need CI check status
-        need_checks = show_checks or ctx.global_config_ops.get_show_pr_checks()
-
-        if need_checks:
-            # Fetch from GitHub with check status (slower)
-            prs = ctx.github_ops.get_prs_for_repo(repo.root, include_checks=True)
-        else:
-            # Try Graphite first (fast - no CI status)
-            prs = ctx.graphite_ops.get_prs_from_graphite(ctx.git_ops, repo.root)
+    for wt_path_resolved in worktrees_by_resolved:
+        if current_dir == wt_path_resolved or current_dir.is_relative_to(wt_path_resolved):
+            current_worktree_path = wt_path_resolved
+            break
+
+    # Load graphite cache once for stacks and parent-relative status
+    if show_stacks and not ctx.global_config_ops.get_use_graphite():
+        click.echo(
+            "Error: --stacks requires graphite to be enabled. "
+            "Run 'workstack config set use_graphite true'",
+            err=True,
+        )
+        raise SystemExit(1)
+
+    # Structured records always carry stacks and plan titles
+    needs_stacks = show_stacks or structured
+    git_common_dir = None
+    if needs_stacks or show_status:
+        git_common_dir = ctx.git_ops.get_git_common_dir(repo.root)
+
+    branch_graph: dict[str, BranchInfo] = {}
+    if (needs_stacks or show_status) and ctx.global_config_ops.get_use_graphite():
+        branch_graph = _load_branch_graph(git_common_dir)
+
+    # Plan titles come from the shared index, so unchanged plans are not re-read
+    plan_index = PlanIndex.load(git_common_dir) if needs_stacks else PlanIndex(None, {})
+
+    # Dirty and ahead/behind state for every worktree, gathered in bulk
+    summaries: dict[Path, WorktreeStatusSummary] = {}
+    if show_status:
+        parents = {name: info["parent"] for name, info in branch_graph.items()}
+        summaries = collect_worktree_summaries(
+            ctx.git_ops, repo.root, list(branches.items()), parents
+        )
 
-            # If Graphite data not available, fall back to GitHub without checks
-            if not prs:
-                prs = ctx.github_ops.get_prs_for_repo(repo.root, include_checks=False)
+    prs = load_pr_map(ctx, repo.root, show_checks=show_checks)
+
+    writer = RecordWriter(output_format) if structured else None
 
     # Show root repo first (display as "root" to distinguish from worktrees)
     root_branch = branches.get(repo.root)
     is_current_root = repo.root.resolve() == current_worktree_path
-    click.echo(
-        _format_worktree_line(
-            "root", root_branch, path=str(repo.root), is_root=True, is_current=is_current_root
+    if writer is not None:
+        writer.write(
+            _worktree_record(
+                ctx,
+                "root",
+                repo.root,
+                root_branch,
+                is_root=True,
+                is_current=is_current_root,
+                all_branches=branches,
+                branch_graph=branch_graph,
+                checked_out_branches=checked_out_branches,
+                prs=prs,
+                plan_index=plan_index,
+                summary=summaries.get(repo.root),
+                show_status=show_status,
+            )
+        )
+    else:
+        click.echo(
+            _format_worktree_line(
+                "root", root_branch, path=str(repo.root), is_root=True, is_current=is_current_root
+            )
+            + _format_status_summary(summaries.get(repo.root))
         )
-    )
 
-    # Add plan summary if exists (only when showing stacks)
-    if show_stacks:
-        plan_summary = _format_plan_summary(repo.root)
-        if plan_summary:
-            click.echo(plan_summary)
+        # Add plan summary if exists (only when showing stacks)
+        if show_stacks:
+            plan_summary = _format_plan_summary(repo.root, plan_index)
+            if plan_summary:
+                click.echo(plan_summary)
 
-    if show_stacks and root_branch:
-        _display_branch_stack(
-            ctx, repo.root, repo.root, root_branch, branches, True, cache_data, prs
-        )
+        if show_stacks and root_branch:
+            _display_branch_stack(
+                ctx,
+                repo.root,
+                repo.root,
+                root_branch,
+                branches,
+                True,
+                branch_graph,
+                checked_out_branches,
+                prs,
+            )
 
     # Show worktrees
     workstacks_dir = ensure_workstacks_dir(repo)
-    if not workstacks_dir.exists():
-        return
-    entries = sorted(p for p in workstacks_dir.iterdir() if p.is_dir())
-    for p in entries:
+    entries = sorted(list_worktree_dirs(workstacks_dir))
+    for index, p in enumerate(entries):
         name = p.name
         # Find the actual worktree path from git worktree list
         # The path p might be a symlink or different from the actual worktree path
-        wt_path = None
-        wt_branch = None
-        for branch_path, branch_name in branches.items():
-            if branch_path.resolve() == p.resolve():
-                wt_path = branch_path
-                wt_branch = branch_name
-                break
+        p_resolved = p.resolve()
+        wt_path, wt_branch = worktrees_by_resolved.get(p_resolved, (None, None))
+        is_current_wt = wt_path is not None and p_resolved == current_worktree_path
+        summary = summaries.get(wt_path) if wt_path is not None else None
+
+        if writer is not None:
+            writer.write(
+                _worktree_record(
+                    ctx,
+                    name,
+                    wt_path if wt_path is not None else p,
+                    wt_branch,
+                    is_root=False,
+                    is_current=is_current_wt,
+                    all_branches=branches,
+                    branch_graph=branch_graph,
+                    checked_out_branches=checked_out_branches,
+                    prs=prs,
+                    plan_index=plan_index,
+                    summary=summary,
+                    show_status=show_status,
+                )
+            )
+            continue
 
         # Add blank line before each worktree (except first) when showing stacks
-        if show_stacks and (root_branch or entries.index(p) > 0):
+        if show_stacks and (root_branch or index > 0):
             click.echo()
 
-        is_current_wt = bool(wt_path and wt_path.resolve() == current_worktree_path)
         click.echo(
             _format_worktree_line(
                 name, wt_branch, path=str(p), is_root=False, is_current=is_current_wt
             )
+            + _format_status_summary(summary)
         )
 
         # Add plan summary if exists (only when showing stacks)
         if show_stacks and wt_path:
-            plan_summary = _format_plan_summary(wt_path)
+            plan_summary = _format_plan_summary(wt_path, plan_index)
             if plan_summary:
                 click.echo(plan_summary)
 
         if show_stacks and wt_branch and wt_path:
             _display_branch_stack(
-                ctx, repo.root, wt_path, wt_branch, branches, False, cache_data, prs
+                ctx,
+                repo.root,
+                wt_path,
+                wt_branch,
+                branches,
+                False,
+                branch_graph,
+                checked_out_branches,
+                prs,
+            )
+
+    if writer is not None:
+        writer.close()
+    plan_index.save()
+
+
+def _worktree_record(
+    ctx: WorkstackContext,
+    name: str,
+    path: Path,
+    branch: str | None,
+    *,
+    is_root: bool,
+    is_current: bool,
+    all_branches: dict[Path, str | None],
+    branch_graph: dict[str, BranchInfo],
+    checked_out_branches: set[str],
+    prs: dict[str, PullRequestInfo] | None,
+    plan_index: PlanIndex,
+    summary: WorktreeStatusSummary | None,
+    show_status: bool,
+) -> dict[str, Any]:
+    """Build the structured-output record for one worktree.
+
+    The stack is the same filtered list of branches that --stacks displays,
+    ordered from trunk to the tip.
+    """
+    stack = None
+    if branch is not None:
+        full_stack = stack_from_branch_info(branch_graph, branch)
+        if full_stack:
+            stack = _filter_stack_for_worktree(
+                full_stack, path, all_branches, is_root, checked_out_branches
             )
 
+    pr = prs.get(branch) if prs is not None and branch is not None else None
+    plan = plan_index.get(path / PLAN_FILENAME) if path.exists() else None
+
+    record: dict[str, Any] = {
+        "name": name,
+        "path": str(path),
+        "branch": branch,
+        "is_root": is_root,
+        "is_current": is_current,
+        "stack": stack,
+        "pr": pr_record(ctx, pr),
+        "plan_title": plan.title if plan is not None else None,
+    }
+    if show_status:
+        record["status"] = _status_record(summary)
+    return record
+
+
+def _status_record(summary: WorktreeStatusSummary | None) -> dict[str, Any] | None:
+    """Convert a --status summary into its structured-output form."""
+    if summary is None:
+        return None
+    upstream = summary.upstream
+    parent_counts = summary.parent_ahead_behind
+    return {
+        "dirty": summary.dirty,
+        "upstream_ahead": upstream[0] if upstream is not None else None,
+        "upstream_behind": upstream[1] if upstream is not None else None,
+        "parent": summary.parent,
+        "parent_ahead": parent_counts[0] if parent_counts is not None else None,
+        "parent_behind": parent_counts[1] if parent_counts is not None else None,
+    }
+
+
+def _load_branch_graph(git_dir: Path | None) -> dict[str, BranchInfo]:
+    """Load and parse the Graphite branch graph, or return an empty graph if absent."""
+    if git_dir is None:
+        return {}
+
+    cache_file = git_dir / ".graphite_cache_persist"
+    if not cache_file.exists():
+        return {}
+    return parse_branch_info(_load_graphite_cache(cache_file))
+
 
 @click.command("list")
 @click.option("--stacks", "-s", is_flag=True, help="Show graphite stacks for each worktree")
 @click.option(
     "--checks", "-c", is_flag=True, help="Show CI check status (requires GitHub API call)"
 )
+@click.option(
+    "--status",
+    "show_status",
+    is_flag=True,
+    help="Show dirty marker and ahead/behind vs upstream and Graphite parent",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="text",
+    help="Output format; json and ndjson stream one record per worktree",
+)
 @click.pass_obj
-def list_cmd(ctx: WorkstackContext, stacks: bool, checks: bool) -> None:
-    """List worktrees with activation hints (alias: ls)."""
-    _list_worktrees(ctx, show_stacks=stacks, show_checks=checks)
+def list_cmd(
+    ctx: WorkstackContext, stacks: bool, checks: bool, show_status: bool, output_format: str
+) -> None:
+    """List worktrees with activation hints (alias: ls).
+
+    With --status, each worktree shows a red * when it has uncommitted
+    changes, ⇡/⇣ commit counts versus its upstream, and ↑/↓ counts versus its
+    Graphite parent.
+
+    With --format json or ndjson, one record per worktree is written as soon
+    as it is computed: name, path, branch, is_root, is_current, stack (trunk
+    first), pr, plan_title and, with --status, status.
+    """
+    _list_worktrees(
+        ctx,
+        show_stacks=stacks,
+        show_checks=checks,
+        show_status=show_status,
+        output_format=output_format,
+    )
 
 
 # Register ls as a hidden alias (won't show in help)
@@ -439,7 +674,28 @@ def list_cmd(ctx: WorkstackContext, stacks: bool, checks: bool) -> None:
 @click.option(
     "--checks", "-c", is_flag=True, help="Show CI check status (requires GitHub API call)"
 )
+@click.option(
+    "--status",
+    "show_status",
+    is_flag=True,
+    help="Show dirty marker and ahead/behind vs upstream and Graphite parent",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="text",
+    help="Output format; json and ndjson stream one record per worktree",
+)
 @click.pass_obj
-def ls_cmd(ctx: WorkstackContext, stacks: bool, checks: bool) -> None:
+def ls_cmd(
+    ctx: WorkstackContext, stacks: bool, checks: bool, show_status: bool, output_format: str
+) -> None:
     """List worktrees with activation hints (alias of 'list')."""
-    _list_worktrees(ctx, show_stacks=stacks, show_checks=checks)
+    _list_worktrees(
+        ctx,
+        show_stacks=stacks,
+        show_checks=checks,
+        show_status=show_status,
+        output_format=output_format,
+    )
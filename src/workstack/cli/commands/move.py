@@ -1,14 +1,28 @@
 """Move branches between worktrees with explicit source specification."""
 
+import os
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import click
 
+from workstack.cli.commands.create import make_env_content
 from workstack.cli.commands.switch import complete_worktree_names
-from workstack.cli.core import discover_repo_context, ensure_workstacks_dir, worktree_path_for
+from workstack.cli.config import load_config
+from workstack.cli.core import (
+    WORKTREES_SCOPE,
+    discover_repo_context,
+    ensure_workstacks_dir,
+    refresh_completion_index,
+    repo_lock,
+    worktree_path_for,
+)
 from workstack.core.context import WorkstackContext
 
+# Virtualenv directory that stays in place when worktree directories are swapped
+VENV_DIRNAME = ".venv"
+
 
 def _get_worktree_branch(ctx: WorkstackContext, repo_root: Path, wt_path: Path) -> str | None:
     """Get the branch checked out in a worktree.
@@ -217,36 +231,145 @@ def execute_move(
     # 2. Create/checkout source_branch in target worktree
     # 3. Checkout fallback_ref in source worktree
     click.echo(f"Moving '{source_branch}' from '{source_wt.name}' to '{target_wt.name}'")
-    ctx.git_ops.checkout_detached(source_wt, source_branch)
+    with repo_lock(ctx, repo_root, WORKTREES_SCOPE):
+        ctx.git_ops.checkout_detached(source_wt, source_branch)
+
+        if target_exists:
+            # Target exists - check for uncommitted changes
+            if _has_uncommitted_changes(target_wt) and not force:
+                click.echo(
+                    f"Error: Uncommitted changes in target worktree '{target_wt.name}'.\n"
+                    f"Commit, stash, or use --force to override.",
+                    err=True,
+                )
+                raise SystemExit(1)
+
+            # Checkout branch in existing target
+            ctx.git_ops.checkout_branch(target_wt, source_branch)
+        else:
+            # Create new worktree with branch
+            ctx.git_ops.add_worktree(
+                repo_root, target_wt, branch=source_branch, ref=None, create_branch=False
+            )
+
+        # Check if fallback_ref is already checked out elsewhere, and detach it if needed
+        fallback_wt = ctx.git_ops.is_branch_checked_out(repo_root, fallback_ref)
+        if fallback_wt is not None and fallback_wt.resolve() != source_wt.resolve():
+            # Fallback branch is checked out in another worktree, detach it first
+            ctx.git_ops.checkout_detached(fallback_wt, fallback_ref)
+
+        # Switch source to fallback branch
+        ctx.git_ops.checkout_branch(source_wt, fallback_ref)
+
+    click.echo(f"✓ Moved '{source_branch}' from '{source_wt.name}' to '{target_wt.name}'")
+
+
+def _swap_directories(
+    ctx: WorkstackContext, repo_root: Path, source_wt: Path, target_wt: Path
+) -> None:
+    """Swap two worktree directories with `git worktree move`, via a parking name.
 
-    if target_exists:
-        # Target exists - check for uncommitted changes
-        if _has_uncommitted_changes(target_wt) and not force:
+    Each branch keeps its working tree, so nothing is checked out. Stops
+    with an error if git refuses a move (e.g. a locked worktree or one with
+    submodules), after undoing the moves already made.
+    """
+    parking = source_wt.with_name(f".{source_wt.name}.swapping")
+    moves = [(source_wt, parking), (target_wt, source_wt), (parking, target_wt)]
+    # Where the directory of each worktree currently is
+    locations = {source_wt: source_wt, target_wt: target_wt}
+
+    def apply(old_path: Path, new_path: Path) -> None:
+        ctx.git_ops.move_worktree(repo_root, old_path, new_path)
+        for origin, location in locations.items():
+            if location == old_path:
+                locations[origin] = new_path
+
+    done: list[tuple[Path, Path]] = []
+    for old_path, new_path in moves:
+        # Error boundary: whether git accepts the move (locks, submodules) is
+        # only known by trying it; earlier moves are then rolled back.
+        try:
+            apply(old_path, new_path)
+        except subprocess.CalledProcessError:
+            click.echo(f"Error: git worktree move {old_path} {new_path} failed.", err=True)
+            _undo_moves(apply, done, locations)
+            click.echo("Retry with --swap-by checkout.", err=True)
+            raise SystemExit(1) from None
+        done.append((old_path, new_path))
+
+    _swap_venvs(ctx, source_wt, target_wt)
+
+    # .env files moved with their directories and name the old location
+    cfg = load_config(source_wt.parent)
+    for wt_path in (source_wt, target_wt):
+        env_content = make_env_content(
+            cfg, worktree_path=wt_path, repo_root=repo_root, name=wt_path.name
+        )
+        env_file = wt_path / ".env"
+        if ctx.dry_run:
+            click.echo(f"[DRY RUN] Would write .env file: {env_file}", err=True)
+        else:
+            env_file.write_text(env_content, encoding="utf-8")
+
+
+def _undo_moves(
+    apply: Callable[[Path, Path], None],
+    done: list[tuple[Path, Path]],
+    locations: dict[Path, Path],
+) -> None:
+    """Roll back directory moves, reporting where everything is if that fails too."""
+    for undo_old, undo_new in reversed(done):
+        # Error boundary: the rollback can fail for the same reasons as the
+        # move; the user then has to finish it, so say where things are.
+        try:
+            apply(undo_new, undo_old)
+        except subprocess.CalledProcessError:
             click.echo(
-                f"Error: Uncommitted changes in target worktree '{target_wt.name}'.\n"
-                f"Commit, stash, or use --force to override.",
+                f"Error: Undoing the swap failed too (git worktree move {undo_new} {undo_old}).\n"
+                "The worktree directories are now at:",
                 err=True,
             )
-            raise SystemExit(1)
+            for origin, location in locations.items():
+                click.echo(f"  {origin.name}: {location}", err=True)
+            click.echo("Move them back with git worktree move.", err=True)
+            raise SystemExit(1) from None
 
-        # Checkout branch in existing target
-        ctx.git_ops.checkout_branch(target_wt, source_branch)
-    else:
-        # Create new worktree with branch
-        ctx.git_ops.add_worktree(
-            repo_root, target_wt, branch=source_branch, ref=None, create_branch=False
-        )
 
-    # Check if fallback_ref is already checked out elsewhere, and detach it if needed
-    fallback_wt = ctx.git_ops.is_branch_checked_out(repo_root, fallback_ref)
-    if fallback_wt is not None and fallback_wt.resolve() != source_wt.resolve():
-        # Fallback branch is checked out in another worktree, detach it first
-        ctx.git_ops.checkout_detached(fallback_wt, fallback_ref)
+def _swap_venvs(ctx: WorkstackContext, source_wt: Path, target_wt: Path) -> None:
+    """Put each .venv back in the directory it was created for.
 
-    # Switch source to fallback branch
-    ctx.git_ops.checkout_branch(source_wt, fallback_ref)
-
-    click.echo(f"✓ Moved '{source_branch}' from '{source_wt.name}' to '{target_wt.name}'")
+    A virtualenv is not relocatable: script shebangs, VIRTUAL_ENV in its
+    activate scripts and editable-install .pth entries are absolute paths. After
+    a directory swap each .venv would point into the other worktree, so the
+    venvs trade places too and stay where they were built.
+    """
+    venvs = [source_wt / VENV_DIRNAME, target_wt / VENV_DIRNAME]
+    if not any(venv.exists() or venv.is_symlink() for venv in venvs):
+        return
+
+    if ctx.dry_run:
+        click.echo(f"[DRY RUN] Would swap {venvs[0]} and {venvs[1]}", err=True)
+        return
+
+    parking = source_wt / f".{VENV_DIRNAME}.swapping"
+    moves = [(venvs[0], parking), (venvs[1], venvs[0]), (parking, venvs[1])]
+    # Error boundary: a rename can fail (permissions, a process holding files
+    # on platforms that care); the venvs are then only warned about.
+    try:
+        for old_path, new_path in moves:
+            if old_path.exists() or old_path.is_symlink():
+                os.rename(old_path, new_path)
+    except OSError as e:
+        click.echo(
+            f"Warning: Could not move .venv back to where it was created ({e}).\n"
+            "Its scripts and editable installs point into the other worktree; recreate it.",
+            err=True,
+        )
+        return
+    click.echo(
+        "Kept each .venv in place (virtualenvs cannot be moved); re-sync dependencies "
+        "if the branches need different ones."
+    )
 
 
 def execute_swap(
@@ -256,10 +379,18 @@ def execute_swap(
     target_wt: Path,
     *,
     force: bool,
+    by_directory: bool = False,
 ) -> None:
     """Execute swap operation (both worktrees exist with branches).
 
-    Swaps the branches between source and target worktrees.
+    Swaps the branches between source and target worktrees. By default both
+    branches are checked out again, rewriting every file that differs between
+    them, twice. With ``by_directory`` the worktree directories trade places
+    instead, so each branch keeps its files, build outputs and environment,
+    and uncommitted changes travel with their branch. A .venv records absolute
+    paths, so it stays in its directory instead. A shell inside a swapped
+    worktree moves along with it. The root worktree cannot be moved, so swaps
+    involving it always check out.
     """
     source_branch = _get_worktree_branch(ctx, repo_root, source_wt)
     target_branch = _get_worktree_branch(ctx, repo_root, target_wt)
@@ -268,8 +399,16 @@ def execute_swap(
         click.echo("Error: Both worktrees must have branches checked out for swap", err=True)
         raise SystemExit(1)
 
-    # Check for uncommitted changes
-    if _has_uncommitted_changes(source_wt) or _has_uncommitted_changes(target_wt):
+    if by_directory and repo_root in (source_wt, target_wt):
+        click.echo(
+            "Note: The root worktree cannot be moved; swapping by checkout instead.", err=True
+        )
+        by_directory = False
+
+    # Check for uncommitted changes (a directory swap keeps them with their branch)
+    if not by_directory and (
+        _has_uncommitted_changes(source_wt) or _has_uncommitted_changes(target_wt)
+    ):
         if not force:
             click.echo(
                 "Error: Uncommitted changes detected in one or more worktrees.\n"
@@ -289,14 +428,18 @@ def execute_swap(
 
     click.echo(f"Swapping branches between '{source_wt.name}' and '{target_wt.name}'")
 
-    # To swap branches between worktrees, we need to avoid having the same branch
-    # checked out in two places simultaneously. Strategy:
-    # 1. Detach HEAD in source worktree (frees up source_branch)
-    # 2. Checkout source_branch in target worktree
-    # 3. Checkout target_branch in source worktree
-    ctx.git_ops.checkout_detached(source_wt, source_branch)
-    ctx.git_ops.checkout_branch(target_wt, source_branch)
-    ctx.git_ops.checkout_branch(source_wt, target_branch)
+    with repo_lock(ctx, repo_root, WORKTREES_SCOPE):
+        if by_directory:
+            _swap_directories(ctx, repo_root, source_wt, target_wt)
+        else:
+            # To swap branches between worktrees, we need to avoid having the same
+            # branch checked out in two places simultaneously. Strategy:
+            # 1. Detach HEAD in source worktree (frees up source_branch)
+            # 2. Checkout source_branch in target worktree
+            # 3. Checkout target_branch in source worktree
+            ctx.git_ops.checkout_detached(source_wt, source_branch)
+            ctx.git_ops.checkout_branch(target_wt, source_branch)
+            ctx.git_ops.checkout_branch(source_wt, target_branch)
 
     click.echo(f"✓ Swapped '{source_branch}' ↔ '{target_branch}'")
 
@@ -307,6 +450,13 @@ def execute_swap(
 @click.option("--worktree", help="Use specific worktree as source")
 @click.option("--ref", default="main", help="Fallback branch for source after move (default: main)")
 @click.option("-f", "--force", is_flag=True, help="Skip confirmation prompts")
+@click.option(
+    "--swap-by",
+    type=click.Choice(["checkout", "directory"]),
+    default="checkout",
+    help="How to swap: check out both branches again, or trade the worktree directories "
+    "(keeps build outputs and environments)",
+)
 @click.argument("target", required=True, shell_complete=complete_worktree_names)
 @click.pass_obj
 def move_cmd(
@@ -316,6 +466,7 @@ def move_cmd(
     worktree: str | None,
     ref: str,
     force: bool,
+    swap_by: str,
     target: str,
 ) -> None:
     """Move branches between worktrees with explicit source specification.
@@ -346,6 +497,10 @@ def move_cmd(
         # Swap branches between current and another worktree
         workstack move --current existing-wt
 
+        \b
+        # Swap by trading directories, keeping each branch's build outputs
+        workstack move --current existing-wt --swap-by directory
+
         \b
         # Force operation without prompts (for scripts)
         workstack move --current target-wt --force
@@ -385,7 +540,9 @@ def move_cmd(
 
     # Execute operation
     if operation_type == "swap":
-        execute_swap(ctx, repo.root, source_wt, target_wt, force=force)
+        execute_swap(
+            ctx, repo.root, source_wt, target_wt, force=force, by_directory=swap_by == "directory"
+        )
     else:
         # Auto-detect default branch if using 'main' default and it doesn't exist
         if ref == "main":
@@ -393,3 +550,5 @@ def move_cmd(
             ref = detected_default
 
         execute_move(ctx, repo.root, source_wt, target_wt, ref, force=force)
+
+    refresh_completion_index(ctx, repo)
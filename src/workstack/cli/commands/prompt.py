@@ -0,0 +1,118 @@
+"""Prompt command implementation."""
+
+import os
+import time
+from pathlib import Path
+
+import click
+
+from workstack.cli.prompt import claim_refresh, refresh_command, render_prompt
+from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import (
+    DEFAULT_PROMPT_FORMAT,
+    branch_from_head,
+    clear_refresh_marker,
+    compute_snapshot_key,
+    locate_worktree,
+    prompt_format_error,
+    read_common_dir,
+    read_head,
+    write_snapshot,
+)
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.collectors.github import GitHubPRCollector
+from workstack.status.collectors.graphite import GraphiteStackCollector
+from workstack.status.models.status_data import StatusData
+from workstack.status.orchestrator import StatusOrchestrator
+
+
+@click.command("prompt")
+@click.option(
+    "--format",
+    "fmt",
+    default=DEFAULT_PROMPT_FORMAT,
+    show_default=True,
+    help="Segment template using {worktree}, {branch}, {stack} and {pr}.",
+)
+@click.option("--no-refresh", is_flag=True, help="Never start a background snapshot refresh.")
+@click.option("--refresh", is_flag=True, hidden=True, help="Recompute the snapshot and exit.")
+@click.pass_obj
+def prompt_cmd(ctx: WorkstackContext, fmt: str, no_refresh: bool, refresh: bool) -> None:
+    """Print a compact status segment for shell prompts.
+
+    Reads a per-worktree snapshot instead of running git, so it is cheap
+    enough to call from PS1/PROMPT. When the snapshot is stale, a background
+    refresh is started and the next prompt picks up the new values.
+
+    Example (bash):
+      PS1='$(workstack prompt) \\$ '
+    """
+    if refresh:
+        _refresh_snapshot(ctx, Path.cwd())
+        return
+
+    format_error = prompt_format_error(fmt)
+    if format_error is not None:
+        click.echo(f"Error: Invalid --format: {format_error}", err=True)
+        raise SystemExit(1)
+
+    segment, stale_location = render_prompt(os.getcwd(), fmt)
+    if stale_location is not None and not no_refresh:
+        worktree_root, git_dir = stale_location
+        if claim_refresh(git_dir):
+            ctx.shell_ops.spawn_detached(refresh_command(), cwd=Path(worktree_root))
+
+    if segment:
+        click.echo(segment)
+
+
+def _refresh_snapshot(ctx: WorkstackContext, cwd: Path) -> None:
+    """Run the stack and PR collectors and write the prompt snapshot.
+
+    The key is computed before collecting, so a checkout that happens while
+    collectors run leaves the snapshot marked stale rather than mislabelled.
+    """
+    location = locate_worktree(str(cwd))
+    if location is None:
+        return
+
+    worktree_root, git_dir = location
+    head = read_head(git_dir)
+    key = compute_snapshot_key(git_dir, head)
+    repo_root = Path(read_common_dir(git_dir)).parent
+
+    # Without a global config the collectors can't tell whether Graphite and PR
+    # info are enabled; still write a snapshot so prompts stop spawning refreshes
+    collectors: list[StatusCollector] = []
+    if ctx.global_config_ops.exists():
+        collectors = [GraphiteStackCollector(), GitHubPRCollector()]
+
+    orchestrator = StatusOrchestrator(collectors)
+    status = orchestrator.collect_status(ctx, Path(worktree_root), repo_root)
+
+    write_snapshot(git_dir, _snapshot_fields(status, key, branch_from_head(head)))
+    clear_refresh_marker(git_dir)
+
+
+def _snapshot_fields(status: StatusData, key: str, branch: str | None) -> dict[str, str]:
+    """Flatten collected status into snapshot fields."""
+    fields = {
+        "key": key,
+        "written_at": f"{time.time():.3f}",
+        "branch": branch or "",
+        "stack": "",
+        "pr_number": "",
+    }
+
+    if status.stack_position is not None:
+        fields["stack"] = " ".join(status.stack_position.stack)
+
+    pr = status.pr_status
+    if pr is not None:
+        fields["pr_number"] = str(pr.number)
+        fields["pr_state"] = pr.state
+        fields["pr_draft"] = "1" if pr.is_draft else "0"
+        if pr.checks_passing is not None:
+            fields["pr_checks"] = "1" if pr.checks_passing else "0"
+
+    return fields
@@ -1,19 +1,27 @@
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
 from workstack.cli.commands.switch import complete_worktree_names
 from workstack.cli.core import (
+    GRAPHITE_SCOPE,
+    WORKTREES_SCOPE,
     discover_repo_context,
     ensure_workstacks_dir,
+    refresh_completion_index,
+    repo_lock,
     validate_worktree_name_for_removal,
     worktree_path_for,
 )
-from workstack.cli.graphite import get_branch_stack
+from workstack.cli.graphite import BranchInfo, get_branch_stack, parse_branch_info
 from workstack.core.context import WorkstackContext, create_context
 from workstack.core.gitops import GitOps
-from workstack.core.graphite_ops import read_graphite_json_file
+from workstack.core.graphite_ops import prune_graphite_cache, read_graphite_json_file
+
+# Worktrees removed at the same time by a bulk removal
+MAX_PARALLEL_REMOVALS = 8
 
 
 def _try_git_worktree_remove(git_ops: GitOps, repo_root: Path, wt_path: Path) -> bool:
@@ -96,89 +104,273 @@ def _get_non_trunk_branches(ctx: WorkstackContext, repo_root: Path, stack: list[
     return [b for b in stack if b not in trunk_branches]
 
 
+def _find_trunk(branch_info: dict[str, BranchInfo], branch: str) -> str | None:
+    """Follow parents from a branch to the trunk of its stack."""
+    seen: set[str] = set()
+    current: str | None = branch
+    while current is not None and current in branch_info and current not in seen:
+        if branch_info[current]["is_trunk"]:
+            return current
+        seen.add(current)
+        current = branch_info[current]["parent"]
+    return None
+
+
+def _split_branch_deletions(
+    ctx: WorkstackContext, repo_root: Path, branches: list[str], *, force: bool
+) -> tuple[list[str], list[str]]:
+    """Split stack branches into one batch deletion and individual gt deletes.
+
+    A branch with a descendant that is kept needs gt delete, which moves the
+    descendant onto the branch's parent. Without force, a branch that is not
+    merged into its trunk may be kept too (gt delete asks first), so it and
+    its ancestors also go through gt delete. Every other branch is deleted in
+    one batch, which costs the same for a whole stack as for a single branch.
+
+    Returns:
+        Tuple of (branches to delete in one batch, branches to delete with
+        gt delete, leaf first so each one's parent is still in place)
+    """
+    git_dir = ctx.git_ops.get_git_common_dir(repo_root)
+    if git_dir is None:
+        return [], list(reversed(branches))
+    cache_file = git_dir / ".graphite_cache_persist"
+    if not cache_file.exists():
+        return [], list(reversed(branches))
+    branch_info = parse_branch_info(read_graphite_json_file(cache_file, "Graphite cache"))
+
+    unmerged: set[str] = set()
+    if not force:
+        trunks = {branch: _find_trunk(branch_info, branch) for branch in branches}
+        merged = {
+            trunk: ctx.git_ops.list_merged_branches(repo_root, trunk)
+            for trunk in set(trunks.values())
+            if trunk is not None
+        }
+        unmerged = {
+            branch
+            for branch, trunk in trunks.items()
+            if trunk is None or branch not in merged[trunk]
+        }
+
+    deleting = set(branches)
+    needs_gt: dict[str, bool] = {}
+
+    def needs_gt_delete(branch: str) -> bool:
+        if branch not in needs_gt:
+            children = branch_info[branch]["children"] if branch in branch_info else []
+            needs_gt[branch] = branch in unmerged or any(
+                child not in deleting or needs_gt_delete(child) for child in children
+            )
+        return needs_gt[branch]
+
+    batch = [branch for branch in branches if not needs_gt_delete(branch)]
+    one_by_one = [branch for branch in reversed(branches) if needs_gt_delete(branch)]
+    return batch, one_by_one
+
+
+def _forget_deleted_branches(ctx: WorkstackContext, repo_root: Path, branches: list[str]) -> None:
+    """Drop branches deleted without gt from the Graphite cache."""
+    git_dir = ctx.git_ops.get_git_common_dir(repo_root)
+    if not branches or git_dir is None:
+        return
+    cache_file = git_dir / ".graphite_cache_persist"
+    if cache_file.exists():
+        prune_graphite_cache(cache_file, branches)
+
+
+@dataclass(frozen=True)
+class RemovalOutcome:
+    """Result of removing one worktree.
+
+    Attributes:
+        path: Worktree directory
+        error: Why the directory could not be deleted, or None on success
+    """
+
+    path: Path
+    error: str | None
+
+
+def _remove_one_worktree(ctx: WorkstackContext, repo_root: Path, wt_path: Path) -> RemovalOutcome:
+    """Remove a single worktree in place, without pruning git metadata."""
+    # Try to remove via git first; this updates git's metadata when possible
+    _try_git_worktree_remove(ctx.git_ops, repo_root, wt_path)
+
+    # Always delete the directory if it is still there (git worktree remove
+    # may have failed, or only removed the metadata)
+    if not wt_path.exists():
+        return RemovalOutcome(path=wt_path, error=None)
+
+    # Error boundary: one undeletable directory (permissions, a process
+    # holding files open) must not abort the other removals of the batch.
+    try:
+        shutil.rmtree(wt_path)
+    except OSError as e:
+        return RemovalOutcome(path=wt_path, error=str(e))
+    return RemovalOutcome(path=wt_path, error=None)
+
+
+def remove_worktrees(
+    ctx: WorkstackContext, repo_root: Path, wt_paths: list[Path]
+) -> list[RemovalOutcome]:
+    """Remove several worktrees, then prune git metadata once.
+
+    Each worktree is renamed into the trash next to it, which is instant,
+    and a detached reaper deletes the contents in the background (see
+    workstack.core.trash). Pruning then drops git's metadata for the moved
+    worktrees. Worktrees that cannot be renamed are removed in place on a
+    bounded pool, since `git worktree remove` process startup and recursive
+    deletion overlap well.
+
+    Args:
+        ctx: Workstack context with git operations
+        repo_root: Root of the repository owning the worktrees
+        wt_paths: Worktree directories to remove
+
+    Returns:
+        One outcome per path, in the order given
+    """
+    # Imported here so that `rm --help` does not pay for it
+    from workstack.core.trash import move_to_trash, pending_entries, reaper_command, trash_dir_for
+
+    outcomes: dict[Path, RemovalOutcome] = {}
+    in_place: list[Path] = []
+
+    with repo_lock(ctx, repo_root, WORKTREES_SCOPE):
+        for path in wt_paths:
+            if ctx.dry_run:
+                click.echo(f"[DRY RUN] Would move to trash: {path}", err=True)
+                outcomes[path] = RemovalOutcome(path=path, error=None)
+            elif move_to_trash(path, trash_dir_for(path.parent)) is not None:
+                outcomes[path] = RemovalOutcome(path=path, error=None)
+            else:
+                in_place.append(path)
+
+        workers = min(MAX_PARALLEL_REMOVALS, len(in_place))
+        if workers == 1:
+            outcomes[in_place[0]] = _remove_one_worktree(ctx, repo_root, in_place[0])
+        elif workers > 1:
+            # Imported here so that single removals do not pay for it
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                removed = pool.map(
+                    lambda path: _remove_one_worktree(ctx, repo_root, path), in_place
+                )
+                outcomes.update((outcome.path, outcome) for outcome in removed)
+
+        # Drop metadata of trashed worktrees and stale references left by
+        # failed git removals, once for the whole batch
+        _prune_worktrees_safe(ctx.git_ops, repo_root)
+
+    # Also restarts reaping of anything a crashed reaper left behind
+    if not ctx.dry_run:
+        for trash_dir in dict.fromkeys(trash_dir_for(path.parent) for path in wt_paths):
+            if pending_entries(trash_dir):
+                ctx.shell_ops.spawn_detached(reaper_command(trash_dir))
+
+    return [outcomes[path] for path in wt_paths]
+
+
+def _collect_stack_branches(
+    ctx: WorkstackContext, repo_root: Path, name: str, wt_path: Path
+) -> list[str]:
+    """Find the non-trunk branches of the Graphite stack of a worktree."""
+    worktree_branch = _find_worktree_branch(ctx, repo_root, wt_path)
+    if worktree_branch is None:
+        click.echo(
+            f"Warning: Worktree {name} is in detached HEAD state. "
+            "Cannot delete stack without a branch.",
+            err=True,
+        )
+        return []
+
+    # gt may be rewriting its cache (sync, delete) in another process
+    with repo_lock(ctx, repo_root, GRAPHITE_SCOPE, shared=True):
+        stack = get_branch_stack(ctx, repo_root, worktree_branch)
+    if stack is None:
+        click.echo(
+            f"Warning: Branch {worktree_branch} is not tracked by Graphite. Cannot delete stack.",
+            err=True,
+        )
+        return []
+
+    branches = _get_non_trunk_branches(ctx, repo_root, stack)
+    if not branches:
+        click.echo("No branches to delete (all branches in stack are trunk branches).")
+    return branches
+
+
 def _remove_worktree(
-    ctx: WorkstackContext, name: str, force: bool, delete_stack: bool, dry_run: bool
+    ctx: WorkstackContext, names: tuple[str, ...], force: bool, delete_stack: bool, dry_run: bool
 ) -> None:
-    """Internal function to remove a worktree.
+    """Internal function to remove one or more worktrees.
 
-    Uses git worktree remove when possible, but falls back to direct rmtree
-    if git fails (e.g., worktree already removed from git metadata but directory exists).
-    This is acceptable exception handling because there's no reliable way to check
-    a priori if git worktree remove will succeed - the worktree might be in various
-    states of partial removal.
+    Every name is validated before anything is removed, so a typo in one
+    name leaves all worktrees in place. Uses git worktree remove when
+    possible, but falls back to direct rmtree if git fails (e.g., worktree
+    already removed from git metadata but directory exists). This is
+    acceptable exception handling because there's no reliable way to check a
+    priori if git worktree remove will succeed - the worktree might be in
+    various states of partial removal.
 
     Args:
         ctx: Workstack context with git operations
-        name: Name of the worktree to remove
+        names: Names of the worktrees to remove
         force: Skip confirmation prompts
-        delete_stack: Delete all branches in the Graphite stack (requires Graphite)
+        delete_stack: Delete all branches in the Graphite stacks (requires Graphite)
         dry_run: Print what would be done without executing destructive operations
     """
     # Create dry-run context if needed
     if dry_run:
         ctx = create_context(dry_run=True)
 
-    # Validate worktree name before any operations
-    validate_worktree_name_for_removal(name)
+    # Validate worktree names before any operations
+    names = tuple(dict.fromkeys(names))
+    for name in names:
+        validate_worktree_name_for_removal(name)
 
     repo = discover_repo_context(ctx, Path.cwd())
     workstacks_dir = ensure_workstacks_dir(repo)
-    wt_path = worktree_path_for(workstacks_dir, name)
+    wt_paths = {name: worktree_path_for(workstacks_dir, name) for name in names}
+
+    missing = [path for path in wt_paths.values() if not path.exists() or not path.is_dir()]
+    if missing:
+        for path in missing:
+            click.echo(f"Worktree not found: {path}")
+        raise SystemExit(1)
 
-    if not wt_path.exists() or not wt_path.is_dir():
-        click.echo(f"Worktree not found: {wt_path}")
+    if delete_stack and not ctx.global_config_ops.get_use_graphite():
+        click.echo(
+            "Error: --delete-stack requires Graphite to be enabled. "
+            "Run 'workstack config set use-graphite true'",
+            err=True,
+        )
         raise SystemExit(1)
 
     # Step 1: Collect all operations to perform
-    branches_to_delete: list[str] = []
+    # Branches of each worktree's stack, looked up before the worktree is removed
+    branches_by_path: dict[Path, list[str]] = {}
     if delete_stack:
-        use_graphite = ctx.global_config_ops.get_use_graphite()
-        if not use_graphite:
-            click.echo(
-                "Error: --delete-stack requires Graphite to be enabled. "
-                "Run 'workstack config set use-graphite true'",
-                err=True,
-            )
-            raise SystemExit(1)
-
-        # Get the branches in the stack before removing the worktree
-        worktrees = ctx.git_ops.list_worktrees(repo.root)
-        worktree_branch = None
-        for wt in worktrees:
-            if wt.path == wt_path:
-                worktree_branch = wt.branch
-                break
-
-        if worktree_branch is None:
-            click.echo(
-                f"Warning: Worktree {name} is in detached HEAD state. "
-                "Cannot delete stack without a branch.",
-                err=True,
-            )
-        else:
-            stack = get_branch_stack(ctx, repo.root, worktree_branch)
-            if stack is None:
-                click.echo(
-                    f"Warning: Branch {worktree_branch} is not tracked by Graphite. "
-                    "Cannot delete stack.",
-                    err=True,
-                )
-            else:
-                branches_to_delete = _get_non_trunk_branches(ctx, repo.root, stack)
-
-                if not branches_to_delete:
-                    click.echo("No branches to delete (all branches in stack are trunk branches).")
+        for name, wt_path in wt_paths.items():
+            branches_by_path[wt_path] = _collect_stack_branches(ctx, repo.root, name, wt_path)
+    branches_to_delete = list(
+        dict.fromkeys(branch for branches in branches_by_path.values() for branch in branches)
+    )
 
     # Step 2: Display all planned operations
-    if branches_to_delete or True:
-        click.echo(click.style("📋 Planning to perform the following operations:", bold=True))
+    click.echo(click.style("📋 Planning to perform the following operations:", bold=True))
+    step = 0
+    for wt_path in wt_paths.values():
+        step += 1
         worktree_text = click.style(str(wt_path), fg="cyan")
-        click.echo(f"  1. 🗑️  Remove worktree: {worktree_text}")
-        if branches_to_delete:
-            click.echo("  2. 🌳 Delete branches in stack:")
-            for branch in branches_to_delete:
-                branch_text = click.style(branch, fg="yellow")
-                click.echo(f"     - {branch_text}")
+        click.echo(f"  {step}. 🗑️  Remove worktree: {worktree_text}")
+    if branches_to_delete:
+        click.echo(f"  {step + 1}. 🌳 Delete branches in stack:")
+        for branch in branches_to_delete:
+            branch_text = click.style(branch, fg="yellow")
+            click.echo(f"     - {branch_text}")
 
     # Step 3: Single confirmation prompt (unless --force or --dry-run)
     if not force and not dry_run:
@@ -188,39 +380,60 @@ def _remove_worktree(
             return
 
     # Step 4: Execute operations
+    outcomes = remove_worktrees(ctx, repo.root, list(wt_paths.values()))
+    failed = [outcome for outcome in outcomes if outcome.error is not None]
 
-    # 4a. Try to remove via git first
-    # This updates git's metadata when possible
-    _try_git_worktree_remove(ctx.git_ops, repo.root, wt_path)
-
-    # 4b. Always manually delete directory if it still exists
-    # (git worktree remove may have succeeded or failed, but directory might still be there)
-    if wt_path.exists():
-        if ctx.dry_run:
-            click.echo(f"[DRY RUN] Would delete directory: {wt_path}", err=True)
-        else:
-            shutil.rmtree(wt_path)
-
-    # 4c. Prune worktree metadata to clean up any stale references
-    # This is important if git worktree remove failed or if we manually deleted
-    if not ctx.dry_run:
-        _prune_worktrees_safe(ctx.git_ops, repo.root)
-
-    # 4c. Delete stack branches (now that worktree is removed)
-    if branches_to_delete:
-        for branch in branches_to_delete:
-            ctx.git_ops.delete_branch_with_graphite(repo.root, branch, force=force)
-            if not dry_run:
-                branch_text = click.style(branch, fg="green")
-                click.echo(f"✅ Deleted branch: {branch_text}")
+    # Delete stack branches (now that worktrees are removed), except those
+    # still checked out in a worktree that could not be removed
+    kept_branches = {
+        branch for outcome in failed for branch in branches_by_path.get(outcome.path, [])
+    }
+    deletable_branches = [branch for branch in branches_to_delete if branch not in kept_branches]
+    if deletable_branches:
+        with repo_lock(ctx, repo.root, GRAPHITE_SCOPE):
+            batch, one_by_one = _split_branch_deletions(
+                ctx, repo.root, deletable_branches, force=force
+            )
+            refused: list[str] = []
+            if batch:
+                # Without force the batch only holds branches merged into
+                # their trunk; -d would judge that against HEAD instead
+                refused = ctx.git_ops.delete_branches_with_graphite(repo.root, batch, force=True)
+                if not ctx.dry_run:
+                    _forget_deleted_branches(
+                        ctx, repo.root, [branch for branch in batch if branch not in refused]
+                    )
+            # gt delete asks before deleting unmerged branches, and moves kept
+            # children onto the parent
+            for branch in [*refused, *one_by_one]:
+                ctx.git_ops.delete_branch_with_graphite(repo.root, branch, force=force)
+        if not dry_run:
+            # The user may have declined some gt deletes
+            remaining = ctx.git_ops.list_branch_heads(repo.root)
+            for branch in deletable_branches:
+                if branch not in remaining:
+                    branch_text = click.style(branch, fg="green")
+                    click.echo(f"✅ Deleted branch: {branch_text}")
+
+    refresh_completion_index(ctx, repo)
 
     if not dry_run:
-        path_text = click.style(str(wt_path), fg="green")
-        click.echo(f"✅ {path_text}")
+        for outcome in outcomes:
+            if outcome.error is None:
+                path_text = click.style(str(outcome.path), fg="green")
+                click.echo(f"✅ {path_text}")
+            else:
+                path_text = click.style(str(outcome.path), fg="red")
+                click.echo(f"❌ {path_text}: {outcome.error}", err=True)
+
+    if failed:
+        raise SystemExit(1)
 
 
 @click.command("remove")
-@click.argument("name", metavar="NAME", shell_complete=complete_worktree_names)
+@click.argument(
+    "names", metavar="NAME...", nargs=-1, required=True, shell_complete=complete_worktree_names
+)
 @click.option("-f", "--force", is_flag=True, help="Do not prompt for confirmation.")
 @click.option(
     "-s",
@@ -237,19 +450,28 @@ def _remove_worktree(
 )
 @click.pass_obj
 def remove_cmd(
-    ctx: WorkstackContext, name: str, force: bool, delete_stack: bool, dry_run: bool
+    ctx: WorkstackContext,
+    names: tuple[str, ...],
+    force: bool,
+    delete_stack: bool,
+    dry_run: bool,
 ) -> None:
-    """Remove the worktree directory (alias: rm).
+    """Remove worktree directories (alias: rm).
+
+    Several worktrees can be removed at once; all names are checked before
+    anything is removed, and the removals run in parallel.
 
     With `-f/--force`, skips the confirmation prompt.
-    Attempts `git worktree remove` before deleting the directory.
+    Attempts `git worktree remove` before deleting each directory.
     """
-    _remove_worktree(ctx, name, force, delete_stack, dry_run)
+    _remove_worktree(ctx, names, force, delete_stack, dry_run)
 
 
 # Register rm as a hidden alias (won't show in help)
 @click.command("rm", hidden=True)
-@click.argument("name", metavar="NAME", shell_complete=complete_worktree_names)
+@click.argument(
+    "names", metavar="NAME...", nargs=-1, required=True, shell_complete=complete_worktree_names
+)
 @click.option("-f", "--force", is_flag=True, help="Do not prompt for confirmation.")
 @click.option(
     "-s",
@@ -266,7 +488,11 @@ def remove_cmd(
 )
 @click.pass_obj
 def rm_cmd(
-    ctx: WorkstackContext, name: str, force: bool, delete_stack: bool, dry_run: bool
+    ctx: WorkstackContext,
+    names: tuple[str, ...],
+    force: bool,
+    delete_stack: bool,
+    dry_run: bool,
 ) -> None:
-    """Remove the worktree directory (alias of 'remove')."""
-    _remove_worktree(ctx, name, force, delete_stack, dry_run)
+    """Remove worktree directories (alias of 'remove')."""
+    _remove_worktree(ctx, names, force, delete_stack, dry_run)
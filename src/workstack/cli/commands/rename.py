@@ -5,7 +5,14 @@ import click
 from workstack.cli.commands.create import make_env_content, sanitize_worktree_name
 from workstack.cli.commands.switch import complete_worktree_names
 from workstack.cli.config import load_config
-from workstack.cli.core import discover_repo_context, ensure_workstacks_dir, worktree_path_for
+from workstack.cli.core import (
+    WORKTREES_SCOPE,
+    discover_repo_context,
+    ensure_workstacks_dir,
+    refresh_completion_index,
+    repo_lock,
+    worktree_path_for,
+)
 from workstack.core.context import WorkstackContext, create_context
 
 
@@ -50,7 +57,8 @@ def rename_cmd(ctx: WorkstackContext, old_name: str, new_name: str, dry_run: boo
         raise SystemExit(1)
 
     # Move via git worktree move
-    ctx.git_ops.move_worktree(repo.root, old_path, new_path)
+    with repo_lock(ctx, repo.root, WORKTREES_SCOPE):
+        ctx.git_ops.move_worktree(repo.root, old_path, new_path)
 
     # Regenerate .env file with updated paths and name
     cfg = load_config(workstacks_dir)
@@ -64,6 +72,7 @@ def rename_cmd(ctx: WorkstackContext, old_name: str, new_name: str, dry_run: boo
         click.echo(f"[DRY RUN] Would write .env file: {env_file}", err=True)
     else:
         env_file.write_text(env_content, encoding="utf-8")
+    refresh_completion_index(ctx, repo)
 
     click.echo(f"Renamed worktree: {old_name} -> {sanitized_new_name}")
     click.echo(str(new_path))
@@ -1,5 +1,7 @@
 import click
 
+from workstack.cli.shell_integration.client import ensure_private_dir, runtime_dir, spawn_daemon
+from workstack.cli.shell_integration.daemon import DAEMON_IDLE_TIMEOUT_SECONDS, ping, serve, stop
 from workstack.cli.shell_integration.handler import (
     PASSTHROUGH_MARKER,
     ShellIntegrationResult,
@@ -26,3 +28,60 @@ def hidden_shell_cmd(args: tuple[str, ...]) -> None:
         click.echo(result.script, nl=False)
 
     raise SystemExit(result.exit_code)
+
+
+@click.group("__daemon", hidden=True)
+def hidden_daemon_group() -> None:
+    """Manage the per-user daemon that answers shell integration requests."""
+
+
+@hidden_daemon_group.command("serve")
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=1),
+    default=DAEMON_IDLE_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Exit after this many seconds without a request.",
+)
+def daemon_serve_cmd(idle_timeout: float) -> None:
+    """Run the daemon in the foreground."""
+    directory = runtime_dir()
+    if not ensure_private_dir(directory):
+        click.echo(f"Error: {directory} is not a private directory owned by you", err=True)
+        raise SystemExit(1)
+    if not serve(directory, idle_timeout=idle_timeout):
+        click.echo("Daemon already running", err=True)
+
+
+@hidden_daemon_group.command("start")
+def daemon_start_cmd() -> None:
+    """Start the daemon in the background unless it is already running."""
+    directory = runtime_dir()
+    if not ensure_private_dir(directory):
+        click.echo(f"Error: {directory} is not a private directory owned by you", err=True)
+        raise SystemExit(1)
+    pid = ping(directory)
+    if pid is not None:
+        click.echo(f"Daemon already running (pid {pid})")
+        return
+    spawn_daemon(directory, backoff=False)
+    click.echo("Daemon starting")
+
+
+@hidden_daemon_group.command("stop")
+def daemon_stop_cmd() -> None:
+    """Stop the daemon if it is running."""
+    if stop(runtime_dir()):
+        click.echo("Daemon stopped")
+    else:
+        click.echo("Daemon not running")
+
+
+@hidden_daemon_group.command("status")
+def daemon_status_cmd() -> None:
+    """Report whether the daemon is running."""
+    pid = ping(runtime_dir())
+    if pid is None:
+        click.echo("Daemon not running")
+        raise SystemExit(1)
+    click.echo(f"Daemon running (pid {pid})")
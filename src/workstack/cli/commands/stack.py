@@ -0,0 +1,104 @@
+"""Stack command - jump straight to either end of the current Graphite stack."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+
+from workstack.cli.commands.switch import (
+    _activate_stack_branch,
+    _ensure_graphite_enabled,
+    _load_stack_position,
+    _note_forks,
+)
+from workstack.cli.core import discover_repo_context
+from workstack.cli.graphite import StackPosition
+from workstack.core.context import WorkstackContext
+
+_CHECKOUT_HELP = "Check the target branch out in the current worktree if it has no worktree."
+_SCRIPT_HELP = "Print only the activation script without usage instructions."
+
+
+@click.group("stack")
+def stack_group() -> None:
+    """Navigate the current Graphite stack."""
+
+
+def _resolve_top(position: StackPosition) -> str:
+    """Resolve the leaf of the stack, following the first child at forks."""
+    if position.index == len(position.chain) - 1:
+        click.echo("Already at the top of the stack (no child branches)", err=True)
+        raise SystemExit(1)
+    _note_forks(position, position.chain[position.index : -1])
+    return position.chain[-1]
+
+
+def _resolve_bottom(position: StackPosition) -> str:
+    """Resolve the first branch above trunk."""
+    if len(position.chain) < 2:
+        click.echo(f"Error: No branches are stacked on '{position.chain[0]}'", err=True)
+        raise SystemExit(1)
+    bottom = position.chain[1]
+    if bottom == position.branch:
+        click.echo(f"Already at the bottom of the stack ('{bottom}')", err=True)
+        raise SystemExit(1)
+    if position.index == 0:
+        _note_forks(position, position.chain[:1])
+    return bottom
+
+
+def _navigate(
+    ctx: WorkstackContext,
+    resolve_target: Callable[[StackPosition], str],
+    *,
+    checkout: bool,
+    script: bool,
+) -> None:
+    """Resolve and activate a stack end from the current branch."""
+    _ensure_graphite_enabled(ctx)
+    repo = discover_repo_context(ctx, Path.cwd())
+
+    current_branch = ctx.git_ops.get_current_branch(Path.cwd())
+    if current_branch is None:
+        click.echo("Error: Not currently on a branch (detached HEAD)", err=True)
+        raise SystemExit(1)
+
+    position = _load_stack_position(ctx, repo, current_branch)
+    target_branch = resolve_target(position)
+    worktrees = ctx.git_ops.list_worktrees(repo.root)
+
+    _activate_stack_branch(
+        ctx,
+        repo,
+        worktrees,
+        position,
+        target_branch,
+        checkout=checkout,
+        script=script,
+        command_name="stack",
+    )
+
+
+@stack_group.command("top")
+@click.option("--checkout", is_flag=True, help=_CHECKOUT_HELP)
+@click.option("--script", is_flag=True, help=_SCRIPT_HELP)
+@click.pass_obj
+def stack_top_cmd(ctx: WorkstackContext, checkout: bool, script: bool) -> None:
+    """Move to the top (leaf) of the current stack.
+
+    At a fork, the first child is followed.
+    Requires Graphite to be enabled: 'workstack config set use_graphite true'
+    """
+    _navigate(ctx, _resolve_top, checkout=checkout, script=script)
+
+
+@stack_group.command("bottom")
+@click.option("--checkout", is_flag=True, help=_CHECKOUT_HELP)
+@click.option("--script", is_flag=True, help=_SCRIPT_HELP)
+@click.pass_obj
+def stack_bottom_cmd(ctx: WorkstackContext, checkout: bool, script: bool) -> None:
+    """Move to the bottom of the current stack (the first branch above trunk).
+
+    Requires Graphite to be enabled: 'workstack config set use_graphite true'
+    """
+    _navigate(ctx, _resolve_bottom, checkout=checkout, script=script)
@@ -1,23 +1,80 @@
 """Status command implementation."""
 
+import json
+import os
+from dataclasses import replace
 from pathlib import Path
 
 import click
 
 from workstack.cli.core import discover_repo_context
 from workstack.core.context import WorkstackContext
+from workstack.status.cache import CollectorCache
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.collectors.dependencies import DependencyCollector
+from workstack.status.collectors.environment import EnvironmentCollector
 from workstack.status.collectors.git import GitStatusCollector
 from workstack.status.collectors.github import GitHubPRCollector
 from workstack.status.collectors.graphite import GraphiteStackCollector
 from workstack.status.collectors.plan import PlanFileCollector
+from workstack.status.collectors.trash import TrashCollector
+from workstack.status.models.serialization import to_jsonable
+from workstack.status.models.status_data import EnvironmentStatus, StatusData
 from workstack.status.orchestrator import StatusOrchestrator
 from workstack.status.renderers.simple import SimpleRenderer
+from workstack.status.watch import (
+    IncrementalScreen,
+    create_change_source,
+    render_status_text,
+    resolve_watch_layout,
+    watch_status,
+)
+
+# Per-list cap on staged/modified/untracked files in --fast mode
+FAST_MAX_FILES = 20
 
 
 @click.command("status")
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and refresh affected sections when files change.",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format (text or json)",
+)
+@click.option(
+    "--fast",
+    is_flag=True,
+    help=f"Skip network-bound collectors and cap file lists at {FAST_MAX_FILES} entries.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run every collector instead of reusing results from earlier runs.",
+)
 @click.pass_obj
-def status_cmd(ctx: WorkstackContext) -> None:
-    """Show comprehensive status of current worktree."""
+def status_cmd(ctx: WorkstackContext, watch: bool, format: str, fast: bool, no_cache: bool) -> None:
+    """Show comprehensive status of current worktree.
+
+    Use --format json for a machine-readable dump of every section, including
+    how long each collector took and whether it timed out, failed or was
+    served from cache. Combine with --fast for a cheap local-only snapshot.
+
+    Removed worktrees whose files are still being deleted in the background
+    are reported with their remaining size.
+
+    Git, stack, PR and plan sections are cached in the worktree's git
+    directory and reused while their inputs (HEAD, index, Graphite cache,
+    .PLAN.md) are unchanged; PR data expires after two minutes.
+    """
+    if watch and format != "text":
+        click.echo("Error: --watch can only be used with --format text", err=True)
+        raise SystemExit(1)
+
     # Discover repository context
     repo = discover_repo_context(ctx, Path.cwd())
     current_dir = Path.cwd().resolve()
@@ -40,19 +97,87 @@ def status_cmd(ctx: WorkstackContext) -> None:
         raise SystemExit(1)
 
     # Create collectors
-    collectors = [
-        GitStatusCollector(),
-        GraphiteStackCollector(),
-        GitHubPRCollector(),
-        PlanFileCollector(),
-    ]
+    collectors = _create_collectors(fast=fast)
 
     # Create orchestrator
-    orchestrator = StatusOrchestrator(collectors)
+    cache = None if no_cache else CollectorCache.for_worktree(current_worktree_path)
+    orchestrator = StatusOrchestrator(collectors, cache=cache)
+
+    if watch:
+        _watch(ctx, orchestrator, current_worktree_path, repo.root)
+        return
 
     # Collect status
     status = orchestrator.collect_status(ctx, current_worktree_path, repo.root)
 
     # Render status
+    if format == "json":
+        click.echo(json.dumps(to_jsonable(_redact_environment(status)), indent=2))
+        return
+
     renderer = SimpleRenderer()
     renderer.render(status)
+
+
+# Stands in for .env values in JSON output
+REDACTED_VALUE = "<redacted>"
+
+
+def _redact_environment(status: StatusData) -> StatusData:
+    """Hide .env values, which may contain secrets; like the text output, keep the names."""
+    if status.environment is None:
+        return status
+    variables = {name: REDACTED_VALUE for name in status.environment.variables}
+    return replace(status, environment=EnvironmentStatus(variables=variables))
+
+
+def _create_collectors(*, fast: bool) -> list[StatusCollector]:
+    """Create the status collectors, restricted to the fast profile if requested."""
+    collectors: list[StatusCollector] = [
+        GitStatusCollector(max_files=FAST_MAX_FILES if fast else None),
+        GraphiteStackCollector(),
+        GitHubPRCollector(),
+        PlanFileCollector(),
+        EnvironmentCollector(),
+        DependencyCollector(),
+        TrashCollector(),
+    ]
+    if fast:
+        return [collector for collector in collectors if not collector.requires_network]
+    return collectors
+
+
+def _watch(
+    ctx: WorkstackContext,
+    orchestrator: StatusOrchestrator,
+    worktree_path: Path,
+    repo_root: Path,
+) -> None:
+    """Run the status view in watch mode until interrupted."""
+    layout = resolve_watch_layout(worktree_path)
+    if layout is None:
+        click.echo("Error: Could not locate git directory for worktree", err=True)
+        raise SystemExit(1)
+
+    # Stop `git status` from opportunistically rewriting the index, which
+    # would wake the watcher after every refresh
+    os.environ["GIT_OPTIONAL_LOCKS"] = "0"
+
+    stdout = click.get_text_stream("stdout")
+    color = stdout.isatty()
+    source = create_change_source(layout)
+    try:
+        watch_status(
+            ctx,
+            orchestrator,
+            layout,
+            repo_root,
+            source,
+            IncrementalScreen(stdout),
+            lambda status: render_status_text(status, color=color),
+        )
+    except KeyboardInterrupt:
+        # Ctrl-C is the normal way to leave watch mode
+        click.echo()
+    finally:
+        source.close()
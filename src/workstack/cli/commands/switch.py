@@ -4,14 +4,22 @@ import click
 
 from workstack.cli.activation import render_activation_script
 from workstack.cli.core import (
+    WORKTREES_SCOPE,
     RepoContext,
     discover_repo_context,
     ensure_workstacks_dir,
+    list_worktree_dirs,
+    refresh_completion_index,
+    repo_lock,
     worktree_path_for,
 )
 from workstack.cli.debug import debug_log
-from workstack.cli.graphite import find_worktree_for_branch, get_child_branches, get_parent_branch
-from workstack.cli.shell_utils import write_script_to_temp
+from workstack.cli.graphite import (
+    StackPosition,
+    find_worktree_for_branch,
+    get_stack_position,
+)
+from workstack.cli.shell_utils import script_handoff
 from workstack.core.context import WorkstackContext, create_context
 from workstack.core.gitops import WorktreeInfo
 
@@ -52,12 +60,12 @@ def _activate_root_repo(repo: RepoContext, script: bool, command_name: str) -> N
             final_message='echo "Switched to root repo: $(pwd)"',
             comment="work activate-script (root repo)",
         )
-        script_path = write_script_to_temp(
+        handoff = script_handoff(
             script_content,
             command_name=command_name,
             comment="activate root",
         )
-        click.echo(str(script_path), nl=False)
+        click.echo(handoff, nl=False)
     else:
         click.echo(f"Switched to root repo: {root_path}")
         click.echo(
@@ -95,17 +103,16 @@ def _activate_worktree(
 
     if script:
         activation_script = render_activation_script(worktree_path=wt_path)
-        script_path = write_script_to_temp(
+        handoff = script_handoff(
             activation_script,
             command_name=command_name,
             comment=f"activate {worktree_name}",
         )
 
-        debug_log(f"{command_name.capitalize()}: Generated script at {script_path}")
+        debug_log(f"{command_name.capitalize()}: Script handoff: {handoff.splitlines()[0]}")
         debug_log(f"{command_name.capitalize()}: Script content:\n{activation_script}")
-        debug_log(f"{command_name.capitalize()}: File exists? {script_path.exists()}")
 
-        click.echo(str(script_path), nl=False)
+        click.echo(handoff, nl=False)
     else:
         click.echo(
             "Shell integration not detected. "
@@ -118,119 +125,150 @@ def _activate_worktree(
     raise SystemExit(0)
 
 
-def _resolve_up_navigation(
-    ctx: WorkstackContext, repo: RepoContext, current_branch: str, worktrees: list[WorktreeInfo]
-) -> str:
-    """Resolve --up navigation to determine target branch name.
-
-    Args:
-        ctx: Workstack context
-        repo: Repository context
-        current_branch: Current branch name
-        worktrees: List of worktrees from git_ops.list_worktrees()
+def _load_stack_position(
+    ctx: WorkstackContext, repo: RepoContext, current_branch: str
+) -> StackPosition:
+    """Locate the current branch in its Graphite stack.
 
-    Returns:
-        Target branch name to switch to
+    An untracked trunk is a stack of its own, so moving from it reports the
+    end of the stack rather than an untracked branch.
 
     Raises:
-        SystemExit: If navigation fails (at top of stack or target has no worktree)
+        SystemExit: If the branch is not tracked by Graphite
     """
-    # Navigate up to child branch
-    children = get_child_branches(ctx, repo.root, current_branch)
-    if not children:
-        click.echo("Already at the top of the stack (no child branches)", err=True)
-        raise SystemExit(1)
-
-    # Use first child (future enhancement: handle multiple children interactively)
-    target_branch = children[0]
-    if len(children) > 1:
-        click.echo(
-            f"Note: Branch '{current_branch}' has multiple children. "
-            f"Selecting first child: '{target_branch}'",
-            err=True,
-        )
-
-    # Check if target branch has a worktree
-    target_wt_path = find_worktree_for_branch(worktrees, target_branch)
-    if target_wt_path is None:
+    position = get_stack_position(ctx, repo.root, current_branch)
+    if position is None and current_branch == ctx.git_ops.detect_default_branch(repo.root):
+        return StackPosition(branch=current_branch, chain=(current_branch,), index=0, forks={})
+    if position is None:
         click.echo(
-            f"Branch '{target_branch}' is the next branch up in the stack "
-            f"but has no worktree.\n"
-            f"To create a worktree for it, run:\n"
-            f"  workstack create {target_branch}",
+            f"Error: Branch '{current_branch}' is not tracked in Graphite's metadata",
             err=True,
         )
         raise SystemExit(1)
+    return position
 
-    return target_branch
 
+def _note_forks(position: StackPosition, crossed: tuple[str, ...]) -> None:
+    """Say which child was picked at every fork in ``crossed``."""
+    for branch in crossed:
+        children = position.forks.get(branch)
+        if children is not None:
+            click.echo(
+                f"Note: Branch '{branch}' has multiple children. "
+                f"Selecting first child: '{children[0]}'",
+                err=True,
+            )
 
-def _resolve_down_navigation(
-    ctx: WorkstackContext, repo: RepoContext, current_branch: str, worktrees: list[WorktreeInfo]
-) -> str:
-    """Resolve --down navigation to determine target branch name.
+
+def _resolve_stack_offset(position: StackPosition, offset: int) -> str:
+    """Resolve the branch ``offset`` levels up (positive) or down (negative) the stack.
 
     Args:
-        ctx: Workstack context
-        repo: Repository context
-        current_branch: Current branch name
-        worktrees: List of worktrees from git_ops.list_worktrees()
+        position: Position of the current branch
+        offset: Number of levels to move; never zero
 
     Returns:
-        Target branch name or 'root' to switch to
+        Target branch name
 
     Raises:
-        SystemExit: If navigation fails (at bottom of stack or target has no worktree)
+        SystemExit: If already at that end of the stack, or the stack is not
+            tall enough for the move
     """
-    # Navigate down to parent branch
-    parent_branch = get_parent_branch(ctx, repo.root, current_branch)
-    if parent_branch is None:
-        # Check if we're already on trunk
-        trunk_branch = ctx.git_ops.detect_default_branch(repo.root)
-        if current_branch == trunk_branch:
+    target_index = position.index + offset
+    if offset > 0:
+        levels = len(position.chain) - 1 - position.index
+        if levels == 0:
+            click.echo("Already at the top of the stack (no child branches)", err=True)
+            raise SystemExit(1)
+        if offset > levels:
             click.echo(
-                f"Already at the bottom of the stack (on trunk branch '{trunk_branch}')",
+                f"Error: Cannot move up {offset} levels; "
+                f"the top of the stack ('{position.chain[-1]}') is {levels} up",
                 err=True,
             )
             raise SystemExit(1)
-        else:
+        _note_forks(position, position.chain[position.index : target_index])
+    else:
+        levels = position.index
+        if levels == 0:
             click.echo(
-                "Error: Could not determine parent branch from Graphite metadata",
+                f"Already at the bottom of the stack (on trunk branch '{position.branch}')",
                 err=True,
             )
             raise SystemExit(1)
+        if -offset > levels:
+            click.echo(
+                f"Error: Cannot move down {-offset} levels; "
+                f"trunk ('{position.chain[0]}') is {levels} down",
+                err=True,
+            )
+            raise SystemExit(1)
+    return position.chain[target_index]
+
+
+def _activate_stack_branch(
+    ctx: WorkstackContext,
+    repo: RepoContext,
+    worktrees: list[WorktreeInfo],
+    position: StackPosition,
+    target_branch: str,
+    *,
+    checkout: bool,
+    script: bool,
+    command_name: str,
+) -> None:
+    """Activate the worktree holding a branch of the current stack and exit.
 
-    # Check if parent is the trunk - if so, switch to root
-    trunk_branch = ctx.git_ops.detect_default_branch(repo.root)
-    if parent_branch == trunk_branch:
-        # Check if trunk is checked out in root (repo.root path)
-        trunk_wt_path = find_worktree_for_branch(worktrees, trunk_branch)
-        if trunk_wt_path is not None and trunk_wt_path == repo.root:
-            # Trunk is in root repository, not in a dedicated worktree
-            return "root"
-        else:
-            # Trunk has a dedicated worktree
-            if trunk_wt_path is None:
-                click.echo(
-                    f"Branch '{parent_branch}' is the parent branch but has no worktree.\n"
-                    f"To switch to the root repository, run:\n"
-                    f"  workstack switch root",
-                    err=True,
-                )
-                raise SystemExit(1)
-            return parent_branch
-    else:
-        # Parent is not trunk, check if it has a worktree
-        target_wt_path = find_worktree_for_branch(worktrees, parent_branch)
-        if target_wt_path is None:
+    Args:
+        ctx: Workstack context
+        repo: Repository context
+        worktrees: List of worktrees from git_ops.list_worktrees()
+        position: Position of the current branch
+        target_branch: Branch to move to
+        checkout: If the target branch has no worktree, check it out in the
+            current worktree instead of failing
+        script: Whether to output script path or user message
+        command_name: Name of the command (for script generation)
+
+    Raises:
+        SystemExit: Always (after activation, or if the target has no worktree)
+    """
+    target_wt_path = find_worktree_for_branch(worktrees, target_branch)
+    if target_wt_path is None:
+        current_wt_path = find_worktree_for_branch(worktrees, position.branch)
+        # Trunk normally belongs in the root repository, not a new worktree
+        if target_branch == position.chain[0] and not checkout:
+            role = "parent" if position.index == 1 else "trunk"
             click.echo(
-                f"Branch '{parent_branch}' is the parent branch but has no worktree.\n"
+                f"Branch '{target_branch}' is the {role} branch but has no worktree.\n"
+                f"To switch to the root repository, run:\n"
+                f"  workstack switch root",
+                err=True,
+            )
+            raise SystemExit(1)
+        if not checkout or current_wt_path is None:
+            click.echo(
+                f"Branch '{target_branch}' is in the stack but has no worktree.\n"
                 f"To create a worktree for it, run:\n"
-                f"  workstack create {parent_branch}",
+                f"  workstack create {target_branch}",
                 err=True,
             )
+            if command_name != "switch":
+                click.echo(
+                    "Or rerun with --checkout to check it out in the current worktree.",
+                    err=True,
+                )
             raise SystemExit(1)
-        return parent_branch
+
+        with repo_lock(ctx, repo.root, WORKTREES_SCOPE):
+            ctx.git_ops.checkout_branch(current_wt_path, target_branch)
+        click.echo(f"Checked out '{target_branch}' in worktree", err=True)
+        target_wt_path = current_wt_path
+
+    # Trunk usually lives in the root repository rather than a worktree
+    if target_wt_path == repo.root:
+        _activate_root_repo(repo, script, command_name)
+    _activate_worktree(repo, target_wt_path, script, command_name)
 
 
 def complete_worktree_names(
@@ -258,13 +296,12 @@ def complete_worktree_names(
 
         names = ["root"] if "root".startswith(incomplete) else []
 
-        if repo.workstacks_dir.exists():
-            names.extend(
-                p.name
-                for p in repo.workstacks_dir.iterdir()
-                if p.is_dir() and p.name.startswith(incomplete)
-            )
+        names.extend(
+            p.name for p in list_worktree_dirs(repo.workstacks_dir) if p.name.startswith(incomplete)
+        )
 
+        # The fast path in workstack.main() declined; rebuild its index
+        refresh_completion_index(workstack_ctx, repo)
         return names
     except Exception:
         # Shell completion error boundary: return empty list for graceful degradation
@@ -282,14 +319,22 @@ def complete_worktree_names(
 @click.option(
     "--down", is_flag=True, help="Move to parent branch in Graphite stack (requires Graphite)."
 )
+@click.option(
+    "--fuzzy",
+    is_flag=True,
+    help="Treat NAME as a fuzzy query over worktree names, branches, plan titles and PR numbers.",
+)
 @click.pass_obj
-def switch_cmd(ctx: WorkstackContext, name: str | None, script: bool, up: bool, down: bool) -> None:
+def switch_cmd(
+    ctx: WorkstackContext, name: str | None, script: bool, up: bool, down: bool, fuzzy: bool
+) -> None:
     """Switch to a worktree and activate its environment.
 
     With shell integration (recommended):
       workstack switch NAME
       workstack switch --up
       workstack switch --down
+      workstack switch --fuzzy QUERY
 
     The shell wrapper function automatically activates the worktree.
     Run 'workstack init --shell' to set up shell integration.
@@ -300,6 +345,9 @@ def switch_cmd(ctx: WorkstackContext, name: str | None, script: bool, up: bool,
     NAME can be a worktree name, or 'root' to switch to the root repo.
     Use --up to navigate to the child branch in the Graphite stack.
     Use --down to navigate to the parent branch in the Graphite stack.
+    Use --fuzzy to find a worktree by part of its name, branch, stack,
+    plan title or PR number; without a query it offers a picker of recently
+    active worktrees.
     This will cd to the worktree, create/activate .venv, and load .env variables.
     """
 
@@ -308,6 +356,20 @@ def switch_cmd(ctx: WorkstackContext, name: str | None, script: bool, up: bool,
         click.echo("Error: Cannot use both --up and --down", err=True)
         raise SystemExit(1)
 
+    if fuzzy and (up or down):
+        click.echo("Error: Cannot use --fuzzy with --up or --down", err=True)
+        raise SystemExit(1)
+
+    if fuzzy:
+        # Imported here so that plain `switch` stays within its import budget
+        from workstack.cli.fuzzy import resolve_fuzzy_target
+
+        repo = discover_repo_context(ctx, Path.cwd())
+        match = resolve_fuzzy_target(ctx, repo, name or "")
+        if match.document.name == "root":
+            _activate_root_repo(repo, script, "switch")
+        _activate_worktree(repo, Path(match.document.path), script, "switch")
+
     if name and (up or down):
         click.echo("Error: Cannot specify NAME with --up or --down", err=True)
         raise SystemExit(1)
@@ -333,7 +395,6 @@ def switch_cmd(ctx: WorkstackContext, name: str | None, script: bool, up: bool,
         raise SystemExit(1)
 
     # Determine target name based on command arguments
-    target_name: str
     if up or down:
         # Get current branch
         current_branch = ctx.git_ops.get_current_branch(Path.cwd())
@@ -341,28 +402,19 @@ def switch_cmd(ctx: WorkstackContext, name: str | None, script: bool, up: bool,
             click.echo("Error: Not currently on a branch (detached HEAD)", err=True)
             raise SystemExit(1)
 
-        # Get all worktrees for checking if target has a worktree
+        position = _load_stack_position(ctx, repo, current_branch)
+        target_branch = _resolve_stack_offset(position, 1 if up else -1)
         worktrees = ctx.git_ops.list_worktrees(repo.root)
-
-        if up:
-            target_name = _resolve_up_navigation(ctx, repo, current_branch, worktrees)
-        else:  # down
-            target_name = _resolve_down_navigation(ctx, repo, current_branch, worktrees)
-
-        # Check if target_name refers to 'root' which means root repo
-        if target_name == "root":
-            _activate_root_repo(repo, script, "switch")
-
-        # Resolve to actual worktree path
-        target_wt_path = find_worktree_for_branch(worktrees, target_name)
-        if target_wt_path is None:
-            click.echo(
-                f"Error: Branch '{target_name}' has no worktree. This should not happen.",
-                err=True,
-            )
-            raise SystemExit(1)
-
-        _activate_worktree(repo, target_wt_path, script, "switch")
+        _activate_stack_branch(
+            ctx,
+            repo,
+            worktrees,
+            position,
+            target_branch,
+            checkout=False,
+            script=script,
+            command_name="switch",
+        )
     else:
         # NAME argument was provided (validated earlier)
         target_name = name if name else ""  # This branch is unreachable due to validation
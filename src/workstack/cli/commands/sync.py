@@ -1,12 +1,29 @@
 import os
 import subprocess
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 import click
 
-from workstack.cli.commands.remove import _remove_worktree
-from workstack.cli.core import discover_repo_context, ensure_workstacks_dir, worktree_path_for
-from workstack.cli.shell_utils import render_cd_script, write_script_to_temp
+from workstack.cli.commands.gc import (
+    DeletableWorktree,
+    find_deletable_worktrees,
+    format_deletable,
+)
+from workstack.cli.commands.remove import remove_worktrees
+from workstack.cli.core import (
+    GRAPHITE_SCOPE,
+    discover_repo_context,
+    ensure_workstacks_dir,
+    refresh_completion_index,
+    repo_lock,
+    worktree_path_for,
+)
+from workstack.cli.debug import debug_log
+from workstack.cli.shell_utils import render_cd_script, script_handoff
 from workstack.core.context import WorkstackContext
 
 
@@ -27,6 +44,75 @@ def _emit(message: str, *, script_mode: bool, error: bool = False) -> None:
     click.echo(message, err=error or script_mode)
 
 
+@contextmanager
+def _phase(phases: list[tuple[str, float]], name: str) -> Iterator[None]:
+    """Time a phase of sync, recording (name, seconds) in ``phases``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        phases.append((name, elapsed))
+        debug_log(f"sync: {name} took {elapsed * 1000:.1f} ms")
+
+
+def _run_gt_sync(
+    ctx: WorkstackContext, repo_root: Path, *, force: bool, dry_run: bool, script: bool
+) -> None:
+    """Run `gt sync [-f]`, exiting with its status if it fails."""
+    cmd = ["gt", "sync"]
+    if force:
+        cmd.append("-f")
+
+    if dry_run:
+        _emit(f"[DRY RUN] Would run {' '.join(cmd)}", script_mode=script)
+        return
+
+    _emit(f"Running: {' '.join(cmd)}", script_mode=script)
+    # Without -f, gt sync prompts on the terminal; holding the lock while the
+    # user answers would stall every other workstack process until it timed out
+    lock = repo_lock(ctx, repo_root, GRAPHITE_SCOPE) if force else nullcontext()
+    try:
+        with lock:
+            ctx.graphite_ops.sync(repo_root, force=force)
+    except subprocess.CalledProcessError as e:
+        _emit(
+            f"Error: gt sync failed with exit code {e.returncode}",
+            script_mode=script,
+            error=True,
+        )
+        raise SystemExit(e.returncode) from e
+    except FileNotFoundError as e:
+        _emit(
+            "Error: 'gt' command not found. Install Graphite CLI: "
+            "brew install withgraphite/tap/graphite",
+            script_mode=script,
+            error=True,
+        )
+        raise SystemExit(1) from e
+
+
+def _plan_cleanup(
+    ctx: WorkstackContext,
+    repo_root: Path,
+    workstacks_dir: Path,
+    phases: list[tuple[str, float]],
+) -> list[DeletableWorktree]:
+    """Find the managed worktrees whose branches are merged or whose PRs are closed.
+
+    Runs while gt sync rewrites Graphite's PR cache, so PR states come from
+    local merge detection and GitHub only.
+    """
+    with _phase(phases, "plan cleanup"):
+        worktrees = ctx.git_ops.list_worktrees(repo_root)
+        candidates = [
+            (wt.path.name, wt.branch)
+            for wt in worktrees
+            if wt.path != repo_root and wt.branch is not None and wt.path.parent == workstacks_dir
+        ]
+        return find_deletable_worktrees(ctx, repo_root, candidates, use_graphite_cache=False)
+
+
 def _return_to_original_worktree(
     workstacks_dir: Path, current_worktree_name: str | None, *, script_mode: bool
 ) -> None:
@@ -68,8 +154,11 @@ def _return_to_original_worktree(
     hidden=True,
     help="Output shell script for directory change instead of messages.",
 )
+@click.option("--timings", is_flag=True, help="Show how long each phase took.")
 @click.pass_obj
-def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) -> None:
+def sync_cmd(
+    ctx: WorkstackContext, force: bool, dry_run: bool, script: bool, timings: bool
+) -> None:
     """Sync with Graphite and clean up merged worktrees.
 
     This command must be run from a workstack-managed repository.
@@ -79,11 +168,14 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
     2. Save current worktree location
     3. Switch to root worktree (to avoid git checkout conflicts)
     4. Run `gt sync [-f]` from root
-    5. Identify merged/closed workstacks
+    5. Identify merged/closed workstacks (while gt sync runs)
     6. With -f: automatically remove worktrees without confirmation
     7. Without -f: show deletable worktrees and prompt for confirmation
     8. Return to original worktree (if it still exists)
     """
+    started = time.perf_counter()
+    # (phase, seconds) of each timed phase, in order of completion
+    phases: list[tuple[str, float]] = []
 
     # Step 1: Verify Graphite is enabled
     use_graphite = ctx.global_config_ops.get_use_graphite()
@@ -112,58 +204,15 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
         _emit(f"Switching to root worktree: {repo.root}", script_mode=script)
         os.chdir(repo.root)
 
-    # Step 4: Run `gt sync`
-    cmd = ["gt", "sync"]
-    if force:
-        cmd.append("-f")
-
-    if not dry_run:
-        _emit(f"Running: {' '.join(cmd)}", script_mode=script)
-        try:
-            ctx.graphite_ops.sync(repo.root, force=force)
-        except subprocess.CalledProcessError as e:
-            _emit(
-                f"Error: gt sync failed with exit code {e.returncode}",
-                script_mode=script,
-                error=True,
-            )
-            raise SystemExit(e.returncode) from e
-        except FileNotFoundError as e:
-            _emit(
-                "Error: 'gt' command not found. Install Graphite CLI: "
-                "brew install withgraphite/tap/graphite",
-                script_mode=script,
-                error=True,
-            )
-            raise SystemExit(1) from e
-    else:
-        _emit(f"[DRY RUN] Would run {' '.join(cmd)}", script_mode=script)
-
-    # Step 5: Identify deletable workstacks
-    worktrees = ctx.git_ops.list_worktrees(repo.root)
-
-    # Track workstacks eligible for deletion
-    deletable: list[tuple[str, str, str, int]] = []
-
-    for wt in worktrees:
-        # Skip root
-        if wt.path == repo.root:
-            continue
-
-        # Skip detached HEAD
-        if wt.branch is None:
-            continue
-
-        # Skip non-managed worktrees
-        if wt.path.parent != workstacks_dir:
-            continue
-
-        # Check PR status
-        state, pr_number, title = ctx.github_ops.get_pr_status(repo.root, wt.branch, debug=False)
-
-        if state in ("MERGED", "CLOSED") and pr_number is not None:
-            name = wt.path.name
-            deletable.append((name, wt.branch, state, pr_number))
+    # Steps 4 and 5 overlap: the cleanup plan is computed in a worker while
+    # `gt sync` runs here, where it can prompt on the terminal. Sync then takes
+    # about as long as the slower of the two network-bound steps. If gt sync
+    # fails, leaving the block still waits for the plan to finish.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plan = executor.submit(_plan_cleanup, ctx, repo.root, workstacks_dir, phases)
+        with _phase(phases, "gt sync"):
+            _run_gt_sync(ctx, repo.root, force=force, dry_run=dry_run, script=script)
+        deletable = plan.result()
 
     # Step 6: Display and optionally clean
     if not deletable:
@@ -171,14 +220,8 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
     else:
         _emit("\nWorkstacks safe to delete:\n", script_mode=script)
 
-        for name, branch, state, pr_number in deletable:
-            # Display formatted (reuse gc.py formatting)
-            name_part = click.style(name, fg="cyan", bold=True)
-            branch_part = click.style(f"[{branch}]", fg="yellow")
-            state_part = click.style(state.lower(), fg="green" if state == "MERGED" else "red")
-            pr_part = click.style(f"PR #{pr_number}", fg="bright_black")
-
-            _emit(f"  {name_part} {branch_part} - {state_part} ({pr_part})", script_mode=script)
+        for worktree in deletable:
+            _emit(f"  {format_deletable(worktree)}", script_mode=script)
 
         _emit("", script_mode=script)  # Blank line
 
@@ -193,28 +236,43 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
                 )
                 return
 
-        # Remove each worktree
-        for name, _branch, _state, _pr_number in deletable:
-            if dry_run:
+        # Remove the worktrees in one batch
+        if dry_run:
+            for worktree in deletable:
                 _emit(
-                    f"[DRY RUN] Would remove worktree: {name} (branch: {_branch})",
+                    f"[DRY RUN] Would remove worktree: {worktree.name} (branch: {worktree.branch})",
                     script_mode=script,
                 )
-            else:
-                _emit(f"Removing worktree: {name} (branch: {_branch})", script_mode=script)
-                # Reuse remove logic from remove.py
-                _remove_worktree(
+        else:
+            for worktree in deletable:
+                _emit(
+                    f"Removing worktree: {worktree.name} (branch: {worktree.branch})",
+                    script_mode=script,
+                )
+            with _phase(phases, "remove worktrees"):
+                outcomes = remove_worktrees(
                     ctx,
-                    name,
-                    force=True,  # Already confirmed above
-                    delete_stack=False,  # Leave branches for gt sync -f
-                    dry_run=False,
+                    repo.root,
+                    [worktree_path_for(workstacks_dir, worktree.name) for worktree in deletable],
                 )
-
-        # Step 6.5: Automatically run second gt sync -f to delete branches (when force=True)
+            for outcome in outcomes:
+                if outcome.error is None:
+                    _emit(f"✅ {click.style(str(outcome.path), fg='green')}", script_mode=script)
+                else:
+                    _emit(
+                        f"❌ {click.style(str(outcome.path), fg='red')}: {outcome.error}",
+                        script_mode=script,
+                        error=True,
+                    )
+
+        # Step 6.5: Automatically run second gt sync -f to delete branches (when force=True).
+        # gt cannot delete branches that are still checked out, so this waits
+        # for the removals; they only rename the worktrees into the trash,
+        # and deleting their files overlaps with it in the background reaper.
         if force and not dry_run and deletable:
             _emit("\nDeleting merged branches...", script_mode=script)
-            ctx.graphite_ops.sync(repo.root, force=True)
+            with _phase(phases, "gt sync -f"), repo_lock(ctx, repo.root, GRAPHITE_SCOPE):
+                ctx.graphite_ops.sync(repo.root, force=True)
             _emit("✓ Merged branches deleted.", script_mode=script)
 
         # Only show manual instruction if force was not used
@@ -224,8 +282,10 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
                 script_mode=script,
             )
 
+    refresh_completion_index(ctx, repo)
+
     # Step 7: Return to original worktree
-    script_output_path: Path | None = None
+    script_output: str | None = None
 
     if current_worktree_name:
         wt_path = worktree_path_for(workstacks_dir, current_worktree_name)
@@ -242,7 +302,7 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
                     comment=f"return to {current_worktree_name}",
                     success_message=f"✓ Returned to {current_worktree_name}.",
                 )
-                script_output_path = write_script_to_temp(
+                script_output = script_handoff(
                     script_content,
                     command_name="sync",
                     comment=f"return to {current_worktree_name}",
@@ -259,12 +319,18 @@ def sync_cmd(ctx: WorkstackContext, force: bool, dry_run: bool, script: bool) ->
                     comment="return to root",
                     success_message="✓ Switched to root worktree.",
                 )
-                script_output_path = write_script_to_temp(
+                script_output = script_handoff(
                     script_content,
                     command_name="sync",
                     comment="return to root",
                 )
 
-    # Output temp file path for shell wrapper
-    if script and script_output_path:
-        click.echo(str(script_output_path), nl=False)
+    if timings:
+        _emit("\nTimings:", script_mode=script)
+        for name, seconds in phases:
+            _emit(f"  {name}: {seconds:.2f}s", script_mode=script)
+        _emit(f"  total: {time.perf_counter() - started:.2f}s", script_mode=script)
+
+    # Output script (or its file path) for shell wrapper
+    if script and script_output:
+        click.echo(script_output, nl=False)
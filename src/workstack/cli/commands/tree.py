@@ -5,13 +5,35 @@ from pathlib import Path
 import click
 
 from workstack.cli.core import discover_repo_context
-from workstack.cli.tree import build_workstack_tree, render_tree
+from workstack.cli.records import OUTPUT_FORMATS, RecordWriter, load_pr_map, pr_record
+from workstack.cli.tree import TreeNode, build_workstack_tree, render_tree, walk_tree
 from workstack.core.context import WorkstackContext
+from workstack.core.plan_index import PLAN_FILENAME, PlanIndex
 
 
 @click.command("tree")
+@click.option(
+    "--root",
+    "root_branch",
+    help="Only show the subtree starting at this branch",
+)
+@click.option(
+    "--depth",
+    "max_depth",
+    type=click.IntRange(min=0),
+    help="Only show this many levels below the top (0 = top level only)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="text",
+    help="Output format; json and ndjson stream one record per worktree",
+)
 @click.pass_obj
-def tree_cmd(ctx: WorkstackContext) -> None:
+def tree_cmd(
+    ctx: WorkstackContext, root_branch: str | None, max_depth: int | None, output_format: str
+) -> None:
     """Display tree of worktrees with their dependencies.
 
     Shows ONLY branches that have active worktrees, organized
@@ -29,16 +51,60 @@ def tree_cmd(ctx: WorkstackContext) -> None:
     Legend:
         [@worktree-name] = worktree directory name
         Current worktree is highlighted in bright green
+
+    A worktree whose Graphite parent has no worktree is shown under its
+    nearest ancestor that does. Use --root to show one subtree and --depth
+    to limit how many levels are shown.
+
+    With --format json or ndjson, one record per worktree is written in the
+    same order as the text tree: name, path, branch, parent, depth,
+    is_current, pr and plan_title.
     """
     repo = discover_repo_context(ctx, Path.cwd())
 
     # Build tree structure (will exit with error if Graphite cache missing)
-    roots = build_workstack_tree(ctx, repo.root)
+    roots = build_workstack_tree(ctx, repo.root, root_branch=root_branch, max_depth=max_depth)
 
     if not roots:
         click.echo("No worktrees found", err=True)
         raise SystemExit(1)
 
+    if output_format != "text":
+        _write_tree_records(ctx, repo.root, roots, output_format)
+        return
+
     # Render and display
     tree_output = render_tree(roots)
     click.echo(tree_output)
+
+
+def _write_tree_records(
+    ctx: WorkstackContext, repo_root: Path, roots: list[TreeNode], output_format: str
+) -> None:
+    """Stream one structured record per tree node, in pre-order."""
+    prs = load_pr_map(ctx, repo_root, show_checks=False)
+    plan_index = PlanIndex.for_worktree(repo_root)
+    writer = RecordWriter(output_format)
+
+    for node, depth, parent in walk_tree(roots):
+        path = node.worktree_path
+        plan = None
+        if path is not None and path.exists():
+            plan = plan_index.get(path / PLAN_FILENAME)
+        pr = prs.get(node.branch_name) if prs is not None else None
+
+        writer.write(
+            {
+                "name": node.worktree_name,
+                "path": str(path) if path is not None else None,
+                "branch": node.branch_name,
+                "parent": parent.branch_name if parent is not None else None,
+                "depth": depth,
+                "is_current": node.is_current,
+                "pr": pr_record(ctx, pr),
+                "plan_title": plan.title if plan is not None else None,
+            }
+        )
+
+    writer.close()
+    plan_index.save()
@@ -0,0 +1,132 @@
+"""Fast path for shell completion.
+
+The completion scripts generated by `workstack completion` call workstack
+with ``_WORKSTACK_COMPLETE`` set on every TAB. workstack.main() dispatches
+here first: when the word being completed is the worktree or branch argument
+of a command below, the answer comes from the completion index in the git
+common directory, without importing click or the ops layer.
+
+Anything else (options, subcommand names, a missing or stale index, a
+command line with quoting) returns False, and click's own completion runs.
+The output mirrors click's bash, zsh and fish formats for plain items.
+"""
+
+import os
+import sys
+
+from workstack.core.completion_index import (
+    BRANCHES,
+    WORKTREES,
+    lookup_candidates,
+    read_completion_index,
+)
+from workstack.core.status_snapshot import locate_worktree, read_common_dir
+
+# Commands whose first positional argument is completed from the index
+COMPLETION_SOURCES = {
+    "switch": WORKTREES,
+    "rm": WORKTREES,
+    "remove": WORKTREES,
+    "rename": WORKTREES,
+    "move": WORKTREES,
+    "jump": BRANCHES,
+}
+
+_SHELLS = {"bash_complete": "bash", "zsh_complete": "zsh", "fish_complete": "fish"}
+
+
+def parse_completion_request(
+    shell: str, comp_words: str, comp_cword: str
+) -> tuple[list[str], str] | None:
+    """Split the shell's completion variables into (args, incomplete).
+
+    Follows click's protocol: bash and zsh pass the index of the word being
+    completed in COMP_CWORD, fish passes the word itself.
+
+    Returns:
+        Arguments after the program name and the partial word, or None when
+        the command line needs shell-style unquoting (left to click)
+    """
+    if any(char in comp_words or char in comp_cword for char in "\"'\\"):
+        return None
+
+    words = comp_words.split()
+    if shell == "fish":
+        incomplete = comp_cword.strip()
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+
+    if not comp_cword.isdigit():
+        return None
+    cword = int(comp_cword)
+    args = words[1:cword]
+    incomplete = words[cword] if cword < len(words) else ""
+    return args, incomplete
+
+
+def complete_from_index(cwd: str, args: list[str], incomplete: str) -> list[str] | None:
+    """Answer a completion request from the completion index.
+
+    Args:
+        cwd: Directory the shell is in
+        args: Arguments after the program name, excluding the partial word
+        incomplete: Partial word being completed
+
+    Returns:
+        Completions, or None when the request must go through click
+    """
+    if len(args) != 1 or args[0] not in COMPLETION_SOURCES or incomplete.startswith("-"):
+        return None
+
+    location = locate_worktree(cwd)
+    if location is None:
+        return None
+    common_dir = read_common_dir(location[1])
+
+    index = read_completion_index(common_dir)
+    if index is None:
+        return None
+    return lookup_candidates(index, common_dir, COMPLETION_SOURCES[args[0]], incomplete)
+
+
+def format_completions(shell: str, names: list[str]) -> str:
+    """Render completions the way click's completion classes do for plain items."""
+    if shell == "zsh":
+        return "\n".join(f"plain\n{name}\n_" for name in names)
+    return "\n".join(f"plain,{name}" for name in names)
+
+
+def run_fast_path(mode: str) -> bool:
+    """Handle a shell completion request without importing click.
+
+    Args:
+        mode: Value of ``_WORKSTACK_COMPLETE``
+
+    Returns:
+        True if the request was answered, False if the caller should fall back
+        to click's completion
+    """
+    shell = _SHELLS.get(mode)
+    if shell is None:
+        return False
+
+    request = parse_completion_request(
+        shell, os.environ.get("COMP_WORDS", ""), os.environ.get("COMP_CWORD", "")
+    )
+    if request is None:
+        return False
+
+    # Error boundary: any surprise while reading git metadata or the index
+    # (a deleted cwd, a file mid-rewrite) falls back to click's completion.
+    try:
+        names = complete_from_index(os.getcwd(), *request)
+    except (OSError, ValueError):
+        return False
+    if names is None:
+        return False
+
+    if names:
+        sys.stdout.write(format_completions(shell, names) + "\n")
+    return True
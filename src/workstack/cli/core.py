@@ -1,8 +1,13 @@
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
+from workstack.core.completion_index import write_completion_index
 from workstack.core.context import WorkstackContext
 
 
@@ -59,6 +64,144 @@ def ensure_workstacks_dir(repo: RepoContext) -> Path:
     return repo.workstacks_dir
 
 
+def list_worktree_dirs(workstacks_dir: Path) -> list[Path]:
+    """List the worktree directories of a repository, skipping its trash."""
+    # Imported here so that commands which never list worktrees do not load it
+    from workstack.core.trash import TRASH_DIRNAME
+
+    if not workstacks_dir.exists():
+        return []
+    return [p for p in workstacks_dir.iterdir() if p.is_dir() and p.name != TRASH_DIRNAME]
+
+
+def list_completion_branches(ctx: WorkstackContext, repo: RepoContext) -> list[str]:
+    """List the branch names offered by shell completion: local and Graphite-tracked."""
+    branches = set(ctx.git_ops.list_branch_heads(repo.root))
+    if ctx.global_config_ops.get_use_graphite():
+        branches.update(ctx.graphite_ops.get_all_branches(ctx.git_ops, repo.root))
+    return sorted(branches)
+
+
+def refresh_completion_index(ctx: WorkstackContext, repo: RepoContext) -> None:
+    """Rewrite the completion index and update the fuzzy worktree index.
+
+    Called by the commands that add, remove or rename worktrees or branches,
+    so that the next TAB completion is answered without importing the CLI
+    and the next `switch --fuzzy` searches an up-to-date index.
+
+    Args:
+        ctx: Workstack context
+        repo: Repository whose index to rewrite
+    """
+    if ctx.dry_run:
+        return
+
+    git_common_dir = ctx.git_ops.get_git_common_dir(repo.root)
+    if git_common_dir is None or not git_common_dir.is_dir():
+        return
+
+    worktrees = [p.name for p in list_worktree_dirs(repo.workstacks_dir)]
+
+    branches = list_completion_branches(ctx, repo)
+
+    # The index stores space-separated lists; a name with whitespace can only
+    # be a directory created by hand, and is left to click's completion
+    write_completion_index(
+        str(git_common_dir),
+        workstacks_dir=str(repo.workstacks_dir),
+        worktrees=[name for name in worktrees if name.split() == [name]],
+        branches=[name for name in branches if name.split() == [name]],
+    )
+
+    # Imported here so that commands which never change worktrees do not pay for it
+    from workstack.cli.fuzzy import refresh_fuzzy_index
+
+    refresh_fuzzy_index(ctx, repo)
+
+
+# Lock scopes. When both are needed, WORKTREES_SCOPE is taken first.
+# Worktree metadata (add, remove, move, prune) and checkouts in other worktrees
+WORKTREES_SCOPE = "worktrees"
+# Graphite's branch metadata and the refs it rewrites (gt create, sync, delete)
+GRAPHITE_SCOPE = "graphite"
+
+# Seconds to wait for another workstack process to release a repository lock
+LOCK_TIMEOUT_ENV_VAR = "WORKSTACK_LOCK_TIMEOUT"
+
+
+@contextmanager
+def repo_lock(
+    ctx: WorkstackContext, repo_root: Path, scope: str, *, shared: bool = False
+) -> Iterator[None]:
+    """Serialize with other workstack processes working on ``scope`` of a repository.
+
+    Waits are reported on stderr
+    and, with WORKSTACK_DEBUG=1, timed in the debug log. Dry runs change
+    nothing and take no locks.
+
+    Args:
+        ctx: Workstack context
+        repo_root: Repository (or worktree) root
+        scope: Lock scope, e.g. WORKTREES_SCOPE
+        shared: Take the lock shared, for reading
+
+    Raises:
+        SystemExit: If the lock is not released within the timeout
+    """
+    git_common_dir = ctx.git_ops.get_git_common_dir(repo_root)
+    if ctx.dry_run or git_common_dir is None or not git_common_dir.is_dir():
+        yield
+        return
+
+    # Imported here so that commands which never lock stay within their
+    # import budgets
+    from workstack.cli.debug import debug_log
+    from workstack.core.repo_lock import (
+        DEFAULT_TIMEOUT_SECONDS,
+        LockTimeoutError,
+        file_lock,
+        repo_lock_path,
+    )
+
+    timeout_text = os.environ.get(LOCK_TIMEOUT_ENV_VAR, "")
+    timeout = DEFAULT_TIMEOUT_SECONDS
+    if timeout_text.replace(".", "", 1).isdigit():
+        timeout = float(timeout_text)
+    mode = "shared" if shared else "exclusive"
+
+    def report_wait() -> None:
+        click.echo(f"Waiting for another workstack process ({scope} lock)...", err=True)
+
+    # Error boundary: a lock timeout anywhere in the block (including nested
+    # locks) ends the command with an explanation instead of a traceback.
+    try:
+        with file_lock(
+            repo_lock_path(git_common_dir, scope),
+            shared=shared,
+            timeout=timeout,
+            on_contention=report_wait,
+        ) as stats:
+            if not stats.reentered:
+                debug_log(
+                    f"Lock {scope} ({mode}): acquired after {stats.waited_seconds * 1000:.1f} ms"
+                )
+            acquired_at = time.monotonic()
+            try:
+                yield
+            finally:
+                if not stats.reentered:
+                    held_ms = (time.monotonic() - acquired_at) * 1000
+                    debug_log(f"Lock {scope} ({mode}): released after {held_ms:.1f} ms")
+    except LockTimeoutError as e:
+        click.echo(
+            f"Error: {e}\n"
+            f"Another workstack process is still working on this repository. "
+            f"Retry once it finishes, or set {LOCK_TIMEOUT_ENV_VAR} to wait longer.",
+            err=True,
+        )
+        raise SystemExit(1) from None
+
+
 def worktree_path_for(workstacks_dir: Path, name: str) -> Path:
     """Return the absolute path for a named worktree within workstacks_dir.
 
@@ -84,6 +227,7 @@ def validate_worktree_name_for_removal(name: str) -> None:
     - `root` (explicit root worktree name)
     - Names starting with `/` (absolute paths)
     - Names containing `/` (path separators)
+    - The trash directory of removed worktrees
 
     Raises SystemExit(1) with error message if validation fails.
     """
@@ -106,3 +250,10 @@ def validate_worktree_name_for_removal(name: str) -> None:
     if "/" in name:
         click.echo(f"Error: Cannot remove '{name}' - path separators not allowed", err=True)
         raise SystemExit(1)
+
+    # Imported here so that commands which never remove worktrees do not load it
+    from workstack.core.trash import TRASH_DIRNAME
+
+    if name == TRASH_DIRNAME:
+        click.echo(f"Error: Cannot remove '{name}' - it holds worktrees being deleted", err=True)
+        raise SystemExit(1)
@@ -0,0 +1,242 @@
+"""Resolving `workstack switch --fuzzy QUERY` to a worktree.
+
+Documents are built from local metadata only (git worktree list, Graphite's
+cache files and plan files, whose titles come from the plan index). The
+commands that change worktrees update the fuzzy index next to the
+completion index; a lookup loads it and only rebuilds it when its source
+signature shows the metadata changed behind workstack's back. When the best
+match is not clearly ahead of the rest, a numbered picker is shown on the
+controlling terminal; it reads /dev/tty directly because the shell wrapper
+captures the command's stdout.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import TextIO
+
+import click
+
+from workstack.cli.core import RepoContext
+from workstack.cli.graphite import (
+    BranchInfo,
+    _load_graphite_cache,
+    parse_branch_info,
+    stack_from_branch_info,
+)
+from workstack.core.context import WorkstackContext
+from workstack.core.fuzzy_index import (
+    FuzzyDocument,
+    FuzzyIndex,
+    FuzzyMatch,
+    index_source_signature,
+    last_activity,
+    normalize_query,
+)
+from workstack.core.github_ops import PullRequestInfo
+from workstack.core.plan_index import PLAN_FILENAME, PlanIndex
+
+# Matches offered by the picker
+PICKER_LIMIT = 10
+
+# The best match is taken without asking when its score is at least this
+# multiple of the runner-up's
+UNAMBIGUOUS_RATIO = 1.5
+
+TERMINAL_PATH = "/dev/tty"
+
+
+def collect_fuzzy_documents(ctx: WorkstackContext, repo: RepoContext) -> list[FuzzyDocument]:
+    """Build the searchable document of every worktree of the repository."""
+    git_common_dir = ctx.git_ops.get_git_common_dir(repo.root)
+    use_graphite = ctx.global_config_ops.get_use_graphite()
+
+    branch_graph: dict[str, BranchInfo] = {}
+    prs: dict[str, PullRequestInfo] = {}
+    if use_graphite and git_common_dir is not None:
+        cache_file = git_common_dir / ".graphite_cache_persist"
+        if cache_file.exists():
+            branch_graph = parse_branch_info(_load_graphite_cache(cache_file))
+        prs = ctx.graphite_ops.get_prs_from_graphite(ctx.git_ops, repo.root)
+
+    plan_index = PlanIndex.load(git_common_dir)
+    trunk_branches = {name for name, info in branch_graph.items() if info["is_trunk"]}
+
+    documents: list[FuzzyDocument] = []
+    for worktree in ctx.git_ops.list_worktrees(repo.root):
+        name = "root" if worktree.path == repo.root else worktree.path.name
+
+        # Every stack starts at trunk, so a trunk worktree's "stack" would be
+        # whatever chain of first children happens to hang off it
+        stack: tuple[str, ...] = ()
+        if worktree.branch is not None and worktree.branch not in trunk_branches:
+            full_stack = stack_from_branch_info(branch_graph, worktree.branch) or []
+            stack = tuple(
+                branch
+                for branch in full_stack
+                if branch != worktree.branch and branch not in trunk_branches
+            )
+
+        plan = plan_index.get(worktree.path / PLAN_FILENAME)
+        pr = prs.get(worktree.branch) if worktree.branch is not None else None
+        documents.append(
+            FuzzyDocument(
+                name=name,
+                path=str(worktree.path),
+                branch=worktree.branch,
+                stack=stack,
+                plan_title=plan.title if plan is not None else None,
+                pr_number=pr.number if pr is not None else None,
+            )
+        )
+
+    plan_index.save()
+    return documents
+
+
+def refresh_fuzzy_index(ctx: WorkstackContext, repo: RepoContext) -> FuzzyIndex:
+    """Rebuild the documents of the fuzzy index and persist the changes.
+
+    Args:
+        ctx: Workstack context
+        repo: Repository whose index to update
+
+    Returns:
+        The updated index
+    """
+    git_common_dir = ctx.git_ops.get_git_common_dir(repo.root)
+    index = FuzzyIndex.load(git_common_dir)
+    _rebuild_index(ctx, repo, index, git_common_dir)
+    return index
+
+
+def _rebuild_index(
+    ctx: WorkstackContext, repo: RepoContext, index: FuzzyIndex, git_common_dir: Path | None
+) -> None:
+    # Taken before the documents, so that a change made meanwhile is seen by
+    # the next lookup
+    if git_common_dir is not None and git_common_dir.is_dir():
+        index.source_signature = index_source_signature(git_common_dir)
+    index.update(collect_fuzzy_documents(ctx, repo))
+    index.save()
+
+
+def find_fuzzy_matches(
+    ctx: WorkstackContext, repo: RepoContext, query: str, *, limit: int
+) -> list[FuzzyMatch]:
+    """Search the fuzzy index, rebuilding it only if its sources changed.
+
+    Args:
+        ctx: Workstack context
+        repo: Repository to search
+        query: Text typed by the user; empty lists worktrees by recency
+        limit: Maximum number of matches
+
+    Returns:
+        Matches, best first
+    """
+    git_common_dir = ctx.git_ops.get_git_common_dir(repo.root)
+    index = FuzzyIndex.load(git_common_dir)
+    if (
+        git_common_dir is None
+        or not git_common_dir.is_dir()
+        or index.source_signature != index_source_signature(git_common_dir)
+    ):
+        _rebuild_index(ctx, repo, index, git_common_dir)
+
+    # Only the worktrees that can match need their activity looked up
+    candidates = index.candidates(normalize_query(query))
+    activity = {document.name: last_activity(Path(document.path)) for document in candidates}
+    return index.search(query, activity=activity, now=time.time(), limit=limit)
+
+
+def is_unambiguous(query: str, matches: list[FuzzyMatch]) -> bool:
+    """Check whether the best match can be taken without asking.
+
+    Worktree names are unique, so a query naming one exactly always wins.
+    """
+    best = matches[0]
+    if len(matches) == 1:
+        return True
+    if best.field == "name" and best.text.lower() == normalize_query(query):
+        return True
+    return best.score >= matches[1].score * UNAMBIGUOUS_RATIO
+
+
+def describe_match(match: FuzzyMatch) -> str:
+    """Render one picker line: worktree name, branch and what matched."""
+    document = match.document
+    line = click.style(document.name, fg="cyan", bold=True)
+    if document.branch is not None:
+        line += " " + click.style(f"[{document.branch}]", fg="yellow")
+    if document.pr_number is not None:
+        line += " " + click.style(f"#{document.pr_number}", fg="bright_black")
+    if match.field in ("stack", "plan"):
+        line += " " + click.style(f"({match.field}: {match.text})", fg="bright_black")
+    return line
+
+
+def open_terminal() -> TextIO | None:
+    """Open the controlling terminal for the picker, or return None if there is none."""
+    if not os.path.exists(TERMINAL_PATH):
+        return None
+
+    # /dev/tty exists even for processes without a controlling terminal
+    # (cron, CI, the shell daemon); opening it is the only way to find out.
+    try:
+        return open(TERMINAL_PATH, "r+", encoding="utf-8")
+    except OSError:
+        return None
+
+
+def pick_match(matches: list[FuzzyMatch], terminal: TextIO) -> FuzzyMatch | None:
+    """Let the user choose among ``matches`` on ``terminal``.
+
+    Returns:
+        The chosen match, or None if the answer was not a listed number
+    """
+    for number, match in enumerate(matches, start=1):
+        terminal.write(f"{number:>3}. {describe_match(match)}\n")
+    terminal.write(f"Select worktree [1-{len(matches)}] (default 1): ")
+    terminal.flush()
+
+    answer = terminal.readline().strip()
+    if not answer:
+        return matches[0]
+    if answer.isdigit() and 1 <= int(answer) <= len(matches):
+        return matches[int(answer) - 1]
+    return None
+
+
+def resolve_fuzzy_target(ctx: WorkstackContext, repo: RepoContext, query: str) -> FuzzyMatch:
+    """Resolve a fuzzy query to one worktree, asking the user when ambiguous.
+
+    Raises:
+        SystemExit: If nothing matches, or the choice is ambiguous and no
+            terminal is available to ask on, or the user aborts the picker
+    """
+    matches = find_fuzzy_matches(ctx, repo, query, limit=PICKER_LIMIT)
+    if not matches:
+        click.echo(f"Error: No worktree matches '{query}'", err=True)
+        raise SystemExit(1)
+
+    if query and is_unambiguous(query, matches):
+        return matches[0]
+
+    terminal = open_terminal()
+    if terminal is None:
+        if not query:
+            click.echo("Error: --fuzzy without a query needs an interactive terminal", err=True)
+        else:
+            click.echo(f"Error: '{query}' matches several worktrees:", err=True)
+            for match in matches:
+                click.echo(f"  {describe_match(match)}", err=True)
+            click.echo("Refine the query or pass an exact worktree name.", err=True)
+        raise SystemExit(1)
+
+    with terminal:
+        choice = pick_match(matches, terminal)
+    if choice is None:
+        click.echo("Aborted.", err=True)
+        raise SystemExit(1)
+    return choice
@@ -79,6 +79,7 @@ to find the shared git directory where `.graphite_cache_persist` is stored.
 """
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypedDict
 
@@ -140,7 +141,21 @@ def _load_branch_info(ctx: WorkstackContext, repo_root: Path) -> dict[str, Branc
     if not cache_file.exists():
         return None
 
-    cache_data = _load_graphite_cache(cache_file)
+    return parse_branch_info(_load_graphite_cache(cache_file))
+
+
+def parse_branch_info(cache_data: dict[str, Any]) -> dict[str, BranchInfo]:
+    """Build the parent-child graph from already-loaded Graphite cache data.
+
+    Callers that need stacks for many branches should load the cache once,
+    parse it with this function and use stack_from_branch_info() per branch.
+
+    Args:
+        cache_data: Parsed content of `.graphite_cache_persist`
+
+    Returns:
+        Dictionary mapping branch name to BranchInfo
+    """
     branches_data: list[Any] = cache_data.get("branches", [])
 
     # Build parent-child relationship graph
@@ -219,6 +234,22 @@ def get_branch_stack(ctx: WorkstackContext, repo_root: Path, branch: str) -> lis
     if branch_info is None:
         return None
 
+    return stack_from_branch_info(branch_info, branch)
+
+
+def stack_from_branch_info(branch_info: dict[str, BranchInfo], branch: str) -> list[str] | None:
+    """Get the linear stack for a branch from a pre-built branch graph.
+
+    Same traversal as get_branch_stack(), without touching the cache file.
+
+    Args:
+        branch_info: Branch graph from parse_branch_info()
+        branch: Name of the branch to get the stack for
+
+    Returns:
+        List of branch names ordered from trunk to leaf, or None if the
+        branch is not tracked by graphite
+    """
     # Check if the requested branch exists in graphite's cache
     if branch not in branch_info:
         return None
@@ -263,6 +294,65 @@ def get_branch_stack(ctx: WorkstackContext, repo_root: Path, branch: str) -> lis
     return ancestors + descendants
 
 
+@dataclass(frozen=True)
+class StackPosition:
+    """Where a branch sits in its linear stack.
+
+    Attributes:
+        branch: The branch the position is for
+        chain: Branches from trunk to leaf, following the first child at forks
+        index: Position of ``branch`` in ``chain``
+        forks: Children of every branch in ``chain`` that has more than one
+    """
+
+    branch: str
+    chain: tuple[str, ...]
+    index: int
+    forks: dict[str, tuple[str, ...]]
+
+
+def get_stack_position(ctx: WorkstackContext, repo_root: Path, branch: str) -> StackPosition | None:
+    """Locate a branch in its stack with a single read of the Graphite cache.
+
+    Navigating several levels at once indexes into the returned chain instead
+    of calling get_parent_branch() or get_child_branches() once per level.
+
+    Unlike get_branch_stack(), the chain also includes a parent or first
+    child that is named in the metadata but missing from the cache (usually
+    an untracked trunk), since navigation can still reach it.
+
+    Args:
+        ctx: Workstack context with git operations
+        repo_root: Path to the repository root (or worktree root)
+        branch: Name of the branch to locate
+
+    Returns:
+        The branch's position, or None if the cache is unavailable or the
+        branch is not tracked by graphite
+    """
+    branch_info = _load_branch_info(ctx, repo_root)
+    if branch_info is None:
+        return None
+
+    stack = stack_from_branch_info(branch_info, branch)
+    if stack is None:
+        return None
+
+    parent = branch_info[stack[0]]["parent"]
+    if parent is not None and parent not in branch_info:
+        stack.insert(0, parent)
+    children = branch_info[stack[-1]]["children"]
+    if children and children[0] not in branch_info:
+        stack.append(children[0])
+
+    forks = {
+        name: tuple(branch_info[name]["children"])
+        for name in stack
+        if name in branch_info and len(branch_info[name]["children"]) > 1
+    }
+    return StackPosition(branch=branch, chain=tuple(stack), index=stack.index(branch), forks=forks)
+
+
 def get_parent_branch(ctx: WorkstackContext, repo_root: Path, branch: str) -> str | None:
     """Get the parent branch of a given branch in the Graphite stack.
 
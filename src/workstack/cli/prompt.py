@@ -0,0 +1,171 @@
+"""Fast path for `workstack prompt`.
+
+`workstack prompt` runs on every shell prompt, so workstack.main() dispatches
+here before click, the ops layer or any collector is imported. The cached
+path only stats a few files under the worktree's git directory and reads the
+snapshot written by `workstack prompt --refresh`.
+
+When the snapshot is stale the segment is still printed from what is known
+(the branch always comes straight from HEAD), and a detached background
+process is started to recompute the snapshot for the next prompt.
+"""
+
+import os
+import sys
+import time
+
+from workstack.core.status_snapshot import (
+    DEFAULT_PROMPT_FORMAT,
+    branch_from_head,
+    compute_snapshot_key,
+    format_prompt_segment,
+    is_root_worktree,
+    is_snapshot_fresh,
+    locate_worktree,
+    mark_refresh_started,
+    prompt_format_error,
+    read_head,
+    read_snapshot,
+    should_start_refresh,
+)
+
+
+def parse_prompt_args(argv: list[str]) -> tuple[str, bool] | None:
+    """Parse the arguments the fast path understands.
+
+    Args:
+        argv: Arguments following `workstack prompt`
+
+    Returns:
+        Tuple of (format, refresh_allowed), or None if the arguments should be
+        handled by the click command instead (help, --refresh, typos)
+    """
+    fmt = DEFAULT_PROMPT_FORMAT
+    refresh_allowed = True
+
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg == "--no-refresh":
+            refresh_allowed = False
+        elif arg == "--format" and idx + 1 < len(argv):
+            idx += 1
+            fmt = argv[idx]
+        elif arg.startswith("--format="):
+            fmt = arg[len("--format=") :]
+        else:
+            return None
+        idx += 1
+
+    return fmt, refresh_allowed
+
+
+def render_prompt(cwd: str, fmt: str) -> tuple[str, tuple[str, str] | None]:
+    """Render the prompt segment for the worktree containing ``cwd``.
+
+    Args:
+        cwd: Current working directory
+        fmt: Prompt format string
+
+    Returns:
+        Tuple of (segment, stale_location). ``stale_location`` is the
+        (worktree_root, git_dir) pair whose snapshot needs a refresh, or None
+        if the snapshot is fresh or ``cwd`` is not inside a worktree.
+    """
+    location = locate_worktree(cwd)
+    if location is None:
+        return "", None
+
+    worktree_root, git_dir = location
+    head = read_head(git_dir)
+    if head is None:
+        return "", None
+
+    branch = branch_from_head(head)
+    if branch is None:
+        branch = head[:7]
+
+    if is_root_worktree(git_dir, worktree_root):
+        worktree = "root"
+    else:
+        worktree = os.path.basename(worktree_root)
+
+    snapshot = read_snapshot(git_dir)
+    segment = format_prompt_segment(fmt, worktree=worktree, branch=branch, snapshot=snapshot)
+
+    key = compute_snapshot_key(git_dir, head)
+    if is_snapshot_fresh(snapshot, key, now=time.time()):
+        return segment, None
+    return segment, location
+
+
+def refresh_command() -> list[str]:
+    """Return the command that recomputes the snapshot of the current worktree."""
+    return [sys.executable, "-m", "workstack", "prompt", "--refresh"]
+
+
+def claim_refresh(git_dir: str) -> bool:
+    """Mark a refresh as started, unless another one is already in flight.
+
+    Returns:
+        True if the caller should start the refresh
+    """
+    if not should_start_refresh(git_dir, now=time.time()):
+        return False
+    mark_refresh_started(git_dir)
+    return True
+
+
+def spawn_refresh(worktree_root: str, git_dir: str) -> None:
+    """Start a detached `workstack prompt --refresh` for the given worktree.
+
+    The child runs in its own session with no inherited stdio, so the shell
+    neither waits for it nor reports it as a job. This is the fast path's
+    equivalent of ShellOps.spawn_detached(), which it cannot import cheaply.
+    """
+    if not claim_refresh(git_dir):
+        return
+
+    import subprocess
+
+    subprocess.Popen(
+        refresh_command(),
+        cwd=worktree_root,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def run_fast_path(argv: list[str]) -> bool:
+    """Handle `workstack prompt` without importing click.
+
+    Args:
+        argv: Arguments following `workstack prompt`
+
+    Returns:
+        True if the command was handled, False if the caller should fall back
+        to the click command
+    """
+    parsed = parse_prompt_args(argv)
+    if parsed is None:
+        return False
+
+    fmt, refresh_allowed = parsed
+    # The click command reports the broken format
+    if prompt_format_error(fmt) is not None:
+        return False
+
+    # Error boundary: a prompt must never print a traceback. The cwd may have
+    # been deleted underneath the shell, and git metadata may be mid-rewrite.
+    try:
+        segment, stale_location = render_prompt(os.getcwd(), fmt)
+        if stale_location is not None and refresh_allowed:
+            spawn_refresh(*stale_location)
+    except (OSError, ValueError, KeyError, IndexError):
+        return True
+
+    if segment:
+        sys.stdout.write(segment + "\n")
+    return True
@@ -0,0 +1,98 @@
+"""Structured (JSON / NDJSON) output shared by listing commands.
+
+`workstack list` and `workstack tree` can emit one record per worktree
+instead of coloured text. Records are written as soon as each one is
+computed, so downstream tools (``jq``, ``head``, pagers) can start consuming
+a large listing before it is complete:
+
+- ``ndjson``: one compact JSON object per line
+- ``json``: a JSON array, written incrementally with one record per line
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import click
+
+from workstack.core.context import WorkstackContext
+from workstack.core.github_ops import PullRequestInfo
+
+OUTPUT_FORMATS = ["text", "json", "ndjson"]
+
+
+class RecordWriter:
+    """Writes records to stdout in JSON or NDJSON format as they are produced."""
+
+    def __init__(self, output_format: str) -> None:
+        """Create a writer.
+
+        Args:
+            output_format: Either "json" or "ndjson"
+        """
+        self.output_format = output_format
+        self._count = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record immediately."""
+        encoded = json.dumps(record)
+        if self.output_format == "ndjson":
+            click.echo(encoded)
+        elif self._count == 0:
+            click.echo(f"[\n  {encoded}", nl=False)
+        else:
+            click.echo(f",\n  {encoded}", nl=False)
+        self._count += 1
+
+    def close(self) -> None:
+        """Finish the output (closes the JSON array; no-op for NDJSON)."""
+        if self.output_format != "json":
+            return
+        if self._count == 0:
+            click.echo("[]")
+        else:
+            click.echo("\n]")
+
+
+def load_pr_map(
+    ctx: WorkstackContext, repo_root: Path, *, show_checks: bool
+) -> dict[str, PullRequestInfo] | None:
+    """Fetch PR information for all branches, honouring the PR display config.
+
+    Args:
+        ctx: Workstack context
+        repo_root: Repository root
+        show_checks: Whether CI check status was requested explicitly
+
+    Returns:
+        Mapping of branch name -> PR, or None when PR info is disabled
+    """
+    if not ctx.global_config_ops.get_show_pr_info():
+        return None
+
+    need_checks = show_checks or ctx.global_config_ops.get_show_pr_checks()
+    if need_checks:
+        # Fetch from GitHub with check status (slower)
+        return ctx.github_ops.get_prs_for_repo(repo_root, include_checks=True)
+
+    # Try Graphite first (fast - no CI status)
+    prs = ctx.graphite_ops.get_prs_from_graphite(ctx.git_ops, repo_root)
+
+    # If Graphite data not available, fall back to GitHub without checks
+    if not prs:
+        prs = ctx.github_ops.get_prs_for_repo(repo_root, include_checks=False)
+    return prs
+
+
+def pr_record(ctx: WorkstackContext, pr: PullRequestInfo | None) -> dict[str, Any] | None:
+    """Convert a PR into its structured-output form."""
+    if pr is None:
+        return None
+    return {
+        "number": pr.number,
+        "state": pr.state,
+        "is_draft": pr.is_draft,
+        "checks_passing": pr.checks_passing,
+        "url": pr.url,
+        "graphite_url": ctx.graphite_ops.get_graphite_url(pr.owner, pr.repo, pr.number),
+    }
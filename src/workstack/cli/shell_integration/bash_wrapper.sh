@@ -5,17 +5,26 @@ workstack() {
   # Don't intercept if we're doing shell completion
   [ -n "$_WORKSTACK_COMPLETE" ] && { command workstack "$@"; return; }
 
-  local script_path exit_status
-  script_path=$(WORKSTACK_SHELL=bash command workstack __shell "$@")
+  local output exit_status
+  output=$(WORKSTACK_SHELL=bash WORKSTACK_SCRIPT_HANDOFF=stdout command workstack __shell "$@")
   exit_status=$?
 
   # Passthrough mode: run the original command directly
-  [ "$script_path" = "__WORKSTACK_PASSTHROUGH__" ] && { command workstack "$@"; return; }
+  [ "$output" = "__WORKSTACK_PASSTHROUGH__" ] && { command workstack "$@"; return; }
 
   # If __shell returned non-zero, error messages are already sent to stderr
   [ $exit_status -ne 0 ] && return $exit_status
 
-  # Source the script file if it exists
+  # Inline mode: the script follows a sentinel line, no file involved
+  case "$output" in
+    __WORKSTACK_SCRIPT__*)
+      eval "${output#__WORKSTACK_SCRIPT__?}"
+      return $?
+      ;;
+  esac
+
+  # Fallback: the output is the path of a script file
+  local script_path="$output"
   if [ -n "$script_path" ] && [ -f "$script_path" ]; then
     source "$script_path"
     local source_exit=$?
@@ -0,0 +1,200 @@
+"""Client side of the shell-integration daemon.
+
+Shell wrappers call `workstack __shell ...` for every `switch`, `jump`, `up`,
+`down`, `stack` and `create`. Most of that invocation's time goes to importing click,
+the ops layer and every command module. When ``WORKSTACK_DAEMON`` is set,
+workstack.main() dispatches here before anything else is imported: the
+request is forwarded over a per-user Unix socket to a long-lived
+`workstack __daemon serve` process that already has the CLI loaded.
+
+If no daemon is listening, one is started in the background and this
+invocation falls back to the in-process `__shell` command, so the daemon is
+purely an accelerator. Commands that run user subprocesses are never
+forwarded: their output needs the caller's terminal.
+
+Only the standard library modules below are imported here.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+
+DAEMON_ENV_VAR = "WORKSTACK_DAEMON"
+SOCKET_FILENAME = "shell.sock"
+LOCK_FILENAME = "daemon.lock"
+SPAWN_MARKER_FILENAME = "spawned"
+
+# Requests carrying this flag may prompt on the terminal and are run in-process
+INTERACTIVE_FLAG = "--fuzzy"
+
+# Commands that run user subprocesses (post_create_commands, gt create, git)
+# whose output belongs on the caller's terminal, not the daemon's /dev/null.
+# They may also take long enough to hold up every other shell's request.
+IN_PROCESS_COMMANDS = frozenset({"create"})
+
+# Same value as handler.PASSTHROUGH_MARKER, which cannot be imported cheaply
+PASSTHROUGH_MARKER = "__WORKSTACK_PASSTHROUGH__"
+
+CONNECT_TIMEOUT_SECONDS = 0.5
+# Handled commands may run git and gt; this only bounds a wedged daemon.
+RESPONSE_TIMEOUT_SECONDS = 300.0
+# A daemon that fails to come up is not restarted on every keystroke.
+SPAWN_BACKOFF_SECONDS = 10.0
+
+
+def daemon_enabled() -> bool:
+    """Return True if the user opted into the shell-integration daemon."""
+    return os.environ.get(DAEMON_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+def runtime_dir() -> str:
+    """Return the per-user directory holding the daemon socket.
+
+    ``$XDG_RUNTIME_DIR/workstack`` when available, otherwise
+    ``/tmp/workstack-<uid>``.
+    """
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime:
+        return os.path.join(xdg_runtime, "workstack")
+    return os.path.join("/tmp", f"workstack-{os.getuid()}")
+
+
+def ensure_private_dir(path: str) -> bool:
+    """Create ``path`` with mode 0700 if needed and check that it is private.
+
+    Returns:
+        True if the directory exists, is owned by this user and is not
+        accessible to anyone else
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    stat = os.lstat(path)
+    return stat.st_uid == os.getuid() and (stat.st_mode & 0o077) == 0
+
+
+def send_request(socket_path: str, request: dict) -> dict | None:
+    """Send one request to the daemon and return its reply.
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        request: JSON-serialisable request
+
+    Returns:
+        The decoded reply, or None if no daemon accepted the connection
+
+    Raises:
+        OSError: If the connection broke after the request was sent
+        ValueError: If the reply was not valid JSON
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        # Error boundary: a missing or stale socket simply means no daemon.
+        try:
+            sock.connect(socket_path)
+        except (TimeoutError, FileNotFoundError, ConnectionRefusedError):
+            return None
+
+        sock.settimeout(RESPONSE_TIMEOUT_SECONDS)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+
+        chunks: list[bytes] = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    finally:
+        sock.close()
+
+    reply = json.loads(b"".join(chunks).decode("utf-8"))
+    if not isinstance(reply, dict):
+        raise ValueError("daemon reply is not an object")
+    return reply
+
+
+def spawn_daemon(directory: str, *, backoff: bool = True) -> None:
+    """Start a detached `workstack __daemon serve`.
+
+    Args:
+        directory: Private runtime directory of the daemon
+        backoff: Skip the start if one was attempted within the backoff window
+    """
+    marker = os.path.join(directory, SPAWN_MARKER_FILENAME)
+    if backoff and os.path.exists(marker):
+        if time.time() - os.stat(marker).st_mtime < SPAWN_BACKOFF_SECONDS:
+            return
+    with open(marker, "w", encoding="utf-8") as f:
+        f.write(str(os.getpid()))
+
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "workstack", "__daemon", "serve"],
+        cwd="/",
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def run_fast_path(argv: list[str]) -> int | None:
+    """Answer `workstack __shell` through the daemon without importing click.
+
+    Args:
+        argv: Arguments following `workstack __shell`
+
+    Returns:
+        The exit status if the daemon handled the request, or None if the
+        caller should fall back to the in-process command
+    """
+    if not daemon_enabled():
+        return None
+
+    # The fuzzy picker asks on the shell's terminal, which the daemon lacks
+    if INTERACTIVE_FLAG in argv:
+        return None
+    if argv and argv[0] in IN_PROCESS_COMMANDS:
+        return None
+
+    directory = runtime_dir()
+    if not ensure_private_dir(directory):
+        return None
+
+    # The shell's directory may have been removed; the in-process command
+    # knows how to recover from that.
+    try:
+        cwd = os.getcwd()
+    except FileNotFoundError:
+        return None
+
+    request = {
+        "op": "shell",
+        "args": argv,
+        "cwd": cwd,
+        "env": dict(os.environ),
+        "executable": sys.executable,
+    }
+
+    # Error boundary: once the request is sent the command may have run, so
+    # a broken reply must not fall back (that would run it a second time).
+    try:
+        reply = send_request(os.path.join(directory, SOCKET_FILENAME), request)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"workstack: shell daemon failed: {e}\n")
+        return 1
+
+    if reply is None:
+        spawn_daemon(directory)
+        return None
+    if reply.get("status") != "ok":
+        return None
+
+    if reply.get("message"):
+        sys.stderr.write(f"{reply['message']}\n")
+    if reply.get("passthrough"):
+        sys.stdout.write(PASSTHROUGH_MARKER + "\n")
+    elif reply.get("script"):
+        sys.stdout.write(str(reply["script"]))
+    return int(reply.get("exit_code", 0))
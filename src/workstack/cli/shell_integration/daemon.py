@@ -0,0 +1,206 @@
+"""Per-user daemon answering shell-integration requests.
+
+`workstack __daemon serve` imports the CLI once and then answers `__shell`
+requests sent by the client in ``client.py`` over a Unix socket in a private
+runtime directory. Each request carries the caller's argv, working directory
+and environment; the daemon adopts them for the duration of the request and
+runs the same handler as the in-process `__shell` command, so the resulting
+activation scripts are identical.
+
+Requests are handled one at a time because commands rely on the process-wide
+working directory and environment. The daemon exits after a period without
+requests, when asked to stop, or when a client runs a different Python
+interpreter (the installed workstack has most likely changed).
+"""
+
+import fcntl
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+from workstack.cli.shell_integration.client import (
+    IN_PROCESS_COMMANDS,
+    LOCK_FILENAME,
+    SOCKET_FILENAME,
+    send_request,
+)
+from workstack.cli.shell_integration.handler import handle_shell_request
+
+DAEMON_IDLE_TIMEOUT_SECONDS = 15 * 60
+REQUEST_READ_TIMEOUT_SECONDS = 5.0
+MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+
+def serve(directory: str, *, idle_timeout: float = DAEMON_IDLE_TIMEOUT_SECONDS) -> bool:
+    """Serve shell-integration requests until idle, stopped or outdated.
+
+    Args:
+        directory: Private runtime directory holding the socket and lock
+        idle_timeout: Seconds without a request after which the daemon exits
+
+    Returns:
+        False if another daemon already serves this directory, True otherwise
+    """
+    lock_fd = os.open(os.path.join(directory, LOCK_FILENAME), os.O_RDWR | os.O_CREAT, 0o600)
+    # Error boundary: flock reports a held lock as an exception; it means
+    # another daemon won the race to start.
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(lock_fd)
+        return False
+
+    socket_path = os.path.join(directory, SOCKET_FILENAME)
+    if os.path.exists(socket_path):
+        # Left behind by a daemon that was killed; we hold the lock, so no
+        # other daemon is listening on it
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen(16)
+        server.settimeout(idle_timeout)
+        os.chdir("/")
+        while _serve_one(server):
+            pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        os.close(lock_fd)
+    return True
+
+
+def _serve_one(server: socket.socket) -> bool:
+    """Answer one connection. Returns False when the daemon should exit."""
+    # Error boundary: accept() signals the idle timeout by raising.
+    try:
+        conn, _ = server.accept()
+    except TimeoutError:
+        return False
+
+    with conn:
+        conn.settimeout(REQUEST_READ_TIMEOUT_SECONDS)
+        # Error boundary: a client that hangs up or sends garbage must not
+        # take the daemon down with it.
+        try:
+            request = _read_request(conn)
+        except (OSError, ValueError):
+            return True
+
+        reply = handle_request(request)
+        try:
+            conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+    return reply["status"] not in ("stopping", "restart")
+
+
+def _read_request(conn: socket.socket) -> dict[str, Any]:
+    """Read a single JSON request terminated by the client closing its side."""
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := conn.recv(65536):
+        size += len(chunk)
+        if size > MAX_REQUEST_BYTES:
+            raise ValueError("request too large")
+        chunks.append(chunk)
+
+    request = json.loads(b"".join(chunks).decode("utf-8"))
+    if not isinstance(request, dict):
+        raise ValueError("request is not an object")
+    return request
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Answer one decoded request.
+
+    Replies always carry a ``status``: ``ok`` when the request was handled,
+    anything else when the client should fall back to running `__shell`
+    itself (nothing has been executed in that case). A command that raised
+    may have partly run, so it is answered with ``ok``, a non-zero
+    ``exit_code`` and a ``message`` rather than being run a second time.
+
+    Args:
+        request: Decoded request from the client
+
+    Returns:
+        JSON-serialisable reply
+    """
+    op = request.get("op")
+    if op == "ping":
+        return {"status": "ok", "pid": os.getpid()}
+    if op == "stop":
+        return {"status": "stopping"}
+    if op != "shell":
+        return {"status": "error", "message": f"unknown op: {op!r}"}
+
+    args = request.get("args")
+    cwd = request.get("cwd")
+    env = request.get("env")
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        return {"status": "error", "message": "invalid args"}
+    if not isinstance(cwd, str) or not isinstance(env, dict):
+        return {"status": "error", "message": "invalid cwd or env"}
+    if request.get("executable") != sys.executable:
+        return {"status": "restart"}
+    if not os.path.isdir(cwd):
+        return {"status": "fallback"}
+    if args and args[0] in IN_PROCESS_COMMANDS:
+        return {"status": "fallback"}
+
+    saved_env = dict(os.environ)
+    os.environ.clear()
+    os.environ.update({str(key): str(value) for key, value in env.items()})
+    os.chdir(cwd)
+    # Error boundary: the command may have partly run, so it must not be
+    # rerun by the client; report the failure instead of a traceback.
+    try:
+        result = handle_shell_request(tuple(args))
+    except Exception as e:
+        return {
+            "status": "ok",
+            "passthrough": False,
+            "script": None,
+            "exit_code": 1,
+            "message": f"workstack: {args[0] if args else '__shell'} failed: {e}",
+        }
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        # Do not keep a worktree busy (or fail later if it is removed)
+        os.chdir("/")
+
+    return {
+        "status": "ok",
+        "passthrough": result.passthrough,
+        "script": result.script,
+        "exit_code": result.exit_code,
+    }
+
+
+def ping(directory: str) -> int | None:
+    """Return the pid of the daemon serving ``directory``, or None if none is running."""
+    # Error boundary: a daemon exiting mid-request looks like a broken reply.
+    try:
+        reply = send_request(os.path.join(directory, SOCKET_FILENAME), {"op": "ping"})
+    except (OSError, ValueError):
+        return None
+    if reply is None or reply.get("status") != "ok":
+        return None
+    pid = reply.get("pid")
+    return pid if isinstance(pid, int) else None
+
+
+def stop(directory: str) -> bool:
+    """Ask the daemon serving ``directory`` to exit. Returns False if none was running."""
+    # Error boundary: see ping().
+    try:
+        reply = send_request(os.path.join(directory, SOCKET_FILENAME), {"op": "stop"})
+    except (OSError, ValueError):
+        return False
+    return reply is not None
@@ -8,11 +8,11 @@ function workstack
         return
     end
 
-    set -l script_path (env WORKSTACK_SHELL=fish command workstack __shell $argv)
+    set -l output (env WORKSTACK_SHELL=fish WORKSTACK_SCRIPT_HANDOFF=stdout command workstack __shell $argv)
     set -l exit_status $status
 
     # Passthrough mode
-    if test "$script_path" = "__WORKSTACK_PASSTHROUGH__"
+    if test "$output" = "__WORKSTACK_PASSTHROUGH__"
         command workstack $argv
         return
     end
@@ -22,7 +22,14 @@ function workstack
         return $exit_status
     end
 
-    # Source the script file if it exists
+    # Inline mode: the script follows a sentinel line, no file involved
+    if test (count $output) -gt 0; and test "$output[1]" = "__WORKSTACK_SCRIPT__"
+        string join \n -- $output[2..-1] | source
+        return $status
+    end
+
+    # Fallback: the output is the path of a script file
+    set -l script_path "$output"
     if test -n "$script_path" -a -f "$script_path"
         source "$script_path"
         set -l source_exit $status
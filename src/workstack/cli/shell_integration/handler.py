@@ -10,13 +10,15 @@ from workstack.cli.commands.create import create
 from workstack.cli.commands.down import down_cmd
 from workstack.cli.commands.jump import jump_cmd
 from workstack.cli.commands.prepare_cwd_recovery import generate_recovery_script
+from workstack.cli.commands.stack import stack_group
 from workstack.cli.commands.switch import switch_cmd
 from workstack.cli.commands.up import up_cmd
 from workstack.cli.debug import debug_log
 from workstack.cli.shell_utils import (
+    INLINE_SCRIPT_SENTINEL,
     STALE_SCRIPT_MAX_AGE_SECONDS,
     cleanup_stale_scripts,
-    write_script_to_temp,
+    script_handoff,
 )
 from workstack.core.context import create_context
 
@@ -26,7 +28,12 @@ PASSTHROUGH_COMMANDS: Final[set[str]] = {"sync"}
 
 @dataclass(frozen=True)
 class ShellIntegrationResult:
-    """Result returned by shell integration handlers."""
+    """Result returned by shell integration handlers.
+
+    ``script`` is what the wrapper consumes: either the script itself after an
+    INLINE_SCRIPT_SENTINEL line, or the path of a script file (see
+    ``shell_utils.script_handoff``).
+    """
 
     passthrough: bool
     script: str | None
@@ -50,6 +57,7 @@ def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellInt
         "jump": jump_cmd,
         "up": up_cmd,
         "down": down_cmd,
+        "stack": stack_group,
     }
 
     command = command_map.get(command_name)
@@ -80,15 +88,21 @@ def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellInt
     if exit_code != 0:
         return ShellIntegrationResult(passthrough=True, script=None, exit_code=exit_code)
 
-    # Output is now a file path, not script content
-    script_path = result.output.strip() if result.output else None
+    script = _parse_script_output(result.stdout)
+
+    debug_log(f"Handler: Got script={script!r}, exit_code={exit_code}")
+
+    return ShellIntegrationResult(passthrough=False, script=script, exit_code=exit_code)
 
-    debug_log(f"Handler: Got script_path={script_path}, exit_code={exit_code}")
-    if script_path:
-        script_exists = Path(script_path).exists()
-        debug_log(f"Handler: Script exists? {script_exists}")
 
-    return ShellIntegrationResult(passthrough=False, script=script_path, exit_code=exit_code)
+def _parse_script_output(output: str | None) -> str | None:
+    """Extract the handoff (inline script or file path) from a command's output."""
+    if not output:
+        return None
+    if output.startswith(INLINE_SCRIPT_SENTINEL + "\n"):
+        return output
+    # Older contract: the output is a path; stray whitespace is not part of it
+    return output.strip() or None
 
 
 def handle_shell_request(args: tuple[str, ...]) -> ShellIntegrationResult:
@@ -109,12 +123,12 @@ def _build_passthrough_script(command_name: str, args: tuple[str, ...]) -> Shell
     recovery_path = generate_recovery_script(ctx)
 
     script_content = _render_passthrough_script(shell_name, command_name, args, recovery_path)
-    script_path = write_script_to_temp(
+    handoff = script_handoff(
         script_content,
         command_name=f"{command_name}-passthrough",
         comment="generated by __shell passthrough handler",
     )
-    return ShellIntegrationResult(passthrough=False, script=str(script_path), exit_code=0)
+    return ShellIntegrationResult(passthrough=False, script=handoff, exit_code=0)
 
 
 def _render_passthrough_script(
@@ -4,12 +4,21 @@ import os
 import tempfile
 import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 
 from workstack.cli.debug import debug_log
+from workstack.cli.shell_integration.client import ensure_private_dir, runtime_dir
 
 STALE_SCRIPT_MAX_AGE_SECONDS = 3600
+STALE_SCRIPT_SCAN_INTERVAL_SECONDS = 3600
+
+SCRIPT_DIRNAME = "scripts"
+CLEANUP_MARKER_FILENAME = ".last-cleanup"
+
+# Set by the shell wrappers when they can consume a script from stdout
+SCRIPT_HANDOFF_ENV_VAR = "WORKSTACK_SCRIPT_HANDOFF"
+SCRIPT_HANDOFF_STDOUT = "stdout"
+INLINE_SCRIPT_SENTINEL = "__WORKSTACK_SCRIPT__"
 
 
 def render_cd_script(path: Path, *, comment: str, success_message: str) -> str:
@@ -33,13 +42,60 @@ def render_cd_script(path: Path, *, comment: str, success_message: str) -> str:
     return "\n".join(lines) + "\n"
 
 
+def inline_handoff_requested() -> bool:
+    """Return True if the calling shell wrapper reads scripts from stdout."""
+    return os.environ.get(SCRIPT_HANDOFF_ENV_VAR) == SCRIPT_HANDOFF_STDOUT
+
+
+def script_handoff(
+    script_content: str,
+    *,
+    command_name: str,
+    comment: str | None = None,
+) -> str:
+    """Return what a `--script` command prints for the shell wrapper.
+
+    Wrappers that set ``WORKSTACK_SCRIPT_HANDOFF=stdout`` receive the script
+    itself, after a sentinel line, so no file is involved. Anything else (older
+    wrappers, `source <(workstack switch X --script)`) gets the path of a
+    script file.
+
+    Args:
+        script_content: The shell script to hand over
+        command_name: Command that generated this (e.g., 'sync', 'switch', 'create')
+        comment: Optional comment for the script file header
+
+    Returns:
+        The inline payload or the script file path
+    """
+    if inline_handoff_requested():
+        debug_log(f"script_handoff: Inline {command_name} script:\n{script_content}")
+        return f"{INLINE_SCRIPT_SENTINEL}\n{script_content}"
+    return str(write_script_to_temp(script_content, command_name=command_name, comment=comment))
+
+
+def script_dir() -> Path:
+    """Return the per-user private directory for script files.
+
+    Falls back to the system temp directory if the per-user runtime directory
+    is not private (e.g. pre-created by another user).
+    """
+    runtime = runtime_dir()
+    if not ensure_private_dir(runtime):
+        return Path(tempfile.gettempdir())
+    scripts = Path(runtime) / SCRIPT_DIRNAME
+    if not scripts.is_dir():
+        scripts.mkdir(mode=0o700, exist_ok=True)
+    return scripts
+
+
 def write_script_to_temp(
     script_content: str,
     *,
     command_name: str,
     comment: str | None = None,
 ) -> Path:
-    """Write shell script to temp file with unique UUID.
+    """Write shell script to a uniquely named file in the private script directory.
 
     Args:
         script_content: The shell script to write
@@ -47,34 +103,22 @@ def write_script_to_temp(
         comment: Optional comment to include in script header
 
     Returns:
-        Path to the temp file
+        Path to the script file
 
     Filename format: workstack-{command}-{uuid}.sh
     """
     unique_id = uuid.uuid4().hex[:8]  # 8 chars sufficient (4 billion combinations)
-    temp_dir = Path(tempfile.gettempdir())
-    temp_file = temp_dir / f"workstack-{command_name}-{unique_id}.sh"
-
-    # Add metadata header
-    header = [
-        "#!/bin/bash",
-        f"# workstack {command_name}",
-        f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"# UUID: {unique_id}",
-        f"# User: {os.getenv('USER', 'unknown')}",
-        f"# Working dir: {Path.cwd()}",
-    ]
+    temp_file = script_dir() / f"workstack-{command_name}-{unique_id}.sh"
 
+    header = ["#!/bin/bash", f"# workstack {command_name}"]
     if comment:
         header.append(f"# {comment}")
-
     header.append("")  # Blank line before script
 
     full_content = "\n".join(header) + "\n" + script_content
-    temp_file.write_text(full_content, encoding="utf-8")
-
-    # Make executable for good measure
-    temp_file.chmod(0o755)
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(full_content)
 
     debug_log(f"write_script_to_temp: Created {temp_file}")
     debug_log(f"write_script_to_temp: Content:\n{full_content}")
@@ -82,16 +126,29 @@ def write_script_to_temp(
     return temp_file
 
 
-def cleanup_stale_scripts(*, max_age_seconds: int = STALE_SCRIPT_MAX_AGE_SECONDS) -> None:
-    """Remove workstack temp scripts older than max_age_seconds.
+def cleanup_stale_scripts(
+    *,
+    max_age_seconds: int = STALE_SCRIPT_MAX_AGE_SECONDS,
+    scan_interval_seconds: int = STALE_SCRIPT_SCAN_INTERVAL_SECONDS,
+) -> None:
+    """Remove script files older than max_age_seconds from the private script directory.
+
+    The directory is scanned at most once per ``scan_interval_seconds``; in
+    between, this costs a single stat of a marker file.
 
     Args:
         max_age_seconds: Maximum age before cleanup (default 1 hour)
+        scan_interval_seconds: Minimum time between scans (0 to scan now)
     """
-    temp_dir = Path(tempfile.gettempdir())
-    cutoff = time.time() - max_age_seconds
-
-    for script_file in temp_dir.glob("workstack-*.sh"):
+    directory = script_dir()
+    marker = directory / CLEANUP_MARKER_FILENAME
+    now = time.time()
+    if marker.exists() and now - marker.stat().st_mtime < scan_interval_seconds:
+        return
+    marker.touch()
+
+    cutoff = now - max_age_seconds
+    for script_file in directory.glob("workstack-*.sh"):
         if script_file.exists():
             try:
                 if script_file.stat().st_mtime < cutoff:
@@ -5,6 +5,7 @@ Graphite dependency relationships. All functions are pure (no I/O) except
 for the entry point which loads data via WorkstackContext.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -26,12 +27,14 @@ class TreeNode:
         worktree_name: Worktree directory name (e.g., "root", "fix-plan")
         children: List of child TreeNode objects
         is_current: True if this worktree is the current working directory
+        worktree_path: Filesystem path of the worktree, if known
     """
 
     branch_name: str
     worktree_name: str
     children: list["TreeNode"]
     is_current: bool
+    worktree_path: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -67,26 +70,32 @@ class BranchGraph:
 def build_workstack_tree(
     ctx: WorkstackContext,
     repo_root: Path,
+    *,
+    root_branch: str | None = None,
+    max_depth: int | None = None,
 ) -> list[TreeNode]:
     """Build tree structure of ONLY branches with active worktrees.
 
     This is the main entry point that orchestrates the tree building process:
-    1. Get all worktrees and their branches from git
+    1. Get all worktrees and their branches from git (the active branches)
     2. Load Graphite cache for parent-child relationships (REQUIRED)
-    3. Build branch graph from cache data
-    4. Filter graph to ONLY branches that have worktrees
-    5. Build tree starting from trunk branches
-    6. Return list of root nodes (typically just "main")
+    3. Walk up from each active branch through the parent index, visiting
+       only the ancestor closure of active branches
+    4. Build tree starting from active branches without an active ancestor
+    5. Return list of root nodes (typically just "main")
 
     Args:
         ctx: Workstack context with git operations
         repo_root: Path to repository root
+        root_branch: Only show the subtree rooted at this branch
+        max_depth: Only show this many levels below the roots (0 = roots only)
 
     Returns:
         List of root TreeNode objects (typically one for trunk)
 
     Raises:
-        SystemExit: If Graphite cache doesn't exist or can't be loaded
+        SystemExit: If Graphite cache doesn't exist or can't be loaded, or if
+            root_branch has no worktree
     """
     # Step 1: Get worktrees
     worktree_mapping = _get_worktree_mapping(ctx, repo_root)
@@ -105,8 +114,21 @@ def build_workstack_tree(
     active_branches = set(worktree_mapping.branch_to_worktree.keys())
     filtered_graph = _filter_graph_to_active_branches(branch_graph, active_branches)
 
+    if root_branch is not None:
+        if root_branch not in active_branches or not _is_known(branch_graph, root_branch):
+            click.echo(
+                f"Error: Branch '{root_branch}' has no worktree tracked by Graphite",
+                err=True,
+            )
+            raise SystemExit(1)
+        filtered_graph = BranchGraph(
+            parent_of=filtered_graph.parent_of,
+            children_of=filtered_graph.children_of,
+            trunk_branches=[root_branch],
+        )
+
     # Step 4: Build tree from filtered graph
-    return _build_tree_from_graph(filtered_graph, worktree_mapping)
+    return _build_tree_from_graph(filtered_graph, worktree_mapping, max_depth=max_depth)
 
 
 def _get_worktree_mapping(
@@ -117,6 +139,7 @@ def _get_worktree_mapping(
 
     Queries git for all worktrees and creates mappings between branches,
     worktree names, and filesystem paths. Detects the current worktree.
+    Each path is resolved exactly once.
 
     Args:
         ctx: Workstack context with git operations
@@ -127,18 +150,24 @@ def _get_worktree_mapping(
     """
     worktrees = ctx.git_ops.list_worktrees(repo_root)
     current_path = Path.cwd().resolve()
+    repo_root_resolved = repo_root.resolve()
 
     branch_to_worktree: dict[str, str] = {}
     worktree_to_path: dict[str, Path] = {}
     current_worktree: str | None = None
+    # Worktrees may be nested (e.g. inside the root worktree), so the
+    # innermost worktree containing the current directory wins
+    current_match_depth = -1
 
     for wt in worktrees:
         # Skip worktrees with detached HEAD
         if wt.branch is None:
             continue
 
+        wt_resolved = wt.path.resolve()
+
         # Determine worktree name
-        if wt.path.resolve() == repo_root.resolve():
+        if wt_resolved == repo_root_resolved:
             worktree_name = "root"
         else:
             # Use directory name from workstack's work directory
@@ -148,12 +177,11 @@ def _get_worktree_mapping(
         worktree_to_path[worktree_name] = wt.path
 
         # Check if current path is within this worktree (handles subdirectories)
-        try:
-            current_path.relative_to(wt.path.resolve())
+        if current_path.is_relative_to(wt_resolved) and len(wt_resolved.parts) > (
+            current_match_depth
+        ):
             current_worktree = worktree_name
-        except ValueError:
-            # Not within this worktree
-            pass
+            current_match_depth = len(wt_resolved.parts)
 
     return WorktreeMapping(
         branch_to_worktree=branch_to_worktree,
@@ -226,8 +254,12 @@ def _filter_graph_to_active_branches(
 ) -> BranchGraph:
     """Filter branch graph to ONLY include branches with active worktrees.
 
-    This removes branches without worktrees from the graph while preserving
-    the tree structure. Only active branches and their relationships are kept.
+    Each active branch is attached to its nearest active ancestor, found by
+    walking up the parent index. Only the ancestor closure of the active
+    branches is visited (each branch at most once), so the cost depends on
+    the number of worktrees and stack depth rather than on the total number
+    of branches Graphite tracks. Active branches without an active ancestor
+    become roots. Children keep Graphite's ordering.
 
     Args:
         graph: Full branch graph from Graphite cache
@@ -238,30 +270,59 @@ def _filter_graph_to_active_branches(
 
     Example:
         Input graph: main -> [feature-a, feature-b -> feature-b-2]
-        Active branches: {main, feature-a}
-        Output graph: main -> [feature-a]
-        (feature-b and feature-b-2 are removed)
+        Active branches: {main, feature-a, feature-b-2}
+        Output graph: main -> [feature-a, feature-b-2]
+        (feature-b is skipped; feature-b-2 attaches to main)
     """
+    known_active = {branch for branch in active_branches if _is_known(graph, branch)}
+
+    # For every branch in the ancestor closure: the nearest active branch at
+    # or above it, and its position in the full graph (used for ordering)
+    nearest_active: dict[str, str | None] = {}
+    order_key: dict[str, tuple[int, ...]] = {}
+    trunk_position = {branch: i for i, branch in enumerate(graph.trunk_branches)}
+    child_positions: dict[str, dict[str, int]] = {}
+
+    for branch in known_active:
+        # Walk up until reaching a branch whose answer is already known
+        chain: list[str] = []
+        on_chain: set[str] = set()
+        node: str | None = branch
+        while node is not None and node not in nearest_active and node not in on_chain:
+            chain.append(node)
+            on_chain.add(node)
+            node = graph.parent_of.get(node)
+
+        # Unwind from the top of the chain down
+        for current in reversed(chain):
+            parent = graph.parent_of.get(current)
+            if parent is None or parent in on_chain and parent not in nearest_active:
+                # Top of the graph (or a malformed cycle): start a new ordering
+                above: str | None = None
+                order_key[current] = (trunk_position.get(current, len(trunk_position)),)
+            else:
+                above = parent if parent in known_active else nearest_active[parent]
+                positions = child_positions.get(parent)
+                if positions is None:
+                    siblings = graph.children_of.get(parent, [])
+                    positions = {child: i for i, child in enumerate(siblings)}
+                    child_positions[parent] = positions
+                position = positions.get(current, len(positions))
+                order_key[current] = order_key[parent] + (position,)
+            nearest_active[current] = current if current in known_active else above
+
     filtered_parent_of: dict[str, str] = {}
     filtered_children_of: dict[str, list[str]] = {}
     filtered_trunk: list[str] = []
 
-    for branch in active_branches:
-        # Keep parent relationship only if branch is active
-        if branch in graph.parent_of:
-            filtered_parent_of[branch] = graph.parent_of[branch]
-
-        # Keep only children that are also active
-        if branch in graph.children_of:
-            active_children = [
-                child for child in graph.children_of[branch] if child in active_branches
-            ]
-            if active_children:
-                filtered_children_of[branch] = active_children
-
-        # Keep trunk status if active
-        if branch in graph.trunk_branches:
+    for branch in sorted(known_active, key=order_key.__getitem__):
+        parent = graph.parent_of.get(branch)
+        tree_parent = nearest_active.get(parent) if parent is not None else None
+        if tree_parent is None or tree_parent == branch:
             filtered_trunk.append(branch)
+        else:
+            filtered_parent_of[branch] = tree_parent
+            filtered_children_of.setdefault(tree_parent, []).append(branch)
 
     return BranchGraph(
         parent_of=filtered_parent_of,
@@ -270,41 +331,72 @@ def _filter_graph_to_active_branches(
     )
 
 
+def _is_known(graph: BranchGraph, branch: str) -> bool:
+    """Check whether Graphite tracks ``branch``."""
+    return branch in graph.children_of or branch in graph.parent_of
+
+
 def _build_tree_from_graph(
     graph: BranchGraph,
     mapping: WorktreeMapping,
+    *,
+    max_depth: int | None = None,
 ) -> list[TreeNode]:
     """Build TreeNode structure from filtered branch graph.
 
-    Recursively builds tree nodes starting from trunk branches, following
-    parent-child relationships to create the full tree structure.
+    Builds tree nodes iteratively starting from trunk branches, following
+    parent-child relationships to create the full tree structure. Deep stacks
+    therefore cannot hit Python's recursion limit.
 
     Args:
         graph: Filtered graph containing only active branches
         mapping: Worktree mapping for annotations
+        max_depth: Only include this many levels below the roots (0 = roots only)
 
     Returns:
         List of root TreeNode objects (one per trunk branch)
     """
 
-    def build_node(branch: str) -> TreeNode:
-        """Recursively build a tree node and its children."""
+    def make_node(branch: str) -> TreeNode:
         worktree_name = mapping.branch_to_worktree[branch]
-        is_current = worktree_name == mapping.current_worktree
-
-        # Recursively build children
-        children_branches = graph.children_of.get(branch, [])
-        children = [build_node(child) for child in children_branches]
-
         return TreeNode(
             branch_name=branch,
             worktree_name=worktree_name,
-            children=children,
-            is_current=is_current,
+            children=[],
+            is_current=worktree_name == mapping.current_worktree,
+            worktree_path=mapping.worktree_to_path.get(worktree_name),
         )
 
-    # Build tree starting from trunk branches
-    return [build_node(trunk) for trunk in graph.trunk_branches]
+    roots = [make_node(trunk) for trunk in graph.trunk_branches]
+    pending: list[tuple[TreeNode, int]] = [(root, 0) for root in roots]
+    while pending:
+        node, depth = pending.pop()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for child_branch in graph.children_of.get(node.branch_name, []):
+            child = make_node(child_branch)
+            node.children.append(child)
+            pending.append((child, depth + 1))
+
+    return roots
+
+
+def walk_tree(roots: list[TreeNode]) -> Iterator[tuple[TreeNode, int, TreeNode | None]]:
+    """Iterate over all nodes in pre-order (the order render_tree prints them).
+
+    Args:
+        roots: List of root TreeNode objects
+
+    Yields:
+        Tuples of (node, depth, parent), with depth 0 and parent None for roots
+    """
+    pending: list[tuple[TreeNode, int, TreeNode | None]] = [
+        (root, 0, None) for root in reversed(roots)
+    ]
+    while pending:
+        node, depth, parent = pending.pop()
+        yield node, depth, parent
+        pending.extend((child, depth + 1, node) for child in reversed(node.children))
 
 
 def render_tree(roots: list[TreeNode]) -> str:
@@ -335,15 +427,14 @@ def render_tree(roots: list[TreeNode]) -> str:
     """
     lines: list[str] = []
 
-    def render_node(node: TreeNode, prefix: str, is_last: bool, is_root: bool) -> None:
-        """Recursively render a node and its children.
+    # Each entry: (node, prefix for the node's line, is_last, is_root).
+    # Entries are pushed in reverse so they pop in display order.
+    pending: list[tuple[TreeNode, str, bool, bool]] = [
+        (root, "", i == len(roots) - 1, True) for i, root in reversed(list(enumerate(roots)))
+    ]
+    while pending:
+        node, prefix, is_last, is_root = pending.pop()
 
-        Args:
-            node: TreeNode to render
-            prefix: Prefix string for indentation (contains │ and spaces)
-            is_last: True if this is the last child of its parent
-            is_root: True if this is a top-level root node
-        """
         # Format current line
         connector = "└─" if is_last else "├─"
         branch_text = _format_branch_name(node.branch_name, node.is_current)
@@ -351,34 +442,20 @@ def render_tree(roots: list[TreeNode]) -> str:
 
         if is_root:
             # Root node: no connector
-            line = f"{branch_text} {worktree_text}"
+            lines.append(f"{branch_text} {worktree_text}")
         else:
             # All other nodes get connectors
-            line = f"{prefix}{connector} {branch_text} {worktree_text}"
-
-        lines.append(line)
-
-        # Render children
-        if node.children:
-            # Determine prefix for children
-            # Build prefix based on whether this node is the last child of its parent
-            if prefix:
-                # Non-root node: extend existing prefix
-                # Add vertical bar if more siblings below, space otherwise
-                child_prefix = prefix + ("   " if is_last else "│  ")
-            else:
-                # Root node's children: start with appropriate spacing
-                # Use spaces if this is last root, vertical bar otherwise
-                child_prefix = "   " if is_last else "│  "
-
-            for i, child in enumerate(node.children):
-                is_last_child = i == len(node.children) - 1
-                render_node(child, child_prefix, is_last_child, is_root=False)
-
-    # Render all roots
-    for i, root in enumerate(roots):
-        is_last_root = i == len(roots) - 1
-        render_node(root, "", is_last_root, is_root=True)
+            lines.append(f"{prefix}{connector} {branch_text} {worktree_text}")
+
+        if not node.children:
+            continue
+
+        # Children extend the prefix with a vertical bar if more siblings
+        # follow this node, spaces otherwise
+        child_prefix = prefix + ("   " if is_last else "│  ")
+        last_index = len(node.children) - 1
+        for i in range(last_index, -1, -1):
+            pending.append((node.children[i], child_prefix, i == last_index, False))
 
     return "\n".join(lines)
 
@@ -0,0 +1,142 @@
+"""Per-repository index of the names offered by shell completion.
+
+Completing ``workstack switch <TAB>`` used to import the whole CLI, build a
+context, read the global config and list the worktrees directory on every key
+press. Instead, the commands that change the set of worktrees or branches
+(create, rm, rename, move, sync) write the names to one small file in the
+repository's git common directory, and workstack.main() answers completion
+requests from it before click is imported.
+
+Like the prompt snapshot, this module is on a hot path and uses only ``os``.
+The index is a line-oriented ``key<TAB>value`` file; name lists are
+space-separated, which is unambiguous because neither worktree names nor git
+ref names can contain spaces.
+
+Each list is stored with a key made of modification times, and is only used
+while the key still matches:
+
+- worktree names are keyed by the worktrees directory, whose mtime changes
+  whenever a worktree directory is added, removed or renamed
+- branch names are keyed by ``packed-refs``, ``refs/heads`` and Graphite's
+  cache. A branch created or deleted inside an existing ref subdirectory
+  (``refs/heads/feature/...``) does not change the key; such a branch shows
+  up once one of the refreshing commands runs.
+
+A stale list makes the fast path decline, and click's completion runs as
+before.
+"""
+
+import os
+
+COMPLETION_INDEX_FILENAME = "workstack-completion"
+COMPLETION_INDEX_VERSION = "1"
+
+WORKTREES = "worktrees"
+BRANCHES = "branches"
+
+# Included in worktree completions, as accepted by switch, move and friends
+ROOT_WORKTREE_NAME = "root"
+
+
+def compute_worktrees_key(workstacks_dir: str) -> str:
+    """Compute the cache key for the worktree names of a repository."""
+    return str(_mtime_ns(workstacks_dir))
+
+
+def compute_branches_key(git_common_dir: str) -> str:
+    """Compute the cache key for the branch names of a repository."""
+    paths = (
+        os.path.join(git_common_dir, "packed-refs"),
+        os.path.join(git_common_dir, "refs", "heads"),
+        os.path.join(git_common_dir, ".graphite_cache_persist"),
+    )
+    return "|".join(str(_mtime_ns(path)) for path in paths)
+
+
+def read_completion_index(git_common_dir: str) -> dict[str, str] | None:
+    """Read the completion index of a repository.
+
+    Returns:
+        Mapping of index fields, or None if no compatible index exists
+    """
+    path = os.path.join(git_common_dir, COMPLETION_INDEX_FILENAME)
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    fields: dict[str, str] = {}
+    for line in content.splitlines():
+        key, sep, value = line.partition("\t")
+        if sep:
+            fields[key] = value
+
+    if fields.get("version") != COMPLETION_INDEX_VERSION:
+        return None
+    return fields
+
+
+def write_completion_index(
+    git_common_dir: str,
+    *,
+    workstacks_dir: str,
+    worktrees: list[str],
+    branches: list[str],
+) -> None:
+    """Atomically write the completion index of a repository.
+
+    Args:
+        git_common_dir: The repository's git common directory
+        workstacks_dir: Directory holding the repository's worktrees
+        worktrees: Worktree names, without "root"
+        branches: Local and Graphite-tracked branch names
+    """
+    lines = [
+        f"version\t{COMPLETION_INDEX_VERSION}",
+        f"workstacks_dir\t{workstacks_dir}",
+        f"worktrees_key\t{compute_worktrees_key(workstacks_dir)}",
+        f"worktrees\t{' '.join(sorted(set(worktrees)))}",
+        f"branches_key\t{compute_branches_key(git_common_dir)}",
+        f"branches\t{' '.join(sorted(set(branches)))}",
+    ]
+
+    target = os.path.join(git_common_dir, COMPLETION_INDEX_FILENAME)
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, target)
+
+
+def lookup_candidates(
+    index: dict[str, str], git_common_dir: str, kind: str, incomplete: str
+) -> list[str] | None:
+    """Return the completions for ``incomplete`` from an index.
+
+    Args:
+        index: Fields returned by read_completion_index()
+        git_common_dir: The repository's git common directory
+        kind: WORKTREES or BRANCHES
+        incomplete: Partial word being completed
+
+    Returns:
+        Matching names, or None when the list is stale and must be recomputed
+    """
+    if kind == WORKTREES:
+        key = compute_worktrees_key(index.get("workstacks_dir", ""))
+        names = [ROOT_WORKTREE_NAME, *index.get("worktrees", "").split()]
+    elif kind == BRANCHES:
+        key = compute_branches_key(git_common_dir)
+        names = index.get("branches", "").split()
+    else:
+        return None
+
+    if index.get(f"{kind}_key") != key:
+        return None
+    return [name for name in names if name.startswith(incomplete)]
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a path's mtime in nanoseconds, or 0 if it does not exist."""
+    if not os.path.exists(path):
+        return 0
+    return os.stat(path).st_mtime_ns
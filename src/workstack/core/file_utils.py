@@ -2,12 +2,15 @@
 
 from pathlib import Path
 
+from workstack.core.plan_index import read_plan_metadata
+
 
 def extract_plan_title(plan_path: Path) -> str | None:
     """Extract the first heading from a markdown plan file.
 
-    Uses python-frontmatter library to properly parse YAML frontmatter,
-    then extracts the first line starting with # from the content.
+    Skips any YAML front matter, then returns the first line starting with #.
+    Only the head of the file is parsed; see workstack.core.plan_index for the
+    cached variant used when listing many worktrees.
 
     Args:
         plan_path: Path to the .PLAN.md file
@@ -18,22 +21,4 @@ def extract_plan_title(plan_path: Path) -> str | None:
     if not plan_path.exists():
         return None
 
-    import frontmatter
-
-    # Parse file with frontmatter library (handles YAML frontmatter properly)
-    post = frontmatter.load(str(plan_path))
-
-    # Get the content (without frontmatter)
-    content = post.content
-    lines = content.splitlines()
-
-    # Find first heading
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            # Remove all # symbols and strip whitespace
-            title = stripped.lstrip("#").strip()
-            if title:
-                return title
-
-    return None
+    return read_plan_metadata(plan_path).title
@@ -0,0 +1,413 @@
+"""Fuzzy worktree lookup for `workstack switch --fuzzy`.
+
+Each worktree is indexed as a document of searchable fields: its name, the
+branch checked out in it, the other branches of its Graphite stack, its plan
+title and its PR number. Trigrams of every field feed an inverted index that
+is persisted in the repository's git common directory, so a query only scores
+the worktrees sharing a trigram with it rather than every field of every
+worktree.
+
+The index is updated incrementally: documents are compared with the stored
+ones, only changed documents have their postings rewritten, and worktrees
+that no longer exist are dropped. Commands that add, remove or rename
+worktrees update it; a lookup only rebuilds it when the source signature
+(the stat of the files git and Graphite rewrite when worktrees, their
+branches or stacks change) no longer matches the one stored with it.
+
+Matches are ranked by quality (exact, prefix, substring, then trigram
+similarity), weighted by the field that matched, plus a small boost for
+worktrees with recent git activity.
+"""
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from workstack.core.status_snapshot import locate_worktree
+
+FUZZY_INDEX_FILENAME = "workstack-fuzzy-index.json"
+FUZZY_INDEX_VERSION = 1
+
+# A hit on the worktree name beats the same hit on a plan title
+FIELD_WEIGHTS = {"name": 1.0, "branch": 0.9, "pr": 0.9, "stack": 0.8, "plan": 0.7}
+
+EXACT_BONUS = 3.0
+PREFIX_BONUS = 2.0
+SUBSTRING_BONUS = 1.0
+
+# Matches sharing fewer of the query's trigrams than this are noise
+MIN_TRIGRAM_SIMILARITY = 0.3
+
+# Recently active worktrees rank higher; the boost halves every week
+RECENCY_BOOST = 0.25
+RECENCY_HALF_LIFE_SECONDS = 7 * 24 * 3600
+
+# Queries shorter than this are matched against every document
+MIN_INDEXED_QUERY_LENGTH = 3
+
+_WORD_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class FuzzyDocument:
+    """Searchable fields of one worktree.
+
+    Attributes:
+        name: Worktree name ("root" for the repository root)
+        path: Absolute worktree path
+        branch: Branch checked out in the worktree, or None when detached
+        stack: Other branches of the worktree's Graphite stack, trunk excluded
+        plan_title: Title of the worktree's plan file, if any
+        pr_number: Number of the checked-out branch's pull request, if known
+    """
+
+    name: str
+    path: str
+    branch: str | None
+    stack: tuple[str, ...]
+    plan_title: str | None
+    pr_number: int | None
+
+    def fields(self) -> list[tuple[str, str]]:
+        """Return (field, text) pairs for every non-empty field."""
+        fields = [("name", self.name)]
+        if self.branch is not None:
+            fields.append(("branch", self.branch))
+        fields.extend(("stack", branch) for branch in self.stack)
+        if self.plan_title:
+            fields.append(("plan", self.plan_title))
+        if self.pr_number is not None:
+            fields.append(("pr", str(self.pr_number)))
+        return fields
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A worktree matching a query.
+
+    Attributes:
+        document: The matching worktree
+        score: Ranking score; higher is better
+        field: Field that matched best
+        text: Text of that field
+    """
+
+    document: FuzzyDocument
+    score: float
+    field: str
+    text: str
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the trigrams of each word of ``text``, lowercased and padded.
+
+    Words are padded with two leading and one trailing space, so that word
+    starts weigh more and words shorter than three characters still count.
+    """
+    grams: set[str] = set()
+    for word in _WORD_SEPARATORS.split(text.lower()):
+        if not word:
+            continue
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and drop the ``#`` of a PR reference like ``#123``."""
+    return query.strip().lower().lstrip("#")
+
+
+def score_field(query: str, query_grams: set[str], field: str, text: str) -> float | None:
+    """Score one field against a normalized query.
+
+    Returns:
+        The weighted score, or None if the field does not match
+    """
+    lowered = text.lower()
+    if lowered == query:
+        bonus = EXACT_BONUS
+    elif lowered.startswith(query):
+        bonus = PREFIX_BONUS
+    elif query in lowered:
+        bonus = SUBSTRING_BONUS
+    else:
+        bonus = 0.0
+
+    similarity = 0.0
+    if query_grams:
+        similarity = len(query_grams & trigrams(text)) / len(query_grams)
+    if bonus == 0.0 and similarity < MIN_TRIGRAM_SIMILARITY:
+        return None
+    return (bonus + similarity) * FIELD_WEIGHTS[field]
+
+
+def recency_boost(last_activity: float, *, now: float) -> float:
+    """Return the ranking boost for a worktree last active at ``last_activity``."""
+    if last_activity <= 0:
+        return 0.0
+    age = max(0.0, now - last_activity)
+    return RECENCY_BOOST * 0.5 ** (age / RECENCY_HALF_LIFE_SECONDS)
+
+
+def index_source_signature(git_common_dir: Path) -> str:
+    """Return a cheap signature of the metadata the fuzzy documents derive from.
+
+    Covers the worktree list and every worktree's HEAD (so checkouts made
+    with plain git are seen) and Graphite's branch and PR caches. Plan files
+    are not covered; their titles are picked up by the next index update.
+    """
+    worktrees_dir = git_common_dir / "worktrees"
+    paths = [
+        git_common_dir / "HEAD",
+        worktrees_dir,
+        git_common_dir / ".graphite_cache_persist",
+        git_common_dir / ".graphite_pr_info",
+    ]
+    if worktrees_dir.is_dir():
+        paths.extend(sorted(entry / "HEAD" for entry in worktrees_dir.iterdir()))
+
+    parts: list[str] = []
+    for path in paths:
+        # Error boundary: git replaces HEAD and removes worktree directories
+        # at any time; a file that vanished is simply recorded as missing.
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            parts.append(f"{path}:-")
+            continue
+        parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "\n".join(parts)
+
+
+def last_activity(worktree_path: Path) -> float:
+    """Return when git last recorded activity in a worktree, or 0 if unknown.
+
+    Uses the worktree's HEAD reflog, which checkouts, commits and rebases
+    append to, falling back to HEAD itself.
+    """
+    location = locate_worktree(str(worktree_path))
+    if location is None:
+        return 0.0
+    git_dir = location[1]
+    for candidate in (os.path.join(git_dir, "logs", "HEAD"), os.path.join(git_dir, "HEAD")):
+        if os.path.exists(candidate):
+            return os.stat(candidate).st_mtime
+    return 0.0
+
+
+class FuzzyIndex:
+    """Trigram index over the worktrees of one repository."""
+
+    def __init__(self, path: Path | None, documents: dict[str, FuzzyDocument]) -> None:
+        """Create an index backed by ``path``.
+
+        Args:
+            path: Location of the index file, or None to keep it in memory only
+            documents: Indexed documents keyed by worktree name
+        """
+        self.path = path
+        self._documents: dict[str, FuzzyDocument] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._source_signature: str | None = None
+        self._dirty = False
+        for document in documents.values():
+            self._add(document)
+
+    @classmethod
+    def load(cls, git_common_dir: Path | None) -> "FuzzyIndex":
+        """Load the index stored in a repository's git common directory.
+
+        Args:
+            git_common_dir: The repository's common git directory, or None when
+                unknown (the index then lives for this process only)
+        """
+        if git_common_dir is None or not git_common_dir.is_dir():
+            return cls(None, {})
+        path = git_common_dir / FUZZY_INDEX_FILENAME
+        index = cls(path, {})
+        index._load_state(path)
+        return index
+
+    @property
+    def documents(self) -> list[FuzzyDocument]:
+        """Indexed documents, in name order."""
+        return [self._documents[name] for name in sorted(self._documents)]
+
+    @property
+    def source_signature(self) -> str | None:
+        """index_source_signature() of the metadata the documents were built from."""
+        return self._source_signature
+
+    @source_signature.setter
+    def source_signature(self, signature: str | None) -> None:
+        if signature != self._source_signature:
+            self._source_signature = signature
+            self._dirty = True
+
+    def update(self, documents: list[FuzzyDocument]) -> None:
+        """Make the index hold exactly ``documents``, re-indexing only changes.
+
+        Args:
+            documents: Current documents of every worktree
+        """
+        current = {document.name: document for document in documents}
+        for name in list(self._documents):
+            if name not in current:
+                self._remove(name)
+        for document in documents:
+            if self._documents.get(document.name) != document:
+                self._add(document)
+
+    def candidates(self, query: str) -> list[FuzzyDocument]:
+        """Return the documents that may match a normalized query."""
+        if len(query) < MIN_INDEXED_QUERY_LENGTH:
+            return self.documents
+
+        names: set[str] = set()
+        for gram in trigrams(query):
+            names.update(self._postings.get(gram, ()))
+        return [self._documents[name] for name in sorted(names)]
+
+    def search(
+        self, query: str, *, activity: dict[str, float], now: float, limit: int
+    ) -> list[FuzzyMatch]:
+        """Rank the worktrees matching ``query``.
+
+        An empty query matches every worktree, ranked by recency alone.
+
+        Args:
+            query: Text typed by the user
+            activity: Last activity time of each worktree, by name
+            now: Current time, for the recency boost
+            limit: Maximum number of matches to return
+
+        Returns:
+            Matches, best first
+        """
+        normalized = normalize_query(query)
+        query_grams = trigrams(normalized)
+
+        matches: list[FuzzyMatch] = []
+        for document in self.candidates(normalized):
+            boost = recency_boost(activity.get(document.name, 0.0), now=now)
+            if not normalized:
+                matches.append(FuzzyMatch(document, boost, "name", document.name))
+                continue
+
+            best: tuple[float, str, str] | None = None
+            for field, text in document.fields():
+                score = score_field(normalized, query_grams, field, text)
+                if score is not None and (best is None or score > best[0]):
+                    best = (score, field, text)
+            if best is not None:
+                matches.append(FuzzyMatch(document, best[0] + boost, best[1], best[2]))
+
+        matches.sort(key=lambda match: (-match.score, match.document.name))
+        return matches[:limit]
+
+    def save(self) -> None:
+        """Atomically write the index file if any document changed."""
+        if not self._dirty or self.path is None:
+            return
+
+        data = {
+            "version": FUZZY_INDEX_VERSION,
+            "source_signature": self._source_signature,
+            "documents": [asdict(document) for document in self.documents],
+            "postings": {gram: sorted(names) for gram, names in sorted(self._postings.items())},
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    def _add(self, document: FuzzyDocument) -> None:
+        if document.name in self._documents:
+            self._remove(document.name)
+        self._documents[document.name] = document
+        for gram in _document_trigrams(document):
+            self._postings.setdefault(gram, set()).add(document.name)
+        self._dirty = True
+
+    def _remove(self, name: str) -> None:
+        document = self._documents.pop(name)
+        for gram in _document_trigrams(document):
+            names = self._postings.get(gram)
+            if names is None:
+                continue
+            names.discard(name)
+            if not names:
+                del self._postings[gram]
+        self._dirty = True
+
+    def _load_state(self, path: Path) -> None:
+        """Restore documents and postings from disk, treating bad files as empty."""
+        if not path.exists():
+            return
+
+        # The index is advisory: a truncated or hand-edited file just means
+        # worktrees are indexed again, so decode errors are handled here.
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return
+
+        if not isinstance(data, dict) or data.get("version") != FUZZY_INDEX_VERSION:
+            return
+        entries = data.get("documents")
+        postings = data.get("postings")
+        if not isinstance(entries, list) or not isinstance(postings, dict):
+            return
+
+        documents: dict[str, FuzzyDocument] = {}
+        for entry in entries:
+            document = _document_from_entry(entry)
+            if document is None:
+                return
+            documents[document.name] = document
+
+        self._documents = documents
+        self._postings = {gram: set(names) for gram, names in postings.items()}
+        signature = data.get("source_signature")
+        self._source_signature = signature if isinstance(signature, str) else None
+
+
+def _document_trigrams(document: FuzzyDocument) -> set[str]:
+    grams: set[str] = set()
+    for _field, text in document.fields():
+        grams.update(trigrams(text))
+    return grams
+
+
+def _document_from_entry(entry: Any) -> FuzzyDocument | None:
+    """Decode a persisted document, or return None if it is malformed."""
+    if not isinstance(entry, dict):
+        return None
+    name = entry.get("name")
+    path = entry.get("path")
+    branch = entry.get("branch")
+    stack = entry.get("stack")
+    plan_title = entry.get("plan_title")
+    pr_number = entry.get("pr_number")
+    if not isinstance(name, str) or not isinstance(path, str):
+        return None
+    if not (branch is None or isinstance(branch, str)):
+        return None
+    if not isinstance(stack, list) or not all(isinstance(b, str) for b in stack):
+        return None
+    if not (plan_title is None or isinstance(plan_title, str)):
+        return None
+    if not (pr_number is None or isinstance(pr_number, int)):
+        return None
+    return FuzzyDocument(
+        name=name,
+        path=path,
+        branch=branch,
+        stack=tuple(stack),
+        plan_title=plan_title,
+        pr_number=pr_number,
+    )
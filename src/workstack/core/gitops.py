@@ -9,6 +9,7 @@ Architecture:
 - Standalone functions: Convenience wrappers delegating to module singleton
 """
 
+import os
 import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -96,6 +97,9 @@ class GitOps(ABC):
             repo_root: Path to the git repository root
             path: Path to the worktree to remove
             force: True to force removal even if worktree has uncommitted changes
+
+        Stale metadata is not pruned; callers run prune_worktrees() once after
+        removing a batch of worktrees.
         """
         ...
 
@@ -114,6 +118,25 @@ class GitOps(ABC):
         """Delete a branch using Graphite's gt delete command."""
         ...
 
+    @abstractmethod
+    def delete_branches_with_graphite(
+        self, repo_root: Path, branches: list[str], *, force: bool
+    ) -> list[str]:
+        """Delete several branches and their Graphite metadata at once.
+
+        Unlike gt delete, children of the deleted branches are not moved onto
+        their parents; use it for branches whose descendants are all deleted.
+
+        Args:
+            repo_root: Repository root
+            branches: Branches to delete
+            force: Also delete branches that are not merged
+
+        Returns:
+            The branches that could not be deleted (e.g. unmerged without force)
+        """
+        ...
+
     @abstractmethod
     def prune_worktrees(self, repo_root: Path) -> None:
         """Prune stale worktree metadata."""
@@ -158,6 +181,63 @@ class GitOps(ABC):
         """
         ...
 
+    @abstractmethod
+    def list_branch_heads(self, repo_root: Path) -> dict[str, tuple[str, str]]:
+        """Get the head commit and its subject for every local branch at once.
+
+        Args:
+            repo_root: Path to the git repository root
+
+        Returns:
+            Mapping of branch name -> (commit SHA, first line of commit message)
+        """
+        ...
+
+    @abstractmethod
+    def list_merged_branches(self, repo_root: Path, target: str) -> set[str]:
+        """Get the local branches whose head is an ancestor of ``target``.
+
+        Args:
+            repo_root: Path to the git repository root
+            target: Branch or commit the branches must be merged into
+
+        Returns:
+            Names of the branches merged into target (target itself included)
+        """
+        ...
+
+    @abstractmethod
+    def get_commit_graph(self, repo_root: Path, heads: list[str]) -> dict[str, list[str]]:
+        """Get the parent links of the commits between several heads and their common base.
+
+        Only commits reachable from some head but not from the heads' common
+        merge base are returned. Every omitted commit is an ancestor of that
+        base, and therefore of every head.
+
+        Args:
+            repo_root: Path to the git repository root
+            heads: Commit SHAs to start from
+
+        Returns:
+            Mapping of commit SHA -> list of parent SHAs
+        """
+        ...
+
+    @abstractmethod
+    def get_patch_ids(self, repo_root: Path, diffs: list[tuple[str, str]]) -> dict[str, str]:
+        """Get the stable patch-id of several diffs at once.
+
+        Equal patch-ids mean equal changes, whatever commits they were made in.
+
+        Args:
+            repo_root: Path to the git repository root
+            diffs: (commit, base) pairs; each diff goes from base to commit
+
+        Returns:
+            Mapping of commit SHA -> patch-id. Empty diffs are omitted.
+        """
+        ...
+
     @abstractmethod
     def get_file_status(self, cwd: Path) -> tuple[list[str], list[str], list[str]]:
         """Get lists of staged, modified, and untracked files.
@@ -183,6 +263,50 @@ class GitOps(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_upstream_ahead_behind(self, repo_root: Path) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind counts versus upstream for every local branch at once.
+
+        Args:
+            repo_root: Path to the git repository root
+
+        Returns:
+            Mapping of branch name -> (ahead, behind). Branches without an
+            upstream (or whose upstream is gone) are omitted.
+        """
+        ...
+
+    @abstractmethod
+    def get_ahead_behind_base(
+        self, repo_root: Path, base: str, branches: list[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind counts of several branches relative to one base ref.
+
+        Args:
+            repo_root: Path to the git repository root
+            base: Ref every branch is compared against
+            branches: Local branch names to compare
+
+        Returns:
+            Mapping of branch name -> (ahead, behind) for branches that exist
+        """
+        ...
+
+    @abstractmethod
+    def is_worktree_dirty(self, cwd: Path) -> bool:
+        """Check whether a worktree has staged, modified or untracked files.
+
+        Unlike get_file_status(), this only answers yes/no and may stop at the
+        first change it finds.
+
+        Args:
+            cwd: Worktree directory
+
+        Returns:
+            True if the worktree has any uncommitted change
+        """
+        ...
+
     @abstractmethod
     def get_recent_commits(self, cwd: Path, *, limit: int = 5) -> list[dict[str, str]]:
         """Get recent commit information.
@@ -208,6 +332,10 @@ class RealGitOps(GitOps):
     All git operations execute actual git commands via subprocess.
     """
 
+    # Whether the installed git understands %(ahead-behind:) (git >= 2.41);
+    # None until the first batched ahead/behind query finds out.
+    _supports_ahead_behind_atom: bool | None = None
+
     def list_worktrees(self, repo_root: Path) -> list[WorktreeInfo]:
         """List all worktrees in the repository."""
         result = subprocess.run(
@@ -355,15 +483,6 @@ class RealGitOps(GitOps):
         cmd.append(str(path))
         subprocess.run(cmd, cwd=repo_root, check=True)
 
-        # Clean up git worktree metadata to prevent permission issues during test cleanup
-        # This prunes stale administrative files left behind after worktree removal
-        subprocess.run(
-            ["git", "worktree", "prune"],
-            cwd=repo_root,
-            check=True,
-            capture_output=True,
-        )
-
     def checkout_branch(self, cwd: Path, branch: str) -> None:
         """Checkout a branch in the given directory."""
         subprocess.run(
@@ -391,6 +510,39 @@ class RealGitOps(GitOps):
             cmd.insert(2, "-f")
         subprocess.run(cmd, cwd=repo_root, check=True)
 
+    def delete_branches_with_graphite(
+        self, repo_root: Path, branches: list[str], *, force: bool
+    ) -> list[str]:
+        """Delete branches with one git branch call and one metadata ref update.
+
+        Graphite keeps each branch's metadata in refs/branch-metadata/<branch>;
+        deleting those refs is what gt delete does to untrack a branch, without
+        starting the gt CLI for every branch.
+        """
+        # git branch -d deletes what it can and reports the rest, so the exit
+        # status alone does not say which branches are left
+        subprocess.run(
+            ["git", "branch", "-D" if force else "-d", *branches],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        heads = self.list_branch_heads(repo_root)
+        remaining = [branch for branch in branches if branch in heads]
+        deleted = [branch for branch in branches if branch not in heads]
+
+        if deleted:
+            subprocess.run(
+                ["git", "update-ref", "--stdin"],
+                cwd=repo_root,
+                input="".join(f"delete refs/branch-metadata/{branch}\n" for branch in deleted),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        return remaining
+
     def prune_worktrees(self, repo_root: Path) -> None:
         """Prune stale worktree metadata."""
         subprocess.run(["git", "worktree", "prune"], cwd=repo_root, check=True)
@@ -431,6 +583,112 @@ class RealGitOps(GitOps):
 
         return result.stdout.strip()
 
+    def list_branch_heads(self, repo_root: Path) -> dict[str, tuple[str, str]]:
+        """Get head SHA and subject of every local branch in one for-each-ref call."""
+        result = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:short)%00%(objectname)%00%(subject)",
+                "refs/heads",
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        heads: dict[str, tuple[str, str]] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\x00")
+            if len(parts) == 3:
+                heads[parts[0]] = (parts[1], parts[2])
+        return heads
+
+    def list_merged_branches(self, repo_root: Path, target: str) -> set[str]:
+        """Get the branches merged into ``target`` in one for-each-ref call."""
+        result = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                f"--merged={target}",
+                "--format=%(refname:short)",
+                "refs/heads",
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return set(result.stdout.splitlines())
+
+    def get_commit_graph(self, repo_root: Path, heads: list[str]) -> dict[str, list[str]]:
+        """Get parent links below ``heads`` with one merge-base and one rev-list call.
+
+        The heads' octopus merge base bounds the walk, so only the commits
+        that make up the stacks are listed rather than the whole history.
+        Heads without a common ancestor are walked in full.
+        """
+        if not heads:
+            return {}
+
+        unique_heads = list(dict.fromkeys(heads))
+        base = subprocess.run(
+            ["git", "merge-base", "--octopus", *unique_heads],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        revs = list(unique_heads)
+        if base.returncode == 0 and base.stdout.strip():
+            revs.append(f"^{base.stdout.strip()}")
+
+        result = subprocess.run(
+            ["git", "rev-list", "--parents", "--stdin"],
+            cwd=repo_root,
+            input="\n".join(revs) + "\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        graph: dict[str, list[str]] = {}
+        for line in result.stdout.splitlines():
+            commit, *parents = line.split()
+            graph[commit] = parents
+        return graph
+
+    def get_patch_ids(self, repo_root: Path, diffs: list[tuple[str, str]]) -> dict[str, str]:
+        """Get patch-ids with one `git diff-tree --stdin` piped into `git patch-id`.
+
+        diff-tree reads each "<commit> <base>" line as a commit with the
+        given parent, so it prints the diff from base to commit under a
+        header line naming the commit, which patch-id reports it under.
+        """
+        if not diffs:
+            return {}
+
+        # Diffs are handled as bytes: file contents need not be valid UTF-8
+        diff = subprocess.run(
+            ["git", "diff-tree", "-p", "--stdin"],
+            cwd=repo_root,
+            input="".join(f"{commit} {base}\n" for commit, base in diffs).encode(),
+            capture_output=True,
+            check=True,
+        )
+        result = subprocess.run(
+            ["git", "patch-id", "--stable"],
+            cwd=repo_root,
+            input=diff.stdout,
+            capture_output=True,
+            check=True,
+        )
+        patch_ids: dict[str, str] = {}
+        for line in result.stdout.decode().splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                patch_ids[parts[1]] = parts[0]
+        return patch_ids
+
     def get_file_status(self, cwd: Path) -> tuple[list[str], list[str], list[str]]:
         """Get lists of staged, modified, and untracked files."""
         result = subprocess.run(
@@ -500,6 +758,106 @@ class RealGitOps(GitOps):
 
         return 0, 0
 
+    def get_upstream_ahead_behind(self, repo_root: Path) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind versus upstream for all branches in one for-each-ref call."""
+        result = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:short)%00%(upstream)%00%(upstream:track,nobracket)",
+                "refs/heads",
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        counts: dict[str, tuple[int, int]] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\x00")
+            if len(parts) != 3 or not parts[1] or parts[2] == "gone":
+                continue
+            counts[parts[0]] = _parse_track(parts[2])
+        return counts
+
+    def get_ahead_behind_base(
+        self, repo_root: Path, base: str, branches: list[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind of branches versus ``base``.
+
+        Uses a single `git for-each-ref` with the ``%(ahead-behind:)`` atom,
+        which walks the commit graph once for all branches and uses the
+        commit-graph file when present. Git older than 2.41 lacks the atom;
+        there each branch falls back to `git rev-list --left-right --count`.
+        """
+        if not branches:
+            return {}
+
+        if self._supports_ahead_behind_atom is not False:
+            result = subprocess.run(
+                [
+                    "git",
+                    "for-each-ref",
+                    f"--format=%(refname:short)%00%(ahead-behind:{base})",
+                    *[f"refs/heads/{branch}" for branch in branches],
+                ],
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.returncode == 0:
+                self._supports_ahead_behind_atom = True
+                return _parse_ahead_behind_lines(result.stdout)
+            if "ahead-behind" not in result.stderr:
+                raise subprocess.CalledProcessError(
+                    result.returncode, result.args, result.stdout, result.stderr
+                )
+            self._supports_ahead_behind_atom = False
+
+        counts: dict[str, tuple[int, int]] = {}
+        for branch in branches:
+            result = subprocess.run(
+                ["git", "rev-list", "--left-right", "--count", f"{branch}...{base}"],
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            parts = result.stdout.split()
+            if result.returncode == 0 and len(parts) == 2:
+                counts[branch] = (int(parts[0]), int(parts[1]))
+        return counts
+
+    def is_worktree_dirty(self, cwd: Path) -> bool:
+        """Check for uncommitted changes, stopping at the first one found.
+
+        `git diff --quiet HEAD` exits as soon as it finds a changed tracked
+        file; untracked files are only listed when tracked files are clean.
+        Optional index locks are disabled so concurrent probes never contend
+        for (or rewrite) the index.
+        """
+        env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+        result = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD", "--"],
+            cwd=cwd,
+            capture_output=True,
+            env=env,
+            check=False,
+        )
+        if result.returncode == 1:
+            return True
+
+        result = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "--directory"],
+            cwd=cwd,
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+        return bool(result.stdout.strip())
+
     def get_recent_commits(self, cwd: Path, *, limit: int = 5) -> list[dict[str, str]]:
         """Get recent commit information."""
         result = subprocess.run(
@@ -534,6 +892,30 @@ class RealGitOps(GitOps):
         return commits
 
 
+def _parse_track(track: str) -> tuple[int, int]:
+    """Parse ``%(upstream:track,nobracket)`` output such as "ahead 2, behind 1"."""
+    ahead = 0
+    behind = 0
+    for part in track.split(","):
+        word, _, count = part.strip().partition(" ")
+        if word == "ahead" and count.isdigit():
+            ahead = int(count)
+        elif word == "behind" and count.isdigit():
+            behind = int(count)
+    return ahead, behind
+
+
+def _parse_ahead_behind_lines(output: str) -> dict[str, tuple[int, int]]:
+    """Parse ``<branch>NUL<ahead> <behind>`` lines from for-each-ref."""
+    counts: dict[str, tuple[int, int]] = {}
+    for line in output.splitlines():
+        branch, _, numbers = line.partition("\x00")
+        parts = numbers.split()
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            counts[branch] = (int(parts[0]), int(parts[1]))
+    return counts
+
+
 # ============================================================================
 # Dry-Run Wrapper
 # ============================================================================
@@ -629,6 +1011,15 @@ class DryRunGitOps(GitOps):
         force_flag = "-f " if force else ""
         click.echo(f"[DRY RUN] Would run: gt delete {force_flag}{branch}", err=True)
 
+    def delete_branches_with_graphite(
+        self, repo_root: Path, branches: list[str], *, force: bool
+    ) -> list[str]:
+        """Print dry-run messages instead of deleting branches."""
+        flag = "-D" if force else "-d"
+        click.echo(f"[DRY RUN] Would run: git branch {flag} {' '.join(branches)}", err=True)
+        click.echo(f"[DRY RUN] Would delete Graphite metadata of: {', '.join(branches)}", err=True)
+        return []
+
     def prune_worktrees(self, repo_root: Path) -> None:
         """Print dry-run message instead of pruning worktrees."""
         click.echo("[DRY RUN] Would run: git worktree prune", err=True)
@@ -645,6 +1036,22 @@ class DryRunGitOps(GitOps):
         """Get commit message (read-only, delegates to wrapped)."""
         return self._wrapped.get_commit_message(repo_root, commit_sha)
 
+    def list_branch_heads(self, repo_root: Path) -> dict[str, tuple[str, str]]:
+        """List branch heads (read-only, delegates to wrapped)."""
+        return self._wrapped.list_branch_heads(repo_root)
+
+    def list_merged_branches(self, repo_root: Path, target: str) -> set[str]:
+        """List merged branches (read-only, delegates to wrapped)."""
+        return self._wrapped.list_merged_branches(repo_root, target)
+
+    def get_commit_graph(self, repo_root: Path, heads: list[str]) -> dict[str, list[str]]:
+        """Get commit graph (read-only, delegates to wrapped)."""
+        return self._wrapped.get_commit_graph(repo_root, heads)
+
+    def get_patch_ids(self, repo_root: Path, diffs: list[tuple[str, str]]) -> dict[str, str]:
+        """Get patch-ids (read-only, delegates to wrapped)."""
+        return self._wrapped.get_patch_ids(repo_root, diffs)
+
     def get_file_status(self, cwd: Path) -> tuple[list[str], list[str], list[str]]:
         """Get file status (read-only, delegates to wrapped)."""
         return self._wrapped.get_file_status(cwd)
@@ -653,6 +1060,20 @@ class DryRunGitOps(GitOps):
         """Get ahead/behind counts (read-only, delegates to wrapped)."""
         return self._wrapped.get_ahead_behind(cwd, branch)
 
+    def get_upstream_ahead_behind(self, repo_root: Path) -> dict[str, tuple[int, int]]:
+        """Get upstream ahead/behind counts (read-only, delegates to wrapped)."""
+        return self._wrapped.get_upstream_ahead_behind(repo_root)
+
+    def get_ahead_behind_base(
+        self, repo_root: Path, base: str, branches: list[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind counts versus a base (read-only, delegates to wrapped)."""
+        return self._wrapped.get_ahead_behind_base(repo_root, base, branches)
+
+    def is_worktree_dirty(self, cwd: Path) -> bool:
+        """Check worktree dirtiness (read-only, delegates to wrapped)."""
+        return self._wrapped.is_worktree_dirty(cwd)
+
     def get_recent_commits(self, cwd: Path, *, limit: int = 5) -> list[dict[str, str]]:
         """Get recent commits (read-only, delegates to wrapped)."""
         return self._wrapped.get_recent_commits(cwd, limit=limit)
@@ -1,5 +1,6 @@
 """Global configuration operations interface and implementations."""
 
+import os
 import tomllib
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -228,53 +229,65 @@ class RealGlobalConfigOps(GlobalConfigOps):
         ):
             raise ValueError("At least one field must be provided")
 
-        # Get current values (if config exists), or use defaults
-        if self.exists():
-            current_root = self.get_workstacks_root()
-            current_graphite = self.get_use_graphite()
-            current_shell = self.get_shell_setup_complete()
-            current_pr_info = self.get_show_pr_info()
-            current_pr_checks = self.get_show_pr_checks()
-        else:
-            # For new config, all fields must be provided (no defaults)
-            if isinstance(workstacks_root, _UnchangedType):
-                raise ValueError("workstacks_root must be provided for new config")
-            current_root = workstacks_root
-            current_graphite = False
-            current_shell = False
-            current_pr_info = True
-            current_pr_checks = False
-
-        # Apply updates
-        final_root = (
-            current_root if isinstance(workstacks_root, _UnchangedType) else workstacks_root
-        )
-        final_graphite = (
-            current_graphite if isinstance(use_graphite, _UnchangedType) else use_graphite
-        )
-        final_shell = (
-            current_shell
-            if isinstance(shell_setup_complete, _UnchangedType)
-            else shell_setup_complete
-        )
-        final_pr_info = (
-            current_pr_info if isinstance(show_pr_info, _UnchangedType) else show_pr_info
-        )
-        final_pr_checks = (
-            current_pr_checks if isinstance(show_pr_checks, _UnchangedType) else show_pr_checks
-        )
-
-        # Write to disk
+        # Imported here: every command loads this module, few write the config
+        from workstack.core.repo_lock import file_lock
+
+        # Concurrent writers would otherwise each read the old file and
+        # overwrite each other's change
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        content = f"""# Global workstack configuration
+        with file_lock(self._path.with_name(f"{self._path.name}.lock"), shared=False):
+            # Another process may have written since this one last read
+            self._invalidate_cache()
+
+            # Get current values (if config exists), or use defaults
+            if self.exists():
+                current_root = self.get_workstacks_root()
+                current_graphite = self.get_use_graphite()
+                current_shell = self.get_shell_setup_complete()
+                current_pr_info = self.get_show_pr_info()
+                current_pr_checks = self.get_show_pr_checks()
+            else:
+                # For new config, all fields must be provided (no defaults)
+                if isinstance(workstacks_root, _UnchangedType):
+                    raise ValueError("workstacks_root must be provided for new config")
+                current_root = workstacks_root
+                current_graphite = False
+                current_shell = False
+                current_pr_info = True
+                current_pr_checks = False
+
+            # Apply updates
+            final_root = (
+                current_root if isinstance(workstacks_root, _UnchangedType) else workstacks_root
+            )
+            final_graphite = (
+                current_graphite if isinstance(use_graphite, _UnchangedType) else use_graphite
+            )
+            final_shell = (
+                current_shell
+                if isinstance(shell_setup_complete, _UnchangedType)
+                else shell_setup_complete
+            )
+            final_pr_info = (
+                current_pr_info if isinstance(show_pr_info, _UnchangedType) else show_pr_info
+            )
+            final_pr_checks = (
+                current_pr_checks if isinstance(show_pr_checks, _UnchangedType) else show_pr_checks
+            )
+
+            # Write to disk. Replacing the file atomically means readers never
+            # need the lock: they see either the old or the new config.
+            content = f"""# Global workstack configuration
 workstacks_root = "{final_root}"
 use_graphite = {str(final_graphite).lower()}
 shell_setup_complete = {str(final_shell).lower()}
 show_pr_info = {str(final_pr_info).lower()}
 show_pr_checks = {str(final_pr_checks).lower()}
 """
-        self._path.write_text(content, encoding="utf-8")
-        self._invalidate_cache()
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            tmp_path.replace(self._path)
+            self._invalidate_cache()
 
     def exists(self) -> bool:
         return self._path.exists()
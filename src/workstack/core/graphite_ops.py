@@ -132,6 +132,34 @@ def parse_graphite_cache(
     return result
 
 
+def prune_graphite_cache(cache_file: Path, branches: list[str]) -> None:
+    """Remove deleted branches from Graphite's .graphite_cache_persist file.
+
+    gt delete updates the cache itself; branches deleted without gt would
+    otherwise stay in it, and stack navigation would offer them as targets.
+
+    Args:
+        cache_file: Path to the .graphite_cache_persist file (must exist)
+        branches: Branches that no longer exist
+    """
+    gone = set(branches)
+    cache_data = read_graphite_json_file(cache_file, "Graphite cache")
+
+    kept: list[Any] = []
+    for branch_name, info in cache_data.get("branches", []):
+        if branch_name in gone:
+            continue
+        if isinstance(info, dict) and isinstance(info.get("children"), list):
+            info["children"] = [child for child in info["children"] if child not in gone]
+        kept.append([branch_name, info])
+    cache_data["branches"] = kept
+
+    # Replace the file in one rename so gt never reads a half-written cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.workstack-tmp")
+    tmp_file.write_text(json.dumps(cache_data), encoding="utf-8")
+    tmp_file.replace(cache_file)
+
+
 def _graphite_url_to_github_url(graphite_url: str) -> str:
     """Convert Graphite URL to GitHub URL.
 
@@ -311,14 +339,13 @@ class RealGraphiteOps(GraphiteOps):
 
         data = read_graphite_json_file(cache_file, "Graphite cache")
 
-        # Get all branch heads from git for enrichment
+        # Get all branch heads from git for enrichment (one call for every branch)
+        all_heads = git_ops.list_branch_heads(repo_root)
         git_branch_heads = {}
         branches_data = data.get("branches", [])
         for branch_name, _ in branches_data:
-            if isinstance(branch_name, str):
-                commit_sha = git_ops.get_branch_head(repo_root, branch_name)
-                if commit_sha:
-                    git_branch_heads[branch_name] = commit_sha
+            if isinstance(branch_name, str) and branch_name in all_heads:
+                git_branch_heads[branch_name] = all_heads[branch_name][0]
 
         # parse_graphite_cache expects JSON string, so convert back
         return parse_graphite_cache(json.dumps(data), git_branch_heads)
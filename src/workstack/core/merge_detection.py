@@ -0,0 +1,187 @@
+"""Local detection of branches whose changes are already in trunk.
+
+Deciding whether a worktree is disposable used to take one GitHub request
+per branch. Most merged branches can be recognized from the local
+repository alone, for all branches at once:
+
+- ancestry: the branch has no commits that trunk lacks (`git branch --merged`)
+  and its head was merged with a merge commit; a branch that was never
+  worked on looks the same otherwise
+- patch: every commit of the branch has a trunk commit with the same
+  patch-id, as after a rebase merge or cherry-pick (what `git cherry` checks)
+- squash: the branch's combined diff against its merge base has the
+  patch-id of a single trunk commit, as after a squash merge
+
+Only trunk commits made since a branch's merge base are compared with it.
+
+The number of git calls does not depend on the number of branches:
+
+- one `git for-each-ref` for every branch head
+- one `git merge-base --octopus` + `git rev-list --parents` for the commit
+  graph between trunk, the branches and their common base
+- two `git diff-tree --stdin | git patch-id` pipelines, one for single
+  commits and one for whole-branch diffs
+
+A branch that is not found here may still have been merged (e.g. trunk is
+stale locally) or have a closed PR; callers ask GitHub about the rest.
+"""
+
+from pathlib import Path
+
+from workstack.core.gitops import GitOps
+from workstack.core.stack_health import reachable
+
+MERGED_BY_ANCESTRY = "ancestry"
+MERGED_BY_PATCH = "patch"
+MERGED_BY_SQUASH = "squash"
+
+# Trunk candidates when the caller does not name one, in order of preference
+DEFAULT_TRUNKS = ("main", "master")
+
+
+def collect_merged_branches(
+    git_ops: GitOps, repo_root: Path, branches: list[str], *, trunk: str | None = None
+) -> dict[str, str]:
+    """Find which of ``branches`` are already merged into trunk, from local data only.
+
+    Args:
+        git_ops: Git operations
+        repo_root: Repository root
+        branches: Local branch names to check
+        trunk: Trunk branch, or None for the first of DEFAULT_TRUNKS that exists
+
+    Returns:
+        Mapping of merged branch name -> how it was merged (one of the
+        MERGED_BY_* constants). Branches not found merged are omitted.
+    """
+    heads = git_ops.list_branch_heads(repo_root)
+    if not heads:
+        return {}
+    if trunk is None:
+        # Unlike detect_default_branch, finding no trunk is not an error here:
+        # the caller falls back to asking GitHub
+        trunk = next((name for name in DEFAULT_TRUNKS if name in heads), None)
+    if trunk is None or trunk not in heads:
+        return {}
+
+    trunk_head = heads[trunk][0]
+    branch_heads = {
+        branch: heads[branch][0] for branch in branches if branch in heads and branch != trunk
+    }
+    if not branch_heads:
+        return {}
+
+    graph = git_ops.get_commit_graph(repo_root, [trunk_head, *branch_heads.values()])
+    trunk_reach = reachable(trunk_head, graph)
+    own = {branch: _own_commits(head, trunk_reach, graph) for branch, head in branch_heads.items()}
+
+    # A branch without commits of its own is either merged or was never
+    # worked on. Only a head that was merged into trunk, i.e. is a merged-in
+    # parent of a merge commit off trunk's first-parent line, tells the two
+    # apart. A branch created at any other trunk commit, including one that
+    # came in through a merge, is left undecided.
+    first_parents = _first_parent_line(trunk_head, graph)
+    merged_tips = {parent for commit in trunk_reach for parent in graph[commit][1:]}
+    merged: dict[str, str] = {}
+    undecided: set[str] = set()
+    for branch, (commits, _bases) in own.items():
+        if commits:
+            continue
+        head = branch_heads[branch]
+        if head in merged_tips and head not in first_parents:
+            merged[branch] = MERGED_BY_ANCESTRY
+        else:
+            undecided.add(branch)
+
+    pending = [
+        branch for branch in branch_heads if branch not in merged and branch not in undecided
+    ]
+    if not pending:
+        return merged
+
+    # Only trunk commits made after a branch forked off can hold its changes,
+    # so older trunk history is not diffed at all
+    reach_by_base: dict[str, set[str]] = {}
+    candidates: dict[str, set[str]] = {}
+    for branch in pending:
+        older: set[str] = set()
+        for base in own[branch][1]:
+            if base not in reach_by_base:
+                reach_by_base[base] = reachable(base, graph)
+            older |= reach_by_base[base]
+        candidates[branch] = trunk_reach - older
+
+    # Merge commits have no single diff; they are neither candidates on
+    # trunk nor required to match on a branch
+    trunk_commits: set[str] = set().union(*candidates.values())
+    trunk_diffs = [
+        (commit, graph[commit][0]) for commit in trunk_commits if len(graph[commit]) == 1
+    ]
+    commit_diffs = [
+        (commit, graph[commit][0])
+        for branch in pending
+        for commit in own[branch][0]
+        if len(graph[commit]) == 1
+    ]
+    commit_patch_ids = git_ops.get_patch_ids(repo_root, trunk_diffs + commit_diffs)
+
+    # A branch with several merge bases (it merged trunk in) has no single
+    # combined diff to compare
+    branch_diffs = [
+        (branch_heads[branch], next(iter(own[branch][1])))
+        for branch in pending
+        if len(own[branch][1]) == 1
+    ]
+    branch_patch_ids = git_ops.get_patch_ids(repo_root, branch_diffs)
+
+    for branch in pending:
+        commits, _bases = own[branch]
+        trunk_patch_ids = {
+            commit_patch_ids[commit] for commit in candidates[branch] if commit in commit_patch_ids
+        }
+        # Commits with an empty diff have no patch-id and change nothing
+        patch_ids = [commit_patch_ids[commit] for commit in commits if commit in commit_patch_ids]
+        if patch_ids and all(patch_id in trunk_patch_ids for patch_id in patch_ids):
+            merged[branch] = MERGED_BY_PATCH
+        elif branch_patch_ids.get(branch_heads[branch]) in trunk_patch_ids:
+            merged[branch] = MERGED_BY_SQUASH
+
+    return merged
+
+
+def _first_parent_line(head: str, graph: dict[str, list[str]]) -> set[str]:
+    """Return the commits of ``graph`` on the first-parent line of ``head``."""
+    line: set[str] = set()
+    commit: str | None = head
+    while commit is not None and commit in graph and commit not in line:
+        line.add(commit)
+        commit = graph[commit][0] if graph[commit] else None
+    return line
+
+
+def _own_commits(
+    head: str, trunk_reach: set[str], graph: dict[str, list[str]]
+) -> tuple[list[str], set[str]]:
+    """Walk from ``head`` down to trunk.
+
+    Returns:
+        Tuple of (commits of the branch that trunk lacks, trunk commits the
+        walk stopped at, i.e. the branch's merge bases)
+    """
+    seen: set[str] = set()
+    pending = [head]
+    commits: list[str] = []
+    bases: set[str] = set()
+    while pending:
+        commit = pending.pop()
+        if commit in seen:
+            continue
+        seen.add(commit)
+        # Commits outside the graph are ancestors of the common base, and so
+        # of trunk as well
+        if commit not in graph or commit in trunk_reach:
+            bases.add(commit)
+            continue
+        commits.append(commit)
+        pending.extend(graph[commit])
+    return commits, bases
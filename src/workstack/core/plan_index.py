@@ -0,0 +1,294 @@
+"""Plan metadata index shared by `workstack list`, `workstack status` and plan search.
+
+Listing worktrees shows the title of each worktree's ``.PLAN.md``. Getting it
+used to mean parsing the whole file, YAML front matter included, once per
+worktree on every run. Instead:
+
+- only the head of the file is decoded and parsed; the rest is scanned for
+  line breaks so the line count stays exact
+- the front-matter fence is parsed in-house as flat ``key: value`` pairs, so
+  neither python-frontmatter nor PyYAML is imported
+- extracted metadata is cached in one JSON file in the repository's git
+  common directory, keyed by plan path and validated by mtime and size
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from workstack.core.status_snapshot import locate_worktree, read_common_dir
+
+PLAN_FILENAME = ".PLAN.md"
+PLAN_INDEX_FILENAME = "workstack-plan-index.json"
+PLAN_INDEX_VERSION = 1
+
+# Titles and summaries sit at the top of a plan; this is far more than any
+# realistic front matter plus opening section.
+PLAN_HEAD_BYTES = 16 * 1024
+
+FIRST_LINES_COUNT = 5
+SUMMARY_SCAN_LINES = 10
+SUMMARY_MAX_LENGTH = 100
+
+_FRONT_MATTER_FENCE = "---"
+_FRONT_MATTER_END_FENCES = ("---", "...")
+
+
+@dataclass(frozen=True)
+class PlanMetadata:
+    """Metadata extracted from a plan file.
+
+    Attributes:
+        title: Text of the first markdown heading after the front matter
+        summary: First non-heading lines after the front matter, truncated
+        line_count: Number of lines in the whole file
+        first_lines: First lines of the file as written
+        front_matter: Top-level scalar fields of the YAML front matter
+    """
+
+    title: str | None
+    summary: str | None
+    line_count: int
+    first_lines: list[str]
+    front_matter: dict[str, str]
+
+
+class PlanIndex:
+    """Cached plan metadata for the worktrees of one repository."""
+
+    def __init__(self, path: Path | None, entries: dict[str, dict[str, Any]]) -> None:
+        """Create an index backed by ``path``.
+
+        Args:
+            path: Location of the index file, or None to keep it in memory only
+            entries: Previously persisted entries keyed by absolute plan path
+        """
+        self.path = path
+        self._entries = entries
+        self._dirty = False
+
+    @classmethod
+    def load(cls, git_common_dir: Path | None) -> "PlanIndex":
+        """Load the index stored in a repository's git common directory.
+
+        Args:
+            git_common_dir: The repository's common git directory, or None when
+                unknown (the index then lives for this process only)
+        """
+        if git_common_dir is None or not git_common_dir.is_dir():
+            return cls(None, {})
+        path = git_common_dir / PLAN_INDEX_FILENAME
+        return cls(path, _load_entries(path))
+
+    @classmethod
+    def for_worktree(cls, worktree_path: Path) -> "PlanIndex":
+        """Load the index of the repository containing ``worktree_path`` without running git."""
+        location = locate_worktree(str(worktree_path))
+        if location is None:
+            return cls(None, {})
+        return cls.load(Path(read_common_dir(location[1])))
+
+    def get(self, plan_path: Path) -> PlanMetadata | None:
+        """Return metadata for a plan file, reading it only if it changed.
+
+        Args:
+            plan_path: Path to the plan file
+
+        Returns:
+            The plan's metadata, or None if the file does not exist
+        """
+        key = str(plan_path.absolute())
+        if not plan_path.is_file():
+            if key in self._entries:
+                del self._entries[key]
+                self._dirty = True
+            return None
+
+        stat = plan_path.stat()
+        signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+        entry = self._entries.get(key)
+        if isinstance(entry, dict) and entry.get("signature") == signature:
+            metadata = _metadata_from_entry(entry)
+            if metadata is not None:
+                return metadata
+
+        metadata = read_plan_metadata(plan_path)
+        self._entries[key] = _entry_from_metadata(signature, metadata)
+        self._dirty = True
+        return metadata
+
+    def save(self) -> None:
+        """Atomically write the index file if any entry changed."""
+        if not self._dirty or self.path is None:
+            return
+
+        data = {"version": PLAN_INDEX_VERSION, "entries": self._entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+
+def read_plan_metadata(plan_path: Path) -> PlanMetadata:
+    """Extract metadata from a plan file without consulting the index.
+
+    Args:
+        plan_path: Path to an existing plan file
+
+    Returns:
+        Metadata parsed from the head of the file
+    """
+    with plan_path.open("rb") as f:
+        head = f.read(PLAN_HEAD_BYTES)
+        newline_count = head.count(b"\n")
+        last_byte = head[-1:]
+        truncated = False
+        while chunk := f.read(1024 * 1024):
+            truncated = True
+            newline_count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+
+    line_count = newline_count + (1 if last_byte not in (b"", b"\n") else 0)
+
+    text = head.decode("utf-8", errors="replace").removeprefix("\ufeff")
+    lines = text.splitlines()
+    if truncated and lines:
+        # The last line of the head may be cut mid-way (or mid-character)
+        lines.pop()
+
+    front_matter, body_start = parse_front_matter(lines)
+    body = lines[body_start:]
+    return PlanMetadata(
+        title=_first_heading(body),
+        summary=_summary(body[:SUMMARY_SCAN_LINES]),
+        line_count=line_count,
+        first_lines=lines[:FIRST_LINES_COUNT],
+        front_matter=front_matter,
+    )
+
+
+def parse_front_matter(lines: list[str]) -> tuple[dict[str, str], int]:
+    """Parse a leading YAML front-matter block.
+
+    Only flat ``key: value`` scalars are extracted; nested mappings, lists and
+    comments are skipped. A block without a closing fence is not front matter.
+
+    Args:
+        lines: Lines of the document
+
+    Returns:
+        Tuple of (fields, index of the first line after the front matter)
+    """
+    if not lines or lines[0].rstrip() != _FRONT_MATTER_FENCE:
+        return {}, 0
+
+    for index in range(1, len(lines)):
+        if lines[index].rstrip() in _FRONT_MATTER_END_FENCES:
+            return _parse_fields(lines[1:index]), index + 1
+    return {}, 0
+
+
+def _parse_fields(lines: list[str]) -> dict[str, str]:
+    """Parse top-level ``key: value`` lines, skipping anything more structured."""
+    fields: dict[str, str] = {}
+    for line in lines:
+        if not line or line[0] in " \t#-":
+            continue
+        key, sep, value = line.partition(":")
+        value = value.strip()
+        if not sep or not key.strip() or not value:
+            continue
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        fields[key.strip()] = value
+    return fields
+
+
+def _first_heading(lines: list[str]) -> str | None:
+    """Return the text of the first non-empty markdown heading."""
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            title = stripped.lstrip("#").strip()
+            if title:
+                return title
+    return None
+
+
+def _summary(lines: list[str]) -> str | None:
+    """Join the first two non-empty, non-heading lines into a short summary."""
+    summary_lines: list[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            summary_lines.append(stripped)
+            if len(summary_lines) >= 2:
+                break
+
+    if not summary_lines:
+        return None
+    summary = " ".join(summary_lines)
+    if len(summary) > SUMMARY_MAX_LENGTH:
+        summary = summary[: SUMMARY_MAX_LENGTH - 3] + "..."
+    return summary
+
+
+def _entry_from_metadata(signature: str, metadata: PlanMetadata) -> dict[str, Any]:
+    return {
+        "signature": signature,
+        "title": metadata.title,
+        "summary": metadata.summary,
+        "line_count": metadata.line_count,
+        "first_lines": metadata.first_lines,
+        "front_matter": metadata.front_matter,
+    }
+
+
+def _metadata_from_entry(entry: dict[str, Any]) -> PlanMetadata | None:
+    """Decode a persisted entry, or return None if it is malformed."""
+    title = entry.get("title")
+    summary = entry.get("summary")
+    line_count = entry.get("line_count")
+    first_lines = entry.get("first_lines")
+    front_matter = entry.get("front_matter")
+    if not (title is None or isinstance(title, str)):
+        return None
+    if not (summary is None or isinstance(summary, str)):
+        return None
+    if not isinstance(line_count, int):
+        return None
+    if not isinstance(first_lines, list) or not all(isinstance(x, str) for x in first_lines):
+        return None
+    if not isinstance(front_matter, dict):
+        return None
+    if not all(isinstance(k, str) and isinstance(v, str) for k, v in front_matter.items()):
+        return None
+    return PlanMetadata(
+        title=title,
+        summary=summary,
+        line_count=line_count,
+        first_lines=first_lines,
+        front_matter=front_matter,
+    )
+
+
+def _load_entries(path: Path) -> dict[str, dict[str, Any]]:
+    """Read persisted entries, treating a missing or unreadable file as empty."""
+    if not path.exists():
+        return {}
+
+    # The index is advisory: a truncated or hand-edited file just means plans
+    # are parsed again, so decode errors are handled here.
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != PLAN_INDEX_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return entries
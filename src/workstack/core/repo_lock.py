@@ -0,0 +1,201 @@
+"""Cross-process locks for workstack invocations sharing a repository.
+
+Several workstack processes (typically parallel agents) may create, remove
+and move worktrees of one repository at the same time. Unsynchronized, they
+collide on git's ``.git/worktrees`` metadata and ``index.lock`` files and on
+Graphite's metadata, and fail intermittently. Commands therefore take an
+advisory ``fcntl.flock`` lock on the scope they are about to change (see
+workstack.cli.core.repo_lock for the scopes in use).
+
+Each scope has its own lock file in ``<git common dir>/workstack-locks``, so
+invocations touching different scopes never wait for each other. A scope can
+be held shared, by readers that need a consistent view, or exclusive, by
+writers.
+
+Waiting is bounded: acquisition polls with exponential backoff (plus jitter)
+and raises LockTimeoutError once the deadline passes. For fairness, every
+acquirer first passes through a per-scope turnstile lock; a waiting writer
+holds the turnstile, so a stream of readers cannot starve it.
+
+Locks are reentrant within a thread: re-acquiring a held scope, in the same
+or a weaker mode, returns immediately.
+"""
+
+import fcntl
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+LOCKS_DIRNAME = "workstack-locks"
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+INITIAL_BACKOFF_SECONDS = 0.005
+MAX_BACKOFF_SECONDS = 0.25
+
+
+class LockTimeoutError(Exception):
+    """Raised when a lock could not be acquired before the deadline."""
+
+    def __init__(self, path: Path, waited_seconds: float) -> None:
+        super().__init__(f"Timed out after {waited_seconds:.1f}s waiting for lock {path}")
+        self.path = path
+        self.waited_seconds = waited_seconds
+
+
+@dataclass(frozen=True)
+class LockStats:
+    """Timing of one lock acquisition, for traces.
+
+    Attributes:
+        path: Lock file
+        shared: Whether the lock was taken shared
+        waited_seconds: Time spent waiting for the lock
+        reentered: True if the thread already held the lock
+    """
+
+    path: Path
+    shared: bool
+    waited_seconds: float
+    reentered: bool
+
+
+@dataclass
+class _HeldLock:
+    fd: int
+    shared: bool
+    depth: int
+
+
+# Locks held by the current thread, by lock file path. Threads hold their own
+# locks: flock conflicts between separate opens even within one process.
+_local = threading.local()
+
+
+def _held_locks() -> dict[Path, _HeldLock]:
+    held: dict[Path, _HeldLock] | None = getattr(_local, "held", None)
+    if held is None:
+        held = {}
+        _local.held = held
+    return held
+
+
+def repo_lock_path(git_common_dir: Path, scope: str) -> Path:
+    """Return the lock file of a scope of a repository."""
+    return git_common_dir / LOCKS_DIRNAME / f"{scope}.lock"
+
+
+@contextmanager
+def file_lock(
+    path: Path,
+    *,
+    shared: bool,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    on_contention: Callable[[], None] | None = None,
+) -> Iterator[LockStats]:
+    """Hold an advisory lock on ``path`` for the duration of the block.
+
+    Args:
+        path: Lock file; created with its directory if missing
+        shared: Take a shared (reader) lock instead of an exclusive one
+        timeout: Maximum number of seconds to wait
+        on_contention: Called once if the lock is not immediately available
+
+    Yields:
+        Timing of the acquisition
+
+    Raises:
+        LockTimeoutError: If the lock is still unavailable after ``timeout``
+        RuntimeError: If an exclusive lock is requested while this thread
+            holds the same lock shared (upgrades could deadlock)
+    """
+    held_locks = _held_locks()
+    held = held_locks.get(path)
+    if held is not None:
+        if held.shared and not shared:
+            raise RuntimeError(f"Cannot upgrade shared lock {path} to exclusive")
+        held.depth += 1
+        try:
+            yield LockStats(path=path, shared=held.shared, waited_seconds=0.0, reentered=True)
+        finally:
+            held.depth -= 1
+        return
+
+    start = time.monotonic()
+    fd = _acquire(path, shared=shared, deadline=start + timeout, on_contention=on_contention)
+    waited = time.monotonic() - start
+    held_locks[path] = _HeldLock(fd=fd, shared=shared, depth=1)
+    try:
+        yield LockStats(path=path, shared=shared, waited_seconds=waited, reentered=False)
+    finally:
+        del held_locks[path]
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _acquire(
+    path: Path,
+    *,
+    shared: bool,
+    deadline: float,
+    on_contention: Callable[[], None] | None,
+) -> int:
+    """Pass the turnstile, then take the lock itself; return its descriptor."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    turnstile = _open(path.with_name(f"{path.name}.queue"))
+    try:
+        contended = _poll(turnstile, fcntl.LOCK_EX, path, deadline, on_contention)
+        fd = _open(path)
+        try:
+            mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            _poll(fd, mode, path, deadline, None if contended else on_contention)
+        except BaseException:
+            os.close(fd)
+            raise
+    finally:
+        # Closing the turnstile releases it for the next in line
+        os.close(turnstile)
+    return fd
+
+
+def _open(path: Path) -> int:
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+
+def _poll(
+    fd: int,
+    mode: int,
+    path: Path,
+    deadline: float,
+    on_contention: Callable[[], None] | None,
+) -> bool:
+    """Take ``mode`` on ``fd``, backing off until ``deadline``.
+
+    Returns:
+        True if the lock was contended (on_contention was called)
+    """
+    backoff = INITIAL_BACKOFF_SECONDS
+    contended = False
+    started = time.monotonic()
+    while True:
+        # flock reports a held lock as an error; this loop is the only way to
+        # wait with a deadline without blocking signals or spawning threads.
+        try:
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+            return contended
+        except BlockingIOError:
+            pass
+
+        now = time.monotonic()
+        if now >= deadline:
+            raise LockTimeoutError(path, now - started)
+        if not contended:
+            contended = True
+            if on_contention is not None:
+                on_contention()
+        time.sleep(min(backoff * random.uniform(0.5, 1.5), max(0.0, deadline - now)))
+        backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
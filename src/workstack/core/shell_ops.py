@@ -1,12 +1,14 @@
-"""Shell detection and tool availability operations.
+"""Shell detection, tool availability and background process operations.
 
 This module provides abstraction over shell-specific operations like detecting
-the current shell and checking if command-line tools are installed. This abstraction
-enables dependency injection for testing without mock.patch.
+the current shell, checking if command-line tools are installed and starting
+background processes. This abstraction enables dependency injection for testing
+without mock.patch.
 """
 
 import os
 import shutil
+import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -81,6 +83,16 @@ class ShellOps(ABC):
         """
         ...
 
+    @abstractmethod
+    def spawn_detached(self, command: list[str], *, cwd: Path | None = None) -> None:
+        """Start a process that outlives the calling command, without waiting for it.
+
+        Args:
+            command: Program and arguments to run
+            cwd: Working directory for the process, or None to inherit ours
+        """
+        ...
+
 
 class RealShellOps(ShellOps):
     """Production implementation using system environment and PATH."""
@@ -99,3 +111,17 @@ class RealShellOps(ShellOps):
     def get_installed_tool_path(self, tool_name: str) -> str | None:
         """Check if tool is in PATH using shutil.which."""
         return shutil.which(tool_name)
+
+    def spawn_detached(self, command: list[str], *, cwd: Path | None = None) -> None:
+        """Start the command in its own session with no inherited stdio.
+
+        Neither the shell nor the calling command waits for it.
+        """
+        subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
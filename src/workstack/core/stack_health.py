@@ -0,0 +1,140 @@
+"""Per-branch stack health for Graphite branch listings.
+
+For every Graphite branch this computes how many commits it has on top of
+its parent branch and whether it needs restacking (the parent's head is no
+longer an ancestor of the branch). Asking git for that per branch costs a
+couple of processes per node, so it is derived in one pass instead:
+
+- one `git for-each-ref` for every branch head (and its subject)
+- one `git merge-base --octopus` + `git rev-list --parents` for the commit
+  graph between the heads and their common base
+
+The graph is then walked in memory. For a (branch, parent) pair, a walk from
+the branch that stops at commits reachable from the parent visits exactly
+the branch's own commits, and reaches the parent's head precisely when the
+parent's head is an ancestor of the branch.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from workstack.core.branch_metadata import BranchMetadata
+from workstack.core.gitops import GitOps
+
+
+@dataclass(frozen=True)
+class BranchHealth:
+    """Stack health of a single branch.
+
+    Attributes:
+        subject: First line of the head commit's message, or None if unknown
+        commits_ahead: Commits on the branch that are not on its parent, or
+            None for trunk branches and when either head is unknown
+        needs_restack: True if the parent's head is not an ancestor of the branch
+    """
+
+    subject: str | None
+    commits_ahead: int | None
+    needs_restack: bool
+
+
+def collect_stack_health(
+    git_ops: GitOps, repo_root: Path, branches: dict[str, BranchMetadata]
+) -> dict[str, BranchHealth]:
+    """Compute stack health for every Graphite branch with a fixed number of git calls.
+
+    Args:
+        git_ops: Git operations
+        repo_root: Repository root
+        branches: Graphite branch metadata
+
+    Returns:
+        Mapping of branch name -> health, for branches that exist locally
+    """
+    heads = git_ops.list_branch_heads(repo_root)
+    tracked_heads = [heads[name][0] for name in branches if name in heads]
+    graph = git_ops.get_commit_graph(repo_root, tracked_heads)
+    parents = {name: meta.parent for name, meta in branches.items()}
+    return compute_stack_health(heads, parents, graph)
+
+
+def compute_stack_health(
+    heads: dict[str, tuple[str, str]],
+    parents: dict[str, str | None],
+    graph: dict[str, list[str]],
+) -> dict[str, BranchHealth]:
+    """Compute stack health from branch heads and a commit graph.
+
+    Args:
+        heads: Mapping of branch name -> (head SHA, subject)
+        parents: Mapping of branch name -> parent branch name (None for trunk)
+        graph: Commit SHA -> parent SHAs, for commits not reachable from the
+            heads' common base (omitted commits are ancestors of every head)
+
+    Returns:
+        Mapping of branch name -> health, for branches present in ``heads``
+    """
+    reach_by_head: dict[str, set[str]] = {}
+    health: dict[str, BranchHealth] = {}
+
+    for name, parent in parents.items():
+        if name not in heads:
+            continue
+        head, subject = heads[name]
+
+        if parent is None or parent not in heads:
+            health[name] = BranchHealth(subject=subject, commits_ahead=None, needs_restack=False)
+            continue
+
+        parent_head = heads[parent][0]
+        parent_reach = reach_by_head.get(parent_head)
+        if parent_reach is None:
+            parent_reach = reachable(parent_head, graph)
+            reach_by_head[parent_head] = parent_reach
+
+        ahead, contains_parent = _walk_until(head, parent_head, parent_reach, graph)
+        health[name] = BranchHealth(
+            subject=subject, commits_ahead=ahead, needs_restack=not contains_parent
+        )
+
+    return health
+
+
+def reachable(head: str, graph: dict[str, list[str]]) -> set[str]:
+    """Return the commits of ``graph`` reachable from ``head``."""
+    seen: set[str] = set()
+    pending = [head]
+    while pending:
+        commit = pending.pop()
+        if commit in seen or commit not in graph:
+            continue
+        seen.add(commit)
+        pending.extend(graph[commit])
+    return seen
+
+
+def _walk_until(
+    head: str, stop_head: str, stop_reach: set[str], graph: dict[str, list[str]]
+) -> tuple[int, bool]:
+    """Walk from ``head``, stopping at commits reachable from ``stop_head``.
+
+    Returns:
+        Tuple of (commits visited before stopping, whether ``stop_head`` was reached)
+    """
+    seen: set[str] = set()
+    pending = [head]
+    count = 0
+    reached = False
+    while pending:
+        commit = pending.pop()
+        if commit in seen:
+            continue
+        seen.add(commit)
+        # Commits outside the graph are ancestors of the common base, and so
+        # of stop_head as well
+        if commit not in graph or commit in stop_reach:
+            reached = reached or commit == stop_head
+            continue
+        count += 1
+        pending.extend(graph[commit])
+    return count, reached
@@ -0,0 +1,331 @@
+"""Per-worktree status snapshot used by the shell prompt.
+
+The snapshot is a small file stored in the worktree's own git directory
+(``.git`` for the root worktree, ``.git/worktrees/<name>`` for linked
+worktrees), so it is naturally scoped to one worktree and disappears with it.
+
+This module is on the prompt hot path and is imported before click or any of
+the ops layer. It deliberately uses only ``os`` and plain string paths:
+``pathlib``, ``json`` and ``dataclasses`` each cost more to import than the
+whole budget of a prompt render. The snapshot is therefore a line-oriented
+``key<TAB>value`` file rather than JSON.
+"""
+
+import os
+
+SNAPSHOT_FILENAME = "workstack-prompt"
+REFRESH_MARKER_FILENAME = "workstack-prompt.refreshing"
+SNAPSHOT_VERSION = "1"
+
+# PR state comes from the network, so even a snapshot whose git key still
+# matches is refreshed after this long.
+SNAPSHOT_TTL_SECONDS = 300
+
+# A refresh marker older than this is assumed to belong to a refresh process
+# that died, and another refresh may be started.
+REFRESH_MARKER_MAX_AGE_SECONDS = 30
+
+DEFAULT_PROMPT_FORMAT = "{worktree}:{branch}{stack}{pr}"
+
+
+def locate_worktree(start: str) -> tuple[str, str] | None:
+    """Walk up from ``start`` to find the enclosing worktree.
+
+    Args:
+        start: Directory to start searching from
+
+    Returns:
+        Tuple of (worktree_root, git_dir), or None when not inside a worktree
+    """
+    current = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return current, dot_git
+        if os.path.isfile(dot_git):
+            git_dir = _read_gitdir_file(dot_git)
+            if git_dir is None:
+                return None
+            return current, git_dir
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _read_gitdir_file(dot_git_file: str) -> str | None:
+    """Resolve the ``gitdir:`` pointer written into a linked worktree's .git file."""
+    content = _read_text(dot_git_file)
+    if content is None or not content.startswith("gitdir:"):
+        return None
+
+    git_dir = content[len("gitdir:") :].strip()
+    if not os.path.isabs(git_dir):
+        git_dir = os.path.join(os.path.dirname(dot_git_file), git_dir)
+    return os.path.normpath(git_dir)
+
+
+def read_common_dir(git_dir: str) -> str:
+    """Return the git common directory shared by all worktrees of a repository.
+
+    Linked worktree git dirs contain a ``commondir`` file pointing back at the
+    main repository's .git directory; the root worktree's git dir is its own
+    common dir.
+    """
+    content = _read_text(os.path.join(git_dir, "commondir"))
+    if content is None:
+        return git_dir
+
+    common_dir = content.strip()
+    if not os.path.isabs(common_dir):
+        common_dir = os.path.join(git_dir, common_dir)
+    return os.path.normpath(common_dir)
+
+
+def is_root_worktree(git_dir: str, worktree_root: str) -> bool:
+    """Check whether ``git_dir`` is the main repository's .git directory."""
+    return git_dir == os.path.join(worktree_root, ".git")
+
+
+def read_head(git_dir: str) -> str | None:
+    """Return the raw content of HEAD (``ref: refs/heads/x`` or a commit SHA)."""
+    content = _read_text(os.path.join(git_dir, "HEAD"))
+    if content is None:
+        return None
+    return content.strip()
+
+
+def branch_from_head(head: str | None) -> str | None:
+    """Extract the branch name from HEAD content, or None when detached."""
+    if head is None or not head.startswith("ref: refs/heads/"):
+        return None
+    return head[len("ref: refs/heads/") :]
+
+
+def resolve_head_sha(git_dir: str, head: str | None) -> str | None:
+    """Resolve HEAD to a commit SHA by reading loose refs and packed-refs.
+
+    Args:
+        git_dir: The worktree's git directory
+        head: Content of HEAD as returned by read_head()
+
+    Returns:
+        Commit SHA, or None for an unborn branch or unreadable HEAD
+    """
+    if head is None:
+        return None
+    if not head.startswith("ref: "):
+        return head
+
+    ref = head[len("ref: ") :]
+    common_dir = read_common_dir(git_dir)
+    loose = _read_text(os.path.join(common_dir, ref))
+    if loose is not None:
+        return loose.strip()
+
+    packed = _read_text(os.path.join(common_dir, "packed-refs"))
+    if packed is None:
+        return None
+    for line in packed.splitlines():
+        sha, sep, name = line.partition(" ")
+        if sep and name == ref:
+            return sha
+    return None
+
+
+def compute_snapshot_key(git_dir: str, head: str | None) -> str:
+    """Compute the cache key for a worktree's snapshot.
+
+    The key combines HEAD's content with the modification times of HEAD, the
+    index and the loose ref HEAD points at. Checkouts rewrite HEAD, commits
+    move the ref and rewrite the index, so any of those invalidates the key
+    without running git.
+
+    Args:
+        git_dir: The worktree's git directory
+        head: Content of HEAD as returned by read_head()
+
+    Returns:
+        Opaque key string
+    """
+    parts = [head or "", str(_mtime_ns(os.path.join(git_dir, "HEAD")))]
+    parts.append(str(_mtime_ns(os.path.join(git_dir, "index"))))
+
+    branch = branch_from_head(head)
+    if branch is not None:
+        ref_path = os.path.join(read_common_dir(git_dir), "refs", "heads", branch)
+        parts.append(str(_mtime_ns(ref_path)))
+
+    return "|".join(parts)
+
+
+def read_snapshot(git_dir: str) -> dict[str, str] | None:
+    """Read the snapshot file for a worktree.
+
+    Returns:
+        Mapping of snapshot fields, or None if no compatible snapshot exists
+    """
+    content = _read_text(os.path.join(git_dir, SNAPSHOT_FILENAME))
+    if content is None:
+        return None
+
+    fields: dict[str, str] = {}
+    for line in content.splitlines():
+        key, sep, value = line.partition("\t")
+        if sep:
+            fields[key] = value
+
+    if fields.get("version") != SNAPSHOT_VERSION:
+        return None
+    return fields
+
+
+def write_snapshot(git_dir: str, fields: dict[str, str]) -> None:
+    """Atomically write the snapshot file for a worktree.
+
+    Args:
+        git_dir: The worktree's git directory
+        fields: Snapshot fields; values must not contain tabs or newlines
+    """
+    lines = [f"version\t{SNAPSHOT_VERSION}"]
+    lines.extend(f"{key}\t{value}" for key, value in fields.items())
+
+    target = os.path.join(git_dir, SNAPSHOT_FILENAME)
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, target)
+
+
+def is_snapshot_fresh(snapshot: dict[str, str] | None, key: str, *, now: float) -> bool:
+    """Check whether a snapshot matches the current key and is within its TTL."""
+    if snapshot is None or snapshot.get("key") != key:
+        return False
+
+    written_at = snapshot.get("written_at", "")
+    if not written_at.replace(".", "", 1).isdigit():
+        return False
+    return now - float(written_at) < SNAPSHOT_TTL_SECONDS
+
+
+def should_start_refresh(git_dir: str, *, now: float) -> bool:
+    """Check that no other refresh for this worktree is already in flight."""
+    marker_mtime = _mtime_ns(os.path.join(git_dir, REFRESH_MARKER_FILENAME))
+    if marker_mtime == 0:
+        return True
+    return now - marker_mtime / 1e9 > REFRESH_MARKER_MAX_AGE_SECONDS
+
+
+def mark_refresh_started(git_dir: str) -> None:
+    """Create the in-flight marker so concurrent prompts don't spawn refreshes."""
+    with open(os.path.join(git_dir, REFRESH_MARKER_FILENAME), "w", encoding="utf-8"):
+        pass
+
+
+def clear_refresh_marker(git_dir: str) -> None:
+    """Remove the in-flight marker once a refresh finished."""
+    marker = os.path.join(git_dir, REFRESH_MARKER_FILENAME)
+    if os.path.exists(marker):
+        os.remove(marker)
+
+
+def prompt_format_error(fmt: str) -> str | None:
+    """Check that ``fmt`` only uses the fields format_prompt_segment() provides.
+
+    Returns:
+        A message describing the problem, or None if the format is valid
+    """
+    # Error boundary: str.format is the only complete parser of its syntax.
+    try:
+        fmt.format(worktree="root", branch="main", stack=" [1/1]", pr=" #1")
+    except KeyError as e:
+        return (
+            f"unknown field {{{e.args[0]}}}, expected {{worktree}}, {{branch}}, {{stack}} or {{pr}}"
+        )
+    except (ValueError, IndexError, AttributeError) as e:
+        return str(e)
+    return None
+
+
+def format_prompt_segment(
+    fmt: str,
+    *,
+    worktree: str,
+    branch: str,
+    snapshot: dict[str, str] | None,
+) -> str:
+    """Render the prompt segment.
+
+    Stack position and PR badge come from the snapshot, and are only shown
+    when the snapshot was taken on the branch that is checked out now: a
+    stale snapshot for the same branch is still useful, one for a different
+    branch is not.
+
+    Args:
+        fmt: Format string with {worktree}, {branch}, {stack} and {pr} fields
+        worktree: Worktree name ("root" for the main worktree)
+        branch: Branch name, or a short SHA when detached
+        snapshot: Snapshot fields from read_snapshot()
+
+    Returns:
+        Formatted prompt segment
+    """
+    stack = ""
+    pr = ""
+    if snapshot is not None and snapshot.get("branch") == branch:
+        stack = _format_stack_position(branch, snapshot.get("stack", ""))
+        pr = _format_pr_badge(snapshot)
+
+    return fmt.format(worktree=worktree, branch=branch, stack=stack, pr=pr)
+
+
+def _format_stack_position(branch: str, stack_field: str) -> str:
+    """Format position within the stack as `` [n/m]``, counting from above trunk."""
+    # Git ref names cannot contain spaces, so a space-separated list is unambiguous
+    stack = stack_field.split()
+    if branch not in stack:
+        return ""
+
+    position = stack.index(branch)
+    if position == 0:
+        return ""
+    return f" [{position}/{len(stack) - 1}]"
+
+
+def _format_pr_badge(snapshot: dict[str, str]) -> str:
+    """Format the PR badge using the same status glyphs as `workstack list`."""
+    number = snapshot.get("pr_number", "")
+    if not number:
+        return ""
+
+    state = snapshot.get("pr_state", "")
+    checks = snapshot.get("pr_checks", "")
+    if snapshot.get("pr_draft") == "1":
+        emoji = "🚧"
+    elif state == "MERGED":
+        emoji = "🟣"
+    elif state == "CLOSED":
+        emoji = "⭕"
+    elif checks == "1":
+        emoji = "✅"
+    elif checks == "0":
+        emoji = "❌"
+    else:
+        emoji = "◯"
+    return f" #{number}{emoji}"
+
+
+def _read_text(path: str) -> str | None:
+    """Read a small text file, returning None if it does not exist."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a file's mtime in nanoseconds, or 0 if it does not exist."""
+    if not os.path.exists(path):
+        return 0
+    return os.stat(path).st_mtime_ns
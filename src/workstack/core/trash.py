@@ -0,0 +1,168 @@
+"""Deferred deletion of removed worktrees.
+
+Deleting a worktree with a large `.venv`, `node_modules` or build outputs
+takes tens of seconds. Instead, `workstack rm` renames the directory into
+the repository's trash (a `.trash` directory next to its worktrees, so on
+the same filesystem and the rename is atomic) and returns. A detached,
+niced reaper process then deletes the trash contents.
+
+The trash itself is the reaper's work queue: anything left there by a
+reaper that crashed or was killed is picked up by the next one, which is
+started after every removal. Only one reaper runs per trash directory.
+
+Run as `python -m workstack.core.trash TRASH_DIR` to reap a trash directory.
+"""
+
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from workstack.core.repo_lock import LockTimeoutError, file_lock
+
+# Trash directory, inside the directory holding the repository's worktrees
+TRASH_DIRNAME = ".trash"
+
+# Held by the running reaper; dot-prefixed names in the trash are bookkeeping,
+# never trashed worktrees
+REAPER_LOCK_FILENAME = ".reaper.lock"
+
+# Niceness increment of the reaper, which competes with interactive work
+REAPER_NICENESS = 10
+
+# Files measured by measure_trash; a trashed node_modules can hold far more,
+# and status measures the trash on every run
+MAX_MEASURED_FILES = 20_000
+
+
+@dataclass(frozen=True)
+class TrashUsage:
+    """Worktrees waiting in the trash.
+
+    Attributes:
+        entries: Number of trashed worktrees not yet deleted
+        size_bytes: Apparent size of their remaining files
+        size_is_lower_bound: True if measuring stopped before all files were counted
+    """
+
+    entries: int
+    size_bytes: int
+    size_is_lower_bound: bool = False
+
+
+def trash_dir_for(workstacks_dir: Path) -> Path:
+    """Return the trash directory of the worktrees in ``workstacks_dir``."""
+    return workstacks_dir / TRASH_DIRNAME
+
+
+def pending_entries(trash_dir: Path) -> list[Path]:
+    """List the trashed worktrees of ``trash_dir``, oldest first."""
+    if not trash_dir.is_dir():
+        return []
+    return sorted(entry for entry in trash_dir.iterdir() if not entry.name.startswith("."))
+
+
+def move_to_trash(path: Path, trash_dir: Path) -> Path | None:
+    """Atomically move ``path`` into ``trash_dir``.
+
+    Returns:
+        The new location, or None if the directory could not be renamed
+        (e.g. the trash is on another filesystem) and must be deleted in place
+    """
+    trash_dir.mkdir(parents=True, exist_ok=True)
+    # Timestamp first: sorts oldest first and never starts with a dot
+    target = trash_dir / f"{time.time_ns()}-{path.name}"
+
+    # Error boundary: whether rename works (same filesystem, no mount point,
+    # nothing holding the directory on platforms that care) is only known by
+    # trying it.
+    try:
+        os.rename(path, target)
+    except OSError:
+        return None
+    return target
+
+
+def measure_trash(trash_dir: Path, *, max_files: int = MAX_MEASURED_FILES) -> TrashUsage:
+    """Count the trashed worktrees and the size of what is left of them.
+
+    At most ``max_files`` files are measured; the size of a larger trash is
+    reported as a lower bound.
+    """
+    entries = pending_entries(trash_dir)
+    size = 0
+    measured = 0
+    for entry in entries:
+        for dirpath, _dirnames, filenames in os.walk(entry):
+            for filename in filenames:
+                if measured == max_files:
+                    return TrashUsage(
+                        entries=len(entries), size_bytes=size, size_is_lower_bound=True
+                    )
+                measured += 1
+                # The reaper may delete files while they are being counted
+                try:
+                    size += os.lstat(os.path.join(dirpath, filename)).st_size
+                except FileNotFoundError:
+                    continue
+    return TrashUsage(entries=len(entries), size_bytes=size)
+
+
+def reap_trash(trash_dir: Path) -> int:
+    """Delete everything in ``trash_dir`` unless another reaper is already at it.
+
+    Entries trashed while reaping are deleted too. Entries that cannot be
+    deleted are left for the next reaper.
+
+    Returns:
+        Number of entries deleted
+    """
+    if not trash_dir.is_dir():
+        return 0
+
+    try:
+        with file_lock(trash_dir / REAPER_LOCK_FILENAME, shared=False, timeout=0):
+            return _reap_pending(trash_dir)
+    except LockTimeoutError:
+        # Another reaper owns this trash and will also see our entries
+        return 0
+
+
+def _reap_pending(trash_dir: Path) -> int:
+    deleted = 0
+    stuck: set[Path] = set()
+    while True:
+        entries = [entry for entry in pending_entries(trash_dir) if entry not in stuck]
+        if not entries:
+            return deleted
+        for entry in entries:
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+
+            if entry.exists() or entry.is_symlink():
+                stuck.add(entry)
+            else:
+                deleted += 1
+
+
+def reaper_command(trash_dir: Path) -> list[str]:
+    """Return the command that reaps ``trash_dir``, to be started detached."""
+    return [sys.executable, "-m", "workstack.core.trash", str(trash_dir)]
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 1:
+        # The reaper runs on its own; importing click just for this is not worth it
+        sys.stderr.write("usage: python -m workstack.core.trash TRASH_DIR\n")
+        return 2
+    os.nice(REAPER_NICENESS)
+    reap_trash(Path(argv[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,106 @@
+"""Batched per-worktree status summaries for `workstack list --status`.
+
+A summary is the dirty flag plus ahead/behind counts versus upstream and
+versus the Graphite parent. Gathering these one worktree at a time costs
+several git processes per worktree, so they are collected in bulk:
+
+- one `git for-each-ref` for upstream counts of every branch
+- one ahead/behind query per distinct Graphite parent, covering all of its
+  children at once
+- dirty probes run concurrently on a bounded thread pool, each stopping at
+  the first change it finds
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from workstack.core.gitops import GitOps
+
+# Upper bound on concurrent `git` dirty probes; each one walks a worktree,
+# so more than this mostly competes for disk.
+DIRTY_PROBE_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class WorktreeStatusSummary:
+    """Compact status of one worktree.
+
+    Attributes:
+        dirty: Whether the worktree has uncommitted changes
+        upstream: (ahead, behind) versus the upstream branch, or None without one
+        parent: Graphite parent branch, or None if untracked or trunk
+        parent_ahead_behind: (ahead, behind) versus the Graphite parent, or None
+    """
+
+    dirty: bool
+    upstream: tuple[int, int] | None
+    parent: str | None
+    parent_ahead_behind: tuple[int, int] | None
+
+
+def collect_worktree_summaries(
+    git_ops: GitOps,
+    repo_root: Path,
+    worktrees: list[tuple[Path, str | None]],
+    parents: dict[str, str | None],
+) -> dict[Path, WorktreeStatusSummary]:
+    """Collect status summaries for many worktrees with a bounded number of git calls.
+
+    Args:
+        git_ops: Git operations
+        repo_root: Repository root
+        worktrees: (path, branch) for each worktree; branch is None when detached
+        parents: Graphite parent for each tracked branch
+
+    Returns:
+        Mapping of worktree path -> summary, for worktrees that exist on disk
+    """
+    existing = [(path, branch) for path, branch in worktrees if path.exists()]
+    if not existing:
+        return {}
+
+    workers = min(DIRTY_PROBE_WORKERS, len(existing))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        dirty_futures = {
+            path: executor.submit(git_ops.is_worktree_dirty, path) for path, _ in existing
+        }
+
+        # Ref queries run on this thread while the probes walk the worktrees
+        upstream = git_ops.get_upstream_ahead_behind(repo_root)
+        parent_counts = _ahead_behind_vs_parents(git_ops, repo_root, existing, parents)
+
+        dirty = {path: future.result() for path, future in dirty_futures.items()}
+
+    summaries: dict[Path, WorktreeStatusSummary] = {}
+    for path, branch in existing:
+        parent = parents.get(branch) if branch is not None else None
+        summaries[path] = WorktreeStatusSummary(
+            dirty=dirty[path],
+            upstream=upstream.get(branch) if branch is not None else None,
+            parent=parent,
+            parent_ahead_behind=parent_counts.get(branch) if branch is not None else None,
+        )
+    return summaries
+
+
+def _ahead_behind_vs_parents(
+    git_ops: GitOps,
+    repo_root: Path,
+    worktrees: list[tuple[Path, str | None]],
+    parents: dict[str, str | None],
+) -> dict[str, tuple[int, int]]:
+    """Query ahead/behind versus the Graphite parent, one call per distinct parent."""
+    children_by_parent: dict[str, list[str]] = {}
+    for _, branch in worktrees:
+        if branch is None:
+            continue
+        parent = parents.get(branch)
+        if parent is None:
+            continue
+        children_by_parent.setdefault(parent, []).append(branch)
+
+    counts: dict[str, tuple[int, int]] = {}
+    for parent, children in children_by_parent.items():
+        counts.update(git_ops.get_ahead_behind_base(repo_root, parent, children))
+    return counts
@@ -0,0 +1,172 @@
+"""Cross-invocation cache for status collector results.
+
+Collectors that can describe their inputs cheaply (file mtimes, ref
+contents) return a fingerprint string. When a later `workstack status` run
+computes the same fingerprint, the persisted result is reused instead of
+running the collector again.
+
+The cache is one JSON file per worktree, stored in the worktree's own git
+directory next to the prompt snapshot.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from workstack.core.status_snapshot import locate_worktree, read_common_dir
+from workstack.status.models.serialization import from_jsonable, to_jsonable
+
+STATUS_CACHE_FILENAME = "workstack-status-cache.json"
+STATUS_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A collector result read back from the cache.
+
+    Wrapped so that a cached ``None`` (e.g. "this branch has no PR") can be
+    told apart from a cache miss.
+    """
+
+    value: Any
+
+
+class CollectorCache:
+    """Persisted collector results for a single worktree."""
+
+    def __init__(
+        self,
+        path: Path,
+        entries: dict[str, dict[str, Any]],
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create a cache backed by ``path``.
+
+        Args:
+            path: Location of the cache file
+            entries: Previously persisted entries keyed by collector name
+            clock: Returns the current time for TTL checks; read on every
+                get() and put(), since `status --watch` keeps one cache open
+        """
+        self.path = path
+        self._entries = entries
+        self._clock = clock
+        self._dirty = False
+
+    @classmethod
+    def for_worktree(cls, worktree_path: Path) -> "CollectorCache | None":
+        """Load the cache for a worktree.
+
+        Returns:
+            The worktree's cache (empty if nothing was persisted yet), or None
+            when the worktree's git directory cannot be located
+        """
+        dirs = worktree_git_dirs(worktree_path)
+        if dirs is None:
+            return None
+        path = dirs[0] / STATUS_CACHE_FILENAME
+        return cls(path, _load_entries(path))
+
+    def get(
+        self, name: str, fingerprint: str, result_type: Any, *, ttl_seconds: float | None
+    ) -> CachedResult | None:
+        """Look up a collector result.
+
+        Args:
+            name: Collector name
+            fingerprint: Fingerprint of the collector's current inputs
+            result_type: Type annotation the result decodes into
+            ttl_seconds: Maximum age of the entry, or None for no limit
+
+        Returns:
+            The cached result, or None on a miss, a fingerprint mismatch, an
+            expired entry or an entry that no longer matches the model
+        """
+        entry = self._entries.get(name)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+
+        written_at = entry.get("written_at")
+        if not isinstance(written_at, int | float):
+            return None
+        if ttl_seconds is not None and self._clock() - written_at >= ttl_seconds:
+            return None
+
+        # Entries written by an older model version fail to decode; treat them
+        # as a miss so the collector runs and overwrites them.
+        try:
+            value = from_jsonable(result_type, entry.get("value"))
+        except ValueError:
+            return None
+        return CachedResult(value=value)
+
+    def put(self, name: str, fingerprint: str, value: object) -> None:
+        """Record a collector result for ``fingerprint``."""
+        self._entries[name] = {
+            "fingerprint": fingerprint,
+            "written_at": self._clock(),
+            "value": to_jsonable(value),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache file if any entry changed."""
+        if not self._dirty:
+            return
+
+        data = {"version": STATUS_CACHE_VERSION, "entries": self._entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+
+def worktree_git_dirs(worktree_path: Path) -> tuple[Path, Path] | None:
+    """Return (git_dir, common_dir) for a worktree without running git.
+
+    Returns:
+        The worktree's own git directory and the repository's common git
+        directory, or None if ``worktree_path`` is not a worktree root
+    """
+    if not (worktree_path / ".git").exists():
+        return None
+
+    location = locate_worktree(str(worktree_path))
+    if location is None:
+        return None
+
+    git_dir = location[1]
+    return Path(git_dir), Path(read_common_dir(git_dir))
+
+
+def file_signature(path: Path) -> str:
+    """Return a cheap change signature (mtime and size) for a file."""
+    if not path.exists():
+        return "-"
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _load_entries(path: Path) -> dict[str, dict[str, Any]]:
+    """Read persisted entries, treating a missing or unreadable file as empty."""
+    if not path.exists():
+        return {}
+
+    # The cache is advisory: a truncated or hand-edited file just means the
+    # collectors run again, so decode errors are handled here.
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != STATUS_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return entries
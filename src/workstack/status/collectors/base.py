@@ -50,3 +50,58 @@ class StatusCollector(ABC):
             Collected status data or None if collection fails
         """
         ...
+
+    @property
+    def requires_network(self) -> bool:
+        """Whether collect() may make network requests.
+
+        Network-bound collectors are skipped by `workstack status --fast`.
+        """
+        return False
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        """Describe the inputs of collect() so its result can be reused across runs.
+
+        Two runs that compute the same fingerprint are expected to produce the
+        same result. The fingerprint must be much cheaper than collect()
+        itself, typically a few file stats.
+
+        Args:
+            ctx: Workstack context with operations
+            worktree_path: Path to the worktree
+            repo_root: Path to repository root
+
+        Returns:
+            Fingerprint string, or None if results from this collector are not cached
+        """
+        return None
+
+    @property
+    def cache_ttl_seconds(self) -> float | None:
+        """Maximum age of a cached result, for inputs a fingerprint cannot see.
+
+        None means a cached result stays valid while its fingerprint matches.
+        """
+        return None
+
+    def refresh_cached(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path, cached: Any
+    ) -> Any:
+        """Bring a cached result up to date before it is used.
+
+        Called instead of collect() on a cache hit. Collectors whose result has
+        a cheap part the fingerprint cannot cover override this to re-read
+        that part.
+
+        Args:
+            ctx: Workstack context with operations
+            worktree_path: Path to the worktree
+            repo_root: Path to repository root
+            cached: Result read back from the cache
+
+        Returns:
+            Result to use for this run
+        """
+        return cached
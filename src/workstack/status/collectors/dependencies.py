@@ -0,0 +1,224 @@
+"""Dependency freshness collector."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import locate_worktree
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.models.status_data import DependencyStatus
+
+DEPENDENCY_CACHE_FILENAME = "workstack-dependencies.json"
+
+
+@dataclass(frozen=True)
+class Ecosystem:
+    """A lockfile-managed dependency ecosystem.
+
+    Attributes:
+        language: Label shown in status output
+        lockfile: Lockfile name relative to the worktree root
+        install_dir: Directory the installer populates, relative to the worktree root
+        markers: Glob patterns (relative to install_dir) for files or directories
+            the installer rewrites on every install
+        install_command: Command suggested when dependencies are stale
+    """
+
+    language: str
+    lockfile: str
+    install_dir: str
+    markers: tuple[str, ...]
+    install_command: str
+
+
+ECOSYSTEMS: tuple[Ecosystem, ...] = (
+    # uv rewrites site-packages entries whenever it installs or removes a package
+    Ecosystem(
+        language="python",
+        lockfile="uv.lock",
+        install_dir=".venv",
+        markers=("pyvenv.cfg", "lib/python*/site-packages"),
+        install_command="uv sync",
+    ),
+    # pnpm rewrites .modules.yaml and its copy of the lockfile on every install
+    Ecosystem(
+        language="node",
+        lockfile="pnpm-lock.yaml",
+        install_dir="node_modules",
+        markers=(".modules.yaml", ".pnpm/lock.yaml"),
+        install_command="pnpm install",
+    ),
+)
+
+
+class DependencyCollector(StatusCollector):
+    """Detects whether installed dependencies match the worktree's lockfiles.
+
+    The check never runs a package manager. An install is considered current
+    when its marker files are newer than the lockfile. When the lockfile is
+    newer (a checkout or rebase touched it), its hash is compared with the
+    hash recorded the last time the install was known to be current, so
+    content-identical rewrites are not reported as stale.
+
+    Verdicts are cached per worktree in the worktree's git directory, keyed on
+    lockfile mtime/size and marker mtime, so the lockfile is only hashed when
+    one of those changes.
+    """
+
+    @property
+    def name(self) -> str:
+        """Name identifier for this collector."""
+        return "dependencies"
+
+    def is_available(self, ctx: WorkstackContext, worktree_path: Path) -> bool:
+        """Check if the worktree has any supported lockfile.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+
+        Returns:
+            True if at least one supported lockfile exists
+        """
+        return any((worktree_path / eco.lockfile).exists() for eco in ECOSYSTEMS)
+
+    def collect(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> list[DependencyStatus] | None:
+        """Collect dependency freshness for each ecosystem present.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+            repo_root: Repository root path
+
+        Returns:
+            One DependencyStatus per ecosystem with a lockfile, or None if none exist
+        """
+        cache_path = _cache_path(worktree_path)
+        cache = _load_cache(cache_path)
+
+        statuses: list[DependencyStatus] = []
+        new_cache: dict[str, Any] = {}
+        for eco in ECOSYSTEMS:
+            if not (worktree_path / eco.lockfile).exists():
+                continue
+
+            status, entry = _evaluate(eco, worktree_path, cache.get(eco.language))
+            statuses.append(status)
+            if entry is not None:
+                new_cache[eco.language] = entry
+
+        if not statuses:
+            return None
+
+        if cache_path is not None and new_cache != cache:
+            _write_cache(cache_path, new_cache)
+
+        return statuses
+
+
+def _evaluate(
+    eco: Ecosystem, worktree_path: Path, cached: dict[str, Any] | None
+) -> tuple[DependencyStatus, dict[str, Any] | None]:
+    """Decide whether one ecosystem's install matches its lockfile.
+
+    Returns:
+        Tuple of (status, cache entry to persist). The entry is None when the
+        install directory is missing and there is nothing to record.
+    """
+    install_dir = worktree_path / eco.install_dir
+    if not install_dir.exists():
+        status = DependencyStatus(
+            language=eco.language,
+            up_to_date=False,
+            outdated_count=0,
+            details=f"{eco.install_dir} is missing; run `{eco.install_command}`",
+        )
+        return status, cached
+
+    lockfile = worktree_path / eco.lockfile
+    lock_stat = lockfile.stat()
+    marker_mtime_ns = _install_marker_mtime_ns(eco, install_dir)
+    state = [lock_stat.st_mtime_ns, lock_stat.st_size, marker_mtime_ns]
+
+    if cached is not None and cached.get("state") == state:
+        up_to_date = bool(cached.get("up_to_date"))
+        synced_hash = cached.get("synced_hash")
+    else:
+        synced_hash = cached.get("synced_hash") if cached is not None else None
+        lock_hash = _hash_file(lockfile)
+        if marker_mtime_ns >= lock_stat.st_mtime_ns:
+            up_to_date = True
+            synced_hash = lock_hash
+        else:
+            up_to_date = lock_hash == synced_hash
+
+    details = None
+    if not up_to_date:
+        details = f"{eco.lockfile} changed since last install; run `{eco.install_command}`"
+
+    status = DependencyStatus(
+        language=eco.language,
+        up_to_date=up_to_date,
+        outdated_count=0,
+        details=details,
+    )
+    entry = {"state": state, "up_to_date": up_to_date, "synced_hash": synced_hash}
+    return status, entry
+
+
+def _install_marker_mtime_ns(eco: Ecosystem, install_dir: Path) -> int:
+    """Return the newest mtime among the ecosystem's install markers.
+
+    Falls back to the install directory's own mtime when no marker exists.
+    """
+    mtimes = [
+        marker.stat().st_mtime_ns for pattern in eco.markers for marker in install_dir.glob(pattern)
+    ]
+    if not mtimes:
+        return install_dir.stat().st_mtime_ns
+    return max(mtimes)
+
+
+def _hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _cache_path(worktree_path: Path) -> Path | None:
+    """Return the verdict cache location inside the worktree's git directory."""
+    if not (worktree_path / ".git").exists():
+        return None
+
+    location = locate_worktree(str(worktree_path))
+    if location is None:
+        return None
+    return Path(location[1]) / DEPENDENCY_CACHE_FILENAME
+
+
+def _load_cache(cache_path: Path | None) -> dict[str, Any]:
+    """Load cached verdicts, treating a missing or unreadable cache as empty."""
+    if cache_path is None or not cache_path.exists():
+        return {}
+
+    # The cache is advisory: a truncated or hand-edited file just means the
+    # verdicts are recomputed, so decode errors are handled here.
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def _write_cache(cache_path: Path, cache: dict[str, Any]) -> None:
+    """Atomically replace the verdict cache."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+    tmp_path.replace(cache_path)
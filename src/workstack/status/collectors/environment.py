@@ -0,0 +1,83 @@
+"""Environment file collector."""
+
+from pathlib import Path
+
+from workstack.core.context import WorkstackContext
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.models.status_data import EnvironmentStatus
+
+
+class EnvironmentCollector(StatusCollector):
+    """Collects the variables defined in the worktree's .env file."""
+
+    @property
+    def name(self) -> str:
+        """Name identifier for this collector."""
+        return "environment"
+
+    def is_available(self, ctx: WorkstackContext, worktree_path: Path) -> bool:
+        """Check if .env exists.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+
+        Returns:
+            True if .env exists
+        """
+        return (worktree_path / ".env").exists()
+
+    def collect(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> EnvironmentStatus | None:
+        """Collect environment variables from .env.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+            repo_root: Repository root path
+
+        Returns:
+            EnvironmentStatus with parsed variables or None if .env is missing
+        """
+        env_path = worktree_path / ".env"
+        if not env_path.exists():
+            return None
+
+        return EnvironmentStatus(variables=parse_env_file(env_path.read_text(encoding="utf-8")))
+
+
+def parse_env_file(content: str) -> dict[str, str]:
+    """Parse .env content as written by `workstack create`.
+
+    Handles `KEY=value`, `export KEY=value` and double-quoted values using
+    the escaping from quote_env_value(). Comments and blank lines are skipped.
+
+    Args:
+        content: Text content of a .env file
+
+    Returns:
+        Mapping of variable name to value, in file order
+    """
+    variables: dict[str, str] = {}
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+
+        value = value.strip()
+        if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+            value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        elif len(value) >= 2 and value[0] == "'" and value[-1] == "'":
+            value = value[1:-1]
+
+        variables[key.strip()] = value
+
+    return variables
@@ -1,8 +1,11 @@
 """Git status collector."""
 
+from dataclasses import replace
 from pathlib import Path
 
 from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import branch_from_head, read_head, resolve_head_sha
+from workstack.status.cache import file_signature, worktree_git_dirs
 from workstack.status.collectors.base import StatusCollector
 from workstack.status.models.status_data import CommitInfo, GitStatus
 
@@ -10,6 +13,15 @@ from workstack.status.models.status_data import CommitInfo, GitStatus
 class GitStatusCollector(StatusCollector):
     """Collects git repository status information."""
 
+    def __init__(self, *, max_files: int | None = None) -> None:
+        """Create a git status collector.
+
+        Args:
+            max_files: Cap on each of the staged/modified/untracked lists, or
+                None to report every file
+        """
+        self.max_files = max_files
+
     @property
     def name(self) -> str:
         """Name identifier for this collector."""
@@ -50,6 +62,7 @@ class GitStatusCollector(StatusCollector):
         # Get git status
         staged, modified, untracked = ctx.git_ops.get_file_status(worktree_path)
         clean = len(staged) == 0 and len(modified) == 0 and len(untracked) == 0
+        truncated = self._is_over_cap(staged, modified, untracked)
 
         # Get ahead/behind counts
         ahead, behind = ctx.git_ops.get_ahead_behind(worktree_path, branch)
@@ -71,8 +84,64 @@ class GitStatusCollector(StatusCollector):
             clean=clean,
             ahead=ahead,
             behind=behind,
-            staged_files=staged,
-            modified_files=modified,
-            untracked_files=untracked,
+            staged_files=self._cap(staged),
+            modified_files=self._cap(modified),
+            untracked_files=self._cap(untracked),
             recent_commits=recent_commits,
+            files_truncated=truncated,
         )
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        """Fingerprint HEAD, the index and the refs ahead/behind is computed against.
+
+        Working tree edits don't show up here; refresh_cached() re-reads file
+        status on every run instead.
+        """
+        dirs = worktree_git_dirs(worktree_path)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+
+        head = read_head(str(git_dir))
+        parts = [
+            head or "",
+            resolve_head_sha(str(git_dir), head) or "",
+            file_signature(git_dir / "index"),
+            file_signature(common_dir / "packed-refs"),
+            file_signature(common_dir / "FETCH_HEAD"),
+        ]
+        branch = branch_from_head(head)
+        if branch is not None:
+            parts.append(file_signature(common_dir / "refs" / "remotes" / "origin" / branch))
+        return "|".join(parts)
+
+    def refresh_cached(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path, cached: GitStatus | None
+    ) -> GitStatus | None:
+        """Re-read file status, which changes without touching HEAD or the index."""
+        if cached is None:
+            return None
+
+        staged, modified, untracked = ctx.git_ops.get_file_status(worktree_path)
+        return replace(
+            cached,
+            clean=len(staged) == 0 and len(modified) == 0 and len(untracked) == 0,
+            staged_files=self._cap(staged),
+            modified_files=self._cap(modified),
+            untracked_files=self._cap(untracked),
+            files_truncated=self._is_over_cap(staged, modified, untracked),
+        )
+
+    def _cap(self, files: list[str]) -> list[str]:
+        """Apply the max_files cap to one file list."""
+        if self.max_files is None:
+            return files
+        return files[: self.max_files]
+
+    def _is_over_cap(self, *file_lists: list[str]) -> bool:
+        """Check whether any file list exceeds the max_files cap."""
+        if self.max_files is None:
+            return False
+        return any(len(files) > self.max_files for files in file_lists)
@@ -3,9 +3,15 @@
 from pathlib import Path
 
 from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import read_head
+from workstack.status.cache import file_signature, worktree_git_dirs
 from workstack.status.collectors.base import StatusCollector
 from workstack.status.models.status_data import PullRequestStatus
 
+# PR state changes on GitHub without any local file changing, so cached
+# results are only trusted for this long.
+PR_CACHE_TTL_SECONDS = 120
+
 
 class GitHubPRCollector(StatusCollector):
     """Collects GitHub pull request information."""
@@ -79,3 +85,25 @@ class GitHubPRCollector(StatusCollector):
             reviews=None,  # Reviews not available in PullRequestInfo
             ready_to_merge=ready_to_merge,
         )
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        """Fingerprint the checked-out branch and Graphite's PR cache."""
+        dirs = worktree_git_dirs(worktree_path)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+
+        head = read_head(str(git_dir)) or ""
+        return f"{head}|{file_signature(common_dir / '.graphite_pr_info')}"
+
+    @property
+    def requires_network(self) -> bool:
+        """Falls back to the GitHub API when Graphite has no PR data."""
+        return True
+
+    @property
+    def cache_ttl_seconds(self) -> float | None:
+        """PR results expire after PR_CACHE_TTL_SECONDS."""
+        return PR_CACHE_TTL_SECONDS
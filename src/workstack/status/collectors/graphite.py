@@ -3,6 +3,8 @@
 from pathlib import Path
 
 from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import read_head
+from workstack.status.cache import file_signature, worktree_git_dirs
 from workstack.status.collectors.base import StatusCollector
 from workstack.status.models.status_data import StackPosition
 
@@ -78,3 +80,15 @@ class GraphiteStackCollector(StatusCollector):
             children_branches=children_branches,
             is_trunk=is_trunk,
         )
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        """Fingerprint the checked-out branch and Graphite's branch cache."""
+        dirs = worktree_git_dirs(worktree_path)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+
+        head = read_head(str(git_dir)) or ""
+        return f"{head}|{file_signature(common_dir / '.graphite_cache_persist')}"
@@ -3,6 +3,8 @@
 from pathlib import Path
 
 from workstack.core.context import WorkstackContext
+from workstack.core.plan_index import PLAN_FILENAME, PlanIndex
+from workstack.status.cache import file_signature
 from workstack.status.collectors.base import StatusCollector
 from workstack.status.models.status_data import PlanStatus
 
@@ -25,7 +27,7 @@ class PlanFileCollector(StatusCollector):
         Returns:
             True if .PLAN.md exists
         """
-        plan_path = worktree_path / ".PLAN.md"
+        plan_path = worktree_path / PLAN_FILENAME
         return plan_path.exists()
 
     def collect(
@@ -41,9 +43,15 @@ class PlanFileCollector(StatusCollector):
         Returns:
             PlanStatus with file information or None if collection fails
         """
-        plan_path = worktree_path / ".PLAN.md"
+        plan_path = worktree_path / PLAN_FILENAME
 
-        if not plan_path.exists():
+        # The shared index skips re-parsing plans whose mtime and size are
+        # unchanged since any earlier `list` or `status` run.
+        index = PlanIndex.for_worktree(worktree_path)
+        metadata = index.get(plan_path)
+        index.save()
+
+        if metadata is None:
             return PlanStatus(
                 exists=False,
                 path=None,
@@ -52,33 +60,16 @@ class PlanFileCollector(StatusCollector):
                 first_lines=[],
             )
 
-        # Read the file
-        content = plan_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-        line_count = len(lines)
-
-        # Get first 5 lines
-        first_lines = lines[:5] if len(lines) >= 5 else lines
-
-        # Extract summary from first few non-empty lines
-        summary_lines = []
-        for line in lines[:10]:  # Look at first 10 lines
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                summary_lines.append(stripped)
-                if len(summary_lines) >= 2:
-                    break
-
-        summary = " ".join(summary_lines) if summary_lines else None
-
-        # Truncate summary if too long
-        if summary and len(summary) > 100:
-            summary = summary[:97] + "..."
-
         return PlanStatus(
             exists=True,
             path=plan_path,
-            summary=summary,
-            line_count=line_count,
-            first_lines=first_lines,
+            summary=metadata.summary,
+            line_count=metadata.line_count,
+            first_lines=metadata.first_lines,
         )
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        """Fingerprint .PLAN.md by modification time and size."""
+        return file_signature(worktree_path / PLAN_FILENAME)
@@ -0,0 +1,53 @@
+"""Pending trash collector."""
+
+from pathlib import Path
+
+from workstack.core.context import WorkstackContext
+from workstack.core.trash import measure_trash, trash_dir_for
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.models.status_data import TrashStatus
+
+
+class TrashCollector(StatusCollector):
+    """Collects how much of the repository's removed worktrees is left to delete."""
+
+    @property
+    def name(self) -> str:
+        """Name identifier for this collector."""
+        return "trash"
+
+    def is_available(self, ctx: WorkstackContext, worktree_path: Path) -> bool:
+        """The trash belongs to the repository, so it is checked from every worktree.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+
+        Returns:
+            Always True
+        """
+        return True
+
+    def collect(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> TrashStatus | None:
+        """Measure the trash of the repository's worktrees.
+
+        Args:
+            ctx: Workstack context
+            worktree_path: Path to worktree
+            repo_root: Repository root path
+
+        Returns:
+            TrashStatus, or None if nothing is waiting to be deleted
+        """
+        workstacks_dir = ctx.global_config_ops.get_workstacks_root() / repo_root.name
+        usage = measure_trash(trash_dir_for(workstacks_dir))
+        if usage.entries == 0:
+            return None
+
+        return TrashStatus(
+            entries=usage.entries,
+            size_bytes=usage.size_bytes,
+            size_is_lower_bound=usage.size_is_lower_bound,
+        )
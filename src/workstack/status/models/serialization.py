@@ -0,0 +1,109 @@
+"""Generic conversion between status dataclasses and JSON-compatible values.
+
+Both directions are driven by the dataclass field definitions and their type
+annotations, so fields added to the models in status_data.py are serialized
+without changes here.
+"""
+
+import types
+from dataclasses import MISSING, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+_PRIMITIVES: tuple[type, ...] = (str, int, float, bool)
+
+
+def to_jsonable(value: object) -> Any:
+    """Convert a dataclass tree into JSON-compatible values.
+
+    Dataclasses become dicts keyed by field name, Paths become strings, and
+    lists/tuples/dicts are converted element-wise.
+
+    Args:
+        value: Dataclass instance or nested value
+
+    Returns:
+        Value composed of dict, list, str, int, float, bool and None
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def from_jsonable(target_type: Any, data: Any) -> Any:
+    """Rebuild a typed value from to_jsonable() output.
+
+    Args:
+        target_type: Annotation to decode into (dataclass, list[T], dict[str, T],
+            T | None, Path or a primitive)
+        data: JSON-compatible value
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If ``data`` does not match ``target_type``
+    """
+    origin = get_origin(target_type)
+
+    if origin is Union or origin is types.UnionType:
+        options = get_args(target_type)
+        if data is None and type(None) in options:
+            return None
+        non_none = [option for option in options if option is not type(None)]
+        if len(non_none) != 1:
+            raise ValueError(f"Unsupported union type: {target_type}")
+        return from_jsonable(non_none[0], data)
+
+    if origin is list:
+        if not isinstance(data, list):
+            raise ValueError(f"Expected list for {target_type}, got {type(data).__name__}")
+        (item_type,) = get_args(target_type)
+        return [from_jsonable(item_type, item) for item in data]
+
+    if origin is dict:
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected object for {target_type}, got {type(data).__name__}")
+        _key_type, value_type = get_args(target_type)
+        return {key: from_jsonable(value_type, item) for key, item in data.items()}
+
+    if target_type is Path:
+        if not isinstance(data, str):
+            raise ValueError(f"Expected path string, got {type(data).__name__}")
+        return Path(data)
+
+    if isinstance(target_type, type) and is_dataclass(target_type):
+        return _dataclass_from_jsonable(target_type, data)
+
+    if target_type in _PRIMITIVES:
+        # bool is an int subclass; don't let True decode as an int or vice versa
+        if not isinstance(data, target_type) or (target_type is int and isinstance(data, bool)):
+            raise ValueError(f"Expected {target_type.__name__}, got {type(data).__name__}")
+        return data
+
+    if target_type is Any or target_type is object:
+        return data
+
+    raise ValueError(f"Unsupported type: {target_type}")
+
+
+def _dataclass_from_jsonable(target_type: type, data: Any) -> Any:
+    """Decode a dict into dataclass ``target_type``."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected object for {target_type.__name__}")
+
+    hints = get_type_hints(target_type)
+    kwargs: dict[str, Any] = {}
+    for field in fields(target_type):
+        if field.name not in data:
+            if field.default is not MISSING or field.default_factory is not MISSING:
+                continue
+            raise ValueError(f"Missing field '{field.name}' for {target_type.__name__}")
+        kwargs[field.name] = from_jsonable(hints[field.name], data[field.name])
+    return target_type(**kwargs)
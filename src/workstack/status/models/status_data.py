@@ -1,6 +1,6 @@
 """Data models for status information."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -36,6 +36,8 @@ class GitStatus:
     modified_files: list[str]
     untracked_files: list[str]
     recent_commits: list[CommitInfo]
+    # Set when the file lists were capped and hold only the first entries
+    files_truncated: bool = False
 
 
 @dataclass(frozen=True)
@@ -91,6 +93,26 @@ class PlanStatus:
     first_lines: list[str]
 
 
+@dataclass(frozen=True)
+class TrashStatus:
+    """Removed worktrees whose files are still being deleted in the background."""
+
+    entries: int
+    size_bytes: int
+    size_is_lower_bound: bool = False
+
+
+@dataclass(frozen=True)
+class CollectorRun:
+    """How a single collector behaved during a status run."""
+
+    name: str
+    duration_ms: float
+    timed_out: bool
+    failed: bool
+    cached: bool
+
+
 @dataclass(frozen=True)
 class StatusData:
     """Container for all status information."""
@@ -100,6 +122,8 @@ class StatusData:
     stack_position: StackPosition | None
     pr_status: PullRequestStatus | None
     environment: EnvironmentStatus | None
-    dependencies: DependencyStatus | None
+    dependencies: list[DependencyStatus] | None
     plan: PlanStatus | None
     related_worktrees: list[WorktreeInfo]
+    collector_runs: list[CollectorRun] = field(default_factory=list)
+    trash: TrashStatus | None = None
@@ -1,15 +1,51 @@
 """Orchestrator for collecting and assembling status information."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
+from dataclasses import replace
 from pathlib import Path
+from typing import get_type_hints
 
 from workstack.core.context import WorkstackContext
+from workstack.status.cache import CollectorCache
 from workstack.status.collectors.base import StatusCollector
-from workstack.status.models.status_data import StatusData, WorktreeInfo
+from workstack.status.models.status_data import (
+    CollectorRun,
+    DependencyStatus,
+    EnvironmentStatus,
+    GitStatus,
+    PlanStatus,
+    PullRequestStatus,
+    StackPosition,
+    StatusData,
+    TrashStatus,
+    WorktreeInfo,
+)
 
 logger = logging.getLogger(__name__)
 
+# StatusData field filled by each collector, keyed by collector name
+COLLECTOR_FIELDS: dict[str, str] = {
+    "git": "git_status",
+    "stack": "stack_position",
+    "pr": "pr_status",
+    "environment": "environment",
+    "dependencies": "dependencies",
+    "plan": "plan",
+    "trash": "trash",
+}
+
+_FIELD_TYPES: dict[str, type] = {
+    "git_status": GitStatus,
+    "stack_position": StackPosition,
+    "pr_status": PullRequestStatus,
+    "environment": EnvironmentStatus,
+    "plan": PlanStatus,
+    "trash": TrashStatus,
+}
+
 
 class StatusOrchestrator:
     """Coordinates all status collectors and assembles final data.
@@ -18,15 +54,24 @@ class StatusOrchestrator:
     responsive output even if some collectors are slow or fail.
     """
 
-    def __init__(self, collectors: list[StatusCollector], *, timeout_seconds: float = 2.0) -> None:
+    def __init__(
+        self,
+        collectors: list[StatusCollector],
+        *,
+        timeout_seconds: float = 2.0,
+        cache: CollectorCache | None = None,
+    ) -> None:
         """Create a status orchestrator.
 
         Args:
             collectors: List of status collectors to run
             timeout_seconds: Maximum time to wait for each collector (default: 2.0)
+            cache: Persisted results to reuse for collectors whose fingerprint
+                still matches, or None to always run every collector
         """
         self.collectors = collectors
         self.timeout_seconds = timeout_seconds
+        self.cache = cache
 
     def collect_status(
         self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
@@ -47,16 +92,123 @@ class StatusOrchestrator:
         # Determine worktree info
         worktree_info = self._get_worktree_info(ctx, worktree_path, repo_root)
 
-        # Run collectors in parallel
+        results, runs = self._run_collectors(ctx, self.collectors, worktree_path, repo_root)
+
+        # Get related worktrees
+        related_worktrees = self._get_related_worktrees(ctx, repo_root, worktree_path)
+
+        git_result = results.get("git")
+        stack_result = results.get("stack")
+        pr_result = results.get("pr")
+        env_result = results.get("environment")
+        plan_result = results.get("plan")
+        trash_result = results.get("trash")
+
+        return StatusData(
+            worktree_info=worktree_info,
+            git_status=git_result if isinstance(git_result, GitStatus) else None,
+            stack_position=stack_result if isinstance(stack_result, StackPosition) else None,
+            pr_status=pr_result if isinstance(pr_result, PullRequestStatus) else None,
+            environment=env_result if isinstance(env_result, EnvironmentStatus) else None,
+            dependencies=_as_dependencies(results.get("dependencies")),
+            plan=plan_result if isinstance(plan_result, PlanStatus) else None,
+            related_worktrees=related_worktrees,
+            collector_runs=runs,
+            trash=trash_result if isinstance(trash_result, TrashStatus) else None,
+        )
+
+    def refresh_status(
+        self,
+        ctx: WorkstackContext,
+        status: StatusData,
+        worktree_path: Path,
+        repo_root: Path,
+        collector_names: set[str],
+    ) -> StatusData:
+        """Re-run only the named collectors and merge their results into ``status``.
+
+        Sections owned by other collectors are carried over unchanged. A named
+        collector that is no longer available (e.g. .PLAN.md was deleted)
+        clears its section. Re-running "git" also refreshes the worktree
+        header and related worktrees, since both derive from git state.
+
+        Args:
+            ctx: Workstack context with operations
+            status: Previously collected status
+            worktree_path: Path to the worktree
+            repo_root: Path to repository root
+            collector_names: Names of collectors whose inputs changed
+
+        Returns:
+            New StatusData with the named sections refreshed
+        """
+        collectors = [c for c in self.collectors if c.name in collector_names]
+        results, runs = self._run_collectors(ctx, collectors, worktree_path, repo_root)
+
+        refreshed_names = {run.name for run in runs}
+        kept_runs = [run for run in status.collector_runs if run.name not in refreshed_names]
+        updates: dict[str, object] = {"collector_runs": kept_runs + runs}
+        for collector in collectors:
+            field_name = COLLECTOR_FIELDS.get(collector.name)
+            if field_name is None:
+                continue
+            result = results.get(collector.name)
+            if collector.name == "dependencies":
+                updates[field_name] = _as_dependencies(result)
+            elif isinstance(result, _FIELD_TYPES[field_name]):
+                updates[field_name] = result
+            else:
+                updates[field_name] = None
+
+        if "git" in collector_names:
+            updates["worktree_info"] = self._get_worktree_info(ctx, worktree_path, repo_root)
+            updates["related_worktrees"] = self._get_related_worktrees(
+                ctx, repo_root, worktree_path
+            )
+
+        return replace(status, **updates)
+
+    def _run_collectors(
+        self,
+        ctx: WorkstackContext,
+        collectors: list[StatusCollector],
+        worktree_path: Path,
+        repo_root: Path,
+    ) -> tuple[dict[str, object], list[CollectorRun]]:
+        """Run available collectors in parallel.
+
+        Returns:
+            Tuple of (results by collector name, one CollectorRun per collector
+            that was submitted)
+        """
         results: dict[str, object] = {}
+        runs: dict[str, CollectorRun] = {}
+        # Fingerprints of collectors whose results should be written back
+        fingerprints: dict[str, str] = {}
+        failed: set[str] = set()
+        started = time.perf_counter()
 
         with ThreadPoolExecutor(max_workers=5) as executor:
             # Submit all available collectors
             futures = {}
-            for collector in self.collectors:
+            from_cache: set[str] = set()
+            for collector in collectors:
                 if collector.is_available(ctx, worktree_path):
-                    future = executor.submit(collector.collect, ctx, worktree_path, repo_root)
+                    future, cached = self._submit(
+                        executor, ctx, collector, worktree_path, repo_root, fingerprints
+                    )
                     futures[future] = collector.name
+                    if cached:
+                        from_cache.add(collector.name)
+
+            def record(name: str, duration_ms: float, *, timed_out: bool, failed: bool) -> None:
+                runs[name] = CollectorRun(
+                    name=name,
+                    duration_ms=round(duration_ms, 3),
+                    timed_out=timed_out,
+                    failed=failed,
+                    cached=name in from_cache,
+                )
 
             # Collect results with timeout per collector
             # Use a separate timeout for as_completed (total time for all collectors)
@@ -66,8 +218,10 @@ class StatusOrchestrator:
                 for future in as_completed(futures, timeout=total_timeout):
                     collector_name = futures[future]
                     try:
-                        result = future.result(timeout=0.1)  # Should be immediate once complete
+                        # Should be immediate once complete
+                        result, duration_ms = future.result(timeout=0.1)
                         results[collector_name] = result
+                        record(collector_name, duration_ms, timed_out=False, failed=False)
                     except TimeoutError:
                         # Error boundary: Collector timeouts shouldn't fail entire command
                         # Log for debugging but continue with other collectors
@@ -75,6 +229,8 @@ class StatusOrchestrator:
                             f"Collector '{collector_name}' timed out after {self.timeout_seconds}s"
                         )
                         results[collector_name] = None
+                        failed.add(collector_name)
+                        record(collector_name, _elapsed_ms(started), timed_out=True, failed=False)
                     except Exception as e:
                         # Error boundary: Individual collector failures shouldn't fail
                         # entire command. This is an acceptable use of exception handling
@@ -82,6 +238,8 @@ class StatusOrchestrator:
                         # collectors should degrade gracefully
                         logger.debug(f"Collector '{collector_name}' failed: {e}")
                         results[collector_name] = None
+                        failed.add(collector_name)
+                        record(collector_name, _elapsed_ms(started), timed_out=False, failed=True)
             except TimeoutError:
                 # Some collectors didn't complete in time
                 # Mark incomplete collectors as None
@@ -89,38 +247,59 @@ class StatusOrchestrator:
                     if future.running() or not future.done():
                         logger.debug(f"Collector '{collector_name}' did not complete in time")
                         results[collector_name] = None
+                        failed.add(collector_name)
+                        record(collector_name, _elapsed_ms(started), timed_out=True, failed=False)
+
+        if self.cache is not None:
+            for name, fingerprint in fingerprints.items():
+                if name in results and name not in failed:
+                    self.cache.put(name, fingerprint, results[name])
+            self.cache.save()
+
+        ordered_runs = [runs[name] for name in futures.values() if name in runs]
+        return results, ordered_runs
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        ctx: WorkstackContext,
+        collector: StatusCollector,
+        worktree_path: Path,
+        repo_root: Path,
+        fingerprints: dict[str, str],
+    ) -> tuple[Future, bool]:
+        """Submit a collector, serving it from the cache when its fingerprint matches.
+
+        Fingerprints are computed here on the calling thread: they are a few
+        file stats, and keeping all cache access on one thread means the cache
+        needs no locking.
 
-        # Get related worktrees
-        related_worktrees = self._get_related_worktrees(ctx, repo_root, worktree_path)
-
-        # Assemble StatusData - cast results to expected types
-        # Results are either the correct type or None (from collector failures)
-        from workstack.status.models.status_data import (
-            DependencyStatus,
-            EnvironmentStatus,
-            GitStatus,
-            PlanStatus,
-            PullRequestStatus,
-            StackPosition,
+        Returns:
+            Tuple of (future resolving to (result, duration_ms), whether the
+            result came from the cache)
+        """
+        if self.cache is None:
+            return executor.submit(_timed, collector.collect, ctx, worktree_path, repo_root), False
+
+        fingerprint = collector.fingerprint(ctx, worktree_path, repo_root)
+        if fingerprint is None:
+            return executor.submit(_timed, collector.collect, ctx, worktree_path, repo_root), False
+
+        fingerprints[collector.name] = fingerprint
+        cached = self.cache.get(
+            collector.name,
+            fingerprint,
+            _result_type(collector.name),
+            ttl_seconds=collector.cache_ttl_seconds,
         )
+        if cached is None:
+            return executor.submit(_timed, collector.collect, ctx, worktree_path, repo_root), False
 
-        git_result = results.get("git")
-        stack_result = results.get("stack")
-        pr_result = results.get("pr")
-        env_result = results.get("environment")
-        deps_result = results.get("dependencies")
-        plan_result = results.get("plan")
-
-        return StatusData(
-            worktree_info=worktree_info,
-            git_status=git_result if isinstance(git_result, GitStatus) else None,
-            stack_position=stack_result if isinstance(stack_result, StackPosition) else None,
-            pr_status=pr_result if isinstance(pr_result, PullRequestStatus) else None,
-            environment=env_result if isinstance(env_result, EnvironmentStatus) else None,
-            dependencies=deps_result if isinstance(deps_result, DependencyStatus) else None,
-            plan=plan_result if isinstance(plan_result, PlanStatus) else None,
-            related_worktrees=related_worktrees,
+        logger.debug(f"Collector '{collector.name}' served from cache")
+        future = executor.submit(
+            _timed, collector.refresh_cached, ctx, worktree_path, repo_root, cached.value
         )
+        return future, True
 
     def _get_worktree_info(
         self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
@@ -188,3 +367,32 @@ class StatusOrchestrator:
             related.append(WorktreeInfo(name=name, path=wt.path, branch=wt.branch, is_root=is_root))
 
         return related
+
+
+def _timed(fn: Callable[..., object], *args: object) -> tuple[object, float]:
+    """Call ``fn`` and return its result with the elapsed time in milliseconds."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, _elapsed_ms(started)
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return (time.perf_counter() - started) * 1000
+
+
+def _result_type(collector_name: str) -> object:
+    """Return the StatusData annotation a collector's result decodes into."""
+    field_name = COLLECTOR_FIELDS.get(collector_name)
+    if field_name is None:
+        return object
+    return get_type_hints(StatusData)[field_name]
+
+
+def _as_dependencies(result: object) -> list[DependencyStatus] | None:
+    """Return ``result`` if it is a list of DependencyStatus, else None."""
+    if not isinstance(result, list):
+        return None
+    if not all(isinstance(dep, DependencyStatus) for dep in result):
+        return None
+    return result
@@ -1,5 +1,7 @@
 """Simple text-based status renderer."""
 
+from typing import TextIO
+
 import click
 
 from workstack.status.models.status_data import StatusData
@@ -8,6 +10,20 @@ from workstack.status.models.status_data import StatusData
 class SimpleRenderer:
     """Renders status information as simple formatted text."""
 
+    def __init__(self, *, file: TextIO | None = None, color: bool | None = None) -> None:
+        """Create a renderer.
+
+        Args:
+            file: Stream to write to (default: stdout)
+            color: Force styling on or off (default: auto-detect from the stream)
+        """
+        self._file = file
+        self._color = color
+
+    def _echo(self, message: str = "") -> None:
+        """Write one line to the configured stream."""
+        click.echo(message, file=self._file, color=self._color)
+
     def render(self, status: StatusData) -> None:
         """Render status data to console.
 
@@ -19,6 +35,9 @@ class SimpleRenderer:
         self._render_stack(status)
         self._render_pr_status(status)
         self._render_git_status(status)
+        self._render_dependencies(status)
+        self._render_environment(status)
+        self._render_trash(status)
         self._render_related_worktrees(status)
 
     def _render_file_list(self, files: list[str], *, max_files: int = 3) -> None:
@@ -29,11 +48,11 @@ class SimpleRenderer:
             max_files: Maximum number of files to display
         """
         for file in files[:max_files]:
-            click.echo(f"      {file}")
+            self._echo(f"      {file}")
 
         if len(files) > max_files:
             remaining = len(files) - max_files
-            click.echo(
+            self._echo(
                 click.style(
                     f"      ... and {remaining} more",
                     fg="white",
@@ -51,18 +70,18 @@ class SimpleRenderer:
 
         # Title
         name_color = "green" if wt.is_root else "cyan"
-        click.echo(click.style(f"Worktree: {wt.name}", fg=name_color, bold=True))
+        self._echo(click.style(f"Worktree: {wt.name}", fg=name_color, bold=True))
 
         # Location
-        click.echo(click.style(f"Location: {wt.path}", fg="white", dim=True))
+        self._echo(click.style(f"Location: {wt.path}", fg="white", dim=True))
 
         # Branch
         if wt.branch:
-            click.echo(click.style(f"Branch:   {wt.branch}", fg="yellow"))
+            self._echo(click.style(f"Branch:   {wt.branch}", fg="yellow"))
         else:
-            click.echo(click.style("Branch:   (detached HEAD)", fg="red", dim=True))
+            self._echo(click.style("Branch:   (detached HEAD)", fg="red", dim=True))
 
-        click.echo()
+        self._echo()
 
     def _render_plan(self, status: StatusData) -> None:
         """Render plan file section if available.
@@ -73,20 +92,20 @@ class SimpleRenderer:
         if status.plan is None or not status.plan.exists:
             return
 
-        click.echo(click.style("Plan:", fg="bright_magenta", bold=True))
+        self._echo(click.style("Plan:", fg="bright_magenta", bold=True))
 
         if status.plan.first_lines:
             for line in status.plan.first_lines:
-                click.echo(f"  {line}")
+                self._echo(f"  {line}")
 
-        click.echo(
+        self._echo(
             click.style(
                 f"  ({status.plan.line_count} lines in .PLAN.md)",
                 fg="white",
                 dim=True,
             )
         )
-        click.echo()
+        self._echo()
 
     def _render_stack(self, status: StatusData) -> None:
         """Render Graphite stack section if available.
@@ -99,24 +118,24 @@ class SimpleRenderer:
 
         stack = status.stack_position
 
-        click.echo(click.style("Stack Position:", fg="blue", bold=True))
+        self._echo(click.style("Stack Position:", fg="blue", bold=True))
 
         # Show position in stack
         if stack.is_trunk:
-            click.echo("  This is a trunk branch")
+            self._echo("  This is a trunk branch")
         else:
             if stack.parent_branch:
                 parent = click.style(stack.parent_branch, fg="yellow")
-                click.echo(f"  Parent: {parent}")
+                self._echo(f"  Parent: {parent}")
 
             if stack.children_branches:
                 children = ", ".join(click.style(c, fg="yellow") for c in stack.children_branches)
-                click.echo(f"  Children: {children}")
+                self._echo(f"  Children: {children}")
 
         # Show stack visualization
         if len(stack.stack) > 1:
-            click.echo()
-            click.echo(click.style("  Stack:", fg="white", dim=True))
+            self._echo()
+            self._echo(click.style("  Stack:", fg="white", dim=True))
             for branch in reversed(stack.stack):
                 is_current = branch == stack.current_branch
 
@@ -127,9 +146,9 @@ class SimpleRenderer:
                     marker = click.style("◯", fg="bright_black")
                     branch_text = branch
 
-                click.echo(f"    {marker}  {branch_text}")
+                self._echo(f"    {marker}  {branch_text}")
 
-        click.echo()
+        self._echo()
 
     def _render_pr_status(self, status: StatusData) -> None:
         """Render PR status section if available.
@@ -142,7 +161,7 @@ class SimpleRenderer:
 
         pr = status.pr_status
 
-        click.echo(click.style("Pull Request:", fg="blue", bold=True))
+        self._echo(click.style("Pull Request:", fg="blue", bold=True))
 
         # PR number and state
         pr_link = click.style(f"#{pr.number}", fg="cyan")
@@ -150,27 +169,27 @@ class SimpleRenderer:
             "green" if pr.state == "OPEN" else "red" if pr.state == "CLOSED" else "magenta"
         )
         state_text = click.style(pr.state, fg=state_color)
-        click.echo(f"  {pr_link} {state_text}")
+        self._echo(f"  {pr_link} {state_text}")
 
         # Draft status
         if pr.is_draft:
-            click.echo(click.style("  Draft PR", fg="yellow"))
+            self._echo(click.style("  Draft PR", fg="yellow"))
 
         # Checks status
         if pr.checks_passing is not None:
             if pr.checks_passing:
-                click.echo(click.style("  Checks: passing", fg="green"))
+                self._echo(click.style("  Checks: passing", fg="green"))
             else:
-                click.echo(click.style("  Checks: failing", fg="red"))
+                self._echo(click.style("  Checks: failing", fg="red"))
 
         # Ready to merge
         if pr.ready_to_merge:
-            click.echo(click.style("  ✓ Ready to merge", fg="green", bold=True))
+            self._echo(click.style("  ✓ Ready to merge", fg="green", bold=True))
 
         # URL
-        click.echo(click.style(f"  {pr.url}", fg="white", dim=True))
+        self._echo(click.style(f"  {pr.url}", fg="white", dim=True))
 
-        click.echo()
+        self._echo()
 
     def _render_git_status(self, status: StatusData) -> None:
         """Render git status section.
@@ -183,24 +202,24 @@ class SimpleRenderer:
 
         git = status.git_status
 
-        click.echo(click.style("Git Status:", fg="blue", bold=True))
+        self._echo(click.style("Git Status:", fg="blue", bold=True))
 
         # Clean/dirty status
         if git.clean:
-            click.echo(click.style("  Working tree clean", fg="green"))
+            self._echo(click.style("  Working tree clean", fg="green"))
         else:
-            click.echo(click.style("  Working tree has changes:", fg="yellow"))
+            self._echo(click.style("  Working tree has changes:", fg="yellow"))
 
             if git.staged_files:
-                click.echo(click.style("    Staged:", fg="green"))
+                self._echo(click.style("    Staged:", fg="green"))
                 self._render_file_list(git.staged_files, max_files=3)
 
             if git.modified_files:
-                click.echo(click.style("    Modified:", fg="yellow"))
+                self._echo(click.style("    Modified:", fg="yellow"))
                 self._render_file_list(git.modified_files, max_files=3)
 
             if git.untracked_files:
-                click.echo(click.style("    Untracked:", fg="red"))
+                self._echo(click.style("    Untracked:", fg="red"))
                 self._render_file_list(git.untracked_files, max_files=3)
 
         # Ahead/behind
@@ -211,20 +230,76 @@ class SimpleRenderer:
             if git.behind > 0:
                 parts.append(click.style(f"{git.behind} behind", fg="red"))
 
-            click.echo(f"  Branch: {', '.join(parts)}")
+            self._echo(f"  Branch: {', '.join(parts)}")
 
         # Recent commits
         if git.recent_commits:
-            click.echo()
-            click.echo(click.style("  Recent commits:", fg="white", dim=True))
+            self._echo()
+            self._echo(click.style("  Recent commits:", fg="white", dim=True))
             for commit in git.recent_commits[:3]:
                 sha = click.style(commit.sha, fg="yellow")
                 message = commit.message[:60]
                 if len(commit.message) > 60:
                     message += "..."
-                click.echo(f"    {sha} {message}")
+                self._echo(f"    {sha} {message}")
+
+        self._echo()
+
+    def _render_dependencies(self, status: StatusData) -> None:
+        """Render dependency freshness section if available.
+
+        Args:
+            status: Status data
+        """
+        if not status.dependencies:
+            return
+
+        self._echo(click.style("Dependencies:", fg="blue", bold=True))
+
+        for dep in status.dependencies:
+            if dep.up_to_date:
+                self._echo(f"  {dep.language}: " + click.style("up to date", fg="green"))
+            else:
+                self._echo(f"  {dep.language}: " + click.style("out of sync", fg="red"))
+                if dep.details:
+                    self._echo(click.style(f"    {dep.details}", fg="white", dim=True))
+
+        self._echo()
+
+    def _render_environment(self, status: StatusData) -> None:
+        """Render environment section if available.
 
-        click.echo()
+        Only variable names are shown; .env values may contain secrets.
+
+        Args:
+            status: Status data
+        """
+        if status.environment is None or not status.environment.variables:
+            return
+
+        names = list(status.environment.variables)
+        self._echo(click.style("Environment:", fg="blue", bold=True))
+        self._echo(f"  {len(names)} variables from .env")
+        self._render_file_list(names, max_files=5)
+
+        self._echo()
+
+    def _render_trash(self, status: StatusData) -> None:
+        """Render removed worktrees still being deleted in the background.
+
+        Args:
+            status: Status data
+        """
+        if status.trash is None:
+            return
+
+        size = _format_size(status.trash.size_bytes)
+        if status.trash.size_is_lower_bound:
+            size = f"at least {size}"
+        self._echo(click.style("Trash:", fg="blue", bold=True))
+        self._echo(f"  {status.trash.entries} removed worktree(s) pending deletion, {size}")
+
+        self._echo()
 
     def _render_related_worktrees(self, status: StatusData) -> None:
         """Render related worktrees section.
@@ -235,7 +310,7 @@ class SimpleRenderer:
         if not status.related_worktrees:
             return
 
-        click.echo(click.style("Related Worktrees:", fg="blue", bold=True))
+        self._echo(click.style("Related Worktrees:", fg="blue", bold=True))
 
         for wt in status.related_worktrees[:5]:
             name_color = "green" if wt.is_root else "cyan"
@@ -243,13 +318,13 @@ class SimpleRenderer:
 
             if wt.branch:
                 branch_part = click.style(f"[{wt.branch}]", fg="yellow", dim=True)
-                click.echo(f"  {name_part} {branch_part}")
+                self._echo(f"  {name_part} {branch_part}")
             else:
-                click.echo(f"  {name_part}")
+                self._echo(f"  {name_part}")
 
         if len(status.related_worktrees) > 5:
             remaining = len(status.related_worktrees) - 5
-            click.echo(
+            self._echo(
                 click.style(
                     f"  ... and {remaining} more",
                     fg="white",
@@ -257,4 +332,16 @@ class SimpleRenderer:
                 )
             )
 
-        click.echo()
+        self._echo()
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count with a binary unit, e.g. "1.5 GiB"."""
+    size = float(size_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    if unit == "B":
+        return f"{size_bytes} B"
+    return f"{size:.1f} {unit}"
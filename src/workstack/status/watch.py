@@ -0,0 +1,478 @@
+"""Filesystem-event driven refresh for `workstack status --watch`.
+
+The watcher maps every changed path to the collectors whose inputs it can
+affect, so an edit to .PLAN.md re-runs the plan and git collectors but not
+the Graphite or PR collectors. Bursts of events (an agent writing many files,
+git rewriting the index through a lock file) are coalesced into one refresh,
+and only the terminal lines whose text changed are redrawn.
+
+Events come from inotify where available (Linux) and from periodic mtime
+scans everywhere else.
+"""
+
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+from workstack.core.context import WorkstackContext
+from workstack.core.status_snapshot import locate_worktree, read_common_dir
+from workstack.status.collectors.dependencies import ECOSYSTEMS
+from workstack.status.models.status_data import StatusData
+from workstack.status.orchestrator import COLLECTOR_FIELDS, StatusOrchestrator
+from workstack.status.renderers.simple import SimpleRenderer
+
+# Worktree directories that are never watched recursively. Dependency install
+# directories are still watched at their top level for the dependency collector.
+SKIPPED_DIR_NAMES = frozenset(
+    {
+        ".git",
+        ".venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+    }
+)
+
+MAX_WATCHED_DIRS = 8192
+COALESCE_SECONDS = 0.05
+POLL_INTERVAL_SECONDS = 1.0
+
+# PR state changes remotely without any local event, so it is refreshed on a timer
+PR_REFRESH_SECONDS = 60.0
+
+# Files directly inside the worktree's git dir and the common dir, and the
+# collectors that read them. Anything else there (lock files, objects, our
+# own cache files) is ignored.
+_GIT_DIR_FILES: dict[str, frozenset[str]] = {
+    "HEAD": frozenset({"git", "stack", "pr"}),
+    "index": frozenset({"git"}),
+}
+_COMMON_DIR_FILES: dict[str, frozenset[str]] = {
+    "packed-refs": frozenset({"git"}),
+    ".graphite_cache_persist": frozenset({"stack"}),
+    ".graphite_pr_info": frozenset({"pr"}),
+}
+_WORKTREE_FILES: dict[str, frozenset[str]] = {
+    ".PLAN.md": frozenset({"plan", "git"}),
+    ".env": frozenset({"environment", "git"}),
+    **{eco.lockfile: frozenset({"dependencies", "git"}) for eco in ECOSYSTEMS},
+}
+_INSTALL_DIRS = frozenset(eco.install_dir for eco in ECOSYSTEMS)
+
+
+@dataclass(frozen=True)
+class WatchLayout:
+    """Locations watched for one worktree.
+
+    Attributes:
+        worktree_path: Root of the worktree
+        git_dir: The worktree's own git dir (HEAD, index)
+        common_dir: The repository's shared git dir (refs, Graphite caches)
+    """
+
+    worktree_path: Path
+    git_dir: Path
+    common_dir: Path
+
+
+def resolve_watch_layout(worktree_path: Path) -> WatchLayout | None:
+    """Find the git directories backing a worktree.
+
+    Args:
+        worktree_path: Root of the worktree
+
+    Returns:
+        WatchLayout, or None if the path is not inside a git worktree
+    """
+    location = locate_worktree(str(worktree_path))
+    if location is None:
+        return None
+
+    git_dir = location[1]
+    return WatchLayout(
+        worktree_path=Path(location[0]),
+        git_dir=Path(git_dir),
+        common_dir=Path(read_common_dir(git_dir)),
+    )
+
+
+def classify_changes(paths: set[Path], layout: WatchLayout) -> set[str]:
+    """Map changed paths to the names of the collectors that must re-run.
+
+    A change reported on the worktree root itself means events were lost
+    (inotify queue overflow) and refreshes everything.
+
+    Args:
+        paths: Paths reported by a ChangeSource
+        layout: Watched locations
+
+    Returns:
+        Collector names whose inputs changed
+    """
+    names: set[str] = set()
+    for path in paths:
+        if path == layout.worktree_path:
+            return set(COLLECTOR_FIELDS)
+
+        # For the root worktree the git dir and the common dir are the same
+        if path.parent in (layout.git_dir, layout.common_dir):
+            if path.parent == layout.git_dir:
+                names |= _GIT_DIR_FILES.get(path.name, frozenset())
+            if path.parent == layout.common_dir:
+                names |= _COMMON_DIR_FILES.get(path.name, frozenset())
+        elif path.is_relative_to(layout.common_dir / "refs"):
+            names.add("git")
+        elif path.is_relative_to(layout.common_dir):
+            continue
+        elif path.is_relative_to(layout.worktree_path):
+            names |= _classify_worktree_path(path.relative_to(layout.worktree_path))
+
+    return names
+
+
+def _classify_worktree_path(relative: Path) -> set[str]:
+    """Classify a path inside the worktree (relative to its root)."""
+    top = relative.parts[0]
+    if top == ".git":
+        return set()
+    if top in _INSTALL_DIRS:
+        return {"dependencies"}
+    if len(relative.parts) == 1 and top in _WORKTREE_FILES:
+        return set(_WORKTREE_FILES[top])
+    return {"git"}
+
+
+def watch_directories(layout: WatchLayout) -> list[Path]:
+    """List the directories to watch for a worktree.
+
+    Covers the git dirs (non-recursively), branch and remote refs, the
+    worktree tree minus SKIPPED_DIR_NAMES, and the top of each dependency
+    install directory along with any marker directories inside it.
+    """
+    directories = [layout.git_dir]
+    if layout.common_dir != layout.git_dir:
+        directories.append(layout.common_dir)
+
+    for refs_root in (layout.common_dir / "refs" / "heads", layout.common_dir / "refs" / "remotes"):
+        directories.extend(_walk_directories(refs_root, skipped=frozenset()))
+
+    directories.extend(_walk_directories(layout.worktree_path, skipped=SKIPPED_DIR_NAMES))
+
+    for eco in ECOSYSTEMS:
+        install_dir = layout.worktree_path / eco.install_dir
+        if not install_dir.is_dir():
+            continue
+        directories.append(install_dir)
+        for pattern in eco.markers:
+            directories.extend(marker for marker in install_dir.glob(pattern) if marker.is_dir())
+
+    return directories[:MAX_WATCHED_DIRS]
+
+
+def _walk_directories(root: Path, *, skipped: frozenset[str]) -> list[Path]:
+    """Return ``root`` and its subdirectories, pruning names in ``skipped``."""
+    if not root.is_dir():
+        return []
+
+    directories: list[Path] = []
+    for dirpath, dirnames, _filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in skipped]
+        directories.append(Path(dirpath))
+        if len(directories) >= MAX_WATCHED_DIRS:
+            break
+    return directories
+
+
+class ChangeSource(ABC):
+    """Source of filesystem change notifications for a worktree."""
+
+    @abstractmethod
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        """Block until something changes or the timeout expires.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Changed paths (empty on timeout), or None once the source is exhausted
+        """
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release any OS resources held by the source."""
+        ...
+
+
+# inotify(7) constants
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify() -> ctypes.CDLL | None:
+    """Load libc if it provides inotify, else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return None
+
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class InotifyChangeSource(ChangeSource):
+    """Change source backed by Linux inotify.
+
+    Idle cost is a single blocking select() on the inotify descriptor. New
+    directories created inside watched trees are watched as they appear.
+    """
+
+    def __init__(self, layout: WatchLayout, libc: ctypes.CDLL) -> None:
+        """Create an inotify source and register watches for ``layout``.
+
+        Args:
+            layout: Watched locations
+            libc: libc handle from _load_inotify()
+        """
+        self._layout = layout
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: dict[int, Path] = {}
+        for directory in watch_directories(layout):
+            self._add_watch(directory)
+
+    def _add_watch(self, directory: Path) -> None:
+        if len(self._watches) >= MAX_WATCHED_DIRS:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        # A negative descriptor means the directory vanished or the per-user
+        # watch limit was hit; its changes are then simply not reported.
+        if wd >= 0:
+            self._watches[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        return self._parse_events(os.read(self._fd, 64 * 1024))
+
+    def _parse_events(self, data: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + name_len].rstrip(b"\0"))
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                changed.add(self._layout.worktree_path)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                continue
+
+            path = directory / name if name else directory
+            changed.add(path)
+
+            if mask & _IN_CREATE and mask & _IN_ISDIR and path.name not in SKIPPED_DIR_NAMES:
+                for new_dir in _walk_directories(path, skipped=SKIPPED_DIR_NAMES):
+                    self._add_watch(new_dir)
+
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingChangeSource(ChangeSource):
+    """Change source that compares entry mtimes of the watched directories."""
+
+    def __init__(self, layout: WatchLayout, *, interval: float = POLL_INTERVAL_SECONDS) -> None:
+        """Create a polling source and take the initial scan.
+
+        Args:
+            layout: Watched locations
+            interval: Seconds between scans
+        """
+        self._layout = layout
+        self._interval = interval
+        self._entries = self._scan()
+
+    def _scan(self) -> dict[Path, int]:
+        entries: dict[Path, int] = {}
+        for directory in watch_directories(self._layout):
+            if not directory.is_dir():
+                continue
+            # Error boundary: the directory can be deleted between the check
+            # and the listing (e.g. a worktree subdirectory being removed).
+            try:
+                with os.scandir(directory) as listing:
+                    listed = list(listing)
+            except FileNotFoundError:
+                continue
+            entries.update(_entry_mtimes(listed))
+        return entries
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        delay = self._interval if timeout is None else min(self._interval, timeout)
+        time.sleep(delay)
+
+        entries = self._scan()
+        changed = {
+            path
+            for path in entries.keys() | self._entries.keys()
+            if entries.get(path) != self._entries.get(path)
+        }
+        self._entries = entries
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def _entry_mtimes(entries: list[os.DirEntry[str]]) -> dict[Path, int]:
+    """Return the mtime of each listed entry, skipping entries deleted since listing.
+
+    The git dir is polled, and index.lock and *.lock refs appear and vanish
+    there on every git command, so a listed entry is often gone by the time
+    it is stat'ed.
+    """
+    mtimes: dict[Path, int] = {}
+    for entry in entries:
+        # Error boundary: whether the entry still exists is only known by
+        # stat'ing it; checking first would race the same way.
+        try:
+            mtimes[Path(entry.path)] = entry.stat(follow_symlinks=False).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+
+def create_change_source(layout: WatchLayout) -> ChangeSource:
+    """Create the best available change source: inotify, else polling."""
+    libc = _load_inotify()
+    if libc is None:
+        return PollingChangeSource(layout)
+    return InotifyChangeSource(layout, libc)
+
+
+class IncrementalScreen:
+    """Redraws a full-screen text view by rewriting only changed lines."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Create a screen writing ANSI sequences to ``stream``."""
+        self._stream = stream
+        self._lines: list[str] | None = None
+
+    def draw(self, text: str) -> None:
+        """Display ``text``, touching only the lines that differ from the last draw."""
+        lines = text.splitlines()
+        out: list[str] = []
+
+        if self._lines is None:
+            out.append("\x1b[2J\x1b[H")
+            out.append("\n".join(lines))
+        else:
+            for idx, line in enumerate(lines):
+                if idx >= len(self._lines) or self._lines[idx] != line:
+                    out.append(f"\x1b[{idx + 1};1H{line}\x1b[K")
+            if len(lines) < len(self._lines):
+                out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+
+        self._lines = lines
+        if out:
+            self._stream.write("".join(out))
+            self._stream.flush()
+
+
+def render_status_text(status: StatusData, *, color: bool) -> str:
+    """Render status with SimpleRenderer into a string."""
+    buffer = io.StringIO()
+    SimpleRenderer(file=buffer, color=color).render(status)
+    return buffer.getvalue()
+
+
+def watch_status(
+    ctx: WorkstackContext,
+    orchestrator: StatusOrchestrator,
+    layout: WatchLayout,
+    repo_root: Path,
+    source: ChangeSource,
+    screen: IncrementalScreen,
+    render: Callable[[StatusData], str],
+) -> None:
+    """Collect status once, then refresh affected sections as files change.
+
+    Returns when the change source is exhausted; in practice the user
+    interrupts it.
+
+    Args:
+        ctx: Workstack context with operations
+        orchestrator: Orchestrator holding all collectors
+        layout: Watched locations
+        repo_root: Repository root path
+        source: Change notifications
+        screen: Output screen
+        render: Turns StatusData into display text
+    """
+    status = orchestrator.collect_status(ctx, layout.worktree_path, repo_root)
+    screen.draw(render(status))
+    next_pr_refresh = time.monotonic() + PR_REFRESH_SECONDS
+
+    while True:
+        changed = source.wait(max(0.0, next_pr_refresh - time.monotonic()))
+        if changed is None:
+            return
+        names = classify_changes(changed, layout)
+
+        # Coalesce the rest of a burst into the same refresh
+        if changed:
+            deadline = time.monotonic() + COALESCE_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                more = source.wait(remaining)
+                if more is None:
+                    break
+                names |= classify_changes(more, layout)
+
+        if time.monotonic() >= next_pr_refresh:
+            names.add("pr")
+            next_pr_refresh = time.monotonic() + PR_REFRESH_SECONDS
+
+        if not names:
+            continue
+
+        status = orchestrator.refresh_status(ctx, status, layout.worktree_path, repo_root, names)
+        screen.draw(render(status))
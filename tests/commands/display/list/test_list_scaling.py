@@ -0,0 +1,137 @@
+"""Scaling benchmark for `workstack list --stacks`.
+
+Runs the listing at 10, 100 and 500 worktrees and checks that the per-run
+work shared between entries (reading the Graphite cache, asking git for the
+common dir or current branch, fetching PRs) happens a constant number of
+times rather than once per worktree. Wall time per size is visible with
+`pytest --durations=0`.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tests.commands.display.list import strip_ansi
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from workstack.cli.cli import cli
+from workstack.core.context import WorkstackContext
+from workstack.core.github_ops import PullRequestInfo
+from workstack.core.gitops import GitOps, WorktreeInfo
+
+
+class CountingGitOps(FakeGitOps):
+    """FakeGitOps that counts the per-worktree queries listing used to make."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.current_branch_calls = 0
+        self.common_dir_calls = 0
+
+    def get_current_branch(self, cwd: Path) -> str | None:
+        self.current_branch_calls += 1
+        return super().get_current_branch(cwd)
+
+    def get_git_common_dir(self, cwd: Path) -> Path | None:
+        self.common_dir_calls += 1
+        return super().get_git_common_dir(cwd)
+
+
+class CountingGraphiteOps(FakeGraphiteOps):
+    """FakeGraphiteOps that counts PR map fetches."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.pr_fetches = 0
+
+    def get_prs_from_graphite(self, git_ops: GitOps, repo_root: Path) -> dict[str, PullRequestInfo]:
+        self.pr_fetches += 1
+        return super().get_prs_from_graphite(git_ops, repo_root)
+
+
+def _build_scenario(
+    root: Path, count: int
+) -> tuple[WorkstackContext, CountingGitOps, CountingGraphiteOps]:
+    """Create `count` worktrees, each on the middle branch of a three-branch stack."""
+    git_dir = root / ".git"
+    git_dir.mkdir()
+    workstacks_root = root / "workstacks"
+    workstacks_dir = workstacks_root / root.name
+
+    trunk_children = [f"stack-{i}/a" for i in range(count)]
+    branches: list[list[object]] = [
+        ["main", {"validationResult": "TRUNK", "children": trunk_children}]
+    ]
+    worktrees = [WorktreeInfo(path=root, branch="main")]
+    prs: dict[str, PullRequestInfo] = {}
+    for i in range(count):
+        a, b, c = f"stack-{i}/a", f"stack-{i}/b", f"stack-{i}/c"
+        branches.append([a, {"parentBranchName": "main", "children": [b]}])
+        branches.append([b, {"parentBranchName": a, "children": [c]}])
+        branches.append([c, {"parentBranchName": b, "children": []}])
+
+        wt_path = workstacks_dir / f"wt-{i:04d}"
+        wt_path.mkdir(parents=True)
+        worktrees.append(WorktreeInfo(path=wt_path, branch=b))
+        prs[b] = PullRequestInfo(
+            number=i + 1,
+            state="OPEN",
+            url=f"https://github.com/owner/repo/pull/{i + 1}",
+            is_draft=False,
+            checks_passing=True,
+            owner="owner",
+            repo="repo",
+        )
+
+    (git_dir / ".graphite_cache_persist").write_text(
+        json.dumps({"branches": branches}), encoding="utf-8"
+    )
+
+    git_ops = CountingGitOps(
+        worktrees={root: worktrees},
+        git_common_dirs={root: git_dir},
+        current_branches={wt.path: wt.branch for wt in worktrees},
+    )
+    graphite_ops = CountingGraphiteOps(pr_info=prs)
+    ctx = WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=workstacks_root, use_graphite=True, show_pr_info=True
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=graphite_ops,
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+    return ctx, git_ops, graphite_ops
+
+
+@pytest.mark.parametrize("count", [10, 100, 500])
+def test_list_stacks_shared_work_is_constant(count: int) -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, git_ops, graphite_ops = _build_scenario(Path.cwd(), count)
+
+        start = time.perf_counter()
+        result = runner.invoke(cli, ["list", "--stacks"], obj=ctx)
+        elapsed = time.perf_counter() - start
+
+        assert result.exit_code == 0, result.output
+        output = strip_ansi(result.output)
+        assert output.count("◉  stack-") == count
+        assert f"◉  stack-{count - 1}/b" in output
+
+        # Shared inputs are fetched once per run, not once per worktree
+        assert git_ops.current_branch_calls <= 1
+        assert git_ops.common_dir_calls <= 2
+        assert graphite_ops.pr_fetches == 1
+
+        # Generous ceiling: catches a return to quadratic behaviour at 500
+        # worktrees without being sensitive to machine speed
+        assert elapsed < 0.02 * count + 2.0
@@ -287,13 +287,14 @@ def test_list_with_stacks_highlights_current_branch_not_worktree_branch() -> Non
         temporal_stack_dir.mkdir(parents=True)
 
         # Build fake git ops
-        # Key setup: The worktree is registered with ts-phase-4,
-        # but currently checked out to ts-phase-3
+        # Key setup: The worktree's stack runs up to ts-phase-4, but the worktree
+        # is checked out on ts-phase-3. `git worktree list` reads each worktree's
+        # HEAD, so the listed branch is the checked-out branch.
         git_ops = FakeGitOps(
             worktrees={
                 cwd: [
                     WorktreeInfo(path=cwd, branch="main"),
-                    WorktreeInfo(path=temporal_stack_dir, branch="schrockn/ts-phase-4"),
+                    WorktreeInfo(path=temporal_stack_dir, branch="schrockn/ts-phase-3"),
                 ],
             },
             git_common_dirs={
@@ -330,7 +331,7 @@ def test_list_with_stacks_highlights_current_branch_not_worktree_branch() -> Non
         output = strip_ansi(result.output)
 
         # The stack visualization should highlight ts-phase-3 (actual current branch)
-        # NOT ts-phase-4 (the worktree's registered branch from git worktree list)
+        # NOT ts-phase-4 (the tip of the stack)
         lines = output.splitlines()
 
         # Find the stack visualization lines
@@ -351,7 +352,7 @@ def test_list_with_stacks_highlights_current_branch_not_worktree_branch() -> Non
         # ts-phase-4 should NOT be highlighted
         assert phase_4_line is None, (
             "ts-phase-4 should NOT be highlighted with ◉ "
-            "because it's only the registered branch, not the actual checked-out branch. "
+            "because it's only the stack tip, not the actual checked-out branch. "
             f"Output:\n{output}"
         )
 
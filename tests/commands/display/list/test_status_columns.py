@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tests.commands.display.list import strip_ansi
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from workstack.cli.cli import cli
+from workstack.core.context import WorkstackContext
+from workstack.core.gitops import WorktreeInfo
+
+
+def _status_context(cwd: Path, *, use_graphite: bool) -> WorkstackContext:
+    workstacks_root = cwd / "workstacks"
+    git_dir = cwd / ".git"
+    git_dir.mkdir()
+    graphite_cache = {
+        "branches": [
+            ["main", {"validationResult": "TRUNK", "children": ["feat"]}],
+            ["feat", {"parentBranchName": "main", "children": ["feat-2"]}],
+            ["feat-2", {"parentBranchName": "feat", "children": []}],
+        ]
+    }
+    (git_dir / ".graphite_cache_persist").write_text(json.dumps(graphite_cache))
+
+    workstacks_dir = workstacks_root / cwd.name
+    feat = workstacks_dir / "feat"
+    feat_2 = workstacks_dir / "feat-2"
+    feat.mkdir(parents=True)
+    feat_2.mkdir(parents=True)
+
+    git_ops = FakeGitOps(
+        worktrees={
+            cwd: [
+                WorktreeInfo(path=cwd, branch="main"),
+                WorktreeInfo(path=feat, branch="feat"),
+                WorktreeInfo(path=feat_2, branch="feat-2"),
+            ],
+        },
+        git_common_dirs={cwd: git_dir},
+        upstream_ahead_behind={"main": (0, 0), "feat": (2, 0)},
+        base_ahead_behind={("main", "feat"): (3, 1), ("feat", "feat-2"): (0, 0)},
+        dirty_worktrees={feat_2},
+    )
+    return WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=workstacks_root, use_graphite=use_graphite, show_pr_info=False
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=FakeGraphiteOps(),
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+
+
+def test_list_status_shows_dirty_and_ahead_behind() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx = _status_context(Path.cwd(), use_graphite=True)
+
+        result = runner.invoke(cli, ["list", "--status"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        lines = strip_ansi(result.output).splitlines()
+        root_line = next(line for line in lines if line.startswith("root "))
+        feat_line = next(line for line in lines if line.startswith("feat "))
+        feat_2_line = next(line for line in lines if line.startswith("feat-2 "))
+
+        # Clean and in sync: nothing appended
+        assert root_line.endswith("← (cwd)")
+        assert feat_line.endswith("⇡2 ↑3 ↓1 vs main")
+        assert feat_2_line.endswith("*")
+
+
+def test_list_status_without_graphite_omits_parent_counts() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx = _status_context(Path.cwd(), use_graphite=False)
+
+        result = runner.invoke(cli, ["list", "--status"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        output = strip_ansi(result.output)
+        assert "⇡2" in output
+        assert "vs main" not in output
+
+
+def test_list_without_status_has_no_columns() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx = _status_context(Path.cwd(), use_graphite=True)
+
+        result = runner.invoke(cli, ["list"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        output = strip_ansi(result.output)
+        assert "⇡" not in output
+        assert "*" not in output
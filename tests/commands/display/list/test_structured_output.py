@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from workstack.cli.cli import cli
+from workstack.core.context import WorkstackContext
+from workstack.core.github_ops import PullRequestInfo
+from workstack.core.gitops import WorktreeInfo
+
+
+def _structured_context(cwd: Path) -> WorkstackContext:
+    workstacks_root = cwd / "workstacks"
+    git_dir = cwd / ".git"
+    git_dir.mkdir()
+    graphite_cache = {
+        "branches": [
+            ["main", {"validationResult": "TRUNK", "children": ["feat"]}],
+            ["feat", {"parentBranchName": "main", "children": ["feat-2"]}],
+            ["feat-2", {"parentBranchName": "feat", "children": []}],
+        ]
+    }
+    (git_dir / ".graphite_cache_persist").write_text(json.dumps(graphite_cache))
+
+    workstacks_dir = workstacks_root / cwd.name
+    feat = workstacks_dir / "feat"
+    feat.mkdir(parents=True)
+    (feat / ".PLAN.md").write_text("---\ntitle: meta\n---\n# Build feat\n", encoding="utf-8")
+
+    pr = PullRequestInfo(
+        number=7,
+        state="OPEN",
+        url="https://github.com/owner/repo/pull/7",
+        is_draft=False,
+        checks_passing=True,
+        owner="owner",
+        repo="repo",
+    )
+    return WorkstackContext(
+        git_ops=FakeGitOps(
+            worktrees={
+                cwd: [
+                    WorktreeInfo(path=cwd, branch="main"),
+                    WorktreeInfo(path=feat, branch="feat"),
+                ],
+            },
+            git_common_dirs={cwd: git_dir},
+        ),
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=workstacks_root, use_graphite=True, show_pr_info=True
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=FakeGraphiteOps(pr_info={"feat": pr}),
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+
+
+def test_list_ndjson_emits_one_record_per_worktree() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx = _structured_context(Path.cwd())
+
+        result = runner.invoke(cli, ["list", "--format", "ndjson"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        assert "\x1b" not in result.output
+        root, feat = [json.loads(line) for line in result.output.splitlines()]
+
+        assert root["name"] == "root"
+        assert root["is_root"] is True
+        assert root["is_current"] is True
+        assert root["stack"] == ["main"]
+        assert root["pr"] is None
+
+        assert feat["name"] == "feat"
+        assert feat["branch"] == "feat"
+        assert feat["is_current"] is False
+        assert feat["stack"] == ["main", "feat"]
+        assert feat["pr"]["number"] == 7
+        assert feat["pr"]["state"] == "OPEN"
+        assert feat["plan_title"] == "Build feat"
+        assert "status" not in feat
+
+
+def test_list_json_is_a_single_array_and_includes_status() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx = _structured_context(Path.cwd())
+
+        result = runner.invoke(cli, ["list", "--format", "json", "--status"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        records = json.loads(result.output)
+        assert [record["name"] for record in records] == ["root", "feat"]
+        assert records[1]["status"]["dirty"] is False
+        assert records[1]["status"]["parent"] == "main"
@@ -0,0 +1,151 @@
+"""CLI tests for workstack prompt command."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tests.fakes.context import create_test_context
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from tests.test_utils.builders import PullRequestInfoBuilder
+from workstack.cli.commands.prompt import prompt_cmd
+from workstack.cli.prompt import parse_prompt_args, refresh_command, render_prompt, run_fast_path
+
+
+def _make_worktree(tmp_path: Path, branch: str) -> tuple[Path, Path]:
+    """Create a repository with one linked worktree checked out on ``branch``."""
+    repo = tmp_path / "repo"
+    (repo / ".git" / "refs" / "heads").mkdir(parents=True)
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+
+    worktree = tmp_path / "workstacks" / "feature"
+    worktree.mkdir(parents=True)
+    git_dir = repo / ".git" / "worktrees" / "feature"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    (git_dir / "commondir").write_text("../..\n", encoding="utf-8")
+    (worktree / ".git").write_text(f"gitdir: {git_dir}\n", encoding="utf-8")
+    return repo, worktree
+
+
+def test_prompt_refresh_writes_snapshot_used_by_render(tmp_path: Path) -> None:
+    repo, worktree = _make_worktree(tmp_path, "feat-b")
+    git_ops = FakeGitOps(
+        current_branches={worktree: "feat-b"},
+        git_common_dirs={worktree: repo / ".git", repo: repo / ".git"},
+    )
+    graphite_ops = FakeGraphiteOps(
+        stacks={"feat-b": ["main", "feat-a", "feat-b"]},
+        pr_info={"feat-b": PullRequestInfoBuilder(42, "feat-b").with_passing_checks().build()},
+    )
+    ctx = create_test_context(
+        git_ops=git_ops,
+        graphite_ops=graphite_ops,
+        global_config_ops=FakeGlobalConfigOps(use_graphite=True, show_pr_info=True),
+    )
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(worktree)
+    try:
+        result = runner.invoke(prompt_cmd, ["--refresh"], obj=ctx, catch_exceptions=False)
+        segment, stale_location = render_prompt(os.getcwd(), "{worktree}:{branch}{stack}{pr}")
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    assert segment == "feature:feat-b [2/2] #42✅"
+    assert stale_location is None
+    assert not (repo / ".git" / "worktrees" / "feature" / "workstack-prompt.refreshing").exists()
+
+
+def test_prompt_stale_snapshot_still_renders_branch(tmp_path: Path) -> None:
+    repo, worktree = _make_worktree(tmp_path, "feat-b")
+
+    segment, stale_location = render_prompt(str(worktree), "{worktree}:{branch}{stack}{pr}")
+
+    assert segment == "feature:feat-b"
+    assert stale_location == (str(worktree), str(repo / ".git" / "worktrees" / "feature"))
+
+
+def test_prompt_spawns_refresh_through_shell_ops(tmp_path: Path) -> None:
+    repo, worktree = _make_worktree(tmp_path, "feat-b")
+    shell_ops = FakeShellOps()
+    ctx = create_test_context(shell_ops=shell_ops)
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(worktree)
+    try:
+        first = runner.invoke(prompt_cmd, [], obj=ctx, catch_exceptions=False)
+        # The in-flight marker keeps the next prompt from starting another one
+        second = runner.invoke(prompt_cmd, [], obj=ctx, catch_exceptions=False)
+    finally:
+        os.chdir(original_dir)
+
+    assert first.output == second.output == "feature:feat-b\n"
+    assert shell_ops.detached_commands == [refresh_command()]
+    assert shell_ops.detached_cwds == [worktree]
+
+
+def test_prompt_rejects_invalid_format(tmp_path: Path) -> None:
+    _, worktree = _make_worktree(tmp_path, "feat-b")
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(worktree)
+    try:
+        unknown = runner.invoke(prompt_cmd, ["--format", "{foo}"], obj=create_test_context())
+        unbalanced = runner.invoke(prompt_cmd, ["--format", "{branch"], obj=create_test_context())
+        # The fast path leaves the error to the click command
+        handled = run_fast_path(["--format", "{foo}"])
+    finally:
+        os.chdir(original_dir)
+
+    assert unknown.exit_code == 1
+    assert "Invalid --format: unknown field {foo}" in unknown.output
+    assert unbalanced.exit_code == 1
+    assert "Invalid --format" in unbalanced.output
+    assert handled is False
+
+
+def test_prompt_outside_repository_prints_nothing(tmp_path: Path) -> None:
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = runner.invoke(
+            prompt_cmd, ["--no-refresh"], obj=create_test_context(), catch_exceptions=False
+        )
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_parse_prompt_args_defers_unknown_flags_to_click() -> None:
+    assert parse_prompt_args(["--format", "{branch}", "--no-refresh"]) == ("{branch}", False)
+    assert parse_prompt_args(["--format={pr}"]) == ("{pr}", True)
+    assert parse_prompt_args(["--help"]) is None
+    assert parse_prompt_args(["--refresh"]) is None
+
+
+def test_prompt_fast_path_does_not_import_click(tmp_path: Path) -> None:
+    code = (
+        "import sys\n"
+        "from workstack.cli.prompt import run_fast_path\n"
+        "run_fast_path(['--no-refresh'])\n"
+        "heavy = [m for m in ('click', 'pathlib', 'json', 'workstack.core.gitops')"
+        " if m in sys.modules]\n"
+        "print('heavy=' + ','.join(heavy))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "heavy="
@@ -571,3 +571,128 @@ def test_tree_command_shows_three_level_hierarchy_with_correct_indentation() ->
         # beginning
         assert "   └─ create-agents-symlinks-implementation-plan" in lines[2]
         assert "[@create-agents-symlinks-implementation-plan]" in lines[2]
+
+
+def test_tree_command_streams_ndjson_records_in_tree_order() -> None:
+    """--format ndjson writes one record per worktree, parents before children."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root = cwd / "repo"
+        repo_root.mkdir()
+        git_dir = repo_root / ".git"
+        git_dir.mkdir()
+
+        cache_data = {
+            "branches": [
+                ["main", {"validationResult": "TRUNK", "children": ["feature-a"]}],
+                ["feature-a", {"parentBranchName": "main", "children": ["feature-a-2"]}],
+                ["feature-a-2", {"parentBranchName": "feature-a", "children": []}],
+            ]
+        }
+        (git_dir / ".graphite_cache_persist").write_text(json.dumps(cache_data), encoding="utf-8")
+
+        feature_a_2 = repo_root / "work" / "feature-a-2"
+        feature_a_2.mkdir(parents=True)
+        (feature_a_2 / ".PLAN.md").write_text("# Second Step\n", encoding="utf-8")
+
+        git_ops = FakeGitOps(
+            worktrees={
+                repo_root: [
+                    WorktreeInfo(path=repo_root, branch="main"),
+                    WorktreeInfo(path=repo_root / "work" / "feature-a", branch="feature-a"),
+                    WorktreeInfo(path=feature_a_2, branch="feature-a-2"),
+                ]
+            },
+            git_common_dirs={repo_root: git_dir},
+        )
+        global_config_ops = FakeGlobalConfigOps(
+            workstacks_root=cwd / "workstacks", use_graphite=True, show_pr_info=False
+        )
+        ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+        os.chdir(repo_root)
+
+        result = runner.invoke(cli, ["tree", "--format", "ndjson"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [(r["branch"], r["parent"], r["depth"]) for r in records] == [
+            ("main", None, 0),
+            ("feature-a", "main", 1),
+            ("feature-a-2", "feature-a", 2),
+        ]
+        assert records[0]["name"] == "root"
+        assert records[0]["is_current"] is True
+        assert records[2]["path"] == str(feature_a_2)
+        assert records[2]["plan_title"] == "Second Step"
+        assert "\x1b" not in result.output
+
+
+def _write_three_level_repo(cwd: Path) -> tuple[Path, FakeGitOps]:
+    repo_root = cwd / "repo"
+    git_dir = repo_root / ".git"
+    git_dir.mkdir(parents=True)
+    cache_data = {
+        "branches": [
+            ["main", {"validationResult": "TRUNK", "children": ["a", "b"]}],
+            ["a", {"parentBranchName": "main", "children": ["a-2"]}],
+            ["a-2", {"parentBranchName": "a", "children": []}],
+            ["b", {"parentBranchName": "main", "children": []}],
+        ]
+    }
+    (git_dir / ".graphite_cache_persist").write_text(json.dumps(cache_data), encoding="utf-8")
+    git_ops = FakeGitOps(
+        worktrees={
+            repo_root: [
+                WorktreeInfo(path=repo_root, branch="main"),
+                WorktreeInfo(path=repo_root / "work" / "a", branch="a"),
+                WorktreeInfo(path=repo_root / "work" / "a-2", branch="a-2"),
+                WorktreeInfo(path=repo_root / "work" / "b", branch="b"),
+            ]
+        },
+        git_common_dirs={repo_root: git_dir},
+    )
+    return repo_root, git_ops
+
+
+def test_tree_command_root_and_depth_limit_output() -> None:
+    """--root shows one subtree; --depth cuts off deeper levels."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root, git_ops = _write_three_level_repo(cwd)
+        global_config_ops = FakeGlobalConfigOps(
+            workstacks_root=cwd / "workstacks", use_graphite=True
+        )
+        ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+        os.chdir(repo_root)
+
+        rooted = runner.invoke(cli, ["tree", "--root", "a"], obj=ctx)
+        shallow = runner.invoke(cli, ["tree", "--depth", "1"], obj=ctx)
+
+        assert rooted.exit_code == 0, rooted.output
+        rooted_lines = rooted.output.splitlines()
+        assert len(rooted_lines) == 2
+        assert rooted_lines[0].startswith("a ")
+        assert "a-2" in rooted_lines[1]
+
+        assert shallow.exit_code == 0, shallow.output
+        assert "a-2" not in shallow.output
+        assert len(shallow.output.splitlines()) == 3
+
+
+def test_tree_command_root_without_worktree_fails() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root, git_ops = _write_three_level_repo(cwd)
+        global_config_ops = FakeGlobalConfigOps(
+            workstacks_root=cwd / "workstacks", use_graphite=True
+        )
+        ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+        os.chdir(repo_root)
+
+        result = runner.invoke(cli, ["tree", "--root", "missing"], obj=ctx)
+
+        assert result.exit_code == 1
+        assert "Branch 'missing' has no worktree" in result.output
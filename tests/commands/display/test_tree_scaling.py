@@ -0,0 +1,83 @@
+"""Scaling benchmark for `workstack tree`.
+
+Builds a synthetic Graphite cache with 10,000 branches and 200 worktrees and
+checks that the tree is correct and built in time proportional to the
+worktrees' ancestor closure rather than the whole graph. Wall time is
+visible with `pytest --durations=0`.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tests.fakes.context import create_test_context
+from tests.fakes.gitops import FakeGitOps, WorktreeInfo
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from workstack.cli.cli import cli
+
+STACK_COUNT = 500
+STACK_HEIGHT = 20
+WORKTREE_COUNT = 200
+
+
+def _write_scenario(repo_root: Path) -> FakeGitOps:
+    """Create 500 stacks of 20 branches on main, with worktrees on 200 of them."""
+    git_dir = repo_root / ".git"
+    git_dir.mkdir(parents=True)
+
+    stack_bases = [f"s{i}-b0" for i in range(STACK_COUNT)]
+    branches: list[list[object]] = [
+        ["main", {"validationResult": "TRUNK", "children": stack_bases}]
+    ]
+    for i in range(STACK_COUNT):
+        for level in range(STACK_HEIGHT):
+            name = f"s{i}-b{level}"
+            parent = "main" if level == 0 else f"s{i}-b{level - 1}"
+            children = [] if level == STACK_HEIGHT - 1 else [f"s{i}-b{level + 1}"]
+            branches.append([name, {"parentBranchName": parent, "children": children}])
+    assert len(branches) == STACK_COUNT * STACK_HEIGHT + 1
+
+    (git_dir / ".graphite_cache_persist").write_text(
+        json.dumps({"branches": branches}), encoding="utf-8"
+    )
+
+    # Worktrees sit halfway up the first 200 stacks; the branches below them
+    # have no worktree and are skipped
+    worktrees = [WorktreeInfo(path=repo_root, branch="main")]
+    for i in range(WORKTREE_COUNT):
+        worktrees.append(WorktreeInfo(path=repo_root / "work" / f"wt-{i:03d}", branch=f"s{i}-b10"))
+    return FakeGitOps(worktrees={repo_root: worktrees}, git_common_dirs={repo_root: git_dir})
+
+
+def test_tree_with_10k_branches_and_200_worktrees() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root = cwd / "repo"
+        git_ops = _write_scenario(repo_root)
+        ctx = create_test_context(
+            git_ops=git_ops,
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=cwd / "workstacks", use_graphite=True
+            ),
+        )
+        os.chdir(repo_root)
+
+        start = time.perf_counter()
+        result = runner.invoke(cli, ["tree"], obj=ctx)
+        elapsed = time.perf_counter() - start
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert len(lines) == WORKTREE_COUNT + 1
+        assert lines[0].startswith("main")
+        # Every worktree attaches directly to main, in Graphite's order
+        assert "s0-b10" in lines[1]
+        assert "└─" in lines[-1] and f"s{WORKTREE_COUNT - 1}-b10" in lines[-1]
+
+        # Generous ceiling that still catches walking or rendering the whole
+        # graph per worktree
+        assert elapsed < 2.0
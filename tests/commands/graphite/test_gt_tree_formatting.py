@@ -9,6 +9,7 @@ from pathlib import Path
 from tests.fakes.gitops import FakeGitOps
 from workstack.cli.commands.gt import _format_branch_recursive, _format_branches_as_tree
 from workstack.core.branch_metadata import BranchMetadata
+from workstack.core.stack_health import BranchHealth
 
 
 def test_format_branches_as_tree_simple_hierarchy() -> None:
@@ -676,3 +677,29 @@ def test_format_branches_with_special_characters() -> None:
     assert "feature/test-123" in lines[0]
     assert "bug#456" in lines[1]
     assert "hotfix-@special" in lines[2]
+
+
+def test_format_branches_as_tree_with_stack_health() -> None:
+    """Precomputed health supplies subjects and ahead/restack annotations."""
+    branches = {
+        "main": BranchMetadata(
+            name="main", parent=None, children=["feat"], is_trunk=True, commit_sha="abc123456"
+        ),
+        "feat": BranchMetadata(
+            name="feat", parent="main", children=[], is_trunk=False, commit_sha="def456789"
+        ),
+    }
+    health = {
+        "main": BranchHealth(subject="Initial commit", commits_ahead=None, needs_restack=False),
+        "feat": BranchHealth(subject="Add feat", commits_ahead=2, needs_restack=True),
+    }
+
+    # No commit messages configured: subjects must come from the health map
+    tree = _format_branches_as_tree(
+        branches, FakeGitOps(), Path("/test/repo"), root_branch=None, health=health
+    )
+
+    assert tree.split("\n") == [
+        'main (abc1234) "Initial commit"',
+        '   └─ feat (def4567) "Add feat" [2 ahead, needs restack]',
+    ]
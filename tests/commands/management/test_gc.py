@@ -11,6 +11,7 @@ from tests.fakes.graphite_ops import FakeGraphiteOps
 from tests.fakes.shell_ops import FakeShellOps
 from workstack.cli.cli import cli
 from workstack.core.context import WorkstackContext
+from workstack.core.github_ops import PullRequestInfo
 from workstack.core.gitops import WorktreeInfo
 
 
@@ -301,6 +302,7 @@ def test_gc_displays_deletion_suggestions() -> None:
 
         assert result.exit_code == 0, result.output
         assert "workstack rm old-feature" in result.output
+        assert "Remove all at once" not in result.output
 
 
 def test_gc_queries_pr_status_for_each_branch() -> None:
@@ -530,3 +532,148 @@ def test_gc_no_deletable_worktrees() -> None:
 
         assert result.exit_code == 0, result.output
         assert "No workstacks found that are safe to delete" in result.output
+
+
+def test_gc_suggests_single_bulk_removal() -> None:
+    """With several deletable worktrees, gc suggests removing them in one command."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+
+        workstacks_root = cwd / "workstacks"
+        workstacks_dir = workstacks_root / cwd.name
+        wt1 = workstacks_dir / "feature-1"
+        wt2 = workstacks_dir / "feature-2"
+        wt1.mkdir(parents=True)
+        wt2.mkdir()
+
+        test_ctx = WorkstackContext(
+            git_ops=FakeGitOps(
+                git_common_dirs={cwd: git_dir},
+                worktrees={
+                    cwd: [
+                        WorktreeInfo(path=cwd, branch="main"),
+                        WorktreeInfo(path=wt1, branch="feature-1"),
+                        WorktreeInfo(path=wt2, branch="feature-2"),
+                    ]
+                },
+            ),
+            global_config_ops=FakeGlobalConfigOps(exists=True, workstacks_root=workstacks_root),
+            github_ops=FakeGitHubOps(
+                pr_statuses={
+                    "feature-1": ("MERGED", 1, "Feature 1"),
+                    "feature-2": ("CLOSED", 2, "Feature 2"),
+                }
+            ),
+            graphite_ops=FakeGraphiteOps(),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        result = runner.invoke(cli, ["gc"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert "Remove all at once: workstack rm feature-1 feature-2" in result.output
+
+
+def _gc_context(
+    cwd: Path, git_ops: FakeGitOps, github_ops: FakeGitHubOps, graphite_ops: FakeGraphiteOps
+) -> WorkstackContext:
+    return WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            exists=True, workstacks_root=cwd / "workstacks", use_graphite=True
+        ),
+        github_ops=github_ops,
+        graphite_ops=graphite_ops,
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+
+
+def test_gc_detects_squash_merge_without_github() -> None:
+    """Branches squash-merged into trunk are found locally; GitHub is asked about the rest."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        workstacks_dir = cwd / "workstacks" / cwd.name
+        squashed = workstacks_dir / "squashed"
+        other = workstacks_dir / "other"
+        squashed.mkdir(parents=True)
+        other.mkdir()
+
+        # main: m0 <- m1 (squash of squashed: s1 <- s2 on m0); other: o1 on m0
+        git_ops = FakeGitOps(
+            git_common_dirs={cwd: git_dir},
+            worktrees={
+                cwd: [
+                    WorktreeInfo(path=cwd, branch="main"),
+                    WorktreeInfo(path=squashed, branch="squashed"),
+                    WorktreeInfo(path=other, branch="other"),
+                ]
+            },
+            branch_heads={"main": "m1", "squashed": "s2", "other": "o1"},
+            commit_parents={"m0": [], "m1": ["m0"], "s1": ["m0"], "s2": ["s1"], "o1": ["m0"]},
+            patch_ids={
+                ("m1", "m0"): "p-squash",
+                ("s1", "m0"): "p-s1",
+                ("s2", "s1"): "p-s2",
+                ("s2", "m0"): "p-squash",
+                ("o1", "m0"): "p-o",
+            },
+        )
+        github_ops = FakeGitHubOps(pr_statuses={"other": ("CLOSED", 9, "Other")})
+        ctx = _gc_context(cwd, git_ops, github_ops, FakeGraphiteOps())
+
+        result = runner.invoke(cli, ["gc"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        assert "detected locally: squash" in result.output
+        assert "PR #9" in result.output
+        assert "Checking PR status for squashed" not in result.output
+        assert "Checking PR status for other" in result.output
+
+
+def test_gc_uses_graphite_pr_cache() -> None:
+    """PR states cached by Graphite are used without asking GitHub."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        wt = cwd / "workstacks" / cwd.name / "feature-1"
+        wt.mkdir(parents=True)
+
+        git_ops = FakeGitOps(
+            git_common_dirs={cwd: git_dir},
+            worktrees={
+                cwd: [
+                    WorktreeInfo(path=cwd, branch="main"),
+                    WorktreeInfo(path=wt, branch="feature-1"),
+                ]
+            },
+        )
+        graphite_ops = FakeGraphiteOps(
+            pr_info={
+                "feature-1": PullRequestInfo(
+                    number=42,
+                    state="MERGED",
+                    url="https://github.com/owner/repo/pull/42",
+                    is_draft=False,
+                    checks_passing=None,
+                    owner="owner",
+                    repo="repo",
+                )
+            }
+        )
+        ctx = _gc_context(cwd, git_ops, FakeGitHubOps(), graphite_ops)
+
+        result = runner.invoke(cli, ["gc"], obj=ctx)
+
+        assert result.exit_code == 0, result.output
+        assert "PR #42" in result.output
+        assert "Checking PR status" not in result.output
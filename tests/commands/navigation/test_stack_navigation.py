@@ -0,0 +1,217 @@
+"""Tests for multi-level navigation: `up N`, `down N` and `stack top|bottom`."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tests.commands.navigation.test_switch_up_down import setup_graphite_stack
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from workstack.cli.cli import cli
+from workstack.core.context import WorkstackContext
+from workstack.core.gitops import WorktreeInfo
+
+INLINE_ENV = {"WORKSTACK_SCRIPT_HANDOFF": "stdout"}
+
+
+def _build_context(
+    cwd: Path, current_branch: str, *, without_worktree: tuple[str, ...] = ()
+) -> tuple[WorkstackContext, FakeGitOps, Path]:
+    """Stack main -> f1 -> f2 -> f3 -> f4, with f2 forking to f2-alt.
+
+    Every branch except those in ``without_worktree`` has a worktree of the
+    same name; main is checked out in the root repository.
+    """
+    workstacks_dir = cwd / "workstacks" / cwd.name
+    git_dir = cwd / ".git"
+    git_dir.mkdir()
+
+    setup_graphite_stack(
+        git_dir,
+        {
+            "main": {"parent": None, "children": ["f1"], "is_trunk": True},
+            "f1": {"parent": "main", "children": ["f2"]},
+            "f2": {"parent": "f1", "children": ["f3", "f2-alt"]},
+            "f2-alt": {"parent": "f2", "children": []},
+            "f3": {"parent": "f2", "children": ["f4"]},
+            "f4": {"parent": "f3", "children": []},
+        },
+    )
+
+    # Without a worktree for main, the root repository is in detached HEAD
+    root_branch = None if "main" in without_worktree else "main"
+    worktrees = [WorktreeInfo(path=cwd, branch=root_branch)]
+    for branch in ("f1", "f2", "f2-alt", "f3", "f4"):
+        if branch in without_worktree:
+            continue
+        (workstacks_dir / branch).mkdir(parents=True)
+        worktrees.append(WorktreeInfo(path=workstacks_dir / branch, branch=branch))
+
+    git_ops = FakeGitOps(
+        worktrees={cwd: worktrees},
+        current_branches={cwd: current_branch},
+        git_common_dirs={cwd: git_dir},
+        default_branches={cwd: "main"},
+    )
+    ctx = WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=cwd / "workstacks", use_graphite=True
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=FakeGraphiteOps(),
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+    return ctx, git_ops, workstacks_dir
+
+
+@pytest.mark.parametrize(
+    ("current", "args", "expected"),
+    [
+        ("f1", ["up", "3"], "f4"),
+        ("f4", ["down", "2"], "f2"),
+        ("f2", ["stack", "top"], "f4"),
+        ("f4", ["stack", "bottom"], "f1"),
+        ("main", ["stack", "bottom"], "f1"),
+    ],
+)
+def test_navigation_activates_target_worktree(current: str, args: list[str], expected: str) -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _git_ops, workstacks_dir = _build_context(Path.cwd(), current)
+
+        result = runner.invoke(cli, [*args, "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 0, result.stderr
+        assert f"cd {workstacks_dir / expected}" in result.stdout
+
+
+def test_down_to_trunk_activates_root_repo() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        ctx, _git_ops, _workstacks_dir = _build_context(cwd, "f3")
+
+        result = runner.invoke(cli, ["down", "3", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 0, result.stderr
+        assert "Switched to root repo" in result.stdout
+
+
+def test_up_notes_fork_on_the_way() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _git_ops, _workstacks_dir = _build_context(Path.cwd(), "f1")
+
+        result = runner.invoke(cli, ["up", "2", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 0, result.stderr
+        assert "Branch 'f2' has multiple children" in result.stderr
+
+
+@pytest.mark.parametrize(
+    ("current", "args", "message"),
+    [
+        ("f2", ["up", "3"], "Cannot move up 3 levels"),
+        ("f1", ["down", "2"], "Cannot move down 2 levels"),
+        ("f4", ["stack", "top"], "Already at the top of the stack"),
+        ("f1", ["stack", "bottom"], "Already at the bottom of the stack"),
+    ],
+)
+def test_navigation_out_of_range(current: str, args: list[str], message: str) -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _git_ops, _workstacks_dir = _build_context(Path.cwd(), current)
+
+        result = runner.invoke(cli, [*args, "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 1
+        assert message in result.stderr
+
+
+def test_up_rejects_zero_count() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _git_ops, _workstacks_dir = _build_context(Path.cwd(), "f1")
+
+        result = runner.invoke(cli, ["up", "0", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 2
+
+
+def test_target_without_worktree_suggests_checkout() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, git_ops, _workstacks_dir = _build_context(Path.cwd(), "f1", without_worktree=("f3",))
+
+        result = runner.invoke(cli, ["up", "2", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 1
+        assert "workstack create f3" in result.stderr
+        assert "--checkout" in result.stderr
+        assert git_ops.checked_out_branches == []
+
+
+def test_checkout_in_place_when_target_has_no_worktree() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, git_ops, workstacks_dir = _build_context(Path.cwd(), "f1", without_worktree=("f4",))
+
+        result = runner.invoke(
+            cli, ["stack", "top", "--checkout", "--script"], obj=ctx, env=INLINE_ENV
+        )
+
+        assert result.exit_code == 0, result.stderr
+        assert git_ops.checked_out_branches == [(workstacks_dir / "f1", "f4")]
+        assert f"cd {workstacks_dir / 'f1'}" in result.stdout
+
+
+def test_down_to_trunk_without_worktree_suggests_root() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _git_ops, _workstacks_dir = _build_context(
+            Path.cwd(), "f1", without_worktree=("main",)
+        )
+
+        result = runner.invoke(cli, ["down", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 1
+        assert "Branch 'main' is the parent branch but has no worktree" in result.stderr
+        assert "workstack switch root" in result.stderr
+        assert "workstack create main" not in result.stderr
+
+
+def test_down_from_untracked_trunk_is_at_bottom() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        # main is named as f1's parent but has no cache entry of its own
+        setup_graphite_stack(git_dir, {"f1": {"parent": "main", "children": []}})
+        ctx = WorkstackContext(
+            git_ops=FakeGitOps(
+                worktrees={cwd: [WorktreeInfo(path=cwd, branch="main")]},
+                current_branches={cwd: "main"},
+                git_common_dirs={cwd: git_dir},
+                default_branches={cwd: "main"},
+            ),
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=cwd / "workstacks", use_graphite=True
+            ),
+            github_ops=FakeGitHubOps(),
+            graphite_ops=FakeGraphiteOps(),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        result = runner.invoke(cli, ["down", "--script"], obj=ctx, env=INLINE_ENV)
+
+        assert result.exit_code == 1
+        assert "Already at the bottom of the stack (on trunk branch 'main')" in result.stderr
+        assert "not tracked" not in result.stderr
@@ -0,0 +1,203 @@
+"""Tests for workstack switch --fuzzy."""
+
+import io
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from tests.commands.navigation.test_switch_up_down import setup_graphite_stack
+from tests.fakes.github_ops import FakeGitHubOps
+from tests.fakes.gitops import FakeGitOps
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from tests.fakes.graphite_ops import FakeGraphiteOps
+from tests.fakes.shell_ops import FakeShellOps
+from tests.test_utils.builders import PullRequestInfoBuilder
+from workstack.cli.cli import cli
+from workstack.cli.core import RepoContext, refresh_completion_index
+from workstack.cli.fuzzy import find_fuzzy_matches
+from workstack.core.context import WorkstackContext
+from workstack.core.fuzzy_index import FUZZY_INDEX_FILENAME
+from workstack.core.gitops import WorktreeInfo
+
+INLINE_ENV = {"WORKSTACK_SCRIPT_HANDOFF": "stdout"}
+
+
+def _build_context(cwd: Path) -> tuple[WorkstackContext, Path]:
+    """Three worktrees: a login stack of two branches and a billing worktree with a plan."""
+    workstacks_dir = cwd / "workstacks" / cwd.name
+    git_dir = cwd / ".git"
+    git_dir.mkdir()
+    for name in ("login-api", "login-ui", "billing"):
+        (workstacks_dir / name).mkdir(parents=True)
+    (workstacks_dir / "billing" / ".PLAN.md").write_text(
+        "# Invoice export\n\nExport invoices as CSV.\n", encoding="utf-8"
+    )
+
+    setup_graphite_stack(
+        git_dir,
+        {
+            "main": {"parent": None, "children": ["auth/api", "billing"], "is_trunk": True},
+            "auth/api": {"parent": "main", "children": ["auth/ui"]},
+            "auth/ui": {"parent": "auth/api", "children": []},
+            "billing": {"parent": "main", "children": []},
+        },
+    )
+
+    git_ops = FakeGitOps(
+        worktrees={
+            cwd: [
+                WorktreeInfo(path=cwd, branch="main"),
+                WorktreeInfo(path=workstacks_dir / "login-api", branch="auth/api"),
+                WorktreeInfo(path=workstacks_dir / "login-ui", branch="auth/ui"),
+                WorktreeInfo(path=workstacks_dir / "billing", branch="billing"),
+            ]
+        },
+        git_common_dirs={cwd: git_dir},
+    )
+    ctx = WorkstackContext(
+        git_ops=git_ops,
+        global_config_ops=FakeGlobalConfigOps(
+            workstacks_root=cwd / "workstacks", use_graphite=True
+        ),
+        github_ops=FakeGitHubOps(),
+        graphite_ops=FakeGraphiteOps(
+            pr_info={"billing": PullRequestInfoBuilder(4321, "billing").build()}
+        ),
+        shell_ops=FakeShellOps(),
+        dry_run=False,
+    )
+    return ctx, workstacks_dir
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("login-ui", "login-ui"),
+        ("logn-ap", "login-api"),
+        ("invoice", "billing"),
+        ("#4321", "billing"),
+    ],
+)
+def test_switch_fuzzy_activates_best_match(query: str, expected: str) -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        ctx, workstacks_dir = _build_context(cwd)
+
+        result = runner.invoke(
+            cli, ["switch", "--fuzzy", query, "--script"], obj=ctx, env=INLINE_ENV
+        )
+
+        assert result.exit_code == 0, result.output
+        assert str(workstacks_dir / expected) in result.stdout
+        assert (cwd / ".git" / FUZZY_INDEX_FILENAME).exists()
+
+
+def test_switch_fuzzy_ambiguous_without_terminal_lists_candidates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("workstack.cli.fuzzy.open_terminal", lambda: None)
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _ = _build_context(Path.cwd())
+
+        result = runner.invoke(cli, ["switch", "--fuzzy", "login", "--script"], obj=ctx)
+
+        assert result.exit_code == 1
+        assert "matches several worktrees" in result.stderr
+        assert "login-api" in result.stderr
+        assert "login-ui" in result.stderr
+
+
+class _FakeTerminal(io.StringIO):
+    """Records what the picker writes and answers its prompt with ``answer``."""
+
+    def __init__(self, answer: str) -> None:
+        super().__init__()
+        self.answer = answer
+
+    def readline(self, size: int | None = -1) -> str:
+        return self.answer
+
+    def close(self) -> None:
+        self.transcript = self.getvalue()
+        super().close()
+
+
+def test_switch_fuzzy_picker_uses_terminal_choice(monkeypatch: pytest.MonkeyPatch) -> None:
+    terminal = _FakeTerminal("2\n")
+    monkeypatch.setattr("workstack.cli.fuzzy.open_terminal", lambda: terminal)
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, workstacks_dir = _build_context(Path.cwd())
+
+        result = runner.invoke(
+            cli, ["switch", "--fuzzy", "login", "--script"], obj=ctx, env=INLINE_ENV
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "1. login-api [auth/api]" in click.unstyle(terminal.transcript)
+        assert str(workstacks_dir / "login-ui") in result.stdout
+
+
+def test_switch_fuzzy_rejects_up_down() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        ctx, _ = _build_context(Path.cwd())
+
+        result = runner.invoke(cli, ["switch", "--fuzzy", "--up"], obj=ctx)
+
+        assert result.exit_code == 1
+        assert "Cannot use --fuzzy with --up or --down" in result.stderr
+
+
+def _matched_names(ctx: WorkstackContext, repo: RepoContext, query: str) -> list[str]:
+    return [match.document.name for match in find_fuzzy_matches(ctx, repo, query, limit=10)]
+
+
+def test_fuzzy_lookup_reuses_index_until_its_sources_change() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        ctx, workstacks_dir = _build_context(cwd)
+        repo = RepoContext(root=cwd, repo_name=cwd.name, workstacks_dir=workstacks_dir)
+        assert "login-ui" in _matched_names(ctx, repo, "login")
+
+        # login-ui is gone, but nothing the signature covers changed: the
+        # lookup searches the stored index without rebuilding it
+        without_ui = replace(
+            ctx,
+            git_ops=FakeGitOps(
+                worktrees={
+                    cwd: [
+                        WorktreeInfo(path=cwd, branch="main"),
+                        WorktreeInfo(path=workstacks_dir / "login-api", branch="auth/api"),
+                    ]
+                },
+                git_common_dirs={cwd: cwd / ".git"},
+            ),
+        )
+        assert "login-ui" in _matched_names(without_ui, repo, "login")
+
+        # A Graphite cache rewrite makes the next lookup rebuild it
+        cache_file = cwd / ".git" / ".graphite_cache_persist"
+        stat = cache_file.stat()
+        os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _matched_names(without_ui, repo, "login") == ["login-api"]
+
+
+def test_refresh_completion_index_updates_fuzzy_index() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        ctx, workstacks_dir = _build_context(cwd)
+        repo = RepoContext(root=cwd, repo_name=cwd.name, workstacks_dir=workstacks_dir)
+
+        refresh_completion_index(ctx, repo)
+
+        assert (cwd / ".git" / FUZZY_INDEX_FILENAME).exists()
+        assert _matched_names(ctx, repo, "invoice") == ["billing"]
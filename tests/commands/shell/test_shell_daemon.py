@@ -0,0 +1,144 @@
+"""Tests for the shell-integration daemon and its client."""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from workstack.cli.shell_integration import client, daemon
+from workstack.cli.shell_integration.handler import PASSTHROUGH_MARKER
+
+
+def _shell_request(cwd: Path, *args: str) -> dict:
+    return {
+        "op": "shell",
+        "args": list(args),
+        "cwd": str(cwd),
+        "env": dict(os.environ),
+        "executable": sys.executable,
+    }
+
+
+def test_client_marker_matches_handler() -> None:
+    assert client.PASSTHROUGH_MARKER == PASSTHROUGH_MARKER
+
+
+def test_handle_request_runs_handler_in_request_cwd(tmp_path: Path) -> None:
+    original_cwd = os.getcwd()
+    try:
+        reply = daemon.handle_request(_shell_request(tmp_path, "list"))
+    finally:
+        os.chdir(original_cwd)
+
+    assert reply == {"status": "ok", "passthrough": True, "script": None, "exit_code": 0}
+
+
+def test_handle_request_asks_for_fallback_without_running(tmp_path: Path) -> None:
+    missing = _shell_request(tmp_path / "gone", "switch", "x")
+    other_python = {**_shell_request(tmp_path, "switch", "x"), "executable": "/other/python"}
+
+    assert daemon.handle_request(missing) == {"status": "fallback"}
+    assert daemon.handle_request(other_python) == {"status": "restart"}
+    assert daemon.handle_request({"op": "nope"})["status"] == "error"
+
+
+def test_client_round_trip_through_socket(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(client.DAEMON_ENV_VAR, "1")
+    monkeypatch.chdir(tmp_path)
+    directory = client.runtime_dir()
+    assert client.ensure_private_dir(directory)
+
+    server = threading.Thread(target=daemon.serve, args=(directory,), kwargs={"idle_timeout": 10})
+    server.start()
+    try:
+        for _ in range(200):
+            if daemon.ping(directory) is not None:
+                break
+            threading.Event().wait(0.01)
+
+        assert daemon.ping(directory) is not None
+        # A second daemon for the same directory backs off immediately
+        assert daemon.serve(directory, idle_timeout=1) is False
+
+        monkeypatch.chdir(tmp_path)
+        assert client.run_fast_path(["list"]) == 0
+        assert capsys.readouterr().out == PASSTHROUGH_MARKER + "\n"
+    finally:
+        daemon.stop(directory)
+        server.join(timeout=10)
+        monkeypatch.chdir(tmp_path)
+
+    assert not server.is_alive()
+    assert not os.path.exists(os.path.join(directory, client.SOCKET_FILENAME))
+
+
+def test_client_falls_back_when_daemon_absent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(client.DAEMON_ENV_VAR, "1")
+    directory = client.runtime_dir()
+    assert client.ensure_private_dir(directory)
+    # A recent start attempt suppresses spawning another daemon
+    Path(directory, client.SPAWN_MARKER_FILENAME).write_text("1", encoding="utf-8")
+
+    assert client.run_fast_path(["switch", "x"]) is None
+
+
+def test_client_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(client.DAEMON_ENV_VAR, raising=False)
+
+    assert client.run_fast_path(["switch", "x"]) is None
+
+
+def test_client_runs_interactive_requests_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(client.DAEMON_ENV_VAR, "1")
+
+    assert client.run_fast_path(["switch", client.INTERACTIVE_FLAG, "x"]) is None
+    # Declined before looking for a daemon, so none was spawned
+    assert not Path(client.runtime_dir(), client.SPAWN_MARKER_FILENAME).exists()
+
+
+def test_client_runs_subprocess_commands_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(client.DAEMON_ENV_VAR, "1")
+
+    # post_create_commands and gt create must write to the caller's terminal
+    assert client.run_fast_path(["create", "feature"]) is None
+    assert not Path(client.runtime_dir(), client.SPAWN_MARKER_FILENAME).exists()
+    assert daemon.handle_request(_shell_request(tmp_path, "create", "feature")) == {
+        "status": "fallback"
+    }
+
+
+def test_handle_request_reports_failure_without_rerun(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(args: tuple[str, ...]) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(daemon, "handle_shell_request", fail)
+    original_cwd = os.getcwd()
+    try:
+        reply = daemon.handle_request(_shell_request(tmp_path, "switch", "x"))
+    finally:
+        os.chdir(original_cwd)
+
+    # The command may have partly run, so the client must not run it again
+    assert reply == {
+        "status": "ok",
+        "passthrough": False,
+        "script": None,
+        "exit_code": 1,
+        "message": "workstack: switch failed: boom",
+    }
@@ -121,3 +121,18 @@ def test_shell_integration_fish_escapes_special_characters(tmp_path: Path) -> No
         assert 'command workstack "sync" "\\$branch\\;rm" "\\(test\\)"' in content
     finally:
         script_path.unlink(missing_ok=True)
+
+
+def test_shell_integration_sync_inline_handoff_writes_no_file() -> None:
+    """Wrappers that read stdout get the passthrough script inline."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["__shell", "sync"],
+        env={"WORKSTACK_SHELL": "bash", "WORKSTACK_SCRIPT_HANDOFF": "stdout"},
+    )
+    assert result.exit_code == 0
+    sentinel, _, content = result.stdout.partition("\n")
+    assert sentinel == "__WORKSTACK_SCRIPT__"
+    assert "command workstack sync" in content
+    assert "__workstack_exit=$?" in content
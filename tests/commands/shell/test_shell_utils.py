@@ -1,11 +1,20 @@
 """Tests for shell_utils module."""
 
 import os
-import tempfile
 import time
 from pathlib import Path
 
-from workstack.cli.shell_utils import cleanup_stale_scripts, write_script_to_temp
+import pytest
+
+from workstack.cli.shell_utils import (
+    CLEANUP_MARKER_FILENAME,
+    INLINE_SCRIPT_SENTINEL,
+    SCRIPT_HANDOFF_ENV_VAR,
+    cleanup_stale_scripts,
+    script_dir,
+    script_handoff,
+    write_script_to_temp,
+)
 
 
 def test_write_script_to_temp() -> None:
@@ -21,8 +30,9 @@ def test_write_script_to_temp() -> None:
     # File should exist
     assert temp_path.exists()
 
-    # Should be in temp directory
-    assert temp_path.parent == Path(tempfile.gettempdir())
+    # Should be in the per-user private script directory
+    assert temp_path.parent == script_dir()
+    assert temp_path.stat().st_mode & 0o077 == 0
 
     # Should have correct pattern
     assert temp_path.name.startswith("workstack-test-")
@@ -42,7 +52,7 @@ def test_write_script_to_temp() -> None:
 def test_cleanup_stale_scripts() -> None:
     """Test that old scripts are removed."""
     # Create an old script
-    old_script = Path(tempfile.gettempdir()) / "workstack-old-12345678.sh"
+    old_script = script_dir() / "workstack-old-12345678.sh"
     old_script.write_text("# old script\n")
 
     # Set mtime to 2 hours ago
@@ -50,11 +60,11 @@ def test_cleanup_stale_scripts() -> None:
     os.utime(old_script, (two_hours_ago, two_hours_ago))
 
     # Create a new script
-    new_script = Path(tempfile.gettempdir()) / "workstack-new-87654321.sh"
+    new_script = script_dir() / "workstack-new-87654321.sh"
     new_script.write_text("# new script\n")
 
     # Cleanup scripts older than 1 hour
-    cleanup_stale_scripts(max_age_seconds=3600)
+    cleanup_stale_scripts(max_age_seconds=3600, scan_interval_seconds=0)
 
     # Old should be gone, new should remain
     assert not old_script.exists()
@@ -62,3 +72,47 @@ def test_cleanup_stale_scripts() -> None:
 
     # Cleanup
     new_script.unlink(missing_ok=True)
+
+
+def test_cleanup_stale_scripts_scans_rarely(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A recent scan leaves the directory alone until the interval has passed."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    cleanup_stale_scripts(scan_interval_seconds=0)
+    assert (script_dir() / CLEANUP_MARKER_FILENAME).exists()
+
+    old_script = script_dir() / "workstack-old-12345678.sh"
+    old_script.write_text("# old script\n")
+    two_hours_ago = time.time() - 7200
+    os.utime(old_script, (two_hours_ago, two_hours_ago))
+
+    cleanup_stale_scripts(max_age_seconds=3600, scan_interval_seconds=3600)
+    assert old_script.exists()
+
+    cleanup_stale_scripts(max_age_seconds=3600, scan_interval_seconds=0)
+    assert not old_script.exists()
+
+
+def test_script_handoff_inline_writes_no_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With the stdout handoff the script is returned after a sentinel line."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(SCRIPT_HANDOFF_ENV_VAR, "stdout")
+
+    handoff = script_handoff("cd /foo\n", command_name="switch")
+
+    assert handoff == f"{INLINE_SCRIPT_SENTINEL}\ncd /foo\n"
+    assert list(script_dir().glob("*.sh")) == []
+
+
+def test_script_handoff_defaults_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without the stdout handoff the script path is returned."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv(SCRIPT_HANDOFF_ENV_VAR, raising=False)
+
+    handoff = Path(script_handoff("cd /foo\n", command_name="switch"))
+
+    assert handoff.parent == script_dir()
+    assert handoff.read_text().endswith("cd /foo\n")
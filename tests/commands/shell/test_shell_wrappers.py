@@ -22,6 +22,10 @@ case "$cmd" in
   "__shell")
     shell="${WORKSTACK_SHELL:-bash}"
     script_path="$WORKSTACK_TEST_SCRIPT"
+    if [ -n "$WORKSTACK_TEST_INLINE" ] && [ "$WORKSTACK_SCRIPT_HANDOFF" = "stdout" ]; then
+      script_path=/dev/stdout
+      echo "__WORKSTACK_SCRIPT__"
+    fi
     mkdir -p "$(dirname "$script_path")"
     if [ "$shell" = "fish" ]; then
       cat <<'FISH' >"$script_path"
@@ -42,6 +46,7 @@ fi
 return $__workstack_exit
 POSIX
     fi
+    [ "$script_path" = /dev/stdout ] && exit 0
     chmod +x "$script_path"
     printf %s "$script_path"
     exit 0
@@ -132,14 +137,25 @@ def _prepare_environment(tmp_path: Path) -> tuple[Path, Path, Path, dict[str, st
         ),
     ],
 )
+@pytest.mark.parametrize("inline", [False, True], ids=["file", "inline"])
 def test_shell_wrapper_recovers_deleted_directory(
-    shell: str, wrapper_name: str, command_template: str, extra_args: list[str], tmp_path: Path
+    shell: str,
+    wrapper_name: str,
+    command_template: str,
+    extra_args: list[str],
+    inline: bool,
+    tmp_path: Path,
 ) -> None:
-    """Each shell wrapper should recover when the worktree directory vanishes."""
+    """Each shell wrapper should recover when the worktree directory vanishes.
+
+    Covers both the file handoff and the inline (sentinel on stdout) handoff.
+    """
     if shutil.which(shell) is None:
         pytest.skip(f"{shell} is not available on this system")
 
     repo_root, worktree, passthrough_script, env = _prepare_environment(tmp_path)
+    if inline:
+        env["WORKSTACK_TEST_INLINE"] = "1"
     wrapper_path = WRAPPER_DIR / wrapper_name
 
     command = command_template.format(wrapper=wrapper_path)
@@ -162,5 +178,6 @@ def test_shell_wrapper_recovers_deleted_directory(
     assert stdout_lines[-2] == str(repo_root)
     assert stdout_lines[-1] == "EXIT:19"
 
-    # The recovery script should be cleaned up when not needed anymore
+    # The recovery script should be cleaned up when not needed anymore (and
+    # is never written in inline mode)
     assert not passthrough_script.exists()
@@ -2,7 +2,9 @@
 
 import os
 import subprocess
+import threading
 from pathlib import Path
+from typing import Any
 
 from click.testing import CliRunner
 
@@ -14,9 +16,11 @@ from tests.fakes.shell_ops import FakeShellOps
 from workstack.cli.cli import cli
 from workstack.cli.commands.shell_integration import hidden_shell_cmd
 from workstack.cli.commands.sync import sync_cmd
+from workstack.cli.core import GRAPHITE_SCOPE
 from workstack.cli.shell_utils import render_cd_script
 from workstack.core.context import WorkstackContext
 from workstack.core.gitops import WorktreeInfo
+from workstack.core.repo_lock import file_lock, repo_lock_path
 
 
 def test_sync_requires_graphite() -> None:
@@ -1064,3 +1068,176 @@ def test_sync_force_no_deletable_single_sync() -> None:
         # No cleanup message
         assert "Deleting merged branches..." not in result.output
         assert "No workstacks to clean up." in result.output
+
+
+def test_sync_removes_merged_worktrees_in_one_batch() -> None:
+    """All merged worktrees are removed together, with a single prune."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        workstacks_dir = workstacks_root / cwd.name
+        (cwd / ".git").mkdir()
+
+        wts = [workstacks_dir / f"feature-{i}" for i in range(1, 4)]
+        for wt in wts:
+            wt.mkdir(parents=True)
+
+        git_ops = FakeGitOps(
+            git_common_dirs={cwd: cwd / ".git"},
+            worktrees={
+                cwd: [
+                    WorktreeInfo(path=cwd, branch="main"),
+                    *(WorktreeInfo(path=wt, branch=wt.name) for wt in wts),
+                ],
+            },
+        )
+        test_ctx = WorkstackContext(
+            git_ops=git_ops,
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=workstacks_root, use_graphite=True
+            ),
+            graphite_ops=FakeGraphiteOps(),
+            github_ops=FakeGitHubOps(
+                pr_statuses={wt.name: ("MERGED", i, wt.name) for i, wt in enumerate(wts, 1)}
+            ),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        result = runner.invoke(cli, ["sync", "-f"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert git_ops.prune_count == 1
+        assert not any(wt.exists() for wt in wts)
+        assert [wt.path for wt in git_ops.list_worktrees(cwd)] == [cwd]
+
+
+class _BlockingGraphiteOps(FakeGraphiteOps):
+    """gt sync that waits until a PR lookup has started."""
+
+    def __init__(self, lookup_started: threading.Event) -> None:
+        super().__init__()
+        self._lookup_started = lookup_started
+        self.overlapped = False
+
+    def sync(self, repo_root: Path, *, force: bool) -> None:
+        super().sync(repo_root, force=force)
+        if not self.overlapped:
+            self.overlapped = self._lookup_started.wait(5)
+
+
+class _SignalingGitHubOps(FakeGitHubOps):
+    """PR lookups that signal when they start."""
+
+    def __init__(self, lookup_started: threading.Event, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._lookup_started = lookup_started
+
+    def get_pr_status(
+        self, repo_root: Path, branch: str, *, debug: bool
+    ) -> tuple[str, int | None, str | None]:
+        self._lookup_started.set()
+        return super().get_pr_status(repo_root, branch, debug=debug)
+
+
+def test_sync_looks_up_prs_while_gt_sync_runs() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        wt = workstacks_root / cwd.name / "feature-1"
+        wt.mkdir(parents=True)
+        (cwd / ".git").mkdir()
+
+        lookup_started = threading.Event()
+        graphite_ops = _BlockingGraphiteOps(lookup_started)
+        test_ctx = WorkstackContext(
+            git_ops=FakeGitOps(
+                git_common_dirs={cwd: cwd / ".git"},
+                worktrees={
+                    cwd: [
+                        WorktreeInfo(path=cwd, branch="main"),
+                        WorktreeInfo(path=wt, branch="feature-1"),
+                    ]
+                },
+            ),
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=workstacks_root, use_graphite=True
+            ),
+            graphite_ops=graphite_ops,
+            github_ops=_SignalingGitHubOps(
+                lookup_started, pr_statuses={"feature-1": ("MERGED", 1, "Feature 1")}
+            ),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        result = runner.invoke(cli, ["sync", "-f", "--timings"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert graphite_ops.overlapped
+        assert not wt.exists()
+        assert "Timings:" in result.output
+        for phase in ("gt sync", "plan cleanup", "remove worktrees", "gt sync -f", "total"):
+            assert f"  {phase}: " in result.output
+
+
+def _run_sync_while_graphite_locked(args: list[str]) -> tuple[Any, FakeGraphiteOps]:
+    """Run sync while another process (a holder thread) has the Graphite lock."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        graphite_ops = FakeGraphiteOps()
+        test_ctx = WorkstackContext(
+            git_ops=FakeGitOps(
+                git_common_dirs={cwd: git_dir},
+                worktrees={cwd: [WorktreeInfo(path=cwd, branch="main")]},
+            ),
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=cwd / "workstacks", use_graphite=True
+            ),
+            graphite_ops=graphite_ops,
+            github_ops=FakeGitHubOps(),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold() -> None:
+            with file_lock(repo_lock_path(git_dir, GRAPHITE_SCOPE), shared=False):
+                acquired.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        assert acquired.wait(5)
+        try:
+            result = runner.invoke(
+                cli, ["sync", *args], obj=test_ctx, env={"WORKSTACK_LOCK_TIMEOUT": "0.1"}
+            )
+        finally:
+            release.set()
+            holder.join(5)
+        return result, graphite_ops
+
+
+def test_interactive_gt_sync_runs_without_graphite_lock() -> None:
+    """gt sync without -f may prompt, so it must not hold the lock meanwhile."""
+    result, graphite_ops = _run_sync_while_graphite_locked([])
+
+    assert result.exit_code == 0, result.output
+    assert "Waiting for another workstack process" not in result.stderr
+    assert len(graphite_ops.sync_calls) == 1
+
+
+def test_forced_gt_sync_takes_graphite_lock() -> None:
+    result, graphite_ops = _run_sync_while_graphite_locked(["-f"])
+
+    assert result.exit_code == 1
+    assert "Waiting for another workstack process" in result.stderr
+    assert graphite_ops.sync_calls == []
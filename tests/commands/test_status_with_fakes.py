@@ -16,6 +16,7 @@ The business logic of these collectors is tested in their respective unit test f
 This file trusts that unit layer and only tests CLI integration.
 """
 
+import json
 import os
 from pathlib import Path
 
@@ -149,6 +150,77 @@ def test_status_cmd_displays_all_collector_sections(tmp_path: Path) -> None:
     assert "Plan:" in result.output or "Feature Plan" in result.output  # Plan section
 
 
+def _pr_scenario(tmp_path: Path) -> WorktreeScenario:
+    return (
+        WorktreeScenario(tmp_path)
+        .with_main_branch()
+        .with_feature_branch("feature")
+        .with_pr("feature", number=123, checks_passing=True)
+        .build()
+    )
+
+
+def test_status_cmd_json_includes_sections_and_collector_runs(tmp_path: Path) -> None:
+    """JSON output covers every StatusData section plus per-collector run records."""
+    scenario = _pr_scenario(tmp_path)
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(scenario.workstacks_dir / "feature")
+
+    try:
+        result = runner.invoke(
+            status_cmd, ["--format", "json", "--no-cache"], obj=scenario.ctx, catch_exceptions=False
+        )
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["worktree_info"]["name"] == "feature"
+    assert data["git_status"]["branch"] == "feature"
+    assert data["pr_status"]["number"] == 123
+    assert "related_worktrees" in data
+    runs = {run["name"]: run for run in data["collector_runs"]}
+    assert runs["git"]["timed_out"] is False
+    assert runs["git"]["failed"] is False
+    assert runs["git"]["duration_ms"] >= 0
+
+
+def test_status_cmd_fast_skips_network_collectors(tmp_path: Path) -> None:
+    """--fast drops the PR collector, which may call the GitHub API."""
+    scenario = _pr_scenario(tmp_path)
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(scenario.workstacks_dir / "feature")
+
+    try:
+        result = runner.invoke(
+            status_cmd,
+            ["--format", "json", "--fast", "--no-cache"],
+            obj=scenario.ctx,
+            catch_exceptions=False,
+        )
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["pr_status"] is None
+    assert "pr" not in {run["name"] for run in data["collector_runs"]}
+
+
+def test_status_cmd_rejects_watch_with_json(tmp_path: Path) -> None:
+    """Watch mode only renders text."""
+    runner = CliRunner()
+
+    result = runner.invoke(status_cmd, ["--watch", "--format", "json"], obj=create_test_context())
+
+    assert result.exit_code == 1
+    assert "--watch can only be used with --format text" in result.output
+
+
 def test_status_cmd_not_in_git_repo(tmp_path: Path) -> None:
     """Test status command fails when not in a git repository (error handling)."""
     # Arrange
@@ -177,3 +249,27 @@ def test_status_cmd_not_in_git_repo(tmp_path: Path) -> None:
 
     # Assert - CLI error handling
     assert result.exit_code != 0
+
+
+def test_status_cmd_json_redacts_env_values(tmp_path: Path) -> None:
+    """.env values may be secrets: JSON output keeps only the variable names."""
+    scenario = _pr_scenario(tmp_path)
+    worktree = scenario.workstacks_dir / "feature"
+    (worktree / ".env").write_text("API_TOKEN=s3cr3t-value\nDB_URL=postgres://u:pw@h/db\n")
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(worktree)
+
+    try:
+        result = runner.invoke(
+            status_cmd, ["--format", "json", "--no-cache"], obj=scenario.ctx, catch_exceptions=False
+        )
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    assert "s3cr3t-value" not in result.output
+    assert "postgres://" not in result.output
+    data = json.loads(result.output)
+    assert sorted(data["environment"]["variables"]) == ["API_TOKEN", "DB_URL"]
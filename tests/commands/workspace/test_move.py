@@ -1,5 +1,6 @@
 """Tests for the workstack move command."""
 
+import subprocess
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -710,3 +711,165 @@ def test_move_error_source_is_root_target_is_root() -> None:
 
         assert result.exit_code == 1
         assert "Source and target worktrees are the same" in result.output
+
+
+def test_move_swap_by_directory_keeps_files_with_branches() -> None:
+    """Swapping by directory trades the worktrees instead of checking out branches."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root = cwd
+        workstacks_root = cwd / "workstacks"
+        workstacks_dir = workstacks_root / repo_root.name
+        (repo_root / ".git").mkdir()
+
+        source_wt = workstacks_dir / "wt1"
+        source_wt.mkdir(parents=True)
+        (source_wt / "build.out").write_text("branch-a build", encoding="utf-8")
+        target_wt = workstacks_dir / "wt2"
+        target_wt.mkdir(parents=True)
+        (target_wt / "build.out").write_text("branch-b build", encoding="utf-8")
+
+        git_ops = FakeGitOps(
+            worktrees={
+                repo_root: [
+                    WorktreeInfo(path=repo_root, branch="main"),
+                    WorktreeInfo(path=source_wt, branch="branch-a"),
+                    WorktreeInfo(path=target_wt, branch="branch-b"),
+                ],
+            },
+            git_common_dirs={cwd: repo_root / ".git"},
+            default_branches={repo_root: "main"},
+        )
+        global_config_ops = FakeGlobalConfigOps(workstacks_root=workstacks_root)
+        test_ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+
+        result = runner.invoke(
+            cli,
+            ["move", "--worktree", "wt1", "wt2", "--force", "--swap-by", "directory"],
+            obj=test_ctx,
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "✓ Swapped 'branch-a' ↔ 'branch-b'" in result.output
+        assert git_ops.checked_out_branches == []
+        branches = {wt.path: wt.branch for wt in git_ops.list_worktrees(repo_root)}
+        assert branches[source_wt] == "branch-b"
+        assert branches[target_wt] == "branch-a"
+        assert (source_wt / "build.out").read_text(encoding="utf-8") == "branch-b build"
+        assert (target_wt / "build.out").read_text(encoding="utf-8") == "branch-a build"
+        source_env = (source_wt / ".env").read_text(encoding="utf-8")
+        assert f'WORKTREE_PATH="{source_wt}"' in source_env
+        assert 'WORKTREE_NAME="wt2"' in (target_wt / ".env").read_text(encoding="utf-8")
+        assert not list(workstacks_dir.glob(".*"))
+
+
+def test_move_swap_by_directory_with_root_checks_out() -> None:
+    """The root worktree cannot be moved, so the swap falls back to checkouts."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        repo_root = cwd
+        workstacks_root = cwd / "workstacks"
+        (repo_root / ".git").mkdir()
+        source_wt = workstacks_root / repo_root.name / "wt1"
+        source_wt.mkdir(parents=True)
+
+        git_ops = FakeGitOps(
+            worktrees={
+                repo_root: [
+                    WorktreeInfo(path=repo_root, branch="main"),
+                    WorktreeInfo(path=source_wt, branch="branch-a"),
+                ],
+            },
+            git_common_dirs={cwd: repo_root / ".git"},
+            default_branches={repo_root: "main"},
+        )
+        global_config_ops = FakeGlobalConfigOps(workstacks_root=workstacks_root)
+        test_ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+
+        result = runner.invoke(
+            cli,
+            ["move", "--worktree", "wt1", "root", "--force", "--swap-by", "directory"],
+            obj=test_ctx,
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "root worktree cannot be moved; swapping by checkout instead" in result.output
+        assert git_ops.checked_out_branches == [(repo_root, "branch-a"), (source_wt, "main")]
+        assert source_wt.exists()
+
+
+def _invoke_swap_by_directory(git_ops_class: type[FakeGitOps] = FakeGitOps):
+    """Swap wt1 (branch-a) and wt2 (branch-b) by directory; both have a .venv.
+
+    Returns:
+        The command result and the two worktree paths
+    """
+    runner = CliRunner()
+    cwd = Path.cwd()
+    repo_root = cwd
+    workstacks_root = cwd / "workstacks"
+    (repo_root / ".git").mkdir()
+    worktrees = []
+    for name in ("wt1", "wt2"):
+        wt = workstacks_root / repo_root.name / name
+        (wt / ".venv").mkdir(parents=True)
+        (wt / ".venv" / "created-in").write_text(name, encoding="utf-8")
+        worktrees.append(wt)
+
+    git_ops = git_ops_class(
+        worktrees={
+            repo_root: [
+                WorktreeInfo(path=repo_root, branch="main"),
+                WorktreeInfo(path=worktrees[0], branch="branch-a"),
+                WorktreeInfo(path=worktrees[1], branch="branch-b"),
+            ],
+        },
+        git_common_dirs={cwd: repo_root / ".git"},
+        default_branches={repo_root: "main"},
+    )
+    global_config_ops = FakeGlobalConfigOps(workstacks_root=workstacks_root)
+    test_ctx = create_test_context(git_ops=git_ops, global_config_ops=global_config_ops)
+
+    result = runner.invoke(
+        cli,
+        ["move", "--worktree", "wt1", "wt2", "--force", "--swap-by", "directory"],
+        obj=test_ctx,
+    )
+    return result, worktrees[0], worktrees[1]
+
+
+def test_move_swap_by_directory_keeps_venvs_in_place() -> None:
+    """A .venv records absolute paths, so it stays in the directory it was created for."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result, source_wt, target_wt = _invoke_swap_by_directory()
+
+        assert result.exit_code == 0, result.output
+        assert "Kept each .venv in place" in result.output
+        assert (source_wt / ".venv" / "created-in").read_text(encoding="utf-8") == "wt1"
+        assert (target_wt / ".venv" / "created-in").read_text(encoding="utf-8") == "wt2"
+        assert not list(source_wt.glob(".venv.*"))
+
+
+class _FailingMoveGitOps(FakeGitOps):
+    """Fake whose git worktree move fails when moving into wt2."""
+
+    def move_worktree(self, repo_root: Path, old_path: Path, new_path: Path) -> None:
+        if new_path.name == "wt2":
+            raise subprocess.CalledProcessError(128, ["git", "worktree", "move"])
+        super().move_worktree(repo_root, old_path, new_path)
+
+
+def test_move_swap_by_directory_reports_failed_rollback() -> None:
+    """If undoing a failed swap fails too, the user is told where each directory is."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result, source_wt, target_wt = _invoke_swap_by_directory(_FailingMoveGitOps)
+
+        assert result.exit_code == 1
+        assert "Undoing the swap failed too" in result.output
+        assert f"wt1: {source_wt.with_name('.wt1.swapping')}" in result.output
+        assert f"wt2: {source_wt}" in result.output
+        assert "Traceback" not in result.output
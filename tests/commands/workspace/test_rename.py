@@ -13,6 +13,7 @@ from tests.fakes.global_config_ops import FakeGlobalConfigOps
 from tests.fakes.graphite_ops import FakeGraphiteOps
 from tests.fakes.shell_ops import FakeShellOps
 from workstack.cli.cli import cli
+from workstack.core.completion_index import WORKTREES, lookup_candidates, read_completion_index
 from workstack.core.context import WorkstackContext
 from workstack.core.gitops import DryRunGitOps
 
@@ -157,3 +158,21 @@ def test_rename_dry_run() -> None:
 
         assert result.exit_code == 0
         assert "Would rename" in result.output or "DRY RUN" in result.output
+
+
+def test_rename_refreshes_completion_index() -> None:
+    """Test rename rewrites the index read by the shell completion fast path."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        (cwd / ".git").mkdir()
+        (workstacks_root / cwd.name / "old-name").mkdir(parents=True)
+
+        test_ctx = _create_test_context(cwd, workstacks_root)
+        result = runner.invoke(cli, ["rename", "old-name", "new-name"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        index = read_completion_index(str(cwd / ".git"))
+        assert index is not None
+        assert lookup_candidates(index, str(cwd / ".git"), WORKTREES, "") == ["root", "new-name"]
@@ -4,6 +4,7 @@ This file tests the rm command which removes a worktree workspace.
 """
 
 import json
+import threading
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -14,8 +15,11 @@ from tests.fakes.global_config_ops import FakeGlobalConfigOps
 from tests.fakes.graphite_ops import FakeGraphiteOps
 from tests.fakes.shell_ops import FakeShellOps
 from workstack.cli.cli import cli
+from workstack.cli.core import WORKTREES_SCOPE
 from workstack.core.context import WorkstackContext
 from workstack.core.gitops import DryRunGitOps, WorktreeInfo
+from workstack.core.repo_lock import file_lock, repo_lock_path
+from workstack.core.trash import reaper_command
 
 
 def _create_test_context(
@@ -108,8 +112,8 @@ def test_rm_dry_run_does_not_delete() -> None:
 
         assert result.exit_code == 0, result.output
         assert "[DRY RUN]" in result.output
-        assert "Would run: git worktree remove" in result.output
-        assert "Would delete directory" in result.output
+        assert "Would move to trash" in result.output
+        assert "Would run: git worktree prune" in result.output
         assert wt.exists()  # Directory should still exist
         assert (wt / "file.txt").exists()
 
@@ -160,7 +164,8 @@ def test_rm_dry_run_with_delete_stack() -> None:
 
         assert result.exit_code == 0, result.output
         assert "[DRY RUN]" in result.output
-        assert "Would run: gt delete" in result.output
+        assert "Would run: git branch -D feature-1 feature-2" in result.output
+        assert "Would delete Graphite metadata of: feature-1, feature-2" in result.output
         assert len(fake_git_ops.deleted_branches) == 0  # No actual deletion
         assert wt.exists()
 
@@ -227,3 +232,282 @@ def test_rm_rejects_root_name() -> None:
         assert result.exit_code == 1
         assert "Error: Cannot remove 'root'" in result.output
         assert "root worktree name not allowed" in result.output
+
+
+def test_rm_removes_several_worktrees_and_prunes_once() -> None:
+    """Removing several worktrees reports each one and prunes git metadata once."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        (cwd / ".git").mkdir()
+
+        wts = [workstacks_root / cwd.name / name for name in ("a", "b", "c")]
+        for wt in wts:
+            wt.mkdir(parents=True)
+            (wt / "file.txt").write_text("content", encoding="utf-8")
+
+        git_ops = FakeGitOps(git_common_dirs={cwd: cwd / ".git"})
+        test_ctx = WorkstackContext(
+            git_ops=git_ops,
+            global_config_ops=FakeGlobalConfigOps(workstacks_root=workstacks_root),
+            github_ops=FakeGitHubOps(),
+            graphite_ops=FakeGraphiteOps(),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+        result = runner.invoke(cli, ["rm", "a", "b", "c", "-f"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert git_ops.prune_count == 1
+        for wt in wts:
+            assert not wt.exists()
+            assert f"✅ {wt}" in result.stdout
+
+
+def test_rm_removes_nothing_when_any_name_is_missing() -> None:
+    """All names are checked before the first worktree is removed."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        (cwd / ".git").mkdir()
+
+        wt = workstacks_root / cwd.name / "present"
+        wt.mkdir(parents=True)
+
+        test_ctx = _create_test_context(cwd, workstacks_root)
+        result = runner.invoke(cli, ["rm", "present", "absent", "-f"], obj=test_ctx)
+
+        assert result.exit_code == 1
+        assert f"Worktree not found: {workstacks_root / cwd.name / 'absent'}" in result.output
+        assert wt.exists()
+
+
+def test_rm_gives_up_when_another_process_holds_worktrees_lock() -> None:
+    """A removal waits for the worktrees lock and fails cleanly after the timeout."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        wt = workstacks_root / cwd.name / "foo"
+        wt.mkdir(parents=True)
+
+        # flock conflicts between threads, so a holder thread stands in for
+        # another workstack process
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold() -> None:
+            with file_lock(repo_lock_path(git_dir, WORKTREES_SCOPE), shared=False):
+                acquired.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        assert acquired.wait(5)
+        try:
+            test_ctx = _create_test_context(cwd, workstacks_root)
+            result = runner.invoke(
+                cli, ["rm", "foo", "-f"], obj=test_ctx, env={"WORKSTACK_LOCK_TIMEOUT": "0.1"}
+            )
+        finally:
+            release.set()
+            holder.join(5)
+
+        assert result.exit_code == 1
+        assert "Waiting for another workstack process" in result.stderr
+        assert "WORKSTACK_LOCK_TIMEOUT" in result.stderr
+        assert wt.exists()
+
+
+def test_rm_moves_worktree_to_trash() -> None:
+    """The worktree is renamed into the repository's trash and git metadata pruned."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        workstacks_dir = workstacks_root / cwd.name
+        (cwd / ".git").mkdir()
+        wt = workstacks_dir / "foo"
+        wt.mkdir(parents=True)
+
+        git_ops = FakeGitOps(
+            git_common_dirs={cwd: cwd / ".git"},
+            worktrees={
+                cwd: [WorktreeInfo(path=cwd, branch="main"), WorktreeInfo(path=wt, branch="foo")]
+            },
+        )
+        shell_ops = FakeShellOps()
+        test_ctx = WorkstackContext(
+            git_ops=git_ops,
+            global_config_ops=FakeGlobalConfigOps(workstacks_root=workstacks_root),
+            github_ops=FakeGitHubOps(),
+            graphite_ops=FakeGraphiteOps(),
+            shell_ops=shell_ops,
+            dry_run=False,
+        )
+        result = runner.invoke(cli, ["rm", "foo", "-f"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert not wt.exists()
+        trash_dir = workstacks_dir / ".trash"
+        assert [entry.name.endswith("-foo") for entry in trash_dir.iterdir()] == [True]
+        assert shell_ops.detached_commands == [reaper_command(trash_dir)]
+        assert git_ops.removed_worktrees == []
+        assert [info.path for info in git_ops.list_worktrees(cwd)] == [cwd]
+
+
+def test_rm_rejects_trash_directory() -> None:
+    """The trash cannot be removed as if it were a worktree."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        (cwd / ".git").mkdir()
+        trash = workstacks_root / cwd.name / ".trash"
+        trash.mkdir(parents=True)
+
+        test_ctx = _create_test_context(cwd, workstacks_root)
+        result = runner.invoke(cli, ["rm", ".trash", "-f"], obj=test_ctx)
+
+        assert result.exit_code == 1
+        assert "holds worktrees being deleted" in result.stderr
+        assert trash.exists()
+
+
+def _run_rm_delete_stack(
+    cache_branches: list[list[object]],
+    *,
+    git_ops_class: type[FakeGitOps] = FakeGitOps,
+    branch_heads: dict[str, str] | None = None,
+    merged_branches: dict[str, set[str]] | None = None,
+    force: bool = True,
+) -> tuple[FakeGitOps, str, list[list[object]]]:
+    """Run `rm -s` on a worktree of feature-2 with the given Graphite cache.
+
+    Without force, the confirmation prompt is answered with yes.
+
+    Returns:
+        The git ops, the command output and the Graphite cache branches afterwards
+    """
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cwd = Path.cwd()
+        workstacks_root = cwd / "workstacks"
+        git_dir = cwd / ".git"
+        git_dir.mkdir()
+        cache_file = git_dir / ".graphite_cache_persist"
+        cache_file.write_text(json.dumps({"branches": cache_branches}), encoding="utf-8")
+        wt = workstacks_root / cwd.name / "stack"
+        wt.mkdir(parents=True)
+
+        git_ops = git_ops_class(
+            worktrees={cwd: [WorktreeInfo(path=wt, branch="feature-2")]},
+            git_common_dirs={cwd: git_dir},
+            branch_heads=branch_heads,
+            merged_branches=merged_branches,
+        )
+        test_ctx = WorkstackContext(
+            git_ops=git_ops,
+            global_config_ops=FakeGlobalConfigOps(
+                workstacks_root=workstacks_root, use_graphite=True
+            ),
+            github_ops=FakeGitHubOps(),
+            graphite_ops=FakeGraphiteOps(),
+            shell_ops=FakeShellOps(),
+            dry_run=False,
+        )
+
+        args = ["rm", "stack", "-s", *(["-f"] if force else [])]
+        result = runner.invoke(cli, args, obj=test_ctx, input=None if force else "y\n")
+
+        assert result.exit_code == 0, result.output
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        return git_ops, result.output, cache["branches"]
+
+
+def test_rm_delete_stack_deletes_branches_in_one_batch() -> None:
+    git_ops, _, _ = _run_rm_delete_stack(
+        [
+            ["main", {"validationResult": "TRUNK", "children": ["feature-1"]}],
+            ["feature-1", {"parentBranchName": "main", "children": ["feature-2"]}],
+            ["feature-2", {"parentBranchName": "feature-1", "children": ["feature-3"]}],
+            ["feature-3", {"parentBranchName": "feature-2", "children": []}],
+        ]
+    )
+
+    assert git_ops.branch_deletion_batches == [["feature-1", "feature-2", "feature-3"]]
+    assert git_ops.deleted_branches == ["feature-1", "feature-2", "feature-3"]
+
+
+def test_rm_delete_stack_uses_gt_delete_for_branches_with_kept_children() -> None:
+    """feature-1 also has feature-alt, which stays and must be moved onto main."""
+    git_ops, _, _ = _run_rm_delete_stack(
+        [
+            ["main", {"validationResult": "TRUNK", "children": ["feature-1"]}],
+            [
+                "feature-1",
+                {"parentBranchName": "main", "children": ["feature-2", "feature-alt"]},
+            ],
+            ["feature-2", {"parentBranchName": "feature-1", "children": []}],
+            ["feature-alt", {"parentBranchName": "feature-1", "children": []}],
+        ]
+    )
+
+    assert git_ops.branch_deletion_batches == [["feature-2"]]
+    assert git_ops.deleted_branches == ["feature-2", "feature-1"]
+
+
+STACK_CACHE: list[list[object]] = [
+    ["main", {"validationResult": "TRUNK", "children": ["feature-1"]}],
+    ["feature-1", {"parentBranchName": "main", "children": ["feature-2"]}],
+    ["feature-2", {"parentBranchName": "feature-1", "children": []}],
+]
+
+
+def test_rm_delete_stack_prunes_batch_deleted_branches_from_cache() -> None:
+    """Branches deleted without gt must not stay navigable through the cache."""
+    _, _, cache = _run_rm_delete_stack(STACK_CACHE)
+
+    assert cache == [["main", {"validationResult": "TRUNK", "children": []}]]
+
+
+def test_rm_delete_stack_without_force_uses_gt_delete_for_unmerged_branch() -> None:
+    """An unmerged branch may be kept, so its merged parent must not be batch-deleted."""
+    git_ops, _, _ = _run_rm_delete_stack(
+        STACK_CACHE, merged_branches={"main": {"main", "feature-1"}}, force=False
+    )
+
+    assert git_ops.branch_deletion_batches == []
+    assert git_ops.deleted_branches == ["feature-2", "feature-1"]
+
+
+def test_rm_delete_stack_without_force_batches_merged_branches() -> None:
+    git_ops, _, _ = _run_rm_delete_stack(
+        STACK_CACHE, merged_branches={"main": {"main", "feature-1", "feature-2"}}, force=False
+    )
+
+    assert git_ops.branch_deletion_batches == [["feature-1", "feature-2"]]
+
+
+class _DecliningGitOps(FakeGitOps):
+    """Fake whose gt delete is declined by the user for feature-2."""
+
+    def delete_branch_with_graphite(self, repo_root: Path, branch: str, *, force: bool) -> None:
+        if branch != "feature-2":
+            super().delete_branch_with_graphite(repo_root, branch, force=force)
+
+
+def test_rm_delete_stack_reports_only_deleted_branches() -> None:
+    _, output, _ = _run_rm_delete_stack(
+        STACK_CACHE,
+        git_ops_class=_DecliningGitOps,
+        branch_heads={"main": "m", "feature-1": "a", "feature-2": "b"},
+        force=False,
+    )
+
+    assert "Deleted branch: feature-1" in output
+    assert "Deleted branch: feature-2" not in output
@@ -0,0 +1,122 @@
+"""Tests for local merged-branch detection."""
+
+from pathlib import Path
+
+from tests.fakes.gitops import FakeGitOps
+from workstack.core.merge_detection import (
+    MERGED_BY_ANCESTRY,
+    MERGED_BY_PATCH,
+    MERGED_BY_SQUASH,
+    collect_merged_branches,
+)
+
+# main: m0 <- m1 <- m2 (merges merged@a1) <- m3 (squash of squashed) <- m4 (rebased r1)
+# fresh:    m1, never worked on              -> undecided
+# merged:   a1 on m0, merged with a merge commit -> ancestry
+# rebased:  r1 on m0, same patch as m4       -> patch
+# squashed: s1 <- s2 on m0, diff equals m3   -> squash
+# open:     o1 on m0                         -> not merged
+GRAPH = {
+    "m0": [],
+    "m1": ["m0"],
+    "a1": ["m0"],
+    "m2": ["m1", "a1"],
+    "m3": ["m2"],
+    "m4": ["m3"],
+    "r1": ["m0"],
+    "s1": ["m0"],
+    "s2": ["s1"],
+    "o1": ["m0"],
+}
+HEADS = {
+    "main": "m4",
+    "fresh": "m1",
+    "merged": "a1",
+    "rebased": "r1",
+    "squashed": "s2",
+    "open": "o1",
+}
+PATCH_IDS = {
+    ("m1", "m0"): "p-m1",
+    ("a1", "m0"): "p-a1",
+    ("m3", "m2"): "p-squash",
+    ("m4", "m3"): "p-rebased",
+    ("r1", "m0"): "p-rebased",
+    ("s1", "m0"): "p-s1",
+    ("s2", "s1"): "p-s2",
+    ("s2", "m0"): "p-squash",
+    ("o1", "m0"): "p-open",
+}
+
+
+def _git_ops(heads: dict[str, str]) -> FakeGitOps:
+    return FakeGitOps(branch_heads=heads, commit_parents=GRAPH, patch_ids=PATCH_IDS)
+
+
+def test_detects_each_kind_of_merge() -> None:
+    merged = collect_merged_branches(_git_ops(HEADS), Path("/repo"), list(HEADS))
+
+    assert merged == {
+        "merged": MERGED_BY_ANCESTRY,
+        "rebased": MERGED_BY_PATCH,
+        "squashed": MERGED_BY_SQUASH,
+    }
+
+
+def test_branch_partially_on_trunk_is_not_merged() -> None:
+    heads = {**HEADS, "partial": "p2"}
+    git_ops = FakeGitOps(
+        branch_heads=heads,
+        commit_parents={**GRAPH, "p1": ["m0"], "p2": ["p1"]},
+        patch_ids={**PATCH_IDS, ("p1", "m0"): "p-rebased", ("p2", "p1"): "p-new"},
+    )
+
+    merged = collect_merged_branches(git_ops, Path("/repo"), ["partial"])
+
+    assert merged == {}
+
+
+def test_explicit_trunk() -> None:
+    heads = {"develop": "m4", "rebased": "r1"}
+
+    merged = collect_merged_branches(_git_ops(heads), Path("/repo"), ["rebased"], trunk="develop")
+
+    assert merged == {"rebased": MERGED_BY_PATCH}
+
+
+def test_without_trunk_nothing_is_detected() -> None:
+    heads = {"develop": "m4", "rebased": "r1"}
+
+    assert collect_merged_branches(_git_ops(heads), Path("/repo"), ["rebased"]) == {}
+
+
+def test_branch_at_commit_merged_in_from_a_side_branch_is_undecided() -> None:
+    """A branch created at a commit that reached trunk through a merge is not itself merged.
+
+    side (b1 <- b2) is merged into main by m5; topic was created at b1 and
+    never worked on, so its head is on trunk but off the first-parent line.
+    """
+    heads = {**HEADS, "main": "m5", "side": "b2", "topic": "b1"}
+    git_ops = FakeGitOps(
+        branch_heads=heads,
+        commit_parents={**GRAPH, "b1": ["m0"], "b2": ["b1"], "m5": ["m4", "b2"]},
+        patch_ids=PATCH_IDS,
+    )
+
+    merged = collect_merged_branches(git_ops, Path("/repo"), ["side", "topic"])
+
+    assert merged == {"side": MERGED_BY_ANCESTRY}
+
+
+def test_trunk_commits_older_than_the_branch_are_not_compared() -> None:
+    """late forks off m3; m1 predates it, so sharing m1's patch-id is not a merge."""
+    heads = {**HEADS, "late": "l1"}
+    git_ops = FakeGitOps(
+        branch_heads=heads,
+        commit_parents={**GRAPH, "l1": ["m3"]},
+        patch_ids={**PATCH_IDS, ("l1", "m3"): "p-m1"},
+    )
+
+    merged = collect_merged_branches(git_ops, Path("/repo"), ["late"])
+
+    assert merged == {}
@@ -0,0 +1,72 @@
+"""Tests for batched stack health computation."""
+
+from pathlib import Path
+
+from tests.fakes.gitops import FakeGitOps
+from workstack.core.branch_metadata import BranchMetadata
+from workstack.core.stack_health import collect_stack_health, compute_stack_health
+
+# main: m1 <- m2
+# a (on main@m1): a1 <- a2       -> 2 ahead, needs restack (main moved to m2)
+# b (on a@a2):    b1             -> 1 ahead, up to date
+# c (on a, but forked at a1): c1 -> 1 ahead, needs restack
+GRAPH = {
+    "m1": [],
+    "m2": ["m1"],
+    "a1": ["m1"],
+    "a2": ["a1"],
+    "b1": ["a2"],
+    "c1": ["a1"],
+}
+HEADS = {
+    "main": ("m2", "main tip"),
+    "a": ("a2", "a tip"),
+    "b": ("b1", "b tip"),
+    "c": ("c1", "c tip"),
+}
+PARENTS = {"main": None, "a": "main", "b": "a", "c": "a", "deleted": "a"}
+
+
+def test_compute_stack_health_counts_and_restack() -> None:
+    health = compute_stack_health(HEADS, PARENTS, GRAPH)
+
+    assert health["main"].commits_ahead is None
+    assert health["main"].needs_restack is False
+    assert (health["a"].commits_ahead, health["a"].needs_restack) == (2, True)
+    assert (health["b"].commits_ahead, health["b"].needs_restack) == (1, False)
+    assert (health["c"].commits_ahead, health["c"].needs_restack) == (1, True)
+    assert health["b"].subject == "b tip"
+    # Branches missing locally are skipped
+    assert "deleted" not in health
+
+
+def test_compute_stack_health_treats_commits_below_base_as_shared() -> None:
+    """Commits outside the graph are ancestors of every head."""
+    # Graph cut at m1: only commits above the common base are present
+    graph = {"a1": ["m1"], "a2": ["a1"]}
+    heads = {"main": ("m1", ""), "a": ("a2", ""), "same": ("m1", "")}
+
+    health = compute_stack_health(heads, {"main": None, "a": "main", "same": "main"}, graph)
+
+    assert (health["a"].commits_ahead, health["a"].needs_restack) == (2, False)
+    assert (health["same"].commits_ahead, health["same"].needs_restack) == (0, False)
+
+
+def test_collect_stack_health_uses_batched_git_queries() -> None:
+    git_ops = FakeGitOps(
+        branch_heads={name: sha for name, (sha, _) in HEADS.items()},
+        commit_messages={sha: subject for sha, subject in HEADS.values()},
+        commit_parents=GRAPH,
+    )
+    branches = {
+        name: BranchMetadata(
+            name=name, parent=parent, children=[], is_trunk=parent is None, commit_sha=""
+        )
+        for name, parent in PARENTS.items()
+        if name != "deleted"
+    }
+
+    health = collect_stack_health(git_ops, Path("/repo"), branches)
+
+    assert health["c"].needs_restack is True
+    assert health["a"].subject == "a tip"
@@ -0,0 +1,78 @@
+"""Tests for the completion index read by the shell completion fast path."""
+
+import os
+from pathlib import Path
+
+from workstack.core.completion_index import (
+    BRANCHES,
+    WORKTREES,
+    lookup_candidates,
+    read_completion_index,
+    write_completion_index,
+)
+
+
+def _write_index(tmp_path: Path) -> tuple[Path, Path]:
+    git_dir = tmp_path / "repo" / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    workstacks_dir = tmp_path / "workstacks" / "repo"
+    (workstacks_dir / "feature-a").mkdir(parents=True)
+    (workstacks_dir / "bugfix").mkdir()
+    write_completion_index(
+        str(git_dir),
+        workstacks_dir=str(workstacks_dir),
+        worktrees=["feature-a", "bugfix"],
+        branches=["main", "feature/login", "feature/logout", "main"],
+    )
+    return git_dir, workstacks_dir
+
+
+def _touch_later(path: Path) -> None:
+    """Move a path's mtime forward, as adding or removing an entry would."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_round_trip_filters_by_prefix(tmp_path: Path) -> None:
+    git_dir, _ = _write_index(tmp_path)
+
+    index = read_completion_index(str(git_dir))
+
+    assert index is not None
+    assert lookup_candidates(index, str(git_dir), WORKTREES, "") == ["root", "bugfix", "feature-a"]
+    assert lookup_candidates(index, str(git_dir), WORKTREES, "f") == ["feature-a"]
+    assert lookup_candidates(index, str(git_dir), BRANCHES, "feature/") == [
+        "feature/login",
+        "feature/logout",
+    ]
+
+
+def test_worktree_list_is_stale_after_workstacks_dir_changes(tmp_path: Path) -> None:
+    git_dir, workstacks_dir = _write_index(tmp_path)
+    _touch_later(workstacks_dir)
+
+    index = read_completion_index(str(git_dir))
+
+    assert index is not None
+    assert lookup_candidates(index, str(git_dir), WORKTREES, "") is None
+    assert lookup_candidates(index, str(git_dir), BRANCHES, "") is not None
+
+
+def test_branch_list_is_stale_after_graphite_cache_changes(tmp_path: Path) -> None:
+    git_dir, _ = _write_index(tmp_path)
+    (git_dir / ".graphite_cache_persist").write_text("{}", encoding="utf-8")
+
+    index = read_completion_index(str(git_dir))
+
+    assert index is not None
+    assert lookup_candidates(index, str(git_dir), BRANCHES, "") is None
+    assert lookup_candidates(index, str(git_dir), WORKTREES, "") is not None
+
+
+def test_missing_or_incompatible_index_reads_as_none(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    assert read_completion_index(str(git_dir)) is None
+
+    (git_dir / "workstack-completion").write_text("version\t0\n", encoding="utf-8")
+    assert read_completion_index(str(git_dir)) is None
@@ -0,0 +1,118 @@
+"""Tests for the fuzzy worktree index."""
+
+from pathlib import Path
+
+from workstack.core.fuzzy_index import (
+    FUZZY_INDEX_FILENAME,
+    RECENCY_HALF_LIFE_SECONDS,
+    FuzzyDocument,
+    FuzzyIndex,
+    index_source_signature,
+    trigrams,
+)
+
+NOW = 1_700_000_000.0
+
+
+def _document(name: str, branch: str, **fields: object) -> FuzzyDocument:
+    return FuzzyDocument(
+        name=name,
+        path=f"/worktrees/{name}",
+        branch=branch,
+        stack=tuple(fields.get("stack", ())),  # type: ignore[arg-type]
+        plan_title=fields.get("plan_title"),  # type: ignore[arg-type]
+        pr_number=fields.get("pr_number"),  # type: ignore[arg-type]
+    )
+
+
+def _names(index: FuzzyIndex, query: str, activity: dict[str, float] | None = None) -> list[str]:
+    matches = index.search(query, activity=activity or {}, now=NOW, limit=10)
+    return [match.document.name for match in matches]
+
+
+def test_trigrams_pad_each_word() -> None:
+    assert trigrams("ab/Cd") == {"  a", " ab", "ab ", "  c", " cd", "cd "}
+
+
+def test_search_ranks_exact_then_prefix_then_substring() -> None:
+    index = FuzzyIndex(
+        None,
+        {
+            d.name: d
+            for d in [
+                _document("api-v2", "feat/api-v2"),
+                _document("api", "feat/api"),
+                _document("rapid", "feat/rapid"),
+            ]
+        },
+    )
+
+    assert _names(index, "api") == ["api", "api-v2", "rapid"]
+
+
+def test_search_tolerates_typos_and_matches_other_fields() -> None:
+    index = FuzzyIndex(
+        None,
+        {
+            d.name: d
+            for d in [
+                _document("checkout", "pay/checkout", plan_title="Stripe webhooks"),
+                _document("search", "search/facets", stack=("search/index",), pr_number=812),
+            ]
+        },
+    )
+
+    assert _names(index, "chekout") == ["checkout"]
+    assert _names(index, "webhook") == ["checkout"]
+    assert _names(index, "search/index") == ["search"]
+    assert _names(index, "#812") == ["search"]
+    assert _names(index, "zzz") == []
+
+
+def test_recency_breaks_ties_and_orders_empty_query() -> None:
+    index = FuzzyIndex(
+        None, {d.name: d for d in [_document("one", "x/one"), _document("two", "x/two")]}
+    )
+    activity = {"one": NOW - 4 * RECENCY_HALF_LIFE_SECONDS, "two": NOW - 60}
+
+    assert _names(index, "x", activity) == ["two", "one"]
+    assert _names(index, "", activity) == ["two", "one"]
+
+
+def test_update_reindexes_changed_documents_and_persists(tmp_path: Path) -> None:
+    index = FuzzyIndex.load(tmp_path)
+    index.update([_document("alpha", "feat/alpha"), _document("beta", "feat/beta")])
+    index.save()
+
+    reloaded = FuzzyIndex.load(tmp_path)
+    assert (tmp_path / FUZZY_INDEX_FILENAME).exists()
+    assert _names(reloaded, "alpha") == ["alpha"]
+
+    reloaded.update([_document("gamma", "feat/alpha-renamed"), _document("beta", "feat/beta")])
+
+    assert [d.name for d in reloaded.documents] == ["beta", "gamma"]
+    assert _names(reloaded, "alpha") == ["gamma"]
+    assert reloaded.candidates("gamma") == [_document("gamma", "feat/alpha-renamed")]
+
+
+def test_corrupt_index_file_loads_empty(tmp_path: Path) -> None:
+    (tmp_path / FUZZY_INDEX_FILENAME).write_text("{not json", encoding="utf-8")
+
+    assert FuzzyIndex.load(tmp_path).documents == []
+
+
+def test_source_signature_tracks_worktree_heads_and_is_persisted(tmp_path: Path) -> None:
+    (tmp_path / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    linked = tmp_path / "worktrees" / "feature"
+    linked.mkdir(parents=True)
+    (linked / "HEAD").write_text("ref: refs/heads/feature\n", encoding="utf-8")
+    before = index_source_signature(tmp_path)
+
+    index = FuzzyIndex.load(tmp_path)
+    index.source_signature = before
+    index.save()
+    assert FuzzyIndex.load(tmp_path).source_signature == before
+
+    # A checkout in the linked worktree with plain git
+    (linked / "HEAD").write_text("ref: refs/heads/feature-renamed\n", encoding="utf-8")
+    assert index_source_signature(tmp_path) != before
@@ -0,0 +1,126 @@
+"""Tests for the shared plan metadata index."""
+
+import os
+from pathlib import Path
+
+from workstack.core.plan_index import (
+    PLAN_HEAD_BYTES,
+    PLAN_INDEX_FILENAME,
+    PlanIndex,
+    parse_front_matter,
+    read_plan_metadata,
+)
+
+
+def _write_plan(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _title(index: PlanIndex, plan: Path) -> str | None:
+    metadata = index.get(plan)
+    assert metadata is not None
+    return metadata.title
+
+
+def test_parse_front_matter_extracts_flat_scalars() -> None:
+    lines = [
+        "---",
+        "title: Metadata",
+        'status: "in progress"',
+        "tags:",
+        "  - perf",
+        "# a comment",
+        "---",
+        "# Heading",
+    ]
+
+    fields, body_start = parse_front_matter(lines)
+
+    assert fields == {"title": "Metadata", "status": "in progress"}
+    assert lines[body_start] == "# Heading"
+
+
+def test_parse_front_matter_requires_closing_fence() -> None:
+    assert parse_front_matter(["---", "title: x", "# Heading"]) == ({}, 0)
+    assert parse_front_matter(["# Heading"]) == ({}, 0)
+
+
+def test_read_plan_metadata_skips_front_matter_for_title_and_summary(tmp_path: Path) -> None:
+    plan = _write_plan(
+        tmp_path / ".PLAN.md",
+        "---\ntitle: Metadata\n---\n\n# Actual Title\n\nFirst line.\nSecond line.\nThird.\n",
+    )
+
+    metadata = read_plan_metadata(plan)
+
+    assert metadata.title == "Actual Title"
+    assert metadata.summary == "First line. Second line."
+    assert metadata.front_matter == {"title": "Metadata"}
+    assert metadata.line_count == 9
+    assert metadata.first_lines == ["---", "title: Metadata", "---", "", "# Actual Title"]
+
+
+def test_read_plan_metadata_counts_lines_beyond_head(tmp_path: Path) -> None:
+    body_line = "x" * 99 + "\n"
+    line_total = (PLAN_HEAD_BYTES * 3) // len(body_line)
+    plan = _write_plan(tmp_path / ".PLAN.md", "# Big Plan\n" + body_line * line_total)
+
+    metadata = read_plan_metadata(plan)
+
+    assert metadata.title == "Big Plan"
+    assert metadata.line_count == line_total + 1
+
+
+def test_index_reuses_entry_until_mtime_or_size_changes(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    plan = _write_plan(tmp_path / ".PLAN.md", "# Title A\n")
+    stat = plan.stat()
+
+    index = PlanIndex.load(git_dir)
+    assert _title(index, plan) == "Title A"
+    index.save()
+    assert (git_dir / PLAN_INDEX_FILENAME).exists()
+
+    # Same size and mtime: the persisted entry is trusted without re-reading
+    _write_plan(plan, "# Title B\n")
+    os.utime(plan, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _title(PlanIndex.load(git_dir), plan) == "Title A"
+
+    os.utime(plan, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _title(PlanIndex.load(git_dir), plan) == "Title B"
+
+
+def test_index_drops_entries_for_deleted_plans(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    plan = _write_plan(tmp_path / ".PLAN.md", "# Title\n")
+    index = PlanIndex.load(git_dir)
+    index.get(plan)
+    index.save()
+
+    plan.unlink()
+    index = PlanIndex.load(git_dir)
+    assert index.get(plan) is None
+    index.save()
+
+    assert str(plan.absolute()) not in (git_dir / PLAN_INDEX_FILENAME).read_text("utf-8")
+
+
+def test_index_ignores_corrupt_file(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / PLAN_INDEX_FILENAME).write_text("{not json", encoding="utf-8")
+    plan = _write_plan(tmp_path / ".PLAN.md", "# Title\n")
+
+    assert _title(PlanIndex.load(git_dir), plan) == "Title"
+
+
+def test_index_without_git_dir_stays_in_memory(tmp_path: Path) -> None:
+    plan = _write_plan(tmp_path / ".PLAN.md", "# Title\n")
+    index = PlanIndex.load(None)
+
+    assert _title(index, plan) == "Title"
+    index.save()
+    assert index.path is None
@@ -0,0 +1,133 @@
+"""Tests for the cross-process repository locks.
+
+Locks are per thread (separate opens conflict under flock even within one
+process), so contention is simulated with a holder thread.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from workstack.core.repo_lock import LockTimeoutError, file_lock, repo_lock_path
+
+
+@contextmanager
+def _held_in_thread(path: Path, *, shared: bool) -> Iterator[None]:
+    """Hold ``path`` from another thread for the duration of the block."""
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with file_lock(path, shared=shared, timeout=5):
+            acquired.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    assert acquired.wait(5)
+    try:
+        yield
+    finally:
+        release.set()
+        thread.join(5)
+
+
+def test_repo_lock_path_is_per_scope(tmp_path: Path) -> None:
+    assert repo_lock_path(tmp_path, "worktrees") != repo_lock_path(tmp_path, "graphite")
+    assert repo_lock_path(tmp_path, "worktrees").parent.parent == tmp_path
+
+
+def test_uncontended_lock_reports_no_wait(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "worktrees")
+
+    with file_lock(path, shared=False) as stats:
+        assert path.exists()
+        assert stats.waited_seconds < 1
+        assert not stats.reentered
+
+
+def test_shared_locks_coexist(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "graphite")
+
+    with _held_in_thread(path, shared=True):
+        with file_lock(path, shared=True, timeout=0.5) as stats:
+            assert not stats.reentered
+
+
+def test_exclusive_lock_times_out_while_held(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "worktrees")
+    contentions: list[bool] = []
+
+    with _held_in_thread(path, shared=True):
+        with pytest.raises(LockTimeoutError) as exc_info:
+            with file_lock(
+                path, shared=False, timeout=0.1, on_contention=lambda: contentions.append(True)
+            ):
+                pass
+
+    assert exc_info.value.path == path
+    assert contentions == [True]
+
+
+def test_lock_is_acquired_once_released(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "worktrees")
+    release = threading.Event()
+    acquired = threading.Event()
+
+    def hold() -> None:
+        with file_lock(path, shared=False):
+            acquired.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    assert acquired.wait(5)
+    threading.Timer(0.1, release.set).start()
+
+    with file_lock(path, shared=False, timeout=5) as stats:
+        assert stats.waited_seconds > 0
+    thread.join(5)
+
+
+def test_waiting_writer_blocks_new_readers(tmp_path: Path) -> None:
+    """A queued writer holds the turnstile, so later readers cannot overtake it."""
+    path = repo_lock_path(tmp_path, "graphite")
+    writer_done = threading.Event()
+
+    with _held_in_thread(path, shared=True):
+        writer = threading.Thread(target=lambda: _take_and_signal(path, writer_done), daemon=True)
+        writer.start()
+        # Give the writer time to queue behind the reader
+        writer_done.wait(0.2)
+
+        with pytest.raises(LockTimeoutError):
+            with file_lock(path, shared=True, timeout=0.2):
+                pass
+
+    assert writer_done.wait(5)
+    writer.join(5)
+
+
+def _take_and_signal(path: Path, done: threading.Event) -> None:
+    with file_lock(path, shared=False, timeout=5):
+        done.set()
+
+
+def test_lock_is_reentrant_within_a_thread(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "worktrees")
+
+    with file_lock(path, shared=False):
+        with file_lock(path, shared=True, timeout=0.1) as stats:
+            assert stats.reentered
+
+
+def test_shared_lock_cannot_be_upgraded(tmp_path: Path) -> None:
+    path = repo_lock_path(tmp_path, "worktrees")
+
+    with file_lock(path, shared=True):
+        with pytest.raises(RuntimeError, match="upgrade"):
+            with file_lock(path, shared=False):
+                pass
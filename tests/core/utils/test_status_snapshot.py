@@ -0,0 +1,166 @@
+"""Tests for the per-worktree prompt snapshot helpers."""
+
+import os
+import time
+from pathlib import Path
+
+from workstack.core.status_snapshot import (
+    REFRESH_MARKER_MAX_AGE_SECONDS,
+    SNAPSHOT_TTL_SECONDS,
+    clear_refresh_marker,
+    compute_snapshot_key,
+    format_prompt_segment,
+    is_snapshot_fresh,
+    locate_worktree,
+    mark_refresh_started,
+    read_common_dir,
+    read_head,
+    read_snapshot,
+    should_start_refresh,
+    write_snapshot,
+)
+
+
+def _make_repo(tmp_path: Path, branch: str = "main") -> Path:
+    """Create the minimal on-disk layout of a repository's .git directory."""
+    repo = tmp_path / "repo"
+    git_dir = repo / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"")
+    return repo
+
+
+def _make_linked_worktree(tmp_path: Path, repo: Path, name: str, branch: str) -> Path:
+    """Create the on-disk layout of a linked worktree pointing back at ``repo``."""
+    worktree = tmp_path / "worktrees" / name
+    worktree.mkdir(parents=True)
+    git_dir = repo / ".git" / "worktrees" / name
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    (git_dir / "commondir").write_text("../..\n", encoding="utf-8")
+    (worktree / ".git").write_text(f"gitdir: {git_dir}\n", encoding="utf-8")
+    return worktree
+
+
+def test_locate_worktree_in_root_repo_subdirectory(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    subdir = repo / "src" / "pkg"
+    subdir.mkdir(parents=True)
+
+    assert locate_worktree(str(subdir)) == (str(repo), str(repo / ".git"))
+
+
+def test_locate_worktree_follows_gitdir_file(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    worktree = _make_linked_worktree(tmp_path, repo, "feature", "feature")
+
+    location = locate_worktree(str(worktree))
+
+    assert location == (str(worktree), str(repo / ".git" / "worktrees" / "feature"))
+    assert read_common_dir(location[1]) == str(repo / ".git")
+
+
+def test_locate_worktree_outside_repo(tmp_path: Path) -> None:
+    assert locate_worktree(str(tmp_path)) is None
+
+
+def test_snapshot_key_changes_on_checkout(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    git_dir = str(repo / ".git")
+    key_before = compute_snapshot_key(git_dir, read_head(git_dir))
+
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/other\n", encoding="utf-8")
+
+    assert compute_snapshot_key(git_dir, read_head(git_dir)) != key_before
+
+
+def test_snapshot_key_changes_when_branch_ref_moves(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    git_dir = str(repo / ".git")
+    ref = repo / ".git" / "refs" / "heads" / "main"
+    ref.write_text("a" * 40 + "\n", encoding="utf-8")
+    key_before = compute_snapshot_key(git_dir, read_head(git_dir))
+
+    os.utime(ref, ns=(0, ref.stat().st_mtime_ns + 1_000_000))
+
+    assert compute_snapshot_key(git_dir, read_head(git_dir)) != key_before
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    git_dir = str(_make_repo(tmp_path) / ".git")
+
+    write_snapshot(git_dir, {"key": "k", "branch": "main", "stack": "main feat"})
+
+    snapshot = read_snapshot(git_dir)
+    assert snapshot is not None
+    assert snapshot["branch"] == "main"
+    assert snapshot["stack"] == "main feat"
+
+
+def test_read_snapshot_rejects_other_versions(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    (repo / ".git" / "workstack-prompt").write_text("version\t0\nkey\tk\n", encoding="utf-8")
+
+    assert read_snapshot(str(repo / ".git")) is None
+
+
+def test_snapshot_freshness() -> None:
+    now = time.time()
+    snapshot = {"key": "k", "written_at": f"{now:.3f}"}
+
+    assert is_snapshot_fresh(snapshot, "k", now=now)
+    assert not is_snapshot_fresh(snapshot, "other", now=now)
+    assert not is_snapshot_fresh(snapshot, "k", now=now + SNAPSHOT_TTL_SECONDS + 1)
+    assert not is_snapshot_fresh(None, "k", now=now)
+
+
+def test_refresh_marker_prevents_duplicate_refreshes(tmp_path: Path) -> None:
+    git_dir = str(_make_repo(tmp_path) / ".git")
+    now = time.time()
+
+    assert should_start_refresh(git_dir, now=now)
+
+    mark_refresh_started(git_dir)
+    assert not should_start_refresh(git_dir, now=now)
+    assert should_start_refresh(git_dir, now=now + REFRESH_MARKER_MAX_AGE_SECONDS + 1)
+
+    clear_refresh_marker(git_dir)
+    assert should_start_refresh(git_dir, now=now)
+
+
+def test_format_segment_with_stack_and_pr() -> None:
+    snapshot = {
+        "branch": "feat-b",
+        "stack": "main feat-a feat-b",
+        "pr_number": "42",
+        "pr_state": "OPEN",
+        "pr_draft": "0",
+        "pr_checks": "1",
+    }
+
+    segment = format_prompt_segment(
+        "{worktree}:{branch}{stack}{pr}", worktree="feat-b", branch="feat-b", snapshot=snapshot
+    )
+
+    assert segment == "feat-b:feat-b [2/2] #42✅"
+
+
+def test_format_segment_ignores_snapshot_from_other_branch() -> None:
+    snapshot = {"branch": "old", "stack": "main old", "pr_number": "7", "pr_state": "OPEN"}
+
+    segment = format_prompt_segment(
+        "{worktree}:{branch}{stack}{pr}", worktree="wt", branch="new", snapshot=snapshot
+    )
+
+    assert segment == "wt:new"
+
+
+def test_format_segment_on_trunk_has_no_stack_position() -> None:
+    snapshot = {"branch": "main", "stack": "main", "pr_number": ""}
+
+    segment = format_prompt_segment(
+        "{branch}{stack}{pr}", worktree="root", branch="main", snapshot=snapshot
+    )
+
+    assert segment == "main"
@@ -0,0 +1,107 @@
+"""Tests for deferred deletion of removed worktrees."""
+
+import threading
+from pathlib import Path
+
+from workstack.core.repo_lock import file_lock
+from workstack.core.trash import (
+    REAPER_LOCK_FILENAME,
+    measure_trash,
+    move_to_trash,
+    pending_entries,
+    reap_trash,
+    reaper_command,
+    trash_dir_for,
+)
+
+
+def _make_worktree(path: Path, size: int) -> Path:
+    (path / "node_modules" / "pkg").mkdir(parents=True)
+    (path / "node_modules" / "pkg" / "index.js").write_bytes(b"x" * size)
+    return path
+
+
+def test_move_to_trash_renames_into_trash(tmp_path: Path) -> None:
+    wt = _make_worktree(tmp_path / "feature", 10)
+    trash_dir = trash_dir_for(tmp_path)
+
+    moved = move_to_trash(wt, trash_dir)
+
+    assert moved is not None
+    assert not wt.exists()
+    assert moved.parent == trash_dir
+    assert (moved / "node_modules" / "pkg" / "index.js").exists()
+    assert pending_entries(trash_dir) == [moved]
+
+
+def test_move_to_trash_reports_failure(tmp_path: Path) -> None:
+    assert move_to_trash(tmp_path / "missing", trash_dir_for(tmp_path)) is None
+
+
+def test_measure_trash_counts_entries_and_bytes(tmp_path: Path) -> None:
+    trash_dir = trash_dir_for(tmp_path)
+    move_to_trash(_make_worktree(tmp_path / "a", 100), trash_dir)
+    move_to_trash(_make_worktree(tmp_path / "b", 50), trash_dir)
+
+    usage = measure_trash(trash_dir)
+
+    assert usage.entries == 2
+    assert usage.size_bytes == 150
+    assert usage.size_is_lower_bound is False
+
+
+def test_measure_trash_stops_at_max_files(tmp_path: Path) -> None:
+    trash_dir = trash_dir_for(tmp_path)
+    move_to_trash(_make_worktree(tmp_path / "a", 100), trash_dir)
+    move_to_trash(_make_worktree(tmp_path / "b", 100), trash_dir)
+
+    usage = measure_trash(trash_dir, max_files=1)
+
+    assert usage.entries == 2
+    assert usage.size_bytes == 100
+    assert usage.size_is_lower_bound is True
+
+
+def test_reap_trash_deletes_everything_but_bookkeeping(tmp_path: Path) -> None:
+    trash_dir = trash_dir_for(tmp_path)
+    move_to_trash(_make_worktree(tmp_path / "a", 10), trash_dir)
+    move_to_trash(_make_worktree(tmp_path / "b", 10), trash_dir)
+
+    assert reap_trash(trash_dir) == 2
+    assert pending_entries(trash_dir) == []
+    assert measure_trash(trash_dir).entries == 0
+
+
+def test_reap_trash_leaves_trash_to_running_reaper(tmp_path: Path) -> None:
+    trash_dir = trash_dir_for(tmp_path)
+    move_to_trash(_make_worktree(tmp_path / "a", 10), trash_dir)
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with file_lock(trash_dir / REAPER_LOCK_FILENAME, shared=False):
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    assert acquired.wait(5)
+    try:
+        assert reap_trash(trash_dir) == 0
+    finally:
+        release.set()
+        holder.join(5)
+
+    assert len(pending_entries(trash_dir)) == 1
+
+
+def test_reaper_command_reaps_trash(tmp_path: Path) -> None:
+    """The detached reaper command deletes the trash when run."""
+    import subprocess
+
+    trash_dir = trash_dir_for(tmp_path)
+    move_to_trash(_make_worktree(tmp_path / "a", 10), trash_dir)
+
+    subprocess.run(reaper_command(trash_dir), check=True)
+
+    assert pending_entries(trash_dir) == []
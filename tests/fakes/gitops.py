@@ -4,6 +4,7 @@ FakeGitOps is an in-memory implementation that accepts pre-configured state
 in its constructor. Construct instances directly with keyword arguments.
 """
 
+import threading
 from pathlib import Path
 
 import click
@@ -35,7 +36,9 @@ class FakeGitOps(GitOps):
     Mutation Tracking:
     -----------------
     This fake tracks mutations for test assertions via read-only properties:
-    - deleted_branches: Branches deleted via delete_branch_with_graphite()
+    - deleted_branches: Branches deleted via delete_branch_with_graphite() or
+      delete_branches_with_graphite()
+    - branch_deletion_batches: Batches passed to delete_branches_with_graphite()
     - added_worktrees: Worktrees added via add_worktree()
     - removed_worktrees: Worktrees removed via remove_worktree()
     - checked_out_branches: Branches checked out via checkout_branch()
@@ -76,6 +79,12 @@ class FakeGitOps(GitOps):
         file_statuses: dict[Path, tuple[list[str], list[str], list[str]]] | None = None,
         ahead_behind: dict[tuple[Path, str], tuple[int, int]] | None = None,
         recent_commits: dict[Path, list[dict[str, str]]] | None = None,
+        upstream_ahead_behind: dict[str, tuple[int, int]] | None = None,
+        base_ahead_behind: dict[tuple[str, str], tuple[int, int]] | None = None,
+        dirty_worktrees: set[Path] | None = None,
+        commit_parents: dict[str, list[str]] | None = None,
+        patch_ids: dict[tuple[str, str], str] | None = None,
+        merged_branches: dict[str, set[str]] | None = None,
     ) -> None:
         """Create FakeGitOps with pre-configured state.
 
@@ -90,22 +99,37 @@ class FakeGitOps(GitOps):
             file_statuses: Mapping of cwd -> (staged, modified, untracked) files
             ahead_behind: Mapping of (cwd, branch) -> (ahead, behind) counts
             recent_commits: Mapping of cwd -> list of commit info dicts
+            upstream_ahead_behind: Mapping of branch -> (ahead, behind) vs upstream
+            base_ahead_behind: Mapping of (base, branch) -> (ahead, behind) vs base
+            dirty_worktrees: Set of worktree paths with uncommitted changes
+            commit_parents: Mapping of commit SHA -> parent SHAs (the commit graph)
+            patch_ids: Mapping of (commit, base) -> patch-id of the diff between them
+            merged_branches: Mapping of target -> branches merged into it
         """
         self._worktrees = worktrees or {}
         self._current_branches = current_branches or {}
         self._default_branches = default_branches or {}
         self._git_common_dirs = git_common_dirs or {}
-        self._branch_heads = branch_heads or {}
+        self._branch_heads = dict(branch_heads or {})
         self._commit_messages = commit_messages or {}
         self._repos_with_staged_changes: set[Path] = staged_repos or set()
         self._file_statuses = file_statuses or {}
         self._ahead_behind = ahead_behind or {}
         self._recent_commits = recent_commits or {}
+        self._upstream_ahead_behind = upstream_ahead_behind or {}
+        self._base_ahead_behind = base_ahead_behind or {}
+        self._dirty_worktrees = dirty_worktrees or set()
+        self._commit_parents = commit_parents or {}
+        self._patch_ids = patch_ids or {}
+        self._merged_branches = merged_branches or {}
 
         # Mutation tracking
         self._deleted_branches: list[str] = []
+        self._branch_deletion_batches: list[list[str]] = []
         self._added_worktrees: list[tuple[Path, str | None]] = []
         self._removed_worktrees: list[Path] = []
+        self._prune_count = 0
+        self._removal_lock = threading.Lock()
         self._checked_out_branches: list[tuple[Path, str]] = []
         self._detached_checkouts: list[tuple[Path, str]] = []
 
@@ -162,13 +186,17 @@ class FakeGitOps(GitOps):
             old_path.rename(new_path)
 
     def remove_worktree(self, repo_root: Path, path: Path, *, force: bool = False) -> None:
-        """Remove a worktree (mutates internal state)."""
-        if repo_root in self._worktrees:
-            self._worktrees[repo_root] = [
-                wt for wt in self._worktrees[repo_root] if wt.path != path
-            ]
-        # Track the removal
-        self._removed_worktrees.append(path)
+        """Remove a worktree (mutates internal state).
+
+        Bulk removals call this from several threads at once.
+        """
+        with self._removal_lock:
+            if repo_root in self._worktrees:
+                self._worktrees[repo_root] = [
+                    wt for wt in self._worktrees[repo_root] if wt.path != path
+                ]
+            # Track the removal
+            self._removed_worktrees.append(path)
 
     def checkout_branch(self, cwd: Path, branch: str) -> None:
         """Checkout a branch (mutates internal state).
@@ -209,10 +237,25 @@ class FakeGitOps(GitOps):
     def delete_branch_with_graphite(self, repo_root: Path, branch: str, *, force: bool) -> None:
         """Track which branches were deleted (mutates internal state)."""
         self._deleted_branches.append(branch)
+        self._branch_heads.pop(branch, None)
+
+    def delete_branches_with_graphite(
+        self, repo_root: Path, branches: list[str], *, force: bool
+    ) -> list[str]:
+        """Track the batch and its deleted branches (mutates internal state)."""
+        self._branch_deletion_batches.append(list(branches))
+        self._deleted_branches.extend(branches)
+        for branch in branches:
+            self._branch_heads.pop(branch, None)
+        return []
 
     def prune_worktrees(self, repo_root: Path) -> None:
-        """Prune stale worktree metadata (no-op for in-memory fake)."""
-        pass
+        """Forget worktrees whose directory no longer exists, as git does."""
+        self._prune_count += 1
+        if repo_root in self._worktrees:
+            self._worktrees[repo_root] = [
+                wt for wt in self._worktrees[repo_root] if wt.path.exists()
+            ]
 
     def is_branch_checked_out(self, repo_root: Path, branch: str) -> Path | None:
         """Check if a branch is already checked out in any worktree."""
@@ -230,6 +273,29 @@ class FakeGitOps(GitOps):
         """Get the commit message for a given commit SHA."""
         return self._commit_messages.get(commit_sha)
 
+    def list_branch_heads(self, repo_root: Path) -> dict[str, tuple[str, str]]:
+        """Get branch heads with subjects, derived from branch_heads and commit_messages."""
+        return {
+            branch: (sha, self._commit_messages.get(sha, ""))
+            for branch, sha in self._branch_heads.items()
+        }
+
+    def list_merged_branches(self, repo_root: Path, target: str) -> set[str]:
+        """Get the branches configured as merged into target."""
+        return set(self._merged_branches.get(target, set()))
+
+    def get_commit_graph(self, repo_root: Path, heads: list[str]) -> dict[str, list[str]]:
+        """Get the configured commit graph (the whole graph; no merge-base cut)."""
+        return dict(self._commit_parents)
+
+    def get_patch_ids(self, repo_root: Path, diffs: list[tuple[str, str]]) -> dict[str, str]:
+        """Get the configured patch-ids; unconfigured diffs count as empty."""
+        return {
+            commit: self._patch_ids[(commit, base)]
+            for commit, base in diffs
+            if (commit, base) in self._patch_ids
+        }
+
     def get_file_status(self, cwd: Path) -> tuple[list[str], list[str], list[str]]:
         """Get lists of staged, modified, and untracked files."""
         return self._file_statuses.get(cwd, ([], [], []))
@@ -238,6 +304,24 @@ class FakeGitOps(GitOps):
         """Get number of commits ahead and behind tracking branch."""
         return self._ahead_behind.get((cwd, branch), (0, 0))
 
+    def get_upstream_ahead_behind(self, repo_root: Path) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind counts versus upstream for all branches."""
+        return dict(self._upstream_ahead_behind)
+
+    def get_ahead_behind_base(
+        self, repo_root: Path, base: str, branches: list[str]
+    ) -> dict[str, tuple[int, int]]:
+        """Get ahead/behind counts of branches versus a base ref."""
+        return {
+            branch: self._base_ahead_behind[(base, branch)]
+            for branch in branches
+            if (base, branch) in self._base_ahead_behind
+        }
+
+    def is_worktree_dirty(self, cwd: Path) -> bool:
+        """Report whether the worktree has uncommitted changes."""
+        return cwd in self._dirty_worktrees
+
     def get_recent_commits(self, cwd: Path, *, limit: int = 5) -> list[dict[str, str]]:
         """Get recent commit information."""
         commits = self._recent_commits.get(cwd, [])
@@ -251,6 +335,14 @@ class FakeGitOps(GitOps):
         """
         return self._deleted_branches.copy()
 
+    @property
+    def branch_deletion_batches(self) -> list[list[str]]:
+        """Get the batches deleted via delete_branches_with_graphite().
+
+        This property is for test assertions only.
+        """
+        return [batch.copy() for batch in self._branch_deletion_batches]
+
     @property
     def added_worktrees(self) -> list[tuple[Path, str | None]]:
         """Get list of worktrees added during test.
@@ -268,6 +360,14 @@ class FakeGitOps(GitOps):
         """
         return self._removed_worktrees.copy()
 
+    @property
+    def prune_count(self) -> int:
+        """Get the number of times worktree metadata was pruned.
+
+        This property is for test assertions only.
+        """
+        return self._prune_count
+
     @property
     def checked_out_branches(self) -> list[tuple[Path, str]]:
         """Get list of branches checked out during test.
@@ -14,7 +14,11 @@ class FakeShellOps(ShellOps):
 
     Constructor Injection:
     - All state is provided via constructor parameters
-    - No mutations occur (immutable after construction)
+    - Detached processes are recorded instead of started
+
+    Mutation Tracking:
+    - detached_commands: Commands passed to spawn_detached()
+    - detached_cwds: Working directories passed along with them
 
     When to Use:
     - Testing shell-dependent commands (e.g., init, shell setup)
@@ -58,6 +62,8 @@ class FakeShellOps(ShellOps):
         """
         self._detected_shell = detected_shell
         self._installed_tools = installed_tools or {}
+        self._detached_commands: list[list[str]] = []
+        self._detached_cwds: list[Path | None] = []
 
     def detect_shell(self) -> tuple[str, Path] | None:
         """Return the shell configured at construction time."""
@@ -66,3 +72,24 @@ class FakeShellOps(ShellOps):
     def get_installed_tool_path(self, tool_name: str) -> str | None:
         """Return the tool path if configured, None otherwise."""
         return self._installed_tools.get(tool_name)
+
+    def spawn_detached(self, command: list[str], *, cwd: Path | None = None) -> None:
+        """Record the command instead of starting it (mutates internal state)."""
+        self._detached_commands.append(list(command))
+        self._detached_cwds.append(cwd)
+
+    @property
+    def detached_commands(self) -> list[list[str]]:
+        """Get the commands that would have been started.
+
+        Returns a copy to prevent external mutation.
+        """
+        return [command.copy() for command in self._detached_commands]
+
+    @property
+    def detached_cwds(self) -> list[Path | None]:
+        """Get the working directories of the commands that would have been started.
+
+        Returns a copy to prevent external mutation.
+        """
+        return list(self._detached_cwds)
@@ -80,17 +80,13 @@ def test_graphite_ops_get_all_branches():
     mock_git_ops = MagicMock()
     mock_git_ops.get_git_common_dir.return_value = Path("/test/.git")
 
-    # Mock get_branch_head to return commit SHAs
-    def mock_get_branch_head(repo_root, branch_name):
-        commit_map = {
-            "main": "abc123",
-            "feature-1": "def456",
-            "feature-1-sub": "ghi789",
-            "feature-2": "jkl012",
-        }
-        return commit_map.get(branch_name)
-
-    mock_git_ops.get_branch_head = mock_get_branch_head
+    # Mock list_branch_heads to return commit SHAs for every branch at once
+    mock_git_ops.list_branch_heads.return_value = {
+        "main": ("abc123", "Initial commit"),
+        "feature-1": ("def456", "Feature 1"),
+        "feature-1-sub": ("ghi789", "Feature 1 sub"),
+        "feature-2": ("jkl012", "Feature 2"),
+    }
 
     fixture_data = load_fixture("graphite/graphite_cache_persist.json")
 
@@ -0,0 +1,77 @@
+"""Import-time regression tests for CLI startup.
+
+Each command is run under ``python -X importtime`` in a fresh interpreter and
+the modules it imported are compared against a budget. Module counts are used
+rather than timings so the budgets hold on any machine.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from workstack.cli.cli import LAZY_COMMANDS, cli
+
+# Maximum number of workstack modules imported to run `<command> --help`.
+WORKSTACK_MODULE_BUDGETS = {
+    "switch": 20,
+    "jump": 20,
+    "up": 20,
+    "down": 20,
+    "create": 20,
+    "rm": 20,
+    "list": 22,
+}
+
+# Modules only some commands need; none of the budgeted commands may load them.
+# (The dispatched command module itself is loaded through importlib, which
+# importtime does not report, so only indirect imports show up here.)
+HEAVY_MODULES = (
+    "click.testing",
+    "workstack.status",
+    "workstack.cli.commands.status",
+    "workstack.cli.commands.shell_integration",
+    "workstack.cli.commands.completion",
+    "workstack.cli.commands.config",
+    "frontmatter",
+    "yaml",
+)
+
+
+def _imported_modules(args: list[str], home: Path) -> list[str]:
+    env = {**os.environ, "HOME": str(home)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "workstack", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    modules: list[str] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("| package"):
+            continue
+        modules.append(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+@pytest.mark.parametrize("command", sorted(WORKSTACK_MODULE_BUDGETS))
+def test_command_import_budget(command: str, tmp_path: Path) -> None:
+    modules = _imported_modules([command, "--help"], tmp_path)
+
+    workstack_modules = [m for m in modules if m.split(".")[0] == "workstack"]
+    assert len(workstack_modules) <= WORKSTACK_MODULE_BUDGETS[command], workstack_modules
+
+    heavy = [m for m in modules if m.startswith(HEAVY_MODULES)]
+    assert heavy == []
+
+
+def test_lazy_commands_resolve_to_named_commands() -> None:
+    ctx = click.Context(cli)
+    for name in LAZY_COMMANDS:
+        command = cli.get_command(ctx, name)
+        assert command is not None
+        assert command.name == name
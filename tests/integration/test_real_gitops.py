@@ -15,8 +15,9 @@ from tests.integration.conftest import (
     GitOpsWithDetached,
     GitOpsWithExistingBranch,
     GitOpsWithWorktrees,
+    init_git_repo,
 )
-from workstack.core.gitops import WorktreeInfo
+from workstack.core.gitops import RealGitOps, WorktreeInfo
 
 
 def test_list_worktrees_single_repo(git_ops: GitOpsSetup) -> None:
@@ -562,3 +563,176 @@ def test_checkout_branch_in_worktree(
     # Verify branch is checked out
     branch = git_ops.get_current_branch(wt)
     assert branch == "feature-2"
+
+
+def _commit(cwd: Path, message: str) -> None:
+    subprocess.run(["git", "commit", "--allow-empty", "-m", message], cwd=cwd, check=True)
+
+
+def test_real_ahead_behind_base_batches_branches(tmp_path: Path) -> None:
+    """Test ahead/behind of several branches versus one base in a single query."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    subprocess.run(["git", "branch", "one"], cwd=repo, check=True)
+    subprocess.run(["git", "branch", "two"], cwd=repo, check=True)
+    _commit(repo, "main advances")
+    subprocess.run(["git", "checkout", "-q", "one"], cwd=repo, check=True)
+    _commit(repo, "one-1")
+    _commit(repo, "one-2")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+
+    counts = RealGitOps().get_ahead_behind_base(repo, "main", ["one", "two", "missing"])
+
+    assert counts == {"one": (2, 1), "two": (0, 1)}
+
+
+def test_real_upstream_ahead_behind(tmp_path: Path) -> None:
+    """Test upstream ahead/behind for all branches from one for-each-ref call."""
+
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    subprocess.run(["git", "remote", "add", "origin", str(remote)], cwd=repo, check=True)
+    subprocess.run(["git", "push", "-q", "-u", "origin", "main"], cwd=repo, check=True)
+    subprocess.run(["git", "branch", "local-only"], cwd=repo, check=True)
+    _commit(repo, "unpushed")
+
+    counts = RealGitOps().get_upstream_ahead_behind(repo)
+
+    assert counts == {"main": (1, 0)}
+
+
+def test_real_is_worktree_dirty(tmp_path: Path) -> None:
+    """Test dirty detection for modified and untracked files."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    git_ops = RealGitOps()
+
+    assert git_ops.is_worktree_dirty(repo) is False
+
+    (repo / "new.txt").write_text("x", encoding="utf-8")
+    assert git_ops.is_worktree_dirty(repo) is True
+
+    (repo / "new.txt").unlink()
+    (repo / "README.md").write_text("changed\n", encoding="utf-8")
+    assert git_ops.is_worktree_dirty(repo) is True
+
+
+def test_real_stack_health_from_branch_heads_and_commit_graph(tmp_path: Path) -> None:
+    """Test ahead-of-parent and restack detection against a real commit graph."""
+    from workstack.core.stack_health import compute_stack_health
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    subprocess.run(["git", "checkout", "-q", "-b", "a"], cwd=repo, check=True)
+    _commit(repo, "a-1")
+    _commit(repo, "a-2")
+    subprocess.run(["git", "checkout", "-q", "-b", "b"], cwd=repo, check=True)
+    _commit(repo, "b-1")
+    # a moves on after b was created, so b needs a restack
+    subprocess.run(["git", "checkout", "-q", "a"], cwd=repo, check=True)
+    _commit(repo, "a-3")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+
+    git_ops = RealGitOps()
+    heads = git_ops.list_branch_heads(repo)
+    graph = git_ops.get_commit_graph(repo, [sha for sha, _ in heads.values()])
+    health = compute_stack_health(heads, {"main": None, "a": "main", "b": "a"}, graph)
+
+    assert heads["b"][1] == "b-1"
+    assert health["main"].commits_ahead is None
+    assert (health["a"].commits_ahead, health["a"].needs_restack) == (3, False)
+    assert (health["b"].commits_ahead, health["b"].needs_restack) == (1, True)
+    # Commits below the common base (main's history) are not listed
+    assert heads["main"][0] not in graph
+
+
+def test_real_merged_branch_detection(tmp_path: Path) -> None:
+    """Test ancestry, patch-id and squash detection against real merges."""
+    from workstack.core.merge_detection import collect_merged_branches
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    def commit_file(name: str) -> None:
+        (repo / name).write_text(f"{name}\n", encoding="utf-8")
+        git("add", name)
+        git("commit", "-q", "-m", name)
+
+    git("branch", "fresh")
+    for branch, files in [
+        ("merged", ["a"]),
+        ("rebased", ["b"]),
+        ("squashed", ["c1", "c2"]),
+        ("open", ["d"]),
+    ]:
+        git("checkout", "-q", "-b", branch, "main")
+        for name in files:
+            commit_file(name)
+    git("checkout", "-q", "main")
+    commit_file("trunk-moves-on")
+    git("merge", "-q", "--no-ff", "-m", "merge", "merged")
+    git("cherry-pick", "rebased")
+    git("merge", "-q", "--squash", "squashed")
+    git("commit", "-q", "-m", "squashed")
+
+    merged = collect_merged_branches(
+        RealGitOps(), repo, ["fresh", "merged", "rebased", "squashed", "open"]
+    )
+
+    assert merged == {"merged": "ancestry", "rebased": "patch", "squashed": "squash"}
+
+
+def test_real_delete_branches_with_graphite(tmp_path: Path) -> None:
+    """Test batch deletion of branches and their Graphite metadata refs."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    for branch in ("merged", "unmerged"):
+        subprocess.run(["git", "branch", branch], cwd=repo, check=True)
+        subprocess.run(
+            ["git", "update-ref", f"refs/branch-metadata/{branch}", "HEAD"], cwd=repo, check=True
+        )
+    subprocess.run(["git", "checkout", "-q", "unmerged"], cwd=repo, check=True)
+    _commit(repo, "only on unmerged")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+
+    remaining = RealGitOps().delete_branches_with_graphite(
+        repo, ["merged", "unmerged"], force=False
+    )
+
+    refs = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert remaining == ["unmerged"]
+    assert "refs/heads/merged" not in refs
+    assert "refs/branch-metadata/merged" not in refs
+    assert "refs/branch-metadata/unmerged" in refs
+
+
+def test_real_list_merged_branches(tmp_path: Path) -> None:
+    """Test that only branches whose head is in the target's history are listed."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    subprocess.run(["git", "branch", "merged"], cwd=repo, check=True)
+    subprocess.run(["git", "checkout", "-q", "-b", "unmerged"], cwd=repo, check=True)
+    _commit(repo, "only on unmerged")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+
+    assert RealGitOps().list_merged_branches(repo, "main") == {"main", "merged"}
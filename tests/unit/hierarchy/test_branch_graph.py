@@ -303,3 +303,66 @@ def test_render_tree_with_very_deep_nesting() -> None:
     assert "└─" in output
     # Deep nesting should have vertical lines
     assert "│" in output or "  " in output  # Indentation or vertical lines
+
+
+def test_filter_graph_attaches_to_nearest_active_ancestor() -> None:
+    """Branches whose parent has no worktree hang off the closest ancestor that does."""
+    graph = BranchGraph(
+        parent_of={"a": "main", "b": "a", "c": "b", "d": "main"},
+        children_of={"main": ["d", "a"], "a": ["b"], "b": ["c"], "c": [], "d": []},
+        trunk_branches=["main"],
+    )
+
+    filtered = _filter_graph_to_active_branches(graph, {"main", "c", "d", "untracked"})
+
+    assert filtered.parent_of == {"c": "main", "d": "main"}
+    # Graphite's child order is kept: d is main's first child
+    assert filtered.children_of == {"main": ["d", "c"]}
+    assert filtered.trunk_branches == ["main"]
+
+
+def test_filter_graph_without_active_trunk_promotes_roots() -> None:
+    """Active branches without any active ancestor become roots."""
+    graph = BranchGraph(
+        parent_of={"a": "main", "b": "main"},
+        children_of={"main": ["a", "b"], "a": [], "b": []},
+        trunk_branches=["main"],
+    )
+
+    filtered = _filter_graph_to_active_branches(graph, {"b", "a"})
+
+    assert filtered.trunk_branches == ["a", "b"]
+    assert filtered.children_of == {}
+
+
+def test_build_tree_respects_max_depth() -> None:
+    """max_depth=1 keeps roots and their direct children only."""
+    graph = BranchGraph(
+        parent_of={"a": "main", "b": "a"},
+        children_of={"main": ["a"], "a": ["b"]},
+        trunk_branches=["main"],
+    )
+    mapping = WorktreeMapping(
+        branch_to_worktree={"main": "root", "a": "a", "b": "b"},
+        worktree_to_path={"root": Path("/repo"), "a": Path("/a"), "b": Path("/b")},
+        current_worktree=None,
+    )
+
+    roots = _build_tree_from_graph(graph, mapping, max_depth=1)
+
+    assert [child.branch_name for child in roots[0].children] == ["a"]
+    assert roots[0].children[0].children == []
+
+
+def test_render_tree_beyond_recursion_limit() -> None:
+    """Rendering is iterative, so stacks deeper than the recursion limit still render."""
+    depth = 3000
+    node = TreeNode(f"level-{depth}", f"level-{depth}", [], False)
+    for level in range(depth - 1, 0, -1):
+        node = TreeNode(f"level-{level}", f"level-{level}", [node], False)
+    root = TreeNode("main", "root", [node], False)
+
+    lines = render_tree([root]).splitlines()
+
+    assert len(lines) == depth + 1
+    assert lines[-1].startswith(" " * 3 * depth + "└─ level-3000")
@@ -0,0 +1,196 @@
+"""Tests for the cross-invocation collector cache."""
+
+import os
+from pathlib import Path
+
+from tests.fakes.context import create_test_context
+from tests.fakes.gitops import FakeGitOps
+from workstack.core.context import WorkstackContext
+from workstack.status.cache import STATUS_CACHE_FILENAME, CollectorCache
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.collectors.git import GitStatusCollector
+from workstack.status.models.serialization import from_jsonable, to_jsonable
+from workstack.status.models.status_data import CommitInfo, GitStatus, PlanStatus
+from workstack.status.orchestrator import StatusOrchestrator
+
+
+class CountingPlanCollector(StatusCollector):
+    """Plan collector that counts collect() calls and fingerprints a fixed value."""
+
+    def __init__(self, fingerprint_value: str | None) -> None:
+        self.fingerprint_value = fingerprint_value
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "plan"
+
+    def is_available(self, ctx: WorkstackContext, worktree_path: Path) -> bool:
+        return True
+
+    def collect(self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path) -> PlanStatus:
+        self.calls += 1
+        return PlanStatus(
+            exists=True,
+            path=worktree_path / ".PLAN.md",
+            summary=f"run {self.calls}",
+            line_count=1,
+            first_lines=["# Plan"],
+        )
+
+    def fingerprint(
+        self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path
+    ) -> str | None:
+        return self.fingerprint_value
+
+
+def _make_worktree(tmp_path: Path) -> Path:
+    """Create a worktree with a minimal on-disk .git directory."""
+    worktree = tmp_path / "repo"
+    git_dir = worktree / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"index")
+    return worktree
+
+
+def _git_status(staged: list[str]) -> GitStatus:
+    return GitStatus(
+        branch="main",
+        clean=not staged,
+        ahead=1,
+        behind=0,
+        staged_files=staged,
+        modified_files=[],
+        untracked_files=[],
+        recent_commits=[CommitInfo(sha="abc1234", message="msg", author="me", date="now")],
+    )
+
+
+def test_serialization_round_trips_nested_dataclasses() -> None:
+    status = _git_status(["a.py"])
+
+    assert from_jsonable(GitStatus | None, to_jsonable(status)) == status
+    assert from_jsonable(GitStatus | None, None) is None
+
+
+def test_serialization_rejects_mismatched_data() -> None:
+    data = to_jsonable(_git_status([]))
+    data["ahead"] = "1"
+
+    try:
+        from_jsonable(GitStatus, data)
+    except ValueError:
+        return
+    raise AssertionError("Expected ValueError for mismatched field type")
+
+
+def test_cache_round_trips_through_file(tmp_path: Path) -> None:
+    worktree = _make_worktree(tmp_path)
+    cache = CollectorCache.for_worktree(worktree)
+    assert cache is not None
+
+    cache.put("git", "fp", _git_status(["a.py"]))
+    cache.save()
+
+    reloaded = CollectorCache.for_worktree(worktree)
+    assert reloaded is not None
+    hit = reloaded.get("git", "fp", GitStatus | None, ttl_seconds=None)
+    assert hit is not None
+    assert hit.value == _git_status(["a.py"])
+    assert reloaded.get("git", "other", GitStatus | None, ttl_seconds=None) is None
+
+
+def test_cache_distinguishes_cached_none_from_miss(tmp_path: Path) -> None:
+    cache = CollectorCache(tmp_path / "cache.json", {})
+    cache.put("pr", "fp", None)
+
+    hit = cache.get("pr", "fp", GitStatus | None, ttl_seconds=None)
+    assert hit is not None
+    assert hit.value is None
+
+
+def test_cache_entries_expire_after_ttl(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    entries = {"pr": {"fingerprint": "fp", "written_at": 1000.0, "value": None}}
+    fresh = CollectorCache(path, dict(entries), clock=lambda: 1050.0)
+    stale = CollectorCache(path, dict(entries), clock=lambda: 1200.0)
+
+    assert fresh.get("pr", "fp", GitStatus | None, ttl_seconds=120) is not None
+    assert stale.get("pr", "fp", GitStatus | None, ttl_seconds=120) is None
+
+
+def test_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+    worktree = _make_worktree(tmp_path)
+    (worktree / ".git" / STATUS_CACHE_FILENAME).write_text("{not json", encoding="utf-8")
+
+    cache = CollectorCache.for_worktree(worktree)
+
+    assert cache is not None
+    assert cache.get("git", "fp", GitStatus | None, ttl_seconds=None) is None
+
+
+def test_orchestrator_reuses_result_while_fingerprint_matches(tmp_path: Path) -> None:
+    worktree = _make_worktree(tmp_path)
+    ctx = create_test_context(git_ops=FakeGitOps(current_branches={worktree: "main"}))
+    collector = CountingPlanCollector("v1")
+
+    first = StatusOrchestrator([collector], cache=CollectorCache.for_worktree(worktree))
+    first.collect_status(ctx, worktree, worktree)
+    second = StatusOrchestrator([collector], cache=CollectorCache.for_worktree(worktree))
+    status = second.collect_status(ctx, worktree, worktree)
+
+    assert collector.calls == 1
+    assert status.plan is not None
+    assert status.plan.summary == "run 1"
+
+    collector.fingerprint_value = "v2"
+    third = StatusOrchestrator([collector], cache=CollectorCache.for_worktree(worktree))
+    status = third.collect_status(ctx, worktree, worktree)
+
+    assert collector.calls == 2
+    assert status.plan is not None
+    assert status.plan.summary == "run 2"
+
+
+def test_orchestrator_without_cache_always_collects(tmp_path: Path) -> None:
+    worktree = _make_worktree(tmp_path)
+    ctx = create_test_context(git_ops=FakeGitOps(current_branches={worktree: "main"}))
+    collector = CountingPlanCollector("v1")
+
+    StatusOrchestrator([collector]).collect_status(ctx, worktree, worktree)
+    StatusOrchestrator([collector]).collect_status(ctx, worktree, worktree)
+
+    assert collector.calls == 2
+    assert not (worktree / ".git" / STATUS_CACHE_FILENAME).exists()
+
+
+def test_git_fingerprint_tracks_head_and_index(tmp_path: Path) -> None:
+    worktree = _make_worktree(tmp_path)
+    ctx = create_test_context()
+    collector = GitStatusCollector()
+
+    before = collector.fingerprint(ctx, worktree, worktree)
+    (worktree / ".git" / "refs" / "heads" / "main").write_text("b" * 40 + "\n", encoding="utf-8")
+    after_commit = collector.fingerprint(ctx, worktree, worktree)
+    index = worktree / ".git" / "index"
+    os.utime(index, ns=(index.stat().st_atime_ns, index.stat().st_mtime_ns + 10**9))
+    after_index = collector.fingerprint(ctx, worktree, worktree)
+
+    assert before is not None
+    assert len({before, after_commit, after_index}) == 3
+
+
+def test_git_refresh_cached_rereads_file_status(tmp_path: Path) -> None:
+    worktree = tmp_path / "repo"
+    worktree.mkdir()
+    git_ops = FakeGitOps(file_statuses={worktree: ([], ["edited.py"], [])})
+    ctx = create_test_context(git_ops=git_ops)
+
+    refreshed = GitStatusCollector().refresh_cached(ctx, worktree, worktree, _git_status([]))
+
+    assert refreshed is not None
+    assert refreshed.modified_files == ["edited.py"]
+    assert refreshed.clean is False
+    assert refreshed.ahead == 1
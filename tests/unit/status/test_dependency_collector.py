@@ -0,0 +1,125 @@
+"""Unit tests for DependencyCollector."""
+
+import json
+import os
+from pathlib import Path
+
+from tests.fakes.context import create_test_context
+from workstack.status.collectors.dependencies import (
+    DEPENDENCY_CACHE_FILENAME,
+    DependencyCollector,
+)
+
+
+def _set_mtime(path: Path, seconds: int) -> None:
+    os.utime(path, (seconds, seconds))
+
+
+def _make_python_worktree(tmp_path: Path) -> Path:
+    """Create a worktree with uv.lock and an installed .venv."""
+    worktree = tmp_path / "worktree"
+    (worktree / ".git").mkdir(parents=True)
+    site_packages = worktree / ".venv" / "lib" / "python3.13" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (worktree / ".venv" / "pyvenv.cfg").write_text("home = /usr\n", encoding="utf-8")
+    (worktree / "uv.lock").write_text("version = 1\n", encoding="utf-8")
+    return worktree
+
+
+def _mark_installed_at(worktree: Path, seconds: int) -> None:
+    venv = worktree / ".venv"
+    _set_mtime(venv / "pyvenv.cfg", seconds)
+    _set_mtime(venv / "lib" / "python3.13" / "site-packages", seconds)
+
+
+def test_dependency_collector_not_available_without_lockfile(tmp_path: Path) -> None:
+    collector = DependencyCollector()
+
+    assert collector.is_available(create_test_context(), tmp_path) is False
+
+
+def test_install_newer_than_lockfile_is_up_to_date(tmp_path: Path) -> None:
+    worktree = _make_python_worktree(tmp_path)
+    _set_mtime(worktree / "uv.lock", 1_000)
+    _mark_installed_at(worktree, 2_000)
+
+    result = DependencyCollector().collect(create_test_context(), worktree, worktree)
+
+    assert result is not None
+    assert [(d.language, d.up_to_date) for d in result] == [("python", True)]
+
+
+def test_lockfile_changed_after_install_is_stale(tmp_path: Path) -> None:
+    worktree = _make_python_worktree(tmp_path)
+    _set_mtime(worktree / "uv.lock", 1_000)
+    _mark_installed_at(worktree, 2_000)
+    collector = DependencyCollector()
+    collector.collect(create_test_context(), worktree, worktree)
+
+    (worktree / "uv.lock").write_text("version = 2\n", encoding="utf-8")
+    _set_mtime(worktree / "uv.lock", 3_000)
+    result = collector.collect(create_test_context(), worktree, worktree)
+
+    assert result is not None
+    assert result[0].up_to_date is False
+    assert result[0].details is not None
+    assert "uv sync" in result[0].details
+
+
+def test_touched_lockfile_with_same_content_stays_up_to_date(tmp_path: Path) -> None:
+    worktree = _make_python_worktree(tmp_path)
+    _set_mtime(worktree / "uv.lock", 1_000)
+    _mark_installed_at(worktree, 2_000)
+    collector = DependencyCollector()
+    collector.collect(create_test_context(), worktree, worktree)
+
+    # A checkout rewrites the lockfile with identical content
+    _set_mtime(worktree / "uv.lock", 3_000)
+    result = collector.collect(create_test_context(), worktree, worktree)
+
+    assert result is not None
+    assert result[0].up_to_date is True
+
+
+def test_verdict_is_cached_in_git_dir(tmp_path: Path) -> None:
+    worktree = _make_python_worktree(tmp_path)
+    _set_mtime(worktree / "uv.lock", 1_000)
+    _mark_installed_at(worktree, 2_000)
+
+    DependencyCollector().collect(create_test_context(), worktree, worktree)
+
+    cache = json.loads((worktree / ".git" / DEPENDENCY_CACHE_FILENAME).read_text("utf-8"))
+    assert cache["python"]["up_to_date"] is True
+    assert cache["python"]["synced_hash"]
+
+
+def test_cached_verdict_reused_while_state_matches(tmp_path: Path) -> None:
+    worktree = _make_python_worktree(tmp_path)
+    _set_mtime(worktree / "uv.lock", 1_000)
+    _mark_installed_at(worktree, 2_000)
+    cache_path = worktree / ".git" / DEPENDENCY_CACHE_FILENAME
+    DependencyCollector().collect(create_test_context(), worktree, worktree)
+
+    # Forge a stale verdict for the same state: it must be served from cache
+    cache = json.loads(cache_path.read_text("utf-8"))
+    cache["python"]["up_to_date"] = False
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    result = DependencyCollector().collect(create_test_context(), worktree, worktree)
+
+    assert result is not None
+    assert result[0].up_to_date is False
+
+
+def test_missing_node_modules_is_reported(tmp_path: Path) -> None:
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n", encoding="utf-8")
+
+    result = DependencyCollector().collect(create_test_context(), worktree, worktree)
+
+    assert result is not None
+    assert result[0].language == "node"
+    assert result[0].up_to_date is False
+    assert result[0].details is not None
+    assert "pnpm install" in result[0].details
@@ -0,0 +1,41 @@
+"""Unit tests for EnvironmentCollector."""
+
+from pathlib import Path
+
+from tests.fakes.context import create_test_context
+from workstack.status.collectors.environment import EnvironmentCollector, parse_env_file
+
+
+def test_environment_collector_reads_env_file(tmp_path: Path) -> None:
+    (tmp_path / ".env").write_text(
+        'WORKTREE_PATH="/tmp/wt"\nWORKTREE_NAME="wt"\n', encoding="utf-8"
+    )
+    collector = EnvironmentCollector()
+    ctx = create_test_context()
+
+    assert collector.is_available(ctx, tmp_path) is True
+    result = collector.collect(ctx, tmp_path, tmp_path)
+
+    assert result is not None
+    assert result.variables == {"WORKTREE_PATH": "/tmp/wt", "WORKTREE_NAME": "wt"}
+
+
+def test_environment_collector_not_available_without_env_file(tmp_path: Path) -> None:
+    assert EnvironmentCollector().is_available(create_test_context(), tmp_path) is False
+
+
+def test_parse_env_file_handles_quotes_comments_and_export() -> None:
+    content = (
+        "# comment\n"
+        "\n"
+        'QUOTED="say \\"hi\\" \\\\ bye"\n'
+        "export EXPORTED=value\n"
+        "SINGLE='raw $value'\n"
+        "not a variable\n"
+    )
+
+    assert parse_env_file(content) == {
+        "QUOTED": 'say "hi" \\ bye',
+        "EXPORTED": "value",
+        "SINGLE": "raw $value",
+    }
@@ -527,3 +527,30 @@ def test_git_status_collector_limit_recent_commits(tmp_path: Path) -> None:
     assert len(result.recent_commits) == 5  # Limited to 5
     assert result.recent_commits[0].sha == "commit0"
     assert result.recent_commits[4].sha == "commit4"
+
+
+def test_git_status_collector_caps_file_lists(tmp_path: Path) -> None:
+    """Test GitStatusCollector truncates file lists when max_files is set."""
+    # Arrange
+    worktree_path = tmp_path / "worktree"
+    worktree_path.mkdir()
+
+    git_ops = FakeGitOps(
+        current_branches={worktree_path: "feature-branch"},
+        file_statuses={worktree_path: (["a.py"], ["b.py", "c.py", "d.py"], [])},
+        ahead_behind={(worktree_path, "feature-branch"): (0, 0)},
+        recent_commits={worktree_path: []},
+    )
+
+    ctx = create_test_context(git_ops=git_ops)
+    collector = GitStatusCollector(max_files=2)
+
+    # Act
+    result = collector.collect(ctx, worktree_path, tmp_path)
+
+    # Assert
+    assert result is not None
+    assert result.staged_files == ["a.py"]
+    assert result.modified_files == ["b.py", "c.py"]
+    assert result.files_truncated is True
+    assert result.clean is False
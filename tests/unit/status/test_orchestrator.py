@@ -511,3 +511,34 @@ def test_orchestrator_multiple_collector_types(tmp_path: Path) -> None:
     assert status.git_status.branch == "test"
     assert status.plan is not None
     assert status.plan.exists is True
+
+
+def test_orchestrator_refresh_status_only_reruns_named_collectors(tmp_path: Path) -> None:
+    """Test refresh_status re-runs named collectors and keeps other sections."""
+    # Arrange
+    worktree_path = tmp_path / "worktree"
+    worktree_path.mkdir()
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    plan_path = worktree_path / ".PLAN.md"
+    plan_path.write_text("# Plan", encoding="utf-8")
+
+    git_ops = FakeGitOps(
+        current_branches={worktree_path: "branch"},
+        file_statuses={worktree_path: ([], [], [])},
+        ahead_behind={(worktree_path, "branch"): (0, 0)},
+        recent_commits={worktree_path: []},
+    )
+    ctx = create_test_context(git_ops=git_ops)
+    orchestrator = StatusOrchestrator([GitStatusCollector(), PlanFileCollector()])
+    status = orchestrator.collect_status(ctx, worktree_path, repo_root)
+    assert status.plan is not None
+
+    # Act - plan file removed, only the plan collector is refreshed
+    plan_path.unlink()
+    refreshed = orchestrator.refresh_status(ctx, status, worktree_path, repo_root, {"plan"})
+
+    # Assert
+    assert refreshed.plan is None
+    assert refreshed.git_status is status.git_status
+    assert refreshed.worktree_info is status.worktree_info
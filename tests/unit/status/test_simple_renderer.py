@@ -7,11 +7,14 @@ from click.testing import CliRunner
 
 from workstack.status.models.status_data import (
     CommitInfo,
+    DependencyStatus,
+    EnvironmentStatus,
     GitStatus,
     PlanStatus,
     PullRequestStatus,
     StackPosition,
     StatusData,
+    TrashStatus,
     WorktreeInfo,
 )
 from workstack.status.renderers.simple import SimpleRenderer
@@ -1036,3 +1039,78 @@ def test_renderer_file_list_method() -> None:
     assert "single.py" in result.output
     assert "f1.py" in result.output
     assert "... and 1 more" in result.output
+
+
+def test_renderer_dependencies_section() -> None:
+    """Test rendering of stale and current dependency ecosystems."""
+    status_data = StatusData(
+        worktree_info=WorktreeInfo(name="wt", path=Path("/tmp/wt"), branch="main", is_root=False),
+        git_status=None,
+        stack_position=None,
+        pr_status=None,
+        environment=EnvironmentStatus(variables={"WORKTREE_NAME": "wt", "SECRET": "hunter2"}),
+        dependencies=[
+            DependencyStatus(language="python", up_to_date=True, outdated_count=0, details=None),
+            DependencyStatus(
+                language="node",
+                up_to_date=False,
+                outdated_count=0,
+                details="pnpm-lock.yaml changed since last install; run `pnpm install`",
+            ),
+        ],
+        plan=None,
+        related_worktrees=[],
+    )
+
+    output = capture_renderer_output(SimpleRenderer(), status_data)
+
+    assert "Dependencies:" in output
+    assert "python: up to date" in output
+    assert "node: out of sync" in output
+    assert "run `pnpm install`" in output
+    assert "2 variables from .env" in output
+    assert "SECRET" in output
+    assert "hunter2" not in output
+
+
+def test_renderer_pending_trash() -> None:
+    """Removed worktrees still being deleted are reported with their size."""
+    status_data = StatusData(
+        worktree_info=WorktreeInfo(
+            name="test-worktree", path=Path("/tmp/test"), branch="main", is_root=False
+        ),
+        git_status=None,
+        stack_position=None,
+        pr_status=None,
+        environment=None,
+        dependencies=None,
+        plan=None,
+        related_worktrees=[],
+        trash=TrashStatus(entries=2, size_bytes=3 * 1024 * 1024),
+    )
+
+    output = capture_renderer_output(SimpleRenderer(), status_data)
+
+    assert "Trash:" in output
+    assert "2 removed worktree(s) pending deletion, 3.0 MiB" in output
+
+
+def test_renderer_pending_trash_lower_bound() -> None:
+    """A trash too large to measure fully is reported as a lower bound."""
+    status_data = StatusData(
+        worktree_info=WorktreeInfo(
+            name="test-worktree", path=Path("/tmp/test"), branch="main", is_root=False
+        ),
+        git_status=None,
+        stack_position=None,
+        pr_status=None,
+        environment=None,
+        dependencies=None,
+        plan=None,
+        related_worktrees=[],
+        trash=TrashStatus(entries=1, size_bytes=3 * 1024 * 1024, size_is_lower_bound=True),
+    )
+
+    output = capture_renderer_output(SimpleRenderer(), status_data)
+
+    assert "1 removed worktree(s) pending deletion, at least 3.0 MiB" in output
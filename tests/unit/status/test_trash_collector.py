@@ -0,0 +1,34 @@
+"""Unit tests for TrashCollector."""
+
+from pathlib import Path
+
+from tests.fakes.context import create_test_context
+from tests.fakes.global_config_ops import FakeGlobalConfigOps
+from workstack.core.trash import move_to_trash, trash_dir_for
+from workstack.status.collectors.trash import TrashCollector
+
+
+def test_trash_collector_reports_pending_trash(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    workstacks_dir = tmp_path / "workstacks" / "repo"
+    wt = workstacks_dir / "old"
+    wt.mkdir(parents=True)
+    (wt / "big.bin").write_bytes(b"x" * 2048)
+    move_to_trash(wt, trash_dir_for(workstacks_dir))
+    ctx = create_test_context(
+        global_config_ops=FakeGlobalConfigOps(workstacks_root=tmp_path / "workstacks")
+    )
+
+    result = TrashCollector().collect(ctx, repo_root, repo_root)
+
+    assert result is not None
+    assert result.entries == 1
+    assert result.size_bytes == 2048
+
+
+def test_trash_collector_returns_none_without_trash(tmp_path: Path) -> None:
+    ctx = create_test_context(
+        global_config_ops=FakeGlobalConfigOps(workstacks_root=tmp_path / "workstacks")
+    )
+
+    assert TrashCollector().collect(ctx, tmp_path / "repo", tmp_path / "repo") is None
@@ -0,0 +1,289 @@
+"""Unit tests for status watch mode."""
+
+import io
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.fakes.context import create_test_context
+from workstack.core.context import WorkstackContext
+from workstack.status.cache import CollectorCache
+from workstack.status.collectors.base import StatusCollector
+from workstack.status.models.status_data import StatusData
+from workstack.status.orchestrator import StatusOrchestrator
+from workstack.status.watch import (
+    ChangeSource,
+    IncrementalScreen,
+    InotifyChangeSource,
+    PollingChangeSource,
+    WatchLayout,
+    _entry_mtimes,
+    _load_inotify,
+    classify_changes,
+    resolve_watch_layout,
+    watch_status,
+)
+
+
+def _linked_layout(tmp_path: Path) -> WatchLayout:
+    common_dir = tmp_path / "repo" / ".git"
+    return WatchLayout(
+        worktree_path=tmp_path / "wt",
+        git_dir=common_dir / "worktrees" / "wt",
+        common_dir=common_dir,
+    )
+
+
+def _make_layout_on_disk(tmp_path: Path) -> WatchLayout:
+    repo = tmp_path / "repo"
+    (repo / ".git" / "refs" / "heads").mkdir(parents=True)
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    layout = resolve_watch_layout(repo)
+    assert layout is not None
+    return layout
+
+
+@pytest.mark.parametrize(
+    ("relative", "expected"),
+    [
+        ("wt/.PLAN.md", {"plan", "git"}),
+        ("wt/.env", {"environment", "git"}),
+        ("wt/uv.lock", {"dependencies", "git"}),
+        ("wt/src/app.py", {"git"}),
+        ("wt/node_modules/.modules.yaml", {"dependencies"}),
+        ("repo/.git/worktrees/wt/HEAD", {"git", "stack", "pr"}),
+        ("repo/.git/worktrees/wt/index", {"git"}),
+        ("repo/.git/worktrees/wt/index.lock", set()),
+        ("repo/.git/worktrees/wt/workstack-prompt", set()),
+        ("repo/.git/refs/heads/feature/x", {"git"}),
+        ("repo/.git/.graphite_cache_persist", {"stack"}),
+        ("repo/.git/.graphite_pr_info", {"pr"}),
+        ("repo/.git/objects/ab/cdef", set()),
+    ],
+)
+def test_classify_changes(tmp_path: Path, relative: str, expected: set[str]) -> None:
+    layout = _linked_layout(tmp_path)
+
+    assert classify_changes({tmp_path / relative}, layout) == expected
+
+
+def test_classify_changes_for_root_worktree_checks_both_file_sets(tmp_path: Path) -> None:
+    git_dir = tmp_path / "repo" / ".git"
+    layout = WatchLayout(worktree_path=tmp_path / "repo", git_dir=git_dir, common_dir=git_dir)
+
+    changed = {git_dir / "HEAD", git_dir / ".graphite_cache_persist"}
+
+    assert classify_changes(changed, layout) == {"git", "stack", "pr"}
+
+
+def test_classify_changes_overflow_refreshes_everything(tmp_path: Path) -> None:
+    layout = _linked_layout(tmp_path)
+
+    names = classify_changes({layout.worktree_path}, layout)
+
+    assert {"git", "stack", "pr", "plan", "environment", "dependencies"} <= names
+
+
+def test_incremental_screen_rewrites_only_changed_lines() -> None:
+    stream = io.StringIO()
+    screen = IncrementalScreen(stream)
+
+    screen.draw("one\ntwo\nthree\n")
+    stream.seek(0)
+    stream.truncate()
+    screen.draw("one\nTWO\n")
+
+    output = stream.getvalue()
+    assert "\x1b[2;1HTWO\x1b[K" in output
+    assert "one" not in output
+    assert output.endswith("\x1b[3;1H\x1b[J")
+
+
+def test_incremental_screen_skips_identical_frames() -> None:
+    stream = io.StringIO()
+    screen = IncrementalScreen(stream)
+    screen.draw("same\n")
+    stream.seek(0)
+    stream.truncate()
+
+    screen.draw("same\n")
+
+    assert stream.getvalue() == ""
+
+
+class _ScriptedChangeSource(ChangeSource):
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self._batches = list(batches)
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        if not self._batches:
+            return None
+        return self._batches.pop(0)
+
+    def close(self) -> None:
+        pass
+
+
+class _CountingCollector(StatusCollector):
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self._name = name
+        self._calls = calls
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def is_available(self, ctx: WorkstackContext, worktree_path: Path) -> bool:
+        return True
+
+    def collect(self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path) -> object:
+        self._calls.append(self._name)
+        return None
+
+
+def test_watch_status_reruns_only_affected_collectors(tmp_path: Path) -> None:
+    layout = _linked_layout(tmp_path)
+    calls: list[str] = []
+    orchestrator = StatusOrchestrator(
+        [_CountingCollector(name, calls) for name in ("git", "stack", "pr", "plan")]
+    )
+    source = _ScriptedChangeSource(
+        [
+            {layout.worktree_path / ".PLAN.md"},
+            {layout.worktree_path / ".PLAN.md"},
+        ]
+    )
+    frames: list[StatusData] = []
+
+    def render(status: StatusData) -> str:
+        frames.append(status)
+        return status.worktree_info.name
+
+    watch_status(
+        create_test_context(),
+        orchestrator,
+        layout,
+        tmp_path / "repo",
+        source,
+        IncrementalScreen(io.StringIO()),
+        render,
+    )
+
+    initial, refreshed = calls[:4], calls[4:]
+    assert sorted(initial) == ["git", "plan", "pr", "stack"]
+    # Both plan events were coalesced into a single refresh of plan + git
+    assert sorted(refreshed) == ["git", "plan"]
+    assert len(frames) == 2
+
+
+class _FingerprintedCollector(_CountingCollector):
+    """Counting collector whose results are cached for at most 120 seconds."""
+
+    def fingerprint(self, ctx: WorkstackContext, worktree_path: Path, repo_root: Path) -> str:
+        return "unchanged"
+
+    @property
+    def cache_ttl_seconds(self) -> float | None:
+        return 120
+
+
+class _ClockAdvancingChangeSource(ChangeSource):
+    """Delivers each batch at a scripted time, then ends the burst it starts."""
+
+    def __init__(self, batches: list[tuple[float, set[Path]]], clock: list[float]) -> None:
+        self._batches = list(batches)
+        self._clock = clock
+        self._in_burst = False
+
+    def wait(self, timeout: float | None) -> set[Path] | None:
+        # Returning None while coalescing ends the burst, so every batch gets
+        # its own refresh
+        if self._in_burst or not self._batches:
+            self._in_burst = False
+            return None
+        self._in_burst = True
+        self._clock[0], batch = self._batches.pop(0)
+        return batch
+
+    def close(self) -> None:
+        pass
+
+
+def test_watch_status_reruns_cached_collector_after_ttl(tmp_path: Path) -> None:
+    """The session-long cache must read the clock on every lookup, not once."""
+    layout = _linked_layout(tmp_path)
+    calls: list[str] = []
+    clock = [1000.0]
+    cache = CollectorCache(tmp_path / "cache.json", {}, clock=lambda: clock[0])
+    orchestrator = StatusOrchestrator([_FingerprintedCollector("plan", calls)], cache=cache)
+    plan = layout.worktree_path / ".PLAN.md"
+    source = _ClockAdvancingChangeSource([(1050.0, {plan}), (1200.0, {plan})], clock)
+
+    watch_status(
+        create_test_context(),
+        orchestrator,
+        layout,
+        tmp_path / "repo",
+        source,
+        IncrementalScreen(io.StringIO()),
+        lambda status: status.worktree_info.name,
+    )
+
+    # Collected at 1000, served from the cache at 1050, expired by 1200
+    assert calls == ["plan", "plan"]
+
+
+def test_polling_change_source_reports_modified_file(tmp_path: Path) -> None:
+    layout = _make_layout_on_disk(tmp_path)
+    plan = layout.worktree_path / ".PLAN.md"
+    plan.write_text("# v1\n", encoding="utf-8")
+    source = PollingChangeSource(layout, interval=0.01)
+
+    plan.write_text("# v2 with more text\n", encoding="utf-8")
+    changed = source.wait(0.01)
+
+    assert changed is not None
+    assert plan in changed
+    assert source.wait(0.01) == set()
+
+
+def test_polling_skips_entries_deleted_during_scan(tmp_path: Path) -> None:
+    """A lock file listed by scandir but gone by the time it is stat'ed is skipped."""
+    (tmp_path / "index.lock").write_text("", encoding="utf-8")
+    (tmp_path / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    with os.scandir(tmp_path) as listing:
+        listed = list(listing)
+
+    (tmp_path / "index.lock").unlink()
+
+    assert set(_entry_mtimes(listed)) == {tmp_path / "HEAD"}
+
+
+@pytest.mark.skipif(_load_inotify() is None, reason="inotify not available")
+def test_inotify_change_source_reports_new_file_in_new_directory(tmp_path: Path) -> None:
+    layout = _make_layout_on_disk(tmp_path)
+    libc = _load_inotify()
+    assert libc is not None
+    source = InotifyChangeSource(layout, libc)
+    try:
+        (layout.worktree_path / "pkg").mkdir()
+        assert layout.worktree_path / "pkg" in _drain(source)
+
+        (layout.worktree_path / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+        assert layout.worktree_path / "pkg" / "mod.py" in _drain(source)
+    finally:
+        source.close()
+
+
+def _drain(source: ChangeSource) -> set[Path]:
+    changed: set[Path] = set()
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline:
+        batch = source.wait(0.05)
+        if batch:
+            changed |= batch
+        elif changed:
+            break
+    return changed
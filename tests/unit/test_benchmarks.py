@@ -0,0 +1,68 @@
+"""Tests for the benchmark harness in ``benchmarks/``."""
+
+from pathlib import Path
+
+from benchmarks.__main__ import main, run_fake_suite
+from benchmarks.baseline import find_regressions, load_baseline, save_baseline
+from benchmarks.measure import Measurement
+from benchmarks.scenarios import ScenarioSize
+from click.testing import CliRunner
+
+
+def _measurement(wall_ms: float, subprocesses: int, peak_kb: int) -> Measurement:
+    return Measurement(
+        name="real/list", wall_ms=wall_ms, subprocesses=subprocesses, peak_kb=peak_kb, exit_code=0
+    )
+
+
+def test_find_regressions_flags_extra_subprocesses_and_slowdowns() -> None:
+    baseline = {"real/list": _measurement(100.0, 3, 20_000)}
+
+    # Within tolerance, and below the absolute floors
+    assert find_regressions(baseline, [_measurement(120.0, 3, 24_000)]) == []
+    assert (
+        find_regressions({"real/list": _measurement(2.0, 3, 10)}, [_measurement(6.0, 3, 30)]) == []
+    )
+
+    regressions = find_regressions(baseline, [_measurement(200.0, 4, 40_000)])
+    assert [r.metric for r in regressions] == ["subprocesses", "wall_ms", "peak_kb"]
+
+
+def test_baseline_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    assert load_baseline(path) == {}
+
+    save_baseline(path, [_measurement(100.0, 3, 20_000)])
+
+    assert load_baseline(path) == {"real/list": _measurement(100.0, 3, 20_000)}
+
+
+def test_fake_suite_runs_every_command_without_subprocesses(tmp_path: Path) -> None:
+    size = ScenarioSize(worktrees=2, stack_height=2, prs=True)
+
+    measurements = run_fake_suite(tmp_path, size, repeat=1)
+
+    assert [m.name for m in measurements] == [
+        "fake/switch-script",
+        "fake/list-stacks",
+        "fake/status",
+        "fake/tree",
+        "fake/graphite-branches",
+    ]
+    assert all(m.exit_code == 0 for m in measurements)
+    assert all(m.subprocesses == 0 for m in measurements)
+
+
+def test_bench_fails_without_baseline_until_one_is_saved(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    args = ["--suite", "fake", "--worktrees", "1", "--stack-height", "1", "--repeat", "1"]
+    args += ["--baseline", str(path)]
+    runner = CliRunner()
+
+    missing = runner.invoke(main, args)
+    saved = runner.invoke(main, [*args, "--save-baseline"])
+
+    assert missing.exit_code == 1
+    assert "No usable baseline" in missing.output
+    assert saved.exit_code == 0
+    assert path.exists()